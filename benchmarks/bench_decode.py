@@ -0,0 +1,110 @@
+"""
+Sıkıştırılmış log okuma hızı: aynı log düz, gzip, bz2, xz ve (zstandard
+kuruluysa) zstd olarak yazılır; open_log + iter_log_chunks ile açılan
+veri miktarı saniyeye bölünür (tek çekirdek, açılmış MB/s). Her dosya
+ayrıca prescan_path ile taranır; bulgu sayıları düz dosyayla aynı olmalıdır.
+    
+    python benchmarks/bench_decode.py [--size-mb 12.9] [--input app.log] [--repeat 3]
+
+--input verilmezse hata/uyarı/traceback içeren sentetik bir log üretilir.
+"""
+
+import argparse
+import bz2
+import gzip
+import lzma
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from neurops import logfiles  # noqa: E402
+
+
+# Arşivler parça parça tarandığından bağlam pencereleri parça sınırında bölünebilir;
+# yalnızca bulgu sayıları karşılaştırılır
+COMPARED_COUNTS = ("errors", "warnings", "tracebacks", "scanned_bytes")
+
+LEVELS = ["INFO"] * 90 + ["DEBUG"] * 6 + ["WARNING"] * 3 + ["ERROR"]
+
+
+def synthetic_log(size_bytes: int) -> bytes:
+    """Gerçekçi dağılımda seviye, servis ve ara sıra traceback içeren log"""
+    rng = random.Random(1)
+    lines = []
+    total = 0
+    i = 0
+    while total < size_bytes:
+        level = rng.choice(LEVELS)
+        line = (f"2024-05-01T12:{(i // 60) % 60:02d}:{i % 60:02d}.{i % 1000:03d}Z {level} "
+                f"service-{rng.randrange(12)} request_id={rng.getrandbits(64):016x} "
+                f"latency_ms={rng.randrange(2000)} path=/api/v1/items/{rng.randrange(10 ** 6)}\n")
+        if level == "ERROR" and rng.random() < 0.2:
+            line += ("Traceback (most recent call last):\n"
+                     f'  File "/srv/app/handlers.py", line {rng.randrange(900)}, in handle\n'
+                     "ValueError: invalid item\n")
+        lines.append(line)
+        total += len(line)
+        i += 1
+    return "".join(lines).encode("utf-8")
+
+
+def write_variants(data: bytes, directory: Path) -> dict:
+    variants = {
+        "plain": (directory / "app.log", lambda d: d),
+        "gzip": (directory / "app.log.gz", gzip.compress),
+        "bz2": (directory / "app.log.bz2", bz2.compress),
+        "xz": (directory / "app.log.xz", lzma.compress),
+    }
+    if logfiles.zstandard is not None:
+        variants["zstd"] = (directory / "app.log.zst", logfiles.zstandard.ZstdCompressor().compress)
+    paths = {}
+    for name, (path, compress) in variants.items():
+        path.write_bytes(compress(data))
+        paths[name] = path
+    return paths
+
+
+def decode_seconds(path: Path) -> float:
+    start = time.perf_counter()
+    with logfiles.open_log(str(path)) as stream:
+        for _ in logfiles.iter_log_chunks(stream):
+            pass
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sıkıştırılmış log okuma hızı")
+    parser.add_argument("--size-mb", type=float, default=12.9, help="Sentetik log boyutu (default: 12.9)")
+    parser.add_argument("--input", help="Sentetik log yerine kullanılacak düz log dosyası")
+    parser.add_argument("--repeat", type=int, default=3, help="En iyisi alınan tekrar sayısı (default: 3)")
+    args = parser.parse_args()
+    
+    data = Path(args.input).read_bytes() if args.input else synthetic_log(int(args.size_mb * 1e6))
+    size_mb = len(data) / 1e6
+    line_count = data.count(b"\n")
+    skipped = "" if logfiles.zstandard is not None else " (zstandard not installed, zstd skipped)"
+    print(f"log: {size_mb:.1f} MB, {line_count} lines{skipped}")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_variants(data, Path(directory))
+        reference = None
+        for name, path in paths.items():
+            seconds = min(decode_seconds(path) for _ in range(max(1, args.repeat)))
+            start = time.perf_counter()
+            _, counts, _, _ = logfiles.prescan_path(str(path))
+            prescan = time.perf_counter() - start
+            counts = {key: counts.get(key) for key in COMPARED_COUNTS}
+            if reference is None:
+                reference = counts
+            same = "same counts" if counts == reference else f"COUNTS DIFFER: {counts}"
+            print(f"{name:6} {os.path.getsize(path) / 1e6:7.1f} MB on disk  "
+                  f"{size_mb / seconds:8.0f} MB/s decode  prescan {prescan:5.2f} s  {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+get_api_headers maliyeti: kimliği her çağrıda çözümleyen eski yol ile süreç
+başına bir kez çözümlenen get_identity karşılaştırılır.
+
+Eski yol (user-003 öncesi) her header setinde config.json'u üç kez okuyup
+parse ediyor (hf_token, user_id, username), user_id yoksa gethostbyname ve
+getpass çağırıyordu. Ölçüm user_id içermeyen geçici bir config.json ile yapılır.
+    
+    python benchmarks/bench_headers.py [--calls N] [--slow-dns SANIYE]
+
+--slow-dns gethostbyname'i verilen süre kadar bekletir (bozuk resolver);
+eski yol bu süreyi her çağrıda öder, yeni yol en fazla IDENTITY_RESOLVE_TIMEOUT kadar bir kez.
+"""
+
+import argparse
+import getpass
+import json
+import os
+import socket
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def legacy_api_headers(config_file: Path) -> dict:
+    """user-003 öncesi get_api_headers: her alan için config okunur, DNS her seferinde sorgulanır"""
+    def config_get(key):
+        try:
+            with open(config_file, "r", encoding="utf-8") as f:
+                return json.load(f).get(key)
+        except (OSError, ValueError):
+            return None
+    
+    headers = {"Content-Type": "application/json"}
+    token = os.getenv("HF_API_KEY") or config_get("hf_token")
+    if token:
+        headers["X-HF-Token"] = token
+    user_id = config_get("user_id")
+    if not user_id:
+        try:
+            hostname = socket.gethostname()
+            user_id = f"{hostname}_{socket.gethostbyname(hostname)}"
+        except OSError:
+            user_id = "unknown"
+    headers["X-User-ID"] = user_id
+    headers["X-Username"] = config_get("username") or getpass.getuser()
+    return headers
+
+
+def per_call_us(func, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Header oluşturma maliyeti (önce/sonra)")
+    parser.add_argument("--calls", type=int, default=2000, help="Ölçülen çağrı sayısı (default: 2000)")
+    parser.add_argument("--slow-dns", type=float, default=0.0, metavar="SECONDS",
+                        help="gethostbyname'e eklenecek gecikme (default: 0)")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as home:
+        # CONFIG_DIR import anında hesaplanır; neurops HOME ayarlandıktan sonra yüklenmeli
+        os.environ["HOME"] = home
+        os.environ.pop("HF_API_KEY", None)
+        config_file = Path(home) / ".neurops" / "config.json"
+        config_file.parent.mkdir()
+        config_file.write_text(json.dumps({"hf_token": "hf_bench", "setup_completed": True}), encoding="utf-8")
+        
+        if args.slow_dns:
+            real_lookup = socket.gethostbyname
+
+            def slow_lookup(hostname):
+                time.sleep(args.slow_dns)
+                return real_lookup(hostname)
+            
+            socket.gethostbyname = slow_lookup
+        
+        from neurops import config
+        
+        calls = args.calls if not args.slow_dns else max(1, min(args.calls, int(5 / args.slow_dns)))
+        before = per_call_us(lambda: legacy_api_headers(config_file), calls)
+        
+        start = time.perf_counter()
+        config.get_api_headers()  # İlk çağrı kimliği çözümler (ve config'e yazar)
+        first_ms = (time.perf_counter() - start) * 1000
+        after = per_call_us(config.get_api_headers, args.calls)
+    
+    print(f"before (per-call resolution): {before:10.1f} us/call  ({calls} calls)")
+    print(f"after  (cached identity):     {after:10.1f} us/call  ({args.calls} calls, first call {first_ms:.1f} ms)")
+    print(f"speedup: {before / after:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+LogRingBuffer bellek ve hız ölçümü; eski list + pop(0) tamponuyla karşılaştırmalı.
+
+Bellek, tamponun tuttuğu satırların byte'ı olarak ölçülür (sys.getsizeof
+toplamı; LogRingBuffer için ayrıca kendi UTF-8 sayacı nbytes). Süreç RSS'i
+kullanılmaz: serbest bırakılan dev satırlar allocator'da kalır ve iki tampon
+için aynı değeri gösterir. İki iş yükü:
+  
+  1. Saniyede --rate satır, --seconds boyunca; her 100k satırda bir 5 MB'lık
+     tek satır (minify edilmiş JS, base64 dump).
+  2. Satırların hepsi uzun (--long-line-kib); satır sayısı sınırı byte'ları
+     sınırlamaz.
+
+Monitor boyutu (100 satır / 256 KiB) kullanılır. Son olarak hız sınırı
+olmadan ekleme hızı ölçülür: küçük tamponlarda list + pop(0) daha hızlıdır
+(kısa listede pop(0) ucuz, LogRingBuffer satır başına byte sayar);
+LogRingBuffer binlerce satırlık tamponlarda öne geçer.
+    
+    python benchmarks/bench_logbuffer.py [--rate 100000] [--seconds 10] [--long-line-kib 32] [--throughput-lines 1000000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from neurops.logbuffer import LogRingBuffer  # noqa: E402
+
+
+MONITOR_LINES = 100
+MONITOR_BYTES = 256 * 1024
+HUGE_LINE_EVERY = 100_000
+HUGE_LINE_BYTES = 5 * 1024 * 1024
+LINES = [f"2024-05-01T12:00:{i % 60:02d}.000Z INFO service-{i % 12} request handled "
+         f"path=/api/v1/items/{i} latency_ms={i % 2000}" for i in range(1000)]
+
+
+class ListBuffer:
+    """user-021 öncesi tampon: yalnızca satır sayısıyla sınırlı liste"""
+
+    def __init__(self, max_lines: int):
+        self.max_lines = max_lines
+        self._lines = []
+
+    def append(self, line: str):
+        self._lines.append(line)
+        if len(self._lines) > self.max_lines:
+            self._lines.pop(0)
+
+    def __iter__(self):
+        return iter(self._lines)
+
+
+def buffers():
+    return [
+        (f"LogRingBuffer({MONITOR_LINES} lines, {MONITOR_BYTES // 1024} KiB)",
+         LogRingBuffer(max_lines=MONITOR_LINES, max_bytes=MONITOR_BYTES)),
+        (f"list + pop(0) ({MONITOR_LINES} lines)", ListBuffer(MONITOR_LINES)),
+    ]
+
+
+def held_bytes(buffer) -> int:
+    """Tamponun tuttuğu satır nesnelerinin toplam boyutu"""
+    return sum(sys.getsizeof(line) for line in buffer)
+
+
+def describe(buffer) -> str:
+    held = f"{held_bytes(buffer) / 1024:9.1f} KiB held"
+    if isinstance(buffer, LogRingBuffer):
+        held += f" (nbytes {buffer.nbytes / 1024:.1f} KiB)"
+    return held
+
+
+def line_at(i: int) -> str:
+    # Dev satır her seferinde yeni nesne (pipe'tan okunan satır gibi)
+    return "x" * HUGE_LINE_BYTES if i and i % HUGE_LINE_EVERY == 0 else LINES[i % len(LINES)]
+
+
+def spike_workload(rate: int, seconds: int):
+    print(f"1) {rate} lines/s for {seconds} s, a {HUGE_LINE_BYTES // (1024 * 1024)} MB line every {HUGE_LINE_EVERY} lines")
+    for name, buffer in buffers():
+        peak = 0
+        i = 0
+        start = time.perf_counter()
+        for second in range(1, seconds + 1):
+            for _ in range(rate):
+                buffer.append(line_at(i))
+                if i and i % HUGE_LINE_EVERY == 0:
+                    peak = max(peak, held_bytes(buffer))
+                i += 1
+            peak = max(peak, held_bytes(buffer))
+            lag = time.perf_counter() - start - second
+            if lag < 0:
+                time.sleep(-lag)
+        print(f"   {name:34} peak {peak / 1024:9.1f} KiB held, at end {describe(buffer)}")
+
+
+def long_line_workload(line_kib: int, count: int = 1000):
+    print(f"2) {count} lines of {line_kib} KiB each")
+    for name, buffer in buffers():
+        for i in range(count):
+            buffer.append(f"{i:08d} " + "y" * (line_kib * 1024))
+        print(f"   {name:34} {describe(buffer)}")
+
+
+def throughput(buffer, lines: int) -> float:
+    start = time.perf_counter()
+    for i in range(lines):
+        buffer.append(LINES[i % len(LINES)])
+    return lines / (time.perf_counter() - start)
+
+
+def throughput_comparison(lines: int):
+    print(f"3) throughput, {lines} short appends, no pacing")
+    for max_lines in (MONITOR_LINES, 5000):
+        ring = throughput(LogRingBuffer(max_lines=max_lines, max_bytes=max_lines * 2 * 1024), lines)
+        listed = throughput(ListBuffer(max_lines), lines)
+        faster = "LogRingBuffer" if ring > listed else "list + pop(0)"
+        print(f"   {max_lines:5d} lines: LogRingBuffer {ring / 1e6:.2f}M lines/s, "
+              f"list + pop(0) {listed / 1e6:.2f}M lines/s -> {faster} {max(ring, listed) / min(ring, listed):.1f}x faster")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LogRingBuffer bellek ve hız ölçümü")
+    parser.add_argument("--rate", type=int, default=100_000, help="Saniyedeki satır sayısı (default: 100000)")
+    parser.add_argument("--seconds", type=int, default=10, help="1. iş yükünün süresi (default: 10)")
+    parser.add_argument("--long-line-kib", type=int, default=32, help="2. iş yükünde satır boyu, KiB (default: 32)")
+    parser.add_argument("--throughput-lines", type=int, default=1_000_000,
+                        help="Hız ölçümündeki ekleme sayısı (default: 1000000)")
+    args = parser.parse_args()
+    
+    spike_workload(args.rate, args.seconds)
+    long_line_workload(args.long_line_kib)
+    throughput_comparison(args.throughput_lines)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+NeurOps CLI paketi.
+
+Özellik modülleri (incident, workflow, security, team, monitor, agent, ...)
+paket import edilirken yüklenmez; `neurops.incident` gibi ilk erişimde
+import edilir. Böylece tek bir komut çalıştıran çağrı sadece ihtiyaç
+duyduğu modüllerin (rich, requests, yaml, ...) import maliyetini öder.
+"""
+
+import importlib
+
+__version__ = "2.0.0"
+
+SUBMODULES = (
+    "config",
+    "api",
+    "aio",
+    "ui",
+    "auth",
+    "agent",
+    "logs",
+    "logscan",
+    "logcheckpoints",
+    "logtemplates",
+    "localanalysis",
+    "logtime",
+    "logfiles",
+    "logindex",
+    "logbuffer",
+    "analysisworker",
+    "analysistrigger",
+    "tailer",
+    "incident",
+    "team",
+    "security",
+    "workflow",
+    "settings",
+    "monitor",
+    "bootstrap",
+    "commands",
+    "cli",
+)
+
+
+def __getattr__(name):
+    if name in SUBMODULES:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(SUBMODULES))
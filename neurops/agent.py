@@ -0,0 +1,1074 @@
+"""AI agent komutları: durum, problem analizi ve full-agent modu"""
+
+import os
+import time
+import subprocess
+import platform
+import re
+import tempfile
+from typing import Any, Dict, Optional
+
+import requests
+from rich.table import Table
+from rich.prompt import Confirm
+from rich.panel import Panel
+from rich.markdown import Markdown
+from rich.status import Status
+from rich.align import Align
+from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
+from rich import box
+
+from neurops.config import load_hf_token
+from neurops.logbuffer import LogRingBuffer
+from neurops.tailer import FileTailer
+from neurops.api import CircuitOpenError, agent_analyze
+from neurops.ui import console, get_multiline_input_simple
+from neurops.auth import check_token, set_token
+
+
+def agent_status():
+    """Agent durumunu göster (lokal token durumu)"""
+    token_status = check_token()
+    token = load_hf_token()
+    
+    table = Table(
+        title="[rgb(167,199,231)]Agent Status[/rgb(167,199,231)]",
+        box=box.SIMPLE,
+        border_style="rgb(167,199,231)",
+        show_header=True,
+        header_style="rgb(167,199,231)"
+    )
+    table.add_column("Property", style="white", width=20)
+    table.add_column("Value", style="white", width=30)
+    
+    status_text = "ACTIVE" if token_status.get("token_set") else "INACTIVE"
+    status_color = "white" if token_status.get("token_set") else "rgb(167,199,231)"
+    table.add_row("Status", f"[{status_color}]{status_text}[/{status_color}]")
+    
+    token_text = "Yes" if token_status.get("token_set") else "No"
+    token_color = "white" if token_status.get("token_set") else "rgb(167,199,231)"
+    table.add_row("Token Configured", f"[{token_color}]{token_text}[/{token_color}]")
+    
+    if token:
+        # Token'ın ilk ve son birkaç karakterini göster (güvenlik için)
+        masked_token = f"{token[:8]}...{token[-4:]}" if len(token) > 12 else "***"
+        table.add_row("Token Preview", f"[dim white]{masked_token}[/dim white]")
+    
+    table.add_row("Model", "[dim white]deepseek-ai/DeepSeek-R1[/dim white]")
+    table.add_row("Token Storage", "[dim white]~/.neurops/config.json[/dim white]")
+    
+    console.print()
+    console.print(table)
+    console.print()
+    
+    if not token_status.get("token_set"):
+        warning = Panel(
+            "[rgb(167,199,231)]Token not set. Use option 6 to set your Hugging Face API token.[/rgb(167,199,231)]",
+            border_style="white",
+            box=box.SIMPLE
+        )
+        console.print(warning)
+
+def analyze_problem():
+    """AI Agent ile problem analizi"""
+    # Token kontrolü
+    token_status = check_token()
+    if not token_status.get("token_set"):
+        console.print()
+        warning = Panel(
+            "[rgb(167,199,231)] Token not set![/rgb(167,199,231)]\n\n"
+            "AI features require a Hugging Face API token.",
+            title="Warning",
+            border_style="white",
+            box=box.SIMPLE
+        )
+        console.print(warning)
+        console.print()
+        
+        if Confirm.ask("[rgb(167,199,231)]Would you like to set token now?[/rgb(167,199,231)]"):
+            set_token()
+            token_status = check_token()
+            if not token_status.get("token_set"):
+                console.print("[rgb(167,199,231)]Token setup failed. Cannot proceed.[/rgb(167,199,231)]")
+                return
+        else:
+            return
+    console.print()
+    console.print("[rgb(167,199,231)]AI Problem Analysis[/rgb(167,199,231)]")
+    console.print("[dim rgb(167,199,231)]Describe the problem you're experiencing:[/dim rgb(167,199,231)]")
+    console.print()
+    
+    # Multi-line input için özel fonksiyon kullan
+    problem = get_multiline_input_simple("[dim rgb(167,199,231)]Problem description[/dim rgb(167,199,231)]")
+    
+    if not problem:
+        console.print("[rgb(167,199,231)]Problem description cannot be empty![/rgb(167,199,231)]")
+        return
+    
+    # Context bilgileri iste (opsiyonel)
+    context = {}
+    if Confirm.ask("[rgb(167,199,231)]Do you have additional context (logs, metrics, etc.)?[/rgb(167,199,231)]"):
+        console.print()
+        logs = get_multiline_input_simple("[white]Paste relevant logs (optional)[/white]")
+        if logs:
+            context["logs"] = logs
+    
+    auto_apply = Confirm.ask("[rgb(167,199,231)]Auto-apply suggested solutions?[/rgb(167,199,231)]", default=False)
+    
+    try:
+        console.print()
+        
+        # Loading animasyonu ile analiz
+        with Status(
+            "[rgb(167,199,231)]Analyzing problem with AI...[/rgb(167,199,231)]",
+            spinner="dots12",
+            spinner_style="rgb(167,199,231)"
+        ):
+            res = agent_analyze(
+                {
+                    "problem_description": problem,
+                    "context": context if context else None,
+                    "auto_apply": auto_apply
+                },
+                timeout=120  # AI analysis için daha uzun timeout
+            )
+        
+        if res.status_code == 200:
+            result = res.json()
+            
+            console.print()
+            console.print("[rgb(167,199,231)]Analysis Complete[/rgb(167,199,231)]")
+            console.print()
+            
+            if result.get("fallback"):
+                warning = Panel(
+                    "[rgb(167,199,231)]Using fallback mode (AI model not available)[/rgb(167,199,231)]",
+                    border_style="white",
+                    box=box.SIMPLE
+                )
+                console.print(warning)
+                console.print()
+            
+            # Markdown formatında analiz
+            analysis_text = result.get("analysis", "No analysis available")
+            analysis_panel = Panel(
+                Markdown(analysis_text),
+                title="[rgb(167,199,231)]AI Analysis[/rgb(167,199,231)]",
+                border_style="white",
+                title_align="left",
+                box=box.SIMPLE,
+                padding=(0, 0)
+            )
+            console.print(analysis_panel)
+            
+            # Actions taken
+            if result.get("actions_taken"):
+                console.print()
+                console.print("[rgb(167,199,231)]Actions Taken:[/rgb(167,199,231)]")
+                for action in result["actions_taken"]:
+                    console.print(f"  [white]•[/white] {action}")
+            
+            # Recommendations
+            if result.get("recommendations"):
+                console.print()
+                console.print("[rgb(167,199,231)]Recommendations:[/rgb(167,199,231)]")
+                for rec in result["recommendations"]:
+                    console.print(f"  [rgb(167,199,231)]•[/rgb(167,199,231)] {rec}")
+            
+            # Model bilgisi
+            if result.get("model"):
+                console.print()
+                console.print(f"[dim]Model: {result['model']}[/dim]")
+        
+        else:
+            error_detail = res.json().get("detail", "Unknown error")
+            error_panel = Panel(
+                f"[rgb(167,199,231)]Analysis failed:[/rgb(167,199,231)]\n\n{error_detail}",
+                border_style="white",
+                box=box.SIMPLE
+            )
+            console.print(error_panel)
+    
+    except requests.Timeout:
+        error_panel = Panel(
+            "[rgb(167,199,231)]Request Timeout[/rgb(167,199,231)]\n\n"
+            "The AI analysis took longer than expected.\n"
+            "This can happen if:\n"
+            "  • The AI service is slow or overloaded\n"
+            "  • Your problem description is very complex\n"
+            "  • Network connection is slow\n\n"
+            "[rgb(167,199,231)]Try again with a simpler description or check your connection.[/rgb(167,199,231)]",
+            title="Timeout",
+            border_style="white",
+            box=box.SIMPLE
+        )
+        console.print(Align.center(error_panel), width=80)
+    except CircuitOpenError as e:
+        error_panel = Panel(
+            "[rgb(167,199,231)]AI Service Unavailable[/rgb(167,199,231)]\n\n"
+            "Recent AI requests failed, so new requests are paused for a short while.\n"
+            f"[dim]{e}[/dim]",
+            border_style="white",
+            box=box.SIMPLE
+        )
+        console.print(error_panel)
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)]Error: {e}[/rgb(167,199,231)]")
+
+def full_agent_mode():
+    """Full-Agent Mode: Terminal çıktısını izle ve hataları otomatik düzelt"""
+    console.print()
+    console.print("[white]Full-Agent Mode[/white]")
+    console.print()
+    console.print("[rgb(167,199,231)]This mode monitors a terminal window and automatically fixes errors.[/rgb(167,199,231)]")
+    console.print("[rgb(167,199,231)]When an error is detected, the agent will fix it automatically.[/rgb(167,199,231)]")
+    console.print()
+    
+    # Token kontrolü
+    token_status = check_token()
+    if not token_status.get("token_set"):
+        console.print()
+        warning = Panel(
+            "[rgb(167,199,231)]Warning:[/rgb(167,199,231)]\n"
+            "[rgb(167,199,231)] AI Agent token not set![/rgb(167,199,231)]\n\n"
+            "[rgb(167,199,231)]Full-Agent Mode requires a Hugging Face API token.[/rgb(167,199,231)]\n"
+            "[rgb(167,199,231)]Please set your token first (option 7).[/rgb(167,199,231)]",
+            border_style="white",
+            box=box.SIMPLE
+        )
+        console.print(warning)
+        console.print()
+        return
+    
+    # Terminal penceresi seçimi
+    console.print("[rgb(167,199,231)]Step 1: Set up terminal monitoring[/rgb(167,199,231)]")
+    console.print()
+    
+    is_windows = platform.system() == "Windows"
+    
+    if is_windows:
+        console.print("[rgb(167,199,231)]Windows: Please run this command in your terminal:[/rgb(167,199,231)]")
+        console.print()
+        temp_file = tempfile.NamedTemporaryFile(mode='w+', delete=False, suffix='.log', prefix='neurops_agent_')
+        temp_file.close()
+        script_file = temp_file.name
+        console.print(f"[white]YourCommand 2>&1 | Tee-Object -FilePath '{script_file}' -Append[/white]")
+        console.print()
+    else:
+        console.print("[rgb(167,199,231)]Please run this command in your terminal window:[/rgb(167,199,231)]")
+        console.print()
+        temp_file = tempfile.NamedTemporaryFile(mode='w+', delete=False, suffix='.log', prefix='neurops_agent_')
+        temp_file.close()
+        script_file = temp_file.name
+        
+        # macOS'ta -f seçeneği yok, sadece -q kullan
+        if platform.system() == "Darwin":  # macOS
+            console.print(f"[white]script -q {script_file}[/white]")
+            console.print()
+            console.print("[dim]Note: On macOS, use 'script -q' (without -f option)[/dim]")
+        else:
+            # Linux'ta -f ile kullan
+            console.print(f"[white]script -q -f {script_file}[/white]")
+        
+        console.print()
+        console.print(f"[rgb(167,199,231)]Log file location:[/rgb(167,199,231)]")
+        console.print(f"[white]{script_file}[/white]")
+        console.print()
+    
+    if not Confirm.ask("[rgb(167,199,231)]Have you run the command in your terminal?[/rgb(167,199,231)]", default=True):
+        return
+    
+    console.print()
+    console.print("[white]Full-Agent Mode Active[/white]")
+    console.print("[rgb(167,199,231)]Monitoring terminal output and fixing errors automatically...[/rgb(167,199,231)]")
+    console.print("[rgb(167,199,231)]Press Ctrl+C to stop[/rgb(167,199,231)]")
+    console.print()
+    
+    # Son 200 satır / 512 KB; tek dev satır (minify JS vb.) kırpılır
+    log_buffer = LogRingBuffer(max_lines=200, max_bytes=512 * 1024)
+    current_directory = None
+    error_count = 0
+    processed_errors = set()  # İşlenen hataların unique string'leri (logda kalsa bile tekrar işlenmesin)
+    fixed_files = {}  # Düzeltilen dosyaları takip et (file_path -> timestamp)
+    ai_request_in_progress = False  # AI isteği devam ediyor mu? (cevap gelene kadar true)
+    last_command = None  # Son çalıştırılan komut (yeniden başlatma için)
+    last_command_time = None  # Son komutun çalıştırılma zamanı
+    
+    def detect_command_in_output(output_text: str) -> Optional[str]:
+        """Log çıktısından son çalıştırılan komutu tespit et"""
+        # Yaygın komut pattern'leri (daha esnek pattern'ler)
+        command_patterns = [
+            r'(python3?\s+[^\s\n]+\.py(?:\s+[^\n]*)?)',  # python script.py [args]
+            r'(python3?\s+[^\s\n]+(?:\s+[^\n]*)?)',  # python -m module [args]
+            r'(node\s+[^\s\n]+\.js(?:\s+[^\n]*)?)',  # node script.js [args]
+            r'(node\s+[^\s\n]+(?:\s+[^\n]*)?)',  # node --version, node index.js, vb.
+            r'(npm\s+(?:run|start|test|build|install|dev)[^\n]*)',  # npm run/start/test/build/install/dev
+            r'(npm\s+[^\s\n]+[^\n]*)',  # npm install package, npm run script, vb.
+            r'(yarn\s+[^\n]*)',  # yarn komutları
+            r'(go\s+run\s+[^\n]*)',  # go run
+            r'(cargo\s+(?:run|build|test)[^\n]*)',  # cargo run/build/test
+            r'(ruby\s+[^\s\n]+\.rb[^\n]*)',  # ruby script.rb
+            r'(perl\s+[^\s\n]+\.pl[^\n]*)',  # perl script.pl
+            r'(bash\s+[^\s\n]+\.sh[^\n]*)',  # bash script.sh
+            r'(sh\s+[^\s\n]+\.sh[^\n]*)',  # sh script.sh
+            r'(\.\/[^\s\n]+[^\n]*)',  # ./executable [args]
+        ]
+        
+        # Tüm satırları kontrol et (komutlar genellikle en son çalıştırılır)
+        lines = output_text.split('\n')
+        
+        # Ters sırada kontrol et (en son komutu bul)
+        for line in reversed(lines):
+            line_clean = line.strip()
+            if not line_clean:
+                continue
+            
+            # Prompt karakterlerini atla (örn: $, >, #)
+            if line_clean.startswith('$') or line_clean.startswith('>') or line_clean.startswith('#'):
+                line_clean = line_clean[1:].strip()
+            
+            # Script komutu çıktılarını atla
+            if 'Script started' in line_clean or 'Script done' in line_clean:
+                continue
+            
+            # Komut pattern'lerini kontrol et
+            for pattern in command_patterns:
+                match = re.search(pattern, line_clean, re.IGNORECASE)
+                if match:
+                    command = match.group(1).strip()
+                    # Boş komut değilse ve sadece prompt değilse
+                    if command and len(command) > 3 and not command.startswith('cd '):
+                        # Komutun geçerli olduğunu kontrol et (sadece whitespace değilse)
+                        if command.strip() and not command.strip().startswith('#'):
+                            return command
+        
+        return None
+    
+    def restart_command(command: str, working_dir: Optional[str] = None) -> bool:
+        """Komutu yeniden başlat - script komutunun çalıştığı terminale komut gönder"""
+        try:
+            console.print()
+            console.print(f"[rgb(167,199,231)]Restarting command:[/rgb(167,199,231)] [white]{command}[/white]")
+            if working_dir:
+                console.print(f"[rgb(167,199,231)]Working directory:[/rgb(167,199,231)] [white]{working_dir}[/white]")
+            console.print()
+            
+            is_windows = platform.system() == "Windows"
+            
+            if is_windows:
+                if working_dir:
+                    full_command = f'cd /d "{working_dir}" && {command}'
+                else:
+                    full_command = command
+                
+                # Windows'ta arka planda çalıştır
+                subprocess.Popen(
+                    full_command,
+                    shell=True,
+                    cwd=working_dir if working_dir else None,
+                    creationflags=subprocess.CREATE_NEW_CONSOLE if hasattr(subprocess, 'CREATE_NEW_CONSOLE') else 0
+                )
+            else:
+                # macOS/Linux'ta script komutunun çalıştığı terminale komut göndermek için
+                if platform.system() == "Darwin":  # macOS
+                    if working_dir:
+                        full_command = f'cd "{working_dir}" && {command}'
+                    else:
+                        full_command = command
+                    
+                    # macOS'ta script komutunun çalıştığı terminale komut göndermek için
+                    # Script komutunun çalıştığı terminali bulmak için:
+                    # 1. Script komutunun çalıştığı terminalin title'ını veya process'ini bul
+                    # 2. O terminale komut gönder
+                    # En pratik çözüm: Tüm terminal pencerelerini kontrol et ve script komutunun çalıştığı terminali bul
+                    # Script komutunun çalıştığı terminal genellikle "script" kelimesini içerir
+                    
+                    # AppleScript ile script komutunun çalıştığı terminali bul ve o terminale komut gönder
+                    # Eğer bulamazsak, aktif terminale gönder
+                    escaped_command = full_command.replace('\\', '\\\\').replace('"', '\\"').replace('$', '\\$')
+                    applescript = f'''
+                    tell application "Terminal"
+                        set foundWindow to false
+                        repeat with w in windows
+                            try
+                                set windowTitle to name of w
+                                if windowTitle contains "script" or windowTitle contains "{os.path.basename(script_file)}" then
+                                    set foundWindow to true
+                                    do script "{escaped_command}" in w
+                                    exit repeat
+                                end if
+                            end try
+                        end repeat
+                        if not foundWindow then
+                            -- Script komutunun çalıştığı terminal bulunamadı, aktif terminale gönder
+                            do script "{escaped_command}" in front window
+                        end if
+                    end tell
+                    '''
+                    subprocess.run(['osascript', '-e', applescript], check=False)
+                else:
+                    # Linux için
+                    if working_dir:
+                        full_command = f'cd "{working_dir}" && {command}'
+                    else:
+                        full_command = command
+                    
+                    # Linux'ta da komutu direkt çalıştır
+                    subprocess.Popen(
+                        full_command,
+                        shell=True,
+                        cwd=working_dir if working_dir else None,
+                        executable='/bin/bash'
+                    )
+            
+            console.print(f"[rgb(167,199,231)]Command restarted![/rgb(167,199,231)]")
+            console.print()
+            return True
+            
+        except Exception as e:
+            console.print(f"[rgb(167,199,231)]Error restarting command: {e}[/rgb(167,199,231)]")
+            return False
+    
+    def detect_error_in_output(output_text: str) -> Optional[Dict[str, Any]]:
+        """Çıktıda hata tespit et"""
+        # Yaygın hata pattern'leri
+        error_patterns = [
+            # Syntax hataları (öncelikli - önce bunları kontrol et)
+            # Python'un standart hata formatı: File "path", line X -> SyntaxError: message
+            # re.DOTALL modunda . zaten \n ile eşleşir, bu yüzden \n kullanmaya gerek yok
+            (r"File ['\"]([^'\"]+\.py)['\"].*?line (\d+).*?SyntaxError:.*", "syntax_error"),
+            (r"File ['\"]([^'\"]+\.py)['\"].*?line (\d+).*?IndentationError:.*", "syntax_error"),
+            # Alternatif format: SyntaxError: message -> File "path", line X
+            (r"SyntaxError:.*?File ['\"]([^'\"]+\.py)['\"].*?line (\d+)", "syntax_error"),
+            (r"IndentationError:.*?File ['\"]([^'\"]+\.py)['\"].*?line (\d+)", "syntax_error"),
+            # Daha genel syntax hata pattern'leri
+            (r"SyntaxError.*?File ['\"]([^'\"]+)['\"].*?line (\d+)", "syntax_error"),
+            (r"IndentationError.*?File ['\"]([^'\"]+)['\"].*?line (\d+)", "syntax_error"),
+            (r"SyntaxError:.*?invalid syntax.*?File ['\"]([^'\"]+)['\"].*?line (\d+)", "syntax_error"),
+            (r"SyntaxError:.*?unexpected EOF.*?File ['\"]([^'\"]+)['\"].*?line (\d+)", "syntax_error"),
+            (r"SyntaxError:.*?was never closed.*?File ['\"]([^'\"]+)['\"].*?line (\d+)", "syntax_error"),
+            # Python Runtime Hataları (AttributeError, NameError, TypeError, vb.)
+            (r"File ['\"]([^'\"]+\.py)['\"].*?line (\d+).*?AttributeError:.*", "runtime_error"),
+            (r"File ['\"]([^'\"]+\.py)['\"].*?line (\d+).*?NameError:.*", "runtime_error"),
+            (r"File ['\"]([^'\"]+\.py)['\"].*?line (\d+).*?TypeError:.*", "runtime_error"),
+            (r"File ['\"]([^'\"]+\.py)['\"].*?line (\d+).*?ValueError:.*", "runtime_error"),
+            (r"File ['\"]([^'\"]+\.py)['\"].*?line (\d+).*?KeyError:.*", "runtime_error"),
+            (r"File ['\"]([^'\"]+\.py)['\"].*?line (\d+).*?IndexError:.*", "runtime_error"),
+            (r"File ['\"]([^'\"]+\.py)['\"].*?line (\d+).*?ZeroDivisionError:.*", "runtime_error"),
+            (r"File ['\"]([^'\"]+\.py)['\"].*?line (\d+).*?FileNotFoundError:.*", "runtime_error"),
+            (r"File ['\"]([^'\"]+\.py)['\"].*?line (\d+).*?PermissionError:.*", "runtime_error"),
+            (r"File ['\"]([^'\"]+\.py)['\"].*?line (\d+).*?OSError:.*", "runtime_error"),
+            (r"File ['\"]([^'\"]+\.py)['\"].*?line (\d+).*?IOError:.*", "runtime_error"),
+            (r"File ['\"]([^'\"]+\.py)['\"].*?line (\d+).*?UnboundLocalError:.*", "runtime_error"),
+            (r"File ['\"]([^'\"]+\.py)['\"].*?line (\d+).*?RuntimeError:.*", "runtime_error"),
+            # Alternatif format: Error: message -> File "path", line X
+            (r"AttributeError:.*?File ['\"]([^'\"]+\.py)['\"].*?line (\d+)", "runtime_error"),
+            (r"NameError:.*?File ['\"]([^'\"]+\.py)['\"].*?line (\d+)", "runtime_error"),
+            (r"TypeError:.*?File ['\"]([^'\"]+\.py)['\"].*?line (\d+)", "runtime_error"),
+            (r"ValueError:.*?File ['\"]([^'\"]+\.py)['\"].*?line (\d+)", "runtime_error"),
+            # Modül hataları
+            (r"ModuleNotFoundError.*?No module named ['\"]([^'\"]+)['\"]", "module_not_found"),
+            (r"ImportError.*?No module named ['\"]([^'\"]+)['\"]", "module_not_found"),
+            (r"ImportError.*?cannot import name.*?from ['\"]([^'\"]+)['\"]", "module_not_found"),
+            (r"PackageNotFoundError.*?Could not find.*?package.*?['\"]([^'\"]+)['\"]", "package_not_found"),
+            (r"opencv.*?not found", "opencv_not_found"),
+            (r"cv2.*?not found", "opencv_not_found"),
+            (r"pip.*?not found", "pip_not_found"),
+            (r"command not found.*?['\"]([^'\"]+)['\"]", "command_not_found"),
+            (r"Error.*?([A-Za-z0-9_-]+).*?not found", "generic_not_found"),
+        ]
+        
+        for pattern, error_type in error_patterns:
+            match = re.search(pattern, output_text, re.IGNORECASE | re.DOTALL)
+            if match:
+                if error_type in ["syntax_error", "runtime_error"]:
+                    # Syntax veya runtime hatası için dosya yolu ve satır numarasını al
+                    file_path = match.group(1) if match.groups() else None
+                    line_num = match.group(2) if len(match.groups()) > 1 else None
+                    
+                    return {
+                        "error_type": error_type,
+                        "file_path": file_path,
+                        "line_number": int(line_num) if line_num and line_num.isdigit() else None,
+                        "error_text": match.group(0),
+                        "full_output": output_text[-1000:]  # Hatalar için daha fazla context
+                    }
+                else:
+                    # Diğer hata türleri
+                    module_name = match.group(1) if match.groups() else None
+                    if error_type == "opencv_not_found" or (module_name and module_name == "cv2"):
+                        module_name = "cv2"  # cv2 olarak işaretle, fix_error_with_ai'de opencv-python'a çevrilecek
+                    elif error_type == "module_not_found" and module_name:
+                        # Modül adını olduğu gibi bırak, fix_error_with_ai'de dönüştürülecek
+                        pass
+                    
+                    return {
+                        "error_type": error_type,
+                        "module_name": module_name,
+                        "error_text": match.group(0),
+                        "full_output": output_text[-500:]  # Son 500 karakter
+                    }
+        
+        return None
+    
+    def fix_syntax_error(error_info: Dict[str, Any], working_dir: Optional[str] = None) -> bool:
+        """Syntax veya runtime hatasını AI ile düzelt ve dosyaya yaz"""
+        file_path = error_info.get('file_path')
+        line_number = error_info.get('line_number')
+        error_text = error_info.get('error_text', '')
+        full_output = error_info.get('full_output', '')
+        
+        if not file_path:
+            console.print("[rgb(167,199,231)]Could not determine file path from error[/rgb(167,199,231)]")
+            return False
+        
+        # Dosya yolunu düzelt (relative path ise working_dir ile birleştir)
+        if not os.path.isabs(file_path) and working_dir:
+            file_path = os.path.join(working_dir, file_path)
+        
+        # Normalize path
+        file_path = os.path.normpath(file_path)
+        
+        # Bu dosya daha önce düzeltildi mi kontrol et
+        if file_path in fixed_files:
+            # Dosya düzeltildikten sonra değişmiş mi kontrol et
+            try:
+                current_mtime = os.path.getmtime(file_path)
+                if current_mtime <= fixed_files[file_path]:
+                    # Dosya düzeltildikten sonra değişmemiş, yeni hata gelene kadar bekle
+                    return False
+            except:
+                pass
+        
+        if not os.path.exists(file_path):
+            console.print(f"[rgb(167,199,231)]File not found: {file_path}[/rgb(167,199,231)]")
+            return False
+        
+        try:
+            # Dosyayı oku
+            with open(file_path, 'r', encoding='utf-8') as f:
+                file_content = f.read()
+            
+            error_type = error_info.get('error_type', 'syntax_error')
+            error_name = "Runtime error" if error_type == "runtime_error" else "Syntax error"
+            
+            console.print()
+            console.print(f"[rgb(167,199,231)]Detected {error_name.lower()} in:[/rgb(167,199,231)] [white]{file_path}[/white]")
+            if line_number:
+                console.print(f"[rgb(167,199,231)]Line:[/rgb(167,199,231)] [white]{line_number}[/white]")
+            console.print()
+            
+            # AI'ya gönder - daha detaylı ve net prompt
+            error_type_name = "runtime error" if error_info.get('error_type') == "runtime_error" else "syntax error"
+            
+            problem_desc = f"""You are a Python code fixer. Fix the {error_type_name} in the following Python code.
+
+ERROR DETAILS:
+- File: {file_path}
+- Line: {line_number if line_number else 'Unknown'}
+- Error message: {error_text}
+
+FULL ERROR OUTPUT:
+{full_output[:800]}
+
+CURRENT CODE (with error):
+{file_content}
+
+INSTRUCTIONS:
+1. Identify the exact {error_type_name} in the code
+2. Fix ONLY the error - do not change the logic or functionality unnecessarily
+3. Return the COMPLETE corrected code
+4. Do NOT include any explanations, comments, or markdown formatting
+5. Return ONLY the Python code, nothing else
+
+IMPORTANT: Return the entire fixed file content, not just the fixed line.
+"""
+            
+            # Progress bar ile AI isteği gönder
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[rgb(167,199,231)]Analyzing with AI...[/rgb(167,199,231)]"),
+                BarColumn(),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                console=console
+            ) as progress:
+                task = progress.add_task("", total=100)
+                
+                # AI isteğini thread'de çalıştır
+                import threading
+                ai_response = [None]
+                ai_exception = [None]
+                
+                def make_request():
+                    try:
+                        ai_response[0] = agent_analyze(
+                            {
+                                "problem_description": problem_desc,
+                                "context": {
+                                    "error_type": "syntax_error",
+                                    "file_path": file_path,
+                                    "line_number": line_number,
+                                    "error_text": error_text
+                                },
+                                "auto_apply": False
+                            },
+                            timeout=180
+                        )
+                    except Exception as e:
+                        ai_exception[0] = e
+                
+                # Request thread'ini başlat
+                request_thread = threading.Thread(target=make_request, daemon=True)
+                request_thread.start()
+                
+                # Progress bar'ı güncelle
+                elapsed = 0
+                while request_thread.is_alive():
+                    time.sleep(0.1)
+                    elapsed += 0.1
+                    # Progress'i simüle et (0-90% arası)
+                    progress_value = min(90, int(elapsed * 2))
+                    progress.update(task, completed=progress_value)
+                
+                # Thread bitene kadar bekle
+                request_thread.join()
+                
+                # Son %10'u tamamla
+                progress.update(task, completed=100)
+                
+                if ai_exception[0]:
+                    raise ai_exception[0]
+                
+                ai_res = ai_response[0]
+            
+            if ai_res.status_code == 200:
+                ai_result = ai_res.json()
+                analysis = ai_result.get("analysis", "")
+                
+                # Kod düzeltme işlemi için progress bar
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[rgb(167,199,231)]Processing fixed code...[/rgb(167,199,231)]"),
+                    BarColumn(),
+                    TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                    console=console
+                ) as progress:
+                    task = progress.add_task("", total=100)
+                    
+                    # AI'dan düzeltilmiş kodu çıkar
+                    progress.update(task, completed=10)
+                    fixed_code = analysis
+                    
+                    # Markdown code block'larını temizle
+                    progress.update(task, completed=30)
+                    if "```python" in fixed_code:
+                        # ```python ile başlayan blokları bul
+                        parts = fixed_code.split("```python")
+                        if len(parts) > 1:
+                            fixed_code = parts[1].split("```")[0]
+                    elif "```" in fixed_code:
+                        # Genel ``` blokları
+                        parts = fixed_code.split("```")
+                        if len(parts) > 1:
+                            # İlk ``` bloğunu al (genellikle kod bloğu)
+                            fixed_code = parts[1]
+                            if "```" in fixed_code:
+                                fixed_code = fixed_code.split("```")[0]
+                    
+                    # Başta/sonda boşlukları ve gereksiz açıklamaları temizle
+                    progress.update(task, completed=50)
+                    fixed_code = fixed_code.strip()
+                    
+                    # Eğer hala açıklama içeriyorsa, sadece kod kısmını al
+                    # Python kodunun başlangıcını bul (import, def, class, #! gibi)
+                    lines = fixed_code.split('\n')
+                    code_start = 0
+                    for i, line in enumerate(lines):
+                        stripped = line.strip()
+                        # Python kodunun başlangıcı olabilecek satırlar
+                        if stripped and (stripped.startswith('#!') or 
+                                       stripped.startswith('import ') or 
+                                       stripped.startswith('from ') or
+                                       stripped.startswith('def ') or
+                                       stripped.startswith('class ') or
+                                       stripped.startswith('"""') or
+                                       stripped.startswith("'''") or
+                                       (stripped[0].isalpha() and not stripped.startswith('Here') and not stripped.startswith('The') and not stripped.startswith('This'))):
+                            code_start = i
+                            break
+                    
+                    progress.update(task, completed=70)
+                    if code_start > 0:
+                        fixed_code = '\n'.join(lines[code_start:])
+                    
+                    # Son kontrol: eğer çok kısa ise veya Python kodu gibi görünmüyorsa, orijinal analizi kullan
+                    if fixed_code and len(fixed_code) > 50:  # Minimum uzunluk kontrolü
+                        # Dosyaya yaz
+                        progress.update(task, completed=90)
+                        with open(file_path, 'w', encoding='utf-8') as f:
+                            f.write(fixed_code)
+                        
+                        progress.update(task, completed=100)
+                        
+                        # Düzeltilen dosyayı kaydet
+                        fixed_files[file_path] = os.path.getmtime(file_path)
+                        
+                        error_type = error_info.get('error_type', 'syntax_error')
+                        error_name = "Runtime error" if error_type == "runtime_error" else "Syntax error"
+                        
+                        console.print()
+                        console.print(f"[rgb(167,199,231)]{error_name} fixed! File updated: {file_path}[/rgb(167,199,231)]")
+                        console.print()
+                        return True
+                    else:
+                        progress.update(task, completed=100)
+                        console.print()
+                        console.print("[rgb(167,199,231)]AI did not return valid code. Manual fix required.[/rgb(167,199,231)]")
+                        return False
+            else:
+                console.print()
+                console.print(f"[rgb(167,199,231)]AI analysis failed with status {ai_res.status_code}[/rgb(167,199,231)]")
+                return False
+                
+        except Exception as e:
+            console.print()
+            console.print(f"[rgb(167,199,231)]Error fixing syntax: {e}[/rgb(167,199,231)]")
+            return False
+    
+    def guess_pip_package(module_name: str) -> str:
+        """Python modül adından pip paket adını tahmin et (lokal heuristic)"""
+        package_name = module_name
+        if module_name.startswith("cv2"):
+            package_name = "opencv-python"
+        elif module_name.startswith("PIL"):
+            package_name = "Pillow"
+        elif module_name.startswith("sklearn"):
+            package_name = "scikit-learn"
+        elif module_name.startswith("yaml"):
+            package_name = "pyyaml"
+        elif module_name.startswith("bs4"):
+            package_name = "beautifulsoup4"
+        elif module_name.startswith("lxml"):
+            package_name = "lxml"
+        elif module_name.startswith("requests"):
+            package_name = "requests"
+        elif module_name.startswith("numpy"):
+            package_name = "numpy"
+        elif module_name.startswith("pandas"):
+            package_name = "pandas"
+        elif module_name.startswith("matplotlib"):
+            package_name = "matplotlib"
+        return package_name
+    
+    def fix_error_with_ai(error_info: Dict[str, Any], working_dir: Optional[str] = None) -> Optional[str]:
+        """AI ile hatayı düzelt - önce basit fix'leri dene, sonra AI'ya git"""
+        error_type = error_info.get('error_type')
+        module_name = error_info.get('module_name')
+        
+        # Syntax ve runtime hataları için özel işlem (kod düzeltme gerektirir)
+        if error_type in ["syntax_error", "runtime_error"]:
+            # Syntax veya runtime hatasını düzelt (dosyaya yazılır, komut döndürülmez)
+            success = fix_syntax_error(error_info, working_dir)
+            return "FIXED" if success else None  # Hata düzeltildi, komut döndürülmez
+        
+        # Basit hatalar için direkt fix komutları (AI'ya gitmeden)
+        if error_type in ["module_not_found", "package_not_found", "opencv_not_found"]:
+            if module_name:
+                # Direkt fix komutu döndür (AI'ya gitmeden)
+                return f"pip install {guess_pip_package(module_name)}"
+        
+        # Daha karmaşık hatalar için AI'ya git
+        try:
+            error_desc = f"Error detected: {error_info.get('error_text', 'Unknown error')}"
+            if module_name:
+                error_desc += f"\nMissing module/package: {module_name}"
+            
+            context = {
+                "error_type": error_type,
+                "module_name": module_name,
+                "working_directory": working_dir,
+                "output": error_info.get('full_output', '')
+            }
+            
+            console.print("[dim]🤔 Analyzing error with AI (this may take a moment)...[/dim]")
+            
+            # AI'ya sor - circuit breaker açıksa hemen fallback'e düşer
+            ai_res = agent_analyze(
+                {
+                    "problem_description": f"Fix this error automatically:\n\n{error_desc}\n\nContext: {context}",
+                    "context": context,
+                    "auto_apply": False
+                },
+                timeout=120  # 60 saniyeden 120 saniyeye çıkarıldı
+            )
+            
+            if ai_res.status_code == 200:
+                ai_result = ai_res.json()
+                analysis = ai_result.get("analysis", "")
+                
+                # AI'dan komut çıkar (pip install gibi)
+                if "pip install" in analysis.lower():
+                    # pip install komutunu bul
+                    pip_match = re.search(r"pip install\s+([^\s\n]+)", analysis, re.IGNORECASE)
+                    if pip_match:
+                        package = pip_match.group(1)
+                        return f"pip install {package}"
+                
+                # Eğer module_name varsa, direkt pip install dene
+                if module_name:
+                    return f"pip install {module_name}"
+            
+            return None
+        except CircuitOpenError:
+            console.print("[dim]AI service is temporarily unavailable. Using fallback fix...[/dim]")
+            return f"pip install {guess_pip_package(module_name)}" if module_name else None
+        except requests.exceptions.Timeout:
+            console.print("[dim]AI analysis timed out. Using fallback fix...[/dim]")
+            # Timeout olursa basit fix'i dene
+            return f"pip install {guess_pip_package(module_name)}" if module_name else None
+        except Exception as e:
+            console.print(f"[dim]AI analysis error: {e}[/dim]")
+            console.print("[dim]Using fallback fix...[/dim]")
+            # Hata olursa basit fix'i dene
+            return f"pip install {guess_pip_package(module_name)}" if module_name else None
+    
+    def execute_fix_command(command: str, working_dir: Optional[str] = None) -> bool:
+        """Düzeltme komutunu mevcut terminal üzerinden çalıştır ve çıktıları gerçek zamanlı göster"""
+        try:
+            console.print()
+            console.print(f"[rgb(167,199,231)]Executing fix command:[/rgb(167,199,231)] [white]{command}[/white]")
+            if working_dir:
+                console.print(f"[rgb(167,199,231)]Working directory:[/rgb(167,199,231)] [white]{working_dir}[/white]")
+            console.print()
+            console.print("[rgb(167,199,231)]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/rgb(167,199,231)]")
+            console.print()
+            
+            is_windows = platform.system() == "Windows"
+            
+            if is_windows:
+                # Windows için PowerShell komutu
+                if working_dir:
+                    # Önce dizine git, sonra komutu çalıştır
+                    full_command = f'cd /d "{working_dir}" && {command}'
+                else:
+                    full_command = command
+                
+                # Komutu gerçek zamanlı çıktı ile çalıştır
+                process = subprocess.Popen(
+                    full_command,
+                    shell=True,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    bufsize=1,
+                    universal_newlines=True,
+                    cwd=working_dir if working_dir else None
+                )
+            else:
+                # macOS/Linux için bash ile çalıştır
+                if working_dir:
+                    # Önce dizine git, sonra komutu çalıştır
+                    full_command = f'cd "{working_dir}" && {command}'
+                else:
+                    full_command = command
+                
+                # Komutu gerçek zamanlı çıktı ile çalıştır
+                process = subprocess.Popen(
+                    full_command,
+                    shell=True,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    bufsize=1,
+                    universal_newlines=True,
+                    cwd=working_dir if working_dir else None,
+                    executable='/bin/bash'
+                )
+            
+            # Gerçek zamanlı çıktı oku ve göster
+            output_lines = []
+            while True:
+                output = process.stdout.readline()
+                if output == '' and process.poll() is not None:
+                    break
+                if output:
+                    output_line = output.strip()
+                    if output_line:
+                        # Çıktıyı direkt terminale yazdır
+                        console.print(f"[white]{output_line}[/white]")
+                        output_lines.append(output_line)
+            
+            # Process'in bitmesini bekle
+            return_code = process.poll()
+            
+            console.print()
+            console.print("[rgb(167,199,231)]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/rgb(167,199,231)]")
+            
+            if return_code == 0:
+                console.print()
+                console.print("[rgb(167,199,231)]Fix command completed successfully![/rgb(167,199,231)]")
+                return True
+            else:
+                console.print()
+                console.print(f"[rgb(167,199,231)]Fix command failed with exit code {return_code}[/rgb(167,199,231)]")
+                return False
+                
+        except Exception as e:
+            console.print()
+            console.print(f"[rgb(167,199,231)]Error executing fix: {e}[/rgb(167,199,231)]")
+            return False
+    
+    # Dosyayı izle
+    try:
+        # Dosya oluşturulana kadar bekle
+        max_wait = 30
+        waited = 0
+        while not os.path.exists(script_file) and waited < max_wait:
+            time.sleep(1)
+            waited += 1
+        
+        if not os.path.exists(script_file):
+            console.print(f"[rgb(167,199,231)]Log file not created. Make sure you ran the command.[/rgb(167,199,231)]")
+            return
+        
+        console.print("[white]Monitoring started![/white]")
+        console.print()
+        
+        # lines=True: iki okuma arasında bölünen satır tamamlanınca tek satır olarak gelir
+        with FileTailer(lines=True) as tailer:
+            tailer.add(script_file)
+            while True:
+                try:
+                    for _, new_content in tailer.poll():
+                        lines = new_content.splitlines()
+                        for line in lines:
+                            if line.strip():
+                                # ANSI escape kodlarını temizle
+                                line_clean = re.sub(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])', '', line.rstrip())
+                                
+                                if line_clean.strip():
+                                    console.print(f"[dim]{line_clean}[/dim]")
+                                    log_buffer.append(line_clean)
+                                    
+                                    # Çalışma dizinini tespit et (cd komutlarından)
+                                    cd_match = re.search(r'cd\s+([^\s\n]+)', line_clean, re.IGNORECASE)
+                                    if cd_match:
+                                        current_directory = cd_match.group(1)
+                                    
+                                    # Komut tespiti - log_buffer'dan son çalıştırılan komutu tespit et
+                                    # Son 20 satırı kontrol et (komutlar genellikle hata öncesinde görünür)
+                                    recent_lines_for_command = log_buffer.tail_lines(20)
+                                    recent_output_for_command = "\n".join(recent_lines_for_command) + "\n" + line_clean
+                                    detected_command = detect_command_in_output(recent_output_for_command)
+                                    if detected_command:
+                                        last_command = detected_command
+                                        last_command_time = time.time()
+                                    
+                                    # Hata tespiti - son birkaç satırı birlikte kontrol et (syntax hataları çok satırlı olabilir)
+                                    # Son 10 satırı birleştir ve kontrol et
+                                    recent_lines = log_buffer.tail_lines(10)
+                                    recent_output = "\n".join(recent_lines) + "\n" + line_clean
+                                    
+                                    error_info = detect_error_in_output(recent_output)
+                                    if error_info:
+                                        # KRİTİK: AI isteği devam ediyorsa HİÇBİR ŞEY YAPMA
+                                        if ai_request_in_progress:
+                                            continue
+                                        
+                                        error_type = error_info.get('error_type')
+                                        file_path = error_info.get('file_path')
+                                        line_number = error_info.get('line_number', '')
+                                        error_text = error_info.get('error_text', '')[:150]  # İlk 150 karakter
+                                        
+                                        # Dosya yolunu normalize et
+                                        if file_path:
+                                            if not os.path.isabs(file_path) and current_directory:
+                                                file_path = os.path.normpath(os.path.join(current_directory, file_path))
+                                            else:
+                                                file_path = os.path.normpath(file_path)
+                                        
+                                        # Hatanın unique string'ini oluştur (hash YOK, direkt string)
+                                        error_key = f"{error_type}|||{file_path or ''}|||{line_number}|||{error_text}"
+                                        
+                                        # Bu hata daha önce işlendi mi? (LOGDA KALSA BİLE TEKRAR İŞLEME)
+                                        if error_key in processed_errors:
+                                            continue  # Bu hata zaten işlendi, LOGDA KALSA BİLE TEKRAR İŞLEME
+                                        
+                                        # HEMEN İŞARETLE - LOGDA KALSA BİLE TEKRAR İŞLENMESİN
+                                        processed_errors.add(error_key)  # Set'e ekle
+                                        ai_request_in_progress = True  # API İSTEĞİ BAŞLADI
+                                        
+                                        error_count += 1
+                                        console.print()
+                                        
+                                        # Syntax ve runtime hataları için özel mesaj
+                                        if error_type in ["syntax_error", "runtime_error"]:
+                                            error_name = "Runtime Error" if error_type == "runtime_error" else "Syntax Error"
+                                            console.print(f"[rgb(167,199,231)]{error_name} #{error_count} detected:[/rgb(167,199,231)]")
+                                            console.print(f"[white]{error_text[:200]}[/white]")
+                                            console.print()
+                                            
+                                            # Hatayı AI ile düzelt
+                                            try:
+                                                result = fix_error_with_ai(error_info, current_directory)
+                                                if result == "FIXED":
+                                                    console.print(f"[rgb(167,199,231)]{error_name.lower()} fixed automatically![/rgb(167,199,231)]")
+                                                    
+                                                    # Hata düzeltildi, komutu yeniden başlat
+                                                    if last_command and last_command_time:
+                                                        # Son komut 30 saniye içinde çalıştırıldıysa yeniden başlat
+                                                        if time.time() - last_command_time < 30:
+                                                            console.print()
+                                                            console.print(f"[rgb(167,199,231)]Error fixed! Restarting command...[/rgb(167,199,231)]")
+                                                            restart_command(last_command, current_directory)
+                                                            # Komut yeniden başlatıldı, zamanı güncelle
+                                                            last_command_time = time.time()
+                                            except Exception as e:
+                                                console.print(f"[dim]Error during fix: {e}[/dim]")
+                                            finally:
+                                                # CEVAP GELDİ - ARTIK YENİ İSTEK GÖNDERİLEBİLİR
+                                                ai_request_in_progress = False
+                                        else:
+                                            console.print(f"[rgb(167,199,231)]Error #{error_count} detected: {error_info.get('error_text', 'Unknown')[:200]}[/rgb(167,199,231)]")
+                                            
+                                            # AI ile düzeltme komutu al
+                                            fix_command = fix_error_with_ai(error_info, current_directory)
+                                            
+                                            if fix_command:
+                                                console.print(f"[white]Fixing: {fix_command}[/white]")
+                                                
+                                                # Düzeltme komutunu çalıştır
+                                                if execute_fix_command(fix_command, current_directory):
+                                                    console.print(f"[rgb(167,199,231)]Fix command executed successfully[/rgb(167,199,231)]")
+                                                    
+                                                    # Hata düzeltildi, komutu yeniden başlat
+                                                    if last_command and last_command_time:
+                                                        # Son komut 30 saniye içinde çalıştırıldıysa yeniden başlat
+                                                        if time.time() - last_command_time < 30:
+                                                            console.print()
+                                                            console.print(f"[rgb(167,199,231)]Error fixed! Restarting command...[/rgb(167,199,231)]")
+                                                            restart_command(last_command, current_directory)
+                                                            # Komut yeniden başlatıldı, zamanı güncelle
+                                                            last_command_time = time.time()
+                                                else:
+                                                    console.print(f"[rgb(167,199,231)]Failed to execute fix command[/rgb(167,199,231)]")
+                                            else:
+                                                console.print(f"[rgb(167,199,231)]Could not determine fix command[/rgb(167,199,231)]")
+                                        
+                                        console.print()
+                
+                except (IOError, OSError):
+                    time.sleep(0.5)
+                    continue
+                except Exception as e:
+                    console.print(f"[dim]Error: {e}[/dim]")
+                    time.sleep(0.5)
+                    continue
+    
+    except KeyboardInterrupt:
+        console.print()
+        console.print("[rgb(167,199,231)] Full-Agent Mode stopped[/rgb(167,199,231)]")
+        console.print(f"[rgb(167,199,231)]Total errors detected and fixed: {error_count}[/rgb(167,199,231)]")
+        console.print(f"[dim]Log file: {script_file}[/dim]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)] Error: {e}[/rgb(167,199,231)]")
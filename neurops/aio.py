@@ -0,0 +1,207 @@
+"""Asyncio API istemcisi - birden fazla kaynağı sınırlı paralellikle aynı anda çeker"""
+
+import os
+import asyncio
+import functools
+import threading
+import concurrent.futures
+from typing import Any, Dict, Optional
+
+import requests
+
+from neurops.config import get_api_headers
+from neurops.api import agent_analyze, api_get_cached, api_request, check_api_connection, get_response_cache_mode
+
+
+API_MAX_CONCURRENCY = max(1, int(os.getenv("NEUROPS_API_MAX_CONCURRENCY", "4") or "4"))
+
+class DaemonThreadExecutor(concurrent.futures.Executor):
+    """
+    Her işi ayrı bir daemon thread'de çalıştıran executor.
+    ThreadPoolExecutor thread'leri süreç çıkışında join edilir; arka plan
+    işlerinde (bootstrap) askıda kalan bir istek çıkışı geciktirmesin diye kullanılır.
+    """
+
+    def submit(self, fn, *args, **kwargs):
+        future = concurrent.futures.Future()
+        
+        def run():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+        
+        threading.Thread(target=run, daemon=True).start()
+        return future
+
+
+class AsyncApiClient:
+    """
+    Backend endpoint'lerinin asyncio karşılıkları.
+    İstekler paylaşılan pooled session üzerinden executor thread'lerinde çalışır,
+    aynı anda uçuşta olan istek sayısı semaphore ile sınırlanır.
+    Event loop içinde oluşturulmalıdır (run_async ile kullanın).
+    """
+
+    def __init__(self, max_concurrency: int = API_MAX_CONCURRENCY,
+                 executor: Optional[concurrent.futures.Executor] = None):
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._executor = executor  # None: event loop'un varsayılan executor'ı
+
+    async def run(self, func, *args, **kwargs):
+        """Senkron bir fonksiyonu concurrency limiti altında executor'da çalıştırır"""
+        loop = asyncio.get_running_loop()
+        async with self._semaphore:
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def request(self, method: str, path: str, **kwargs) -> requests.Response:
+        return await self.run(api_request, method, path, **kwargs)
+
+    async def get(self, path: str, **kwargs) -> requests.Response:
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs) -> requests.Response:
+        return await self.request("POST", path, **kwargs)
+
+    async def gather(self, calls: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        {isim: coroutine} sözlüğünü eşzamanlı çalıştırır.
+        Sonuç aynı isimlerle döner; hata veren çağrının değeri exception nesnesidir.
+        """
+        names = list(calls.keys())
+        results = await asyncio.gather(*calls.values(), return_exceptions=True)
+        return dict(zip(names, results))
+
+    # Health
+    async def health(self, timeout: float = 5) -> requests.Response:
+        return await self.get("/health", timeout=timeout, retries=0)
+
+    # Incident endpoint'leri
+    async def list_incidents(self, params: Optional[dict] = None) -> requests.Response:
+        return await self.run(api_get_cached, "/incident/", params=params or {}, headers=get_api_headers())
+
+    async def get_incident(self, incident_id: str) -> requests.Response:
+        return await self.get(f"/incident/{incident_id}")
+
+    async def incident_stats(self) -> requests.Response:
+        return await self.run(api_get_cached, "/incident/stats/summary")
+
+    # Workflow endpoint'leri
+    async def list_workflows(self) -> requests.Response:
+        return await self.run(api_get_cached, "/workflow/")
+
+    async def get_workflow(self, name: str) -> requests.Response:
+        return await self.run(api_get_cached, f"/workflow/{name}")
+
+    async def list_workflow_runs(self, params: Optional[dict] = None) -> requests.Response:
+        return await self.get("/workflow/runs", params=params or {})
+
+    async def get_workflow_run(self, run_id: str) -> requests.Response:
+        return await self.get(f"/workflow/runs/{run_id}")
+
+    async def register_workflow(self, workflow_data: dict, timeout: float = 5) -> requests.Response:
+        return await self.post("/workflow/register", json=workflow_data, timeout=timeout)
+
+    # Security endpoint'leri
+    async def list_security_events(self, params: Optional[dict] = None) -> requests.Response:
+        return await self.get("/security/events", params=params or {})
+
+    async def get_security_event(self, event_id: str) -> requests.Response:
+        return await self.get(f"/security/events/{event_id}")
+
+    async def security_recommendations(self) -> requests.Response:
+        return await self.run(api_get_cached, "/security/recommendations")
+
+    async def security_stats(self) -> requests.Response:
+        return await self.run(api_get_cached, "/security/stats/summary")
+
+    # Team endpoint'leri
+    async def list_teams(self) -> requests.Response:
+        return await self.run(api_get_cached, "/team/", headers=get_api_headers())
+
+    async def get_team(self, team_id: str) -> requests.Response:
+        return await self.get(f"/team/{team_id}", headers=get_api_headers())
+
+    async def team_members(self, team_id: str) -> requests.Response:
+        return await self.get(f"/team/{team_id}/members", headers=get_api_headers())
+
+    # Agent
+    async def agent_analyze(self, payload: dict, timeout: float = 120) -> requests.Response:
+        return await self.run(agent_analyze, payload, timeout)
+
+def run_async(coro):
+    """Coroutine'i senkron koddan çalıştır (CLI'da aktif event loop yok)"""
+    return asyncio.run(coro)
+
+async def check_api_connection_async(client: AsyncApiClient):
+    """check_api_connection'ın async karşılığı"""
+    return await client.run(check_api_connection)
+
+# Kaynak adı -> AsyncApiClient metodu (argümansız çağrılır)
+RESOURCE_LOADERS = {
+    "incident_stats": "incident_stats",
+    "incidents": "list_incidents",
+    "security_stats": "security_stats",
+    "security_recommendations": "security_recommendations",
+    "workflows": "list_workflows",
+    "teams": "list_teams",
+}
+
+DASHBOARD_RESOURCES = ("incident_stats", "security_stats", "workflows", "teams")
+
+# Alt menü açılınca ekranlarının okuduğu kaynaklar arka planda önceden çekilir
+MENU_RESOURCES = {
+    "incident": ("incident_stats", "incidents"),
+    "security": ("security_stats", "security_recommendations"),
+}
+
+async def fetch_resources_async(client: AsyncApiClient, names) -> Dict[str, Any]:
+    """
+    Verilen kaynakları (bkz. RESOURCE_LOADERS) aynı anda çeker.
+    Değerler: başarılıysa JSON, değilse None.
+    """
+    responses = await client.gather({name: getattr(client, RESOURCE_LOADERS[name])() for name in names})
+    results = {}
+    for name, res in responses.items():
+        if isinstance(res, Exception) or res.status_code != 200:
+            results[name] = None
+            continue
+        try:
+            results[name] = res.json()
+        except ValueError:
+            results[name] = None
+    return results
+
+async def fetch_dashboard_async(client: AsyncApiClient) -> Dict[str, Any]:
+    """Özet ekranları için incident/security/workflow/team verilerini aynı anda çeker"""
+    return await fetch_resources_async(client, DASHBOARD_RESOURCES)
+
+def fetch_dashboard() -> Dict[str, Any]:
+    """fetch_dashboard_async'in senkron sarmalayıcısı"""
+    async def _run():
+        return await fetch_dashboard_async(AsyncApiClient())
+    return run_async(_run())
+
+def prefetch_menu(menu: str) -> Optional[threading.Thread]:
+    """
+    Alt menünün ekranlarının okuyacağı kaynakları (MENU_RESOURCES) arka planda
+    aynı anda çekip yanıt önbelleğine koyar; kullanıcı seçim yaparken istekler
+    biter ve ekranlar önbellekten açılır. Önbellek kapalıysa bir şey yapılmaz.
+    """
+    names = MENU_RESOURCES.get(menu)
+    if not names or get_response_cache_mode() == "off":
+        return None
+    
+    def prefetch():
+        async def _run():
+            return await fetch_resources_async(AsyncApiClient(executor=DaemonThreadExecutor()), names)
+        try:
+            run_async(_run())
+        except Exception:
+            pass  # Ekran kendi isteğini atar
+    
+    thread = threading.Thread(target=prefetch, name=f"neurops-prefetch-{menu}", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,174 @@
+"""
+Monitor'ün analiz tetikleme politikası.
+Sabit aralıklı zamanlayıcı yerine gelen çıktıya göre karar verilir: hata
+satırında beklemeden, çıktı patlamalarında akış durulunca (debounce) veya
+kesintisiz akışta en geç max_delay sonunda analiz istenir. Son analizden
+beri yeni satır yoksa hiç istek atılmaz; dakikadaki istek sayısı bütçeyle
+sınırlanır. Satır gelmeyen sürede dolan süreler zamanlayıcı thread'inde tetiklenir.
+"""
+
+import re
+import time
+import threading
+import collections
+from typing import Callable, Dict, Optional
+
+from neurops.config import load_settings
+from neurops.logbuffer import LogRingBuffer
+from neurops.logscan import ERROR_PATTERN, TRACEBACK_PATTERN
+
+
+BUDGET_WINDOW = 60.0  # Bütçenin sayıldığı pencere (saniye)
+
+# logscan'in byte regex'lerinin metin satırlarına uygulanan hali
+ERROR_LINE_PATTERN = re.compile(ERROR_PATTERN.pattern.decode() + "|" + TRACEBACK_PATTERN.pattern.decode())
+
+# Tetikleme nedenleri
+REASON_ERROR = "error"  # Hata satırı
+REASON_QUIET = "quiet"  # Çıktı debounce süresince durdu
+REASON_MAX_DELAY = "max_delay"  # Çıktı durmadı, en fazla bekleme doldu
+
+
+class AnalysisTrigger:
+    """
+    Satırları tampona ekler ve politikaya göre fire()'ı çağırır.
+    fire tetikleyicinin kilidi altında çağrılır (tampon o sırada değişmez),
+    bu yüzden hızlı olmalıdır (örn. CoalescingWorker.submit).
+    budget_per_minute 0 ise bütçe uygulanmaz. clock monotonic saniye döndürür
+    (testlerde sahte saat verilir).
+    """
+
+    def __init__(self, buffer: LogRingBuffer, fire: Callable[[], None], debounce: float = 1.0,
+                 max_delay: float = 10.0, budget_per_minute: int = 12, on_error: bool = True,
+                 clock: Callable[[], float] = time.monotonic):
+        self.buffer = buffer
+        self.fire = fire
+        self.debounce = max(0.0, debounce)
+        self.max_delay = max(self.debounce, max_delay)
+        self.budget_per_minute = max(0, budget_per_minute)
+        self.on_error = on_error
+        self.clock = clock
+        self.fired = {REASON_ERROR: 0, REASON_QUIET: 0, REASON_MAX_DELAY: 0}
+        self.budget_deferred = 0  # Bütçe dolu olduğu için geciken tetiklemeler
+        self._pending = 0  # Son analizden beri gelen satır sayısı
+        self._first_pending = 0.0
+        self._last_line = 0.0
+        self._last_fire = float("-inf")
+        self._urgent = False
+        self._deferred = False
+        self._fires = collections.deque()  # Son BUDGET_WINDOW içindeki tetikleme zamanları
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._cond = threading.Condition()
+
+    @classmethod
+    def from_settings(cls, buffer: LogRingBuffer, fire: Callable[[], None]) -> "AnalysisTrigger":
+        settings = load_settings()
+        return cls(
+            buffer, fire,
+            debounce=settings["analysis_debounce"],
+            max_delay=settings["analysis_max_delay"],
+            budget_per_minute=settings["analysis_budget_per_minute"],
+            on_error=settings["analysis_on_error"]
+        )
+
+    def add(self, line: str):
+        """Satırı tampona ekler; tetikleme zamanı geldiyse hemen analiz ister"""
+        now = self.clock()
+        with self._cond:
+            self.buffer.append(line)
+            if not self._pending:
+                self._first_pending = now
+            self._pending += 1
+            self._last_line = now
+            if self.on_error and not self._urgent and ERROR_LINE_PATTERN.search(line):
+                self._urgent = True
+            if self._closed:
+                return
+            due = self._due(now)
+            if due <= now:
+                self._fire(now)
+            elif self._thread is None:
+                # Thread ilk bekleyen tetiklemede başlar
+                self._thread = threading.Thread(target=self._run, name="neurops-analysis-trigger", daemon=True)
+                self._thread.start()
+            else:
+                self._cond.notify_all()
+
+    def _due(self, now: float) -> float:
+        """Bekleyen satırların analiz zamanı (monotonic); çağıran kilidi tutar"""
+        if self._urgent:
+            # Hata satırı beklemez; yalnızca art arda gelen hatalar debounce ile birleştirilir
+            due = self._last_fire + self.debounce
+        else:
+            due = min(self._last_line + self.debounce, self._first_pending + self.max_delay)
+        if self.budget_per_minute:
+            while self._fires and now - self._fires[0] >= BUDGET_WINDOW:
+                self._fires.popleft()
+            if len(self._fires) >= self.budget_per_minute and self._fires[0] + BUDGET_WINDOW > due:
+                due = self._fires[0] + BUDGET_WINDOW
+                if due > now and not self._deferred:
+                    self._deferred = True
+                    self.budget_deferred += 1
+        return due
+
+    def _fire(self, now: float):
+        if self._urgent:
+            reason = REASON_ERROR
+        elif now >= self._last_line + self.debounce:
+            reason = REASON_QUIET
+        else:
+            reason = REASON_MAX_DELAY
+        self.fired[reason] += 1
+        self._pending = 0
+        self._urgent = False
+        self._deferred = False
+        self._last_fire = now
+        self._fires.append(now)
+        self.fire()
+
+    def _run(self):
+        with self._cond:
+            while not self._closed:
+                if not self._pending:
+                    self._cond.wait()
+                    continue
+                now = self.clock()
+                due = self._due(now)
+                if due <= now:
+                    self._fire(now)
+                else:
+                    self._cond.wait(due - now)
+
+    def check(self) -> bool:
+        """Bekleyen satırların zamanı geldiyse analiz ister; istendiyse True"""
+        with self._cond:
+            if self._closed or not self._pending:
+                return False
+            now = self.clock()
+            if self._due(now) > now:
+                return False
+            self._fire(now)
+            return True
+
+    @property
+    def pending(self) -> int:
+        """Son analizden beri eklenen satır sayısı"""
+        with self._cond:
+            return self._pending
+
+    def close(self):
+        """Zamanlayıcıyı durdurur; bekleyen satırlar için analiz istenmez"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "fired": sum(self.fired.values()),
+                "on_error": self.fired[REASON_ERROR],
+                "on_quiet": self.fired[REASON_QUIET],
+                "on_max_delay": self.fired[REASON_MAX_DELAY],
+                "budget_deferred": self.budget_deferred
+            }
@@ -0,0 +1,102 @@
+"""
+Monitor'ün arka plan analiz kuyruğu.
+Her aşama (log analizi, AI analizi) tek bir worker thread'inde çalışır: aynı
+anda en fazla bir istek uçuştadır, bekleyen pencereler sınırlı bir kuyrukta
+tutulur ve kuyruk doluyken gelen yeni pencere en eski bekleyenin yerini alır
+(latest-wins). Yavaş backend'de thread birikmez, aynı sorun için üst üste
+incident açılmaz.
+"""
+
+import collections
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+class CoalescingWorker:
+    """
+    Tek thread'li, sınırlı ve latest-wins iş kuyruğu.
+    Sayaçlar: queue_depth (bekleyen), in_flight, submitted, completed,
+    failed ve dropped (yerini daha yeni pencereye bırakan işler).
+    """
+
+    def __init__(self, func: Callable[..., Any], name: str, max_pending: int = 1):
+        self.func = func
+        self.name = name
+        self.max_pending = max(1, max_pending)
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.dropped = 0
+        self._pending = collections.deque()
+        self._busy = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._cond = threading.Condition()
+
+    def submit(self, *args) -> bool:
+        """İşi kuyruğa ekler (kuyruk doluysa en eski bekleyen düşer); worker kapalıysa False"""
+        with self._cond:
+            if self._closed:
+                return False
+            if len(self._pending) >= self.max_pending:
+                self._pending.popleft()
+                self.dropped += 1
+            self._pending.append(args)
+            self.submitted += 1
+            if self._thread is None:
+                # Thread ilk işte başlar; hiç analiz yapılmayan oturumda açılmaz
+                self._thread = threading.Thread(target=self._run, name=f"neurops-{self.name}-worker", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+        return True
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                args = self._pending.popleft()
+                self._busy = True
+            failed = False
+            try:
+                self.func(*args)
+            except Exception:
+                failed = True
+            with self._cond:
+                if failed:
+                    self.failed += 1
+                else:
+                    self.completed += 1
+                self._busy = False
+                self._cond.notify_all()
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Bekleyen ve çalışan işler bitene kadar bekler; süre dolduysa False"""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def close(self):
+        """Bekleyen işleri düşürür ve thread'i durdurur (çalışan iş tamamlanır)"""
+        with self._cond:
+            self.dropped += len(self._pending)
+            self._pending.clear()
+            self._closed = True
+            self._cond.notify_all()
+
+    @property
+    def queue_depth(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "queue_depth": len(self._pending),
+                "in_flight": int(self._busy),
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "dropped": self.dropped
+            }
@@ -0,0 +1,803 @@
+"""Backend HTTP istemcisi: pooled session, sıkıştırma, yanıt önbelleği ve dayanıklılık katmanı"""
+
+import os
+import json
+import gzip
+import time
+import threading
+import re
+import random
+import collections
+import tempfile
+import hashlib
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from neurops.config import (
+    CONFIG_DIR,
+    DEFAULT_API_URL,
+    get_api_headers,
+    load_api_url,
+    load_settings,
+    normalize_api_url
+)
+
+
+# API URL'ini yükle veya varsayılan kullan ve normalize et
+raw_api_url = os.getenv("NEUROPS_API_URL") or load_api_url() or DEFAULT_API_URL
+API_URL = normalize_api_url(raw_api_url)
+
+def set_api_url(url: str):
+    """
+    Bu oturumun API URL'ini değiştirir (kalıcı kayıt için save_api_url).
+    Diğer modüller URL'yi api.API_URL üzerinden okumalıdır.
+    """
+    global API_URL
+    API_URL = normalize_api_url(url)
+
+# HTTP istemcisi - tüm API çağrıları tek bir pooled, keep-alive session kullanır
+HTTP_POOL_SIZE = max(1, int(os.getenv("NEUROPS_HTTP_POOL_SIZE", "10") or "10"))
+HTTP_KEEP_ALIVE = os.getenv("NEUROPS_HTTP_KEEP_ALIVE", "1").strip().lower() not in ("0", "false", "no", "off")
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+def get_http_session() -> requests.Session:
+    """
+    Paylaşılan HTTP session'ını döndürür (ilk çağrıda oluşturulur).
+    Bağlantı havuzu thread'ler arasında paylaşılır, böylece her istek
+    yeni bir TCP/TLS bağlantısı açmaz.
+    """
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=HTTP_POOL_SIZE,
+                    pool_maxsize=HTTP_POOL_SIZE
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                if not HTTP_KEEP_ALIVE:
+                    session.headers["Connection"] = "close"
+                _http_session = session
+    return _http_session
+
+# Idempotent GET/HEAD istekleri için jitter'lı exponential retry
+HTTP_GET_RETRIES = max(0, int(os.getenv("NEUROPS_HTTP_GET_RETRIES", "2") or "2"))
+HTTP_RETRY_BACKOFF_BASE = 0.25  # saniye
+HTTP_RETRY_BACKOFF_MAX = 4.0
+HTTP_RETRY_STATUS_CODES = (502, 503, 504)
+
+def api_request(method: str, path: str, retries: Optional[int] = None, **kwargs) -> requests.Response:
+    """
+    API isteğini paylaşılan session üzerinden gönderir.
+    path API_URL'e göre relatif ("/incident/") veya tam URL olabilir.
+    GET/HEAD istekleri bağlantı hatası, timeout ve 502/503/504'te tekrar denenir.
+    """
+    url = path if path.startswith(("http://", "https://")) else f"{API_URL}{path}"
+    session = get_http_session()
+    
+    if method.upper() not in ("GET", "HEAD"):
+        try:
+            return session.request(method, url, **kwargs)
+        finally:
+            # Yazma işlemi okuma önbelleğindeki ilgili kayıtları bayatlatır
+            response_cache.invalidate_for_mutation(path, method)
+    
+    attempts = 1 + (HTTP_GET_RETRIES if retries is None else max(0, retries))
+    for attempt in range(attempts):
+        is_last = attempt == attempts - 1
+        try:
+            res = session.request(method, url, **kwargs)
+            if is_last or res.status_code not in HTTP_RETRY_STATUS_CODES:
+                return res
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if is_last:
+                raise
+        # Full jitter: 0 ile üstel üst sınır arasında rastgele bekle
+        time.sleep(random.uniform(0, min(HTTP_RETRY_BACKOFF_MAX, HTTP_RETRY_BACKOFF_BASE * (2 ** attempt))))
+
+def api_get(path: str, **kwargs) -> requests.Response:
+    return api_request("GET", path, **kwargs)
+
+def api_post(path: str, **kwargs) -> requests.Response:
+    return api_request("POST", path, **kwargs)
+
+def api_patch(path: str, **kwargs) -> requests.Response:
+    return api_request("PATCH", path, **kwargs)
+
+def api_put(path: str, **kwargs) -> requests.Response:
+    return api_request("PUT", path, **kwargs)
+
+def api_delete(path: str, **kwargs) -> requests.Response:
+    return api_request("DELETE", path, **kwargs)
+
+# İstek gövdesi sıkıştırma - büyük log yüklemeleri için (opt-in)
+REQUEST_COMPRESSION_MODES = ["off", "auto", "gzip", "zstd"]
+REQUEST_COMPRESSION_MIN_BYTES = 32 * 1024  # Bunun altındaki gövdeler sıkıştırılmaz
+REQUEST_ENCODINGS_TTL = 600  # /health probe sonucunun geçerlilik süresi (saniye)
+REQUEST_ENCODINGS_RETRY = 30  # Probe başarısızsa (bağlantı hatası, 5xx) tekrar denemeden önce
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+_request_encodings = {}  # API URL -> (geçerlilik sonu, backend'in kabul ettiği encoding'ler)
+_rejected_request_encodings = {}  # API URL -> backend'in 415 ile reddettiği encoding'ler
+_request_encodings_lock = threading.Lock()
+
+def get_request_compression_mode() -> str:
+    """NEUROPS_REQUEST_COMPRESSION env'i veya settings'teki request_compression değeri"""
+    mode = (os.getenv("NEUROPS_REQUEST_COMPRESSION") or load_settings().get("request_compression") or "off").strip().lower()
+    return mode if mode in REQUEST_COMPRESSION_MODES else "off"
+
+def get_supported_request_encodings() -> List[str]:
+    """
+    Backend'in istek gövdesinde kabul ettiği Content-Encoding'leri döndürür.
+    /health sorgulanır (RFC 7694 Accept-Encoding yanıt header'ı veya JSON'daki
+    "accept_encoding" alanı), sonuç API URL başına REQUEST_ENCODINGS_TTL boyunca
+    önbellekte kalır. Başarısız probe da (sıkıştırmasız olarak) kısa süre
+    önbelleğe alınır: ulaşılamayan backend'e her yüklemede 5 sn'lik probe yapılmaz,
+    başlangıçtaki geçici bir 503 de sıkıştırmayı kalıcı olarak kapatmaz.
+    """
+    base_url = API_URL
+    now = time.monotonic()
+    with _request_encodings_lock:
+        cached = _request_encodings.get(base_url)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+    
+    encodings = []
+    ttl = REQUEST_ENCODINGS_RETRY
+    try:
+        res = api_get("/health", timeout=5, retries=0)
+        if res.status_code == 200:
+            ttl = REQUEST_ENCODINGS_TTL
+            advertised = res.headers.get("Accept-Encoding", "")
+            if not advertised:
+                try:
+                    body = res.json()
+                    advertised = body.get("accept_encoding", "") if isinstance(body, dict) else ""
+                except ValueError:
+                    advertised = ""
+            if isinstance(advertised, str):
+                advertised = advertised.split(",")
+            encodings = [str(e).split(";")[0].strip().lower() for e in advertised if str(e).strip()]
+    except requests.RequestException:
+        pass
+    
+    with _request_encodings_lock:
+        _request_encodings[base_url] = (now + ttl, encodings)
+    return encodings
+
+def _mark_request_encoding_unsupported(encoding: str):
+    """Backend 415 döndürdüyse bu encoding'i bu API URL için bir daha deneme"""
+    with _request_encodings_lock:
+        _rejected_request_encodings.setdefault(API_URL, set()).add(encoding)
+
+def choose_request_encoding(body_size: int) -> Optional[str]:
+    """Ayara ve backend desteğine göre kullanılacak Content-Encoding (veya None)"""
+    mode = get_request_compression_mode()
+    if mode == "off" or body_size < REQUEST_COMPRESSION_MIN_BYTES:
+        return None
+    
+    local = ["zstd", "gzip"] if zstandard is not None else ["gzip"]
+    rejected = _rejected_request_encodings.get(API_URL, set())
+    if mode == "auto":
+        supported = get_supported_request_encodings()
+        for encoding in local:
+            if encoding in supported and encoding not in rejected:
+                return encoding
+        return None
+    # Zorlanan encoding: probe yapılmaz, lokal olarak mevcutsa ve backend reddetmediyse kullanılır
+    if mode in local and mode not in rejected:
+        return mode
+    return None
+
+def encode_request_body(body: bytes, encoding: str) -> bytes:
+    """Gövdeyi verilen Content-Encoding ile sıkıştır"""
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6)
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(body)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+def api_post_json(path: str, payload: Any, compress: bool = False, **kwargs) -> requests.Response:
+    """
+    JSON gövdesini POST eder. compress=True ise ve ayar/müzakere izin veriyorsa
+    gövde sıkıştırılıp Content-Encoding header'ı ile gönderilir; backend 415
+    dönerse istek sıkıştırmasız tekrarlanır.
+    """
+    headers = dict(kwargs.pop("headers", None) or {})
+    headers["Content-Type"] = "application/json"
+    body = json.dumps(payload).encode("utf-8")
+    
+    encoding = choose_request_encoding(len(body)) if compress else None
+    if encoding:
+        res = api_post(
+            path,
+            data=encode_request_body(body, encoding),
+            headers={**headers, "Content-Encoding": encoding},
+            **kwargs
+        )
+        if res.status_code != 415:
+            return res
+        _mark_request_encoding_unsupported(encoding)
+    
+    return api_post(path, data=body, headers=headers, **kwargs)
+
+# GET yanıt önbelleği - menülerde tekrar tekrar çekilen okuma endpoint'leri için
+RESPONSE_CACHE_MODES = ["off", "memory", "disk"]
+RESPONSE_CACHE_DIR = CONFIG_DIR / "cache" / "responses"
+
+# (path regex, TTL saniye) - ilk eşleşen kural geçerli, TTL None ise önbelleğe alınmaz
+RESPONSE_CACHE_TTLS = [
+    (re.compile(r"^/workflow/runs(/|$)"), None),
+    (re.compile(r"^/workflow/$"), 60),
+    (re.compile(r"^/workflow/[^/]+$"), 300),
+    (re.compile(r"^/security/recommendations$"), 600),
+    (re.compile(r"^/security/stats/summary$"), 30),
+    (re.compile(r"^/incident/stats/summary$"), 30),
+    (re.compile(r"^/incident/$"), 15),
+    (re.compile(r"^/team/$"), 60),
+]
+
+# (mutasyon path regex, etkilenen kaynaklar, HTTP metotları veya None = hepsi) -
+# eşleşen tüm kurallar uygulanır. Yalnızca kayıt oluşturan/değiştiren endpoint'ler
+# listelenir; analiz POST'ları (/security/analyze, /security/scan, /workflow/generate,
+# /logs/analyze) ve önbelleğe alınmayan run'lar (/workflow/run) önbelleğe dokunmaz.
+RESPONSE_CACHE_INVALIDATIONS = [
+    (re.compile(r"^/workflow/register$"), ["workflow"], None),
+    (re.compile(r"^/workflow/[^/]+$"), ["workflow"], {"PUT", "PATCH", "DELETE"}),
+    (re.compile(r"/generate-workflow$"), ["workflow"], None),
+    (re.compile(r"^/incident/(report)?$"), ["incident"], None),
+    (re.compile(r"^/incident/[^/]+(/resolve)?$"), ["incident"], None),
+    (re.compile(r"^/security/events$"), ["security"], None),
+    (re.compile(r"^/team/(create|join)$"), ["team"], None),
+    (re.compile(r"^/team/[^/]+/members(/[^/]+)?$"), ["team"], None),
+]
+RESPONSE_CACHE_MAX_ENTRIES = 256  # Bellekteki en fazla kayıt (LRU)
+
+def get_response_cache_mode() -> str:
+    """NEUROPS_RESPONSE_CACHE env'i veya settings'teki response_cache değeri"""
+    mode = (os.getenv("NEUROPS_RESPONSE_CACHE") or load_settings().get("response_cache") or "memory").strip().lower()
+    return mode if mode in RESPONSE_CACHE_MODES else "memory"
+
+def get_response_cache_ttl(path: str) -> Optional[int]:
+    """Path için TTL (saniye); önbelleğe alınmayacaksa None"""
+    for pattern, ttl in RESPONSE_CACHE_TTLS:
+        if pattern.match(path):
+            return ttl
+    return None
+
+def _relative_api_path(path: str) -> str:
+    """Tam URL'yi API_URL'e göre relatif path'e çevirir"""
+    if path.startswith(API_URL):
+        return path[len(API_URL):] or "/"
+    return path
+
+
+class CachedResponse:
+    """Önbellekten dönen yanıt; çağıranların kullandığı requests.Response alanlarını taşır"""
+
+    from_cache = True
+
+    def __init__(self, entry: dict):
+        self.status_code = entry["status_code"]
+        self.url = entry.get("url", "")
+        self.text = entry["body"]
+        self.content = self.text.encode("utf-8")
+        self.headers = CaseInsensitiveDict({
+            "Content-Type": entry.get("content_type") or "application/json"
+        })
+        if entry.get("etag"):
+            self.headers["ETag"] = entry["etag"]
+        if entry.get("last_modified"):
+            self.headers["Last-Modified"] = entry["last_modified"]
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class ResponseCache:
+    """
+    GET yanıtları için bellek + isteğe bağlı disk önbelleği.
+    TTL dolana kadar yanıt ağa gitmeden döner; dolduktan sonra ETag /
+    Last-Modified ile koşullu istek atılır ve 304 gelirse kayıt tazelenir.
+    Kayıtlar kaynağa göre (workflow, incident, ...) gruplanır; bir mutasyon
+    o kaynağın tüm kayıtlarını siler ve uçuştaki okumaların yazmasını engeller.
+    """
+
+    def __init__(self, directory: Path, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES):
+        self.directory = directory
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()  # key -> entry, en son kullanılan sonda
+        self._generations = collections.Counter()
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def resource(path: str) -> str:
+        return path.strip("/").split("/")[0] or "root"
+
+    def key(self, path: str, params: Optional[dict] = None, headers: Optional[dict] = None) -> str:
+        # Kullanıcıya özel endpoint'ler (/team/) için kimlik de anahtara dahil
+        user_id = (headers or {}).get("X-User-ID", "")
+        raw = json.dumps([API_URL, path, sorted((params or {}).items()), user_id], default=str)
+        return f"{self.resource(path)}-{hashlib.sha256(raw.encode('utf-8')).hexdigest()[:32]}"
+
+    def generation(self, path: str) -> int:
+        with self._lock:
+            return self._generations[self.resource(path)]
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _remember(self, key: str, entry: dict):
+        """Çağıran kilidi tutar; sınır aşılınca en eski kullanılan kayıt düşer"""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def lookup(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is not None or get_response_cache_mode() != "disk":
+            return entry
+        try:
+            with open(self._entry_path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or "body" not in entry:
+            return None
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key]
+            self._remember(key, entry)
+        return entry
+
+    def store(self, key: str, entry: dict, generation: int):
+        """Okuma başladığından beri kaynak geçersiz kılındıysa kaydı yazmaz"""
+        with self._lock:
+            if self._generations[self.resource(entry["path"])] != generation:
+                return
+            self._remember(key, entry)
+        if get_response_cache_mode() != "disk":
+            return
+        tmp_path = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".entry-", suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._entry_path(key))
+        except OSError:
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def invalidate(self, resource: str):
+        """Kaynağın bellek ve disk kayıtlarını siler"""
+        with self._lock:
+            self._generations[resource] += 1
+            for key in [k for k in self._entries if k.startswith(f"{resource}-")]:
+                del self._entries[key]
+        # Mod sonradan disk'e alınırsa bayat kayıt dönmesin diye disk her zaman temizlenir
+        for entry_file in self.directory.glob(f"{resource}-*.json"):
+            try:
+                entry_file.unlink()
+            except OSError:
+                pass
+
+    def invalidate_for_mutation(self, path: str, method: str = "POST"):
+        path = _relative_api_path(path)
+        method = method.upper()
+        resources = set()
+        for pattern, affected, methods in RESPONSE_CACHE_INVALIDATIONS:
+            if (methods is None or method in methods) and pattern.search(path):
+                resources.update(affected)
+        for resource in resources:
+            self.invalidate(resource)
+
+    def clear(self):
+        with self._lock:
+            for resource in {k.split("-", 1)[0] for k in self._entries}:
+                self._generations[resource] += 1
+            self._entries.clear()
+        for entry_file in self.directory.glob("*.json"):
+            try:
+                entry_file.unlink()
+            except OSError:
+                pass
+
+
+response_cache = ResponseCache(RESPONSE_CACHE_DIR)
+
+def api_get_cached(path: str, params: Optional[dict] = None, headers: Optional[dict] = None, **kwargs):
+    """
+    Önbellekli GET. TTL içindeyse ağa gidilmez; süresi dolmuş kayıt
+    koşullu istekle doğrulanır. RESPONSE_CACHE_TTLS'te kuralı olmayan
+    path'ler ve önbellek kapalıyken doğrudan api_get kullanılır.
+    """
+    ttl = get_response_cache_ttl(path)
+    if ttl is None or get_response_cache_mode() == "off":
+        return api_get(path, params=params, headers=headers, **kwargs)
+    
+    key = response_cache.key(path, params, headers)
+    generation = response_cache.generation(path)
+    entry = response_cache.lookup(key)
+    if entry and entry.get("expires_at", 0) > time.time():
+        return CachedResponse(entry)
+    
+    request_headers = dict(headers or {})
+    if entry:
+        if entry.get("etag"):
+            request_headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            request_headers["If-Modified-Since"] = entry["last_modified"]
+    
+    res = api_get(path, params=params, headers=request_headers, **kwargs)
+    if res.status_code == 304 and entry:
+        entry = dict(entry, expires_at=time.time() + ttl)
+        response_cache.store(key, entry, generation)
+        return CachedResponse(entry)
+    if res.status_code == 200:
+        response_cache.store(key, {
+            "path": path,
+            "url": res.url,
+            "status_code": 200,
+            "body": res.text,
+            "content_type": res.headers.get("Content-Type"),
+            "etag": res.headers.get("ETag"),
+            "last_modified": res.headers.get("Last-Modified"),
+            "expires_at": time.time() + ttl
+        }, generation)
+    return res
+
+# Analiz sonucu önbelleği - monitor'ün örtüşen pencereleri ve tekrarlanan problem analizleri
+# aynı gövdeyi tekrar gönderir; aynı içerik TTL içinde ağa ve modele gitmeden yanıtlanır
+ANALYSIS_CACHE_MODES = ["off", "memory", "disk"]
+ANALYSIS_CACHE_DIR = CONFIG_DIR / "cache" / "analysis"
+ANALYSIS_CACHE_MEMORY_BYTES = max(0, int(os.getenv("NEUROPS_ANALYSIS_CACHE_MEMORY_BYTES", str(16 * 1024 * 1024)) or "0"))
+ANALYSIS_CACHE_DISK_BYTES = max(0, int(os.getenv("NEUROPS_ANALYSIS_CACHE_DISK_BYTES", str(128 * 1024 * 1024)) or "0"))
+ANALYSIS_CACHE_ENTRY_OVERHEAD = 512  # Bellek bütçesinde kayıt başına sayılan sabit maliyet
+
+def get_analysis_cache_mode() -> str:
+    """NEUROPS_ANALYSIS_CACHE env'i veya settings'teki analysis_cache değeri"""
+    mode = (os.getenv("NEUROPS_ANALYSIS_CACHE") or load_settings().get("analysis_cache") or "disk").strip().lower()
+    return mode if mode in ANALYSIS_CACHE_MODES else "disk"
+
+def get_analysis_cache_ttl() -> int:
+    """NEUROPS_ANALYSIS_CACHE_TTL env'i veya settings'teki analysis_cache_ttl (saniye)"""
+    try:
+        return max(0, int(os.getenv("NEUROPS_ANALYSIS_CACHE_TTL") or load_settings().get("analysis_cache_ttl") or 0))
+    except ValueError:
+        return 0
+
+
+class AnalysisCache:
+    """
+    İçerik adresli analiz sonucu önbelleği: anahtar API URL, path, kullanıcı ve
+    kanonik JSON gövdenin sha256'sıdır. Bellekte byte bütçeli LRU; disk
+    katmanında dosyalar son kullanım zamanına (mtime) göre bütçeye indirilir.
+    TTL okuma anında kaydın yaşına uygulanır, ayar değişince eski kayıtlara da geçer.
+    """
+
+    def __init__(self, directory: Path, memory_bytes: int, disk_bytes: int):
+        self.directory = directory
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self._entries = collections.OrderedDict()  # key -> (entry, size), en son kullanılan sonda
+        self._memory_used = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(path: str, payload: Any, user_id: str = "") -> str:
+        body = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        raw = json.dumps([API_URL, path, user_id]) + body
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _remember(self, key: str, entry: dict):
+        size = len(entry["body"]) + ANALYSIS_CACHE_ENTRY_OVERHEAD
+        if size > self.memory_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._memory_used -= previous[1]
+            self._entries[key] = (entry, size)
+            self._memory_used += size
+            while self._memory_used > self.memory_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._memory_used -= evicted_size
+
+    def lookup(self, key: str, ttl: int, disk: bool) -> Optional[dict]:
+        now = time.time()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                if now - cached[0]["stored_at"] < ttl:
+                    self._entries.move_to_end(key)
+                    return cached[0]
+                del self._entries[key]
+                self._memory_used -= cached[1]
+        if not disk:
+            return None
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            if not isinstance(entry, dict) or "body" not in entry or now - entry.get("stored_at", 0) >= ttl:
+                return None
+            os.utime(entry_path)  # Disk LRU: son kullanım
+        except (OSError, ValueError):
+            return None
+        self._remember(key, entry)
+        return entry
+
+    def store(self, key: str, entry: dict, disk: bool):
+        self._remember(key, entry)
+        if not disk:
+            return
+        tmp_path = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".entry-", suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._entry_path(key))
+        except OSError:
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            return
+        self._trim_disk()
+
+    def _trim_disk(self):
+        """Disk katmanını en uzun süredir kullanılmayan kayıtları silerek bütçeye indirir"""
+        try:
+            files = [(entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                     for entry in os.scandir(self.directory) if entry.name.endswith(".json")]
+        except OSError:
+            return
+        used = sum(size for _, size, _ in files)
+        for _, size, entry_path in sorted(files):
+            if used <= self.disk_bytes:
+                break
+            try:
+                os.unlink(entry_path)
+            except OSError:
+                continue
+            used -= size
+
+    def clear(self) -> int:
+        """Bellek ve disk kayıtlarını siler; silinen disk kaydı sayısını döndürür"""
+        with self._lock:
+            self._entries.clear()
+            self._memory_used = 0
+        removed = 0
+        for entry_file in self.directory.glob("*.json"):
+            try:
+                entry_file.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+
+analysis_cache = AnalysisCache(ANALYSIS_CACHE_DIR, ANALYSIS_CACHE_MEMORY_BYTES, ANALYSIS_CACHE_DISK_BYTES)
+
+# Backend'in model yokken/çevrimdışıyken verdiği yedek yanıtı işaretleyen alanlar
+ANALYSIS_DEGRADED_FLAGS = ("fallback", "offline")
+
+def _is_degraded_analysis(body: str) -> bool:
+    """Yanıt backend'in yedek (fallback/offline) cevabı mı; böyle yanıtlar önbelleğe alınmaz"""
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return False
+    return isinstance(data, dict) and any(data.get(flag) for flag in ANALYSIS_DEGRADED_FLAGS)
+
+def cached_analysis(path: str, payload: dict, send: Callable[[], requests.Response],
+                    headers: Optional[dict] = None):
+    """
+    Analiz POST'unu içerik adresli önbellekten yanıtlar; yoksa send() çağrılır
+    ve 200 yanıt saklanır (backend'in fallback/offline yanıtları hariç). auto_apply istekleri (sunucu tarafında çözüm
+    uygulanır) ve önbellek kapalıyken her zaman gönderilir.
+    """
+    mode = get_analysis_cache_mode()
+    ttl = get_analysis_cache_ttl()
+    if mode == "off" or ttl <= 0 or payload.get("auto_apply"):
+        return send()
+    
+    disk = mode == "disk"
+    key = analysis_cache.key(path, payload, (headers or {}).get("X-User-ID", ""))
+    entry = analysis_cache.lookup(key, ttl, disk)
+    if entry is not None:
+        return CachedResponse(entry)
+    
+    res = send()
+    if res.status_code == 200 and not _is_degraded_analysis(res.text):
+        analysis_cache.store(key, {
+            "path": path,
+            "url": res.url,
+            "status_code": 200,
+            "body": res.text,
+            "content_type": res.headers.get("Content-Type"),
+            "stored_at": time.time()
+        }, disk)
+    return res
+
+def api_post_analysis(path: str, payload: dict, compress: bool = False, **kwargs):
+    """/logs/analyze, /security/analyze gibi analiz endpoint'lerine önbellekli api_post_json"""
+    return cached_analysis(
+        path, payload, lambda: api_post_json(path, payload, compress=compress, **kwargs), kwargs.get("headers")
+    )
+
+def check_api_connection():
+    """
+    API bağlantısını kontrol eder.
+    Returns: (is_connected: bool, message: str)
+    """
+    try:
+        # API URL'ini normalize et
+        normalized_url = normalize_api_url(API_URL)
+        res = api_get(f"{normalized_url}/health", timeout=5, retries=0)
+        if res.status_code == 200:
+            return True, "Connected"
+        else:
+            return False, f"Not Connected (Status: {res.status_code})"
+    except requests.exceptions.ConnectionError:
+        return False, "Not Connected (Connection error)"
+    except requests.exceptions.Timeout:
+        return False, "Not Connected (Timeout)"
+    except Exception as e:
+        return False, f"Not Connected ({str(e)[:30]})"
+
+# Dayanıklılık - endpoint başına circuit breaker ve gözlenen gecikmeden türetilen timeout
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Endpoint'in circuit breaker'ı açıkken istek hiç gönderilmez"""
+
+
+class CircuitBreaker:
+    """
+    closed: istekler normal gider; art arda failure_threshold hata olursa open olur.
+    open: istekler hemen reddedilir; reset_timeout sonra half-open'a geçer.
+    half-open: tek bir deneme isteğine izin verilir; başarılıysa closed, değilse tekrar open.
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open":
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = "half_open"
+                self._probe_in_flight = False
+            # half-open: aynı anda sadece bir deneme isteği
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def retry_after(self) -> float:
+        """Open durumunda bir sonraki denemeye kalan süre (saniye)"""
+        with self._lock:
+            if self.state != "open":
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.state = "open"
+                self.opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+
+class LatencyTracker:
+    """
+    Son başarılı isteklerin sürelerini tutar ve timeout'u yüzdelikten türetir:
+    timeout = p95 * multiplier, [min_timeout, çağıranın verdiği üst sınır] aralığında.
+    Yeterli örnek yokken çağıranın verdiği timeout aynen kullanılır.
+    """
+
+    def __init__(self, window: int = 50, percentile: float = 0.95, multiplier: float = 1.5,
+                 min_timeout: float = 10.0, min_samples: int = 5):
+        self.samples = collections.deque(maxlen=window)
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.min_timeout = min_timeout
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self.samples.append(seconds)
+
+    def timeout(self, max_timeout: float) -> float:
+        with self._lock:
+            if len(self.samples) < self.min_samples:
+                return max_timeout
+            ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile))
+        return max(self.min_timeout, min(max_timeout, ordered[index] * self.multiplier))
+
+
+_endpoint_guards = {}
+_endpoint_guards_lock = threading.Lock()
+
+def get_endpoint_guard(path: str):
+    """Endpoint için (CircuitBreaker, LatencyTracker) çiftini döndürür"""
+    with _endpoint_guards_lock:
+        if path not in _endpoint_guards:
+            _endpoint_guards[path] = (CircuitBreaker(), LatencyTracker())
+        return _endpoint_guards[path]
+
+def api_request_guarded(method: str, path: str, timeout: float, **kwargs) -> requests.Response:
+    """
+    İsteği endpoint'in circuit breaker'ı ve adaptif timeout'u ile gönderir.
+    timeout üst sınırdır; breaker açıksa CircuitOpenError fırlatılır.
+    Bağlantı hataları, timeout'lar ve 5xx yanıtlar hata sayılır.
+    """
+    breaker, latency = get_endpoint_guard(path)
+    if not breaker.allow_request():
+        raise CircuitOpenError(f"{path} is temporarily unavailable (retry in {breaker.retry_after():.0f}s)")
+    
+    started = time.monotonic()
+    try:
+        res = api_request(method, path, timeout=latency.timeout(timeout), **kwargs)
+    except requests.RequestException:
+        breaker.record_failure()
+        raise
+    except BaseException:
+        # Ctrl+C gibi durumlarda half-open denemesi kilitli kalmasın
+        breaker.record_failure()
+        raise
+    
+    if res.status_code >= 500:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+        latency.record(time.monotonic() - started)
+    return res
+
+def agent_analyze(payload: dict, timeout: float = 120) -> requests.Response:
+    """/agent/analyze çağrısı (circuit breaker + adaptif timeout ile; sonuçlar önbelleklidir)"""
+    headers = get_api_headers()
+    return cached_analysis(
+        "/agent/analyze", payload,
+        lambda: api_request_guarded("POST", "/agent/analyze", timeout, json=payload, headers=headers), headers
+    )
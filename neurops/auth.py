@@ -0,0 +1,205 @@
+"""İlk kurulum, token ve API URL yapılandırması"""
+
+import sys
+import os
+import time
+
+import requests
+from rich.prompt import Confirm, Prompt
+from rich.panel import Panel
+from rich.status import Status
+from rich import box
+
+from neurops.config import (
+    DEFAULT_API_URL,
+    load_api_url,
+    load_hf_token,
+    mark_setup_completed,
+    normalize_api_url,
+    save_api_url,
+    save_hf_token
+)
+from neurops import api
+from neurops.api import api_get
+from neurops.ui import console
+
+
+def check_token():
+    """Token durumunu kontrol et (lokal config'den)"""
+    token = load_hf_token()
+    return {"token_set": bool(token), "agent_initialized": bool(token)}
+
+
+def setup_tutorial():
+    """İlk kurulum ve tutorial"""
+    console.clear()
+    console.print("[rgb(167,199,231)]Welcome to NeurOps![/rgb(167,199,231)]")
+    console.print()
+    console.print("Let's set up your environment:")
+    console.print()
+    
+    # API URL Setup
+    console.print("[rgb(167,199,231)]Step 1: API URL Configuration[/rgb(167,199,231)]")
+    current_url = load_api_url() or DEFAULT_API_URL
+    console.print(f"Current API URL: [white]{current_url}[/white]")
+    
+    if not Confirm.ask("[dim white]Is this correct?[/dim white]", default=True):
+        new_url = Prompt.ask("[bold white]Enter API URL[/bold white]", default=current_url)
+        save_api_url(new_url)
+        console.print("[white]API URL saved![/white]")
+    else:
+        if not current_url:
+            new_url = Prompt.ask("[bold white]Enter API URL[/bold white]", default=DEFAULT_API_URL)
+            save_api_url(new_url)
+            console.print("[white]API URL saved![/white]")
+    
+    console.print()
+    
+    # HF Token Setup
+    console.print("[rgb(167,199,231)]Step 2: Hugging Face API Token[/rgb(167,199,231)]")
+    console.print("To use AI features, you need a Hugging Face API token.")
+    console.print("Get your token from: [link]https://huggingface.co/settings/tokens[/link]")
+    console.print()
+    
+    if Confirm.ask("[bold white]Do you want to set your HF token now?[/bold white]", default=True):
+        if sys.platform == 'win32':
+            console.print("[dim white]Note: Token will be visible as you type (Windows compatibility)[/dim white]")
+            token = Prompt.ask("[bold white]Enter your Hugging Face API token[/bold white]", password=False)
+        else:
+            token = Prompt.ask("[bold white]Enter your Hugging Face API token[/bold white]", password=True)
+        
+        if token:
+            if save_hf_token(token):
+                console.print("[white]Token saved successfully![/white]")
+            else:
+                console.print("[rgb(167,199,231)]Token saved to environment variable only[/rgb(167,199,231)]")
+        else:
+            console.print("[rgb(167,199,231)]Token not set. You can set it later from the main menu.[/rgb(167,199,231)]")
+    else:
+        console.print("[dim white]You can set your token later from the main menu (option 6).[/dim white]")
+    
+    console.print()
+    
+    # Tutorial
+    console.print("[rgb(167,199,231)]Step 3: Quick Tutorial[/rgb(167,199,231)]")
+    console.print()
+    console.print("[bold white]Main Features:[/bold white]")
+    console.print("  • [white]Analyze Logs[/white] - Analyze and search through logs")
+    console.print("  • [white]Incident Management[/white] - Track and manage incidents")
+    console.print("  • [white]Workflow Automation[/white] - Create and run automated workflows")
+    console.print("  • [white]AI Problem Analysis[/white] - Get AI assistance for troubleshooting")
+    console.print("  • [white]Security & Protection[/white] - Security analysis and threat detection")
+    console.print()
+    console.print("[dim white]Press Enter to continue...[/dim white]")
+    input()
+    
+    # Mark setup as completed
+    mark_setup_completed()
+    console.print()
+    console.print("[white]Setup completed![/white]")
+    console.print()
+    time.sleep(1)
+
+def set_token():
+    """Hugging Face API token'ını ayarla (lokal olarak sakla)"""
+    console.print()
+    panel = Panel(
+        "[bold white]Hugging Face API Token Setup[/bold white]\n\n"
+        "Get your token from: [link]https://huggingface.co/settings/tokens[/link]\n\n"
+        "Your token will be stored locally and sent with each API request.",
+        title="Token Configuration",
+        border_style="white",
+        box=box.SIMPLE
+    )
+    console.print(panel)
+    console.print()
+    
+    # Windows'ta password input sorunları olabilir, önce normal input dene
+    import sys
+    if sys.platform == 'win32':
+        # Windows'ta password input bazen donuyor, normal input kullan
+        console.print("[dim white]Note: Token will be visible as you type (Windows compatibility)[/dim white]")
+        token = Prompt.ask("[bold white]Enter your Hugging Face API token[/bold white]", password=False)
+    else:
+        # Linux/macOS'ta password input kullan
+        token = Prompt.ask("[bold white]Enter your Hugging Face API token[/bold white]", password=True)
+    
+    if not token:
+        console.print("[rgb(167,199,231)]Token cannot be empty![/rgb(167,199,231)]")
+        return
+    
+    try:
+        if save_hf_token(token):
+            console.print("[white]Token saved successfully![/white]")
+            console.print("[dim white]Token saved to config file (~/.neurops/config.json)[/dim white]")
+            console.print("[dim white]Token will be sent with each API request[/dim white]")
+        else:
+            console.print("[rgb(167,199,231)] Token saved to environment variable only[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)]Error: {e}[/rgb(167,199,231)]")
+
+def configure_api_url():
+    """API URL'ini yapılandır"""
+    
+    console.print()
+    panel = Panel(
+        "[rgb(167,199,231)]API Server Configuration[/rgb(167,199,231)]\n\n"
+        "Enter the URL of your Neurops API server.\n"
+        "Example: https://api.neurops.dev or http://localhost:8000",
+        title="API Configuration",
+        border_style="rgb(167,199,231)",
+        box=box.SIMPLE
+    )
+    console.print(panel)
+    console.print()
+    console.print(f"[dim]Current API URL: {api.API_URL}[/dim]")
+    console.print()
+    
+    new_url = Prompt.ask(
+        "[white]Enter API URL[/white]",
+        default=api.API_URL
+    )
+    
+    if not new_url:
+        console.print("[rgb(167,199,231)] API URL cannot be empty![/rgb(167,199,231)]")
+        return
+    
+    # URL formatını kontrol et
+    if not new_url.startswith(("http://", "https://")):
+        console.print("[rgb(167,199,231)] Adding http:// prefix...[/rgb(167,199,231)]")
+        new_url = f"http://{new_url}"
+    
+    # Test connection
+    try:
+        with Status("[rgb(167,199,231)]Testing connection...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+            normalized_test_url = normalize_api_url(new_url)
+            res = api_get(f"{normalized_test_url}/health", timeout=5, retries=0)
+        
+        if res.status_code == 200:
+            console.print("[white]Connection successful![/white]")
+            
+            # API URL'ini kaydet (normalize edilmiş hali)
+            normalized_url = normalize_api_url(new_url)
+            if save_api_url(normalized_url):
+                api.set_api_url(normalized_url)
+                os.environ["NEUROPS_API_URL"] = normalized_url
+                console.print("[white]API URL saved successfully![/white]")
+            else:
+                console.print("[rgb(167,199,231)] Could not save to config file, but using for this session.[/rgb(167,199,231)]")
+                normalized_url = normalize_api_url(new_url)
+                api.set_api_url(normalized_url)
+        else:
+            console.print(f"[rgb(167,199,231)] Server responded with status {res.status_code}, but URL saved.[/rgb(167,199,231)]")
+            normalized_url = normalize_api_url(new_url)
+            if save_api_url(normalized_url):
+                api.set_api_url(normalized_url)
+                os.environ["NEUROPS_API_URL"] = normalized_url
+    except requests.exceptions.ConnectionError:
+        console.print("[rgb(167,199,231)] Could not connect to server. URL saved anyway.[/rgb(167,199,231)]")
+        normalized_url = normalize_api_url(new_url)
+        if save_api_url(normalized_url):
+            api.set_api_url(normalized_url)
+            os.environ["NEUROPS_API_URL"] = normalized_url
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)] Error: {e}[/rgb(167,199,231)]")
+        console.print("[rgb(167,199,231)] URL not saved.[/rgb(167,199,231)]")
@@ -0,0 +1,242 @@
+"""Başlangıç işleri: kullanıcı workflow dizini, default workflow kaydı ve API bağlantı kontrolü"""
+
+import hashlib
+import threading
+import time
+from typing import List, Optional, Set, Tuple
+
+import yaml
+
+from neurops import api
+from neurops.config import CONFIG_DIR, DEFAULT_WORKFLOWS_DIR, USER_WORKFLOWS_DIR, ConfigStore
+from neurops.aio import AsyncApiClient, DaemonThreadExecutor, check_api_connection_async, run_async
+
+
+# Son başarılı kayıttan beri içeriği değişmeyen ve backend'de hâlâ kayıtlı olan
+# workflow'lar tekrar POST edilmez
+# Yapı: {api_url: {dosya_adı: {"hash": sha256, "name": workflow adı}}} (eski kayıtlar: dosya_adı -> sha256)
+WORKFLOW_MANIFEST_FILE = CONFIG_DIR / "workflow_manifest.json"
+workflow_manifest = ConfigStore(WORKFLOW_MANIFEST_FILE)
+
+CONNECTION_STATUS_TTL = 30.0  # saniye - menüdeki bağlantı durumu bu süreden eskiyse arka planda yenilenir
+
+
+def clear_workflow_manifest() -> int:
+    """Manifest'i siler; default workflow'lar bir sonraki açılışta yeniden kaydedilir. Silinen API URL sayısı döner"""
+    removed = len(workflow_manifest.load())
+    workflow_manifest.rewrite(lambda data: {})
+    return removed
+
+
+async def _registered_workflow_names(client: AsyncApiClient) -> Optional[Set[str]]:
+    """Backend'deki workflow adları; liste alınamazsa None (manifest'e güvenilir)"""
+    try:
+        res = await client.list_workflows()
+        if res.status_code != 200:
+            return None
+        workflows = res.json()
+    except Exception:
+        return None
+    if not isinstance(workflows, list):
+        return None
+    return {workflow.get("name") for workflow in workflows if isinstance(workflow, dict)}
+
+
+def ensure_user_workflows_dir():
+    """Kullanıcı workflow dizinini oluştur"""
+    USER_WORKFLOWS_DIR.mkdir(parents=True, exist_ok=True)
+
+
+async def load_default_workflows_async(client: AsyncApiClient) -> List[str]:
+    """
+    Default workflow'ları backend'e eşzamanlı olarak kaydet.
+    Manifest'teki hash'i aynı olan dosyalar, backend'in workflow listesinde
+    hâlâ varsa atlanır (backend DB'si sıfırlandıysa yeniden kaydedilir);
+    başarıyla kaydedilenlerin adları döner.
+    """
+    if not DEFAULT_WORKFLOWS_DIR.exists():
+        return []
+    
+    api_url = api.API_URL
+    manifest = dict(workflow_manifest.get(api_url) or {})
+    
+    workflows = {}
+    hashes = {}
+    unchanged = {}  # dosya adı -> (manifest'teki workflow adı, içerik)
+    for workflow_file in DEFAULT_WORKFLOWS_DIR.glob("*.yml"):
+        try:
+            content = workflow_file.read_bytes()
+            content_hash = hashlib.sha256(content).hexdigest()
+            entry = manifest.get(workflow_file.name)
+            entry_hash, entry_name = (entry.get("hash"), entry.get("name")) if isinstance(entry, dict) else (entry, None)
+            if entry_hash == content_hash:
+                unchanged[workflow_file.name] = (entry_name, content)
+                continue
+            workflow_data = yaml.safe_load(content)
+            if isinstance(workflow_data, dict):
+                workflows[workflow_file.name] = workflow_data
+                hashes[workflow_file.name] = content_hash
+        except Exception:
+            # Sessizce devam et, default workflow yükleme kritik değil
+            pass
+    
+    manifest_changed = False
+    if unchanged:
+        names = await _registered_workflow_names(client)
+        if names is not None:
+            for file_name, (workflow_name, content) in unchanged.items():
+                try:
+                    workflow_data = yaml.safe_load(content) if workflow_name is None else None
+                    if workflow_name is None and isinstance(workflow_data, dict):
+                        workflow_name = workflow_data.get("name")
+                    if workflow_name in names:
+                        continue
+                    # Backend bu workflow'u kaybetmiş (DB sıfırlandı, aynı URL'de yeni kurulum): yeniden kaydedilir
+                    if workflow_data is None:
+                        workflow_data = yaml.safe_load(content)
+                    del manifest[file_name]
+                    manifest_changed = True
+                    if isinstance(workflow_data, dict):
+                        workflows[file_name] = workflow_data
+                        hashes[file_name] = hashlib.sha256(content).hexdigest()
+                except Exception:
+                    pass
+    
+    if not workflows:
+        if manifest_changed:
+            _save_manifest(api_url, manifest)
+        return []
+    
+    # Backend'e kaydet (tüm dosyalar aynı anda)
+    responses = await client.gather({
+        name: client.register_workflow(workflow_data)
+        for name, workflow_data in workflows.items()
+    })
+    loaded = []
+    for name, res in responses.items():
+        if not isinstance(res, Exception) and res.status_code in [200, 201]:
+            manifest[name] = {"hash": hashes[name], "name": workflows[name].get('name') or name}
+            loaded.append(workflows[name].get('name') or name)
+    
+    if loaded or manifest_changed:
+        _save_manifest(api_url, manifest)
+    return loaded
+
+
+def _save_manifest(api_url: str, manifest: dict):
+    try:
+        workflow_manifest.update(**{api_url: manifest})
+    except OSError:
+        # Manifest yazılamazsa bir sonraki açılışta tekrar kaydedilir
+        pass
+
+
+def load_default_workflows() -> List[str]:
+    """Default workflow'ları backend'e kaydet"""
+    async def _run():
+        return await load_default_workflows_async(AsyncApiClient())
+    
+    try:
+        return run_async(_run())
+    except Exception:
+        # Sessizce devam et
+        return []
+
+
+class BackgroundBootstrap:
+    """
+    Açılış işlerini (default workflow kaydı + API bağlantı kontrolü) arka plan
+    thread'inde çalıştırır; menü bunları beklemeden gösterilir.
+    Bağlantı durumu önbelleğe alınır ve CONNECTION_STATUS_TTL dolduğunda
+    menüyü bloklamadan arka planda yenilenir.
+    """
+
+    def __init__(self):
+        self.loaded_workflows: List[str] = []
+        self._connection: Optional[Tuple[bool, str]] = None
+        self._checked_at = 0.0
+        self._refreshing = False
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="neurops-bootstrap", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        async def startup():
+            # Daemon thread'ler: backend askıdaysa menüden çıkış istek timeout'unu beklemez
+            client = AsyncApiClient(executor=DaemonThreadExecutor())
+            return await client.gather({
+                "workflows": load_default_workflows_async(client),
+                "connection": check_api_connection_async(client)
+            })
+        
+        try:
+            results = run_async(startup())
+        except Exception as e:
+            results = {"workflows": e, "connection": e}
+        
+        if isinstance(results["workflows"], list):
+            self.loaded_workflows = results["workflows"]
+        self._set_connection(results["connection"])
+        self._done.set()
+
+    def _set_connection(self, connection):
+        if isinstance(connection, Exception):
+            connection = (False, f"Not Connected ({str(connection)[:30]})")
+        with self._lock:
+            self._connection = connection
+            self._checked_at = time.monotonic()
+            self._refreshing = False
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Açılış işleri timeout içinde biterse True"""
+        return self._done.wait(timeout)
+
+    def connection_status(self) -> Optional[Tuple[bool, str]]:
+        """
+        Son bilinen (is_connected, message) değeri; henüz kontrol bitmediyse None.
+        Değer eskiyse yenileme arka planda başlatılır, eski değer döner.
+        """
+        with self._lock:
+            connection = self._connection
+            stale = connection is not None and time.monotonic() - self._checked_at > CONNECTION_STATUS_TTL
+            if stale and not self._refreshing:
+                self._refreshing = True
+                threading.Thread(target=self._refresh_connection, name="neurops-health", daemon=True).start()
+        return connection
+
+    def _refresh_connection(self):
+        try:
+            connection = api.check_api_connection()
+        except Exception as e:
+            connection = e
+        self._set_connection(connection)
+
+
+_bootstrap: Optional[BackgroundBootstrap] = None
+
+def start_background_bootstrap() -> BackgroundBootstrap:
+    """Açılış işlerini arka planda başlatır (süreç başına bir kez)"""
+    global _bootstrap
+    if _bootstrap is None:
+        _bootstrap = BackgroundBootstrap().start()
+    return _bootstrap
+
+def get_connection_status() -> Optional[Tuple[bool, str]]:
+    """
+    Menüde gösterilecek bağlantı durumu. Bootstrap başlatılmadıysa
+    senkron check_api_connection'a düşer.
+    """
+    if _bootstrap is None:
+        return api.check_api_connection()
+    return _bootstrap.connection_status()
+
+def get_cached_connection_status() -> Optional[Tuple[bool, str]]:
+    """Bilinen son bağlantı durumu; bootstrap başlatılmadıysa istek yapılmaz, None döner"""
+    if _bootstrap is None:
+        return None
+    return _bootstrap.connection_status()
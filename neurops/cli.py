@@ -0,0 +1,334 @@
+"""İnteraktif menü ve giriş noktası"""
+
+import sys
+import time
+from typing import List, Optional
+
+from rich.panel import Panel
+from rich.text import Text
+from rich.align import Align
+from rich import box
+
+import neurops
+from neurops.config import is_setup_completed
+from neurops.ui import console, prompt_with_animation, welcome_screen
+
+
+STARTUP_WAIT = 1.0  # saniye - açılışta arka plan kontrolünü en fazla bu kadar bekle
+
+
+def show_menu():
+    """Basit ve temiz menü - margin yok, tamamen sola yaslı"""
+    console.print()
+    console.print("[rgb(167,199,231)]1.[/rgb(167,199,231)] Analyze Logs")
+    console.print("[rgb(167,199,231)]2.[/rgb(167,199,231)] Incident Management")
+    console.print("[rgb(167,199,231)]3.[/rgb(167,199,231)] Workflow Management")
+    console.print()
+    console.print("[rgb(167,199,231)]4.[/rgb(167,199,231)] AI Agent - Analyze Problem")
+    console.print("[rgb(167,199,231)]5.[/rgb(167,199,231)] Security & Protection")
+    console.print()
+    console.print("[rgb(167,199,231)]6.[/rgb(167,199,231)] Team Management")
+    console.print()
+    console.print("[rgb(167,199,231)]7.[/rgb(167,199,231)] AI Agent - Set Token")
+    console.print("[rgb(167,199,231)]8.[/rgb(167,199,231)] AI Agent - Status")
+    console.print()
+    console.print("[rgb(167,199,231)]9.[/rgb(167,199,231)] Monitor Terminal Output")
+    console.print("[rgb(167,199,231)]10.[/rgb(167,199,231)] Full-Agent Mode")
+    console.print()
+    console.print("[rgb(167,199,231)]11.[/rgb(167,199,231)] Settings")
+    console.print("[rgb(167,199,231)]12.[/rgb(167,199,231)] [dim rgb(167,199,231)]Exit[/dim rgb(167,199,231)]")
+    console.print()
+    
+    # API URL ve bağlantı durumu bilgisi (arka plandaki kontrolün son sonucu)
+    connection = neurops.bootstrap.get_connection_status()
+    is_connected, connection_msg = connection if connection is not None else (True, "Checking...")
+    api_info = Text()
+    api_info.append("API: ", style="dim rgb(167,199,231)")
+    api_info.append(neurops.api.API_URL, style="white")
+    api_info.append(" | ", style="dim white")
+    if is_connected:
+        api_info.append(connection_msg, style="dim rgb(167,199,231)")
+    else:
+        api_info.append(connection_msg, style="rgb(167,199,231)")
+    console.print(api_info)
+
+
+def show_security_menu():
+    """Security yönetim menüsü - margin yok, tamamen sola yaslı"""
+    console.print("[rgb(167,199,231)]Security & Protection[/rgb(167,199,231)]")
+    console.print()
+    console.print("[rgb(167,199,231)]5.1.[/rgb(167,199,231)] Security Analysis")
+    console.print()
+    console.print("[rgb(167,199,231)]5.2.[/rgb(167,199,231)] Generate Workflow for Event (AI)")
+    console.print()
+    console.print("[rgb(167,199,231)]5.3.[/rgb(167,199,231)] Security Scan")
+    console.print("[rgb(167,199,231)]5.4.[/rgb(167,199,231)] Security Recommendations")
+    console.print("[rgb(167,199,231)]5.5.[/rgb(167,199,231)] Security Statistics")
+    console.print()
+    console.print("[rgb(167,199,231)]5.6.[/rgb(167,199,231)] [dim white]Back to Main Menu[/dim white]")
+
+
+def show_incident_menu():
+    """Incident yönetim menüsü - margin yok, tamamen sola yaslı"""
+    console.print("[rgb(167,199,231)]Incident Management[/rgb(167,199,231)]")
+    console.print()
+    console.print("[rgb(167,199,231)]2.1.[/rgb(167,199,231)] Report Incident")
+    console.print("[rgb(167,199,231)]2.2.[/rgb(167,199,231)] List Incidents")
+    console.print("[rgb(167,199,231)]2.3.[/rgb(167,199,231)] View Incident Details")
+    console.print()
+    console.print("[rgb(167,199,231)]2.4.[/rgb(167,199,231)] Update Incident")
+    console.print("[rgb(167,199,231)]2.5.[/rgb(167,199,231)] Resolve Incident")
+    console.print()
+    console.print("[rgb(167,199,231)]2.6.[/rgb(167,199,231)] Generate Workflow for Incident (AI)")
+    console.print("[rgb(167,199,231)]2.7.[/rgb(167,199,231)] Incident Statistics")
+    console.print()
+    console.print("[rgb(167,199,231)]2.8.[/rgb(167,199,231)] [dim white]Back to Main Menu[/dim white]")
+
+
+def show_workflow_menu():
+    """Workflow yönetim menüsü - margin yok, tamamen sola yaslı"""
+    console.print("[rgb(167,199,231)]Workflow Management[/rgb(167,199,231)]")
+    console.print()
+    console.print("[rgb(167,199,231)]3.1.[/rgb(167,199,231)] List Workflows")
+    console.print("[rgb(167,199,231)]3.2.[/rgb(167,199,231)] View Workflow Details")
+    console.print()
+    console.print("[rgb(167,199,231)]3.3.[/rgb(167,199,231)] AI - Generate Workflow")
+    console.print()
+    console.print("[rgb(167,199,231)]3.4.[/rgb(167,199,231)] Run Workflow")
+    console.print("[rgb(167,199,231)]3.5.[/rgb(167,199,231)] Check Workflow Run Status")
+    console.print("[rgb(167,199,231)]3.6.[/rgb(167,199,231)] List Workflow Runs")
+    console.print()
+    console.print("[rgb(167,199,231)]3.7.[/rgb(167,199,231)] [dim white]Back to Main Menu[/dim white]")
+
+
+def show_team_menu():
+    """Takım yönetim menüsü"""
+    console.print("[rgb(167,199,231)]Team Management[/rgb(167,199,231)]")
+    console.print()
+    console.print("[rgb(167,199,231)]6.1.[/rgb(167,199,231)] Create Team")
+    console.print("[rgb(167,199,231)]6.2.[/rgb(167,199,231)] Join Team")
+    console.print()
+    console.print("[rgb(167,199,231)]6.3.[/rgb(167,199,231)] List My Teams")
+    console.print("[rgb(167,199,231)]6.4.[/rgb(167,199,231)] View Team Details")
+    console.print()
+    console.print("[rgb(167,199,231)]6.5.[/rgb(167,199,231)] Manage Team Members")
+    console.print("[rgb(167,199,231)]6.6.[/rgb(167,199,231)] View Team Invitation")
+    console.print()
+    console.print("[rgb(167,199,231)]6.7.[/rgb(167,199,231)] [dim white]Back to Main Menu[/dim white]")
+
+
+def main(argv: Optional[List[str]] = None):
+    """Ana fonksiyon - argüman verilirse komut modu (neurops.commands), yoksa interaktif menü"""
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv:
+        return neurops.commands.run(argv)
+    
+    # Konsolu temizle
+    console.clear()
+    
+    # Kullanıcı workflow dizinini oluştur
+    neurops.bootstrap.ensure_user_workflows_dir()
+    
+    # Setup kontrolü - eğer tamamlanmamışsa tutorial göster
+    if not is_setup_completed():
+        neurops.auth.setup_tutorial()
+        console.clear()
+    
+    # Default workflow kaydı ve API bağlantı kontrolü arka planda - menü bunları beklemez
+    bootstrap = neurops.bootstrap.start_background_bootstrap()
+    
+    welcome_screen()
+    
+    # Kontrol kısa sürede biterse sonucu hemen göster, bitmezse menüde "Checking..." görünür
+    bootstrap.wait(STARTUP_WAIT)
+    for workflow_name in bootstrap.loaded_workflows:
+        console.print(f"[dim rgb(167,199,231)]Loaded default workflow: {workflow_name}[/dim rgb(167,199,231)]")
+    
+    # API bağlantı kontrolü ve bilgilendirme
+    connection = bootstrap.connection_status()
+    is_connected, connection_msg = connection if connection is not None else (True, "")
+    if not is_connected:
+        console.print()
+        warning = Panel(
+            f"[rgb(167,199,231)]Connection Error[/rgb(167,199,231)]\n\n"
+            f"API URL: [white]{neurops.api.API_URL}[/white]\n"
+            f"Status: [rgb(167,199,231)]{connection_msg}[/rgb(167,199,231)]\n\n",
+            border_style="white",
+            box=box.SIMPLE,
+            padding=(0, 0),
+            title_align="left"
+        )
+        console.print(warning)
+        console.print()
+    
+    # Token durumunu kontrol et ve göster
+    token_status = neurops.auth.check_token()
+    if not token_status.get("token_set"):
+        warning = Panel(
+            "[rgb(167,199,231)]  AI Agent token not set. Use option 6 to enable AI features.[/rgb(167,199,231)]",
+            border_style="white",
+            box=box.SIMPLE
+        )
+        console.print(warning)
+        console.print()
+    
+    # Özellik modülleri (neurops.incident, neurops.workflow, ...) ilk seçildiklerinde yüklenir
+    while True:
+        show_menu()
+        console.print()
+        choice = prompt_with_animation(
+            "[rgb(167,199,231)]Enter choice[/rgb(167,199,231)]",
+            console=console
+        )
+        
+        if choice == "1":
+            neurops.logs.analyze_logs()
+        elif choice == "2":
+            # Incident submenu - liste ve istatistikler seçim beklenirken önceden çekilir
+            neurops.aio.prefetch_menu("incident")
+            while True:
+                show_incident_menu()
+                console.print()
+                inc_choice = prompt_with_animation(
+                    "[rgb(167,199,231)]Enter choice[/rgb(167,199,231)]",
+                    choices=["2.1", "2.2", "2.3", "2.4", "2.5", "2.6", "2.7", "2.8"],
+                    default="2.8",
+                    console=console
+                )
+                
+                if inc_choice == "2.1":
+                    neurops.incident.report_incident()
+                elif inc_choice == "2.2":
+                    neurops.incident.list_incidents()
+                elif inc_choice == "2.3":
+                    neurops.incident.view_incident()
+                elif inc_choice == "2.4":
+                    neurops.incident.update_incident()
+                elif inc_choice == "2.5":
+                    neurops.incident.resolve_incident()
+                elif inc_choice == "2.6":
+                    neurops.incident.generate_workflow_for_incident()
+                elif inc_choice == "2.7":
+                    neurops.incident.incident_stats()
+                elif inc_choice == "2.8":
+                    break
+                
+                console.print()
+                time.sleep(0.5)
+        elif choice == "3":
+            # Workflow submenu
+            while True:
+                show_workflow_menu()
+                console.print()
+                wf_choice = prompt_with_animation(
+                    "[rgb(167,199,231)]Enter choice[/rgb(167,199,231)]",
+                    choices=["3.1", "3.2", "3.3", "3.4", "3.5", "3.6", "3.7"],
+                    default="3.7",
+                    console=console
+                )
+                
+                if wf_choice == "3.1":
+                    neurops.workflow.list_workflows()
+                elif wf_choice == "3.2":
+                    neurops.workflow.view_workflow()
+                elif wf_choice == "3.3":
+                    neurops.workflow.generate_workflow_ai()
+                elif wf_choice == "3.4":
+                    neurops.workflow.run_workflow()
+                elif wf_choice == "3.5":
+                    neurops.workflow.check_workflow_status()
+                elif wf_choice == "3.6":
+                    neurops.workflow.list_workflow_runs()
+                elif wf_choice == "3.7":
+                    break
+                
+                console.print()
+                time.sleep(0.5)
+        elif choice == "4":
+            neurops.agent.analyze_problem()
+        elif choice == "5":
+            # Security submenu - istatistik ve öneriler seçim beklenirken önceden çekilir
+            neurops.aio.prefetch_menu("security")
+            while True:
+                show_security_menu()
+                console.print()
+                sec_choice = prompt_with_animation(
+                    "[rgb(167,199,231)]Enter choice[/rgb(167,199,231)]",
+                    choices=["5.1", "5.2", "5.3", "5.4", "5.5", "5.6"],
+                    default="5.6",
+                    console=console
+                )
+                
+                if sec_choice == "5.1":
+                    neurops.security.security_analysis()
+                elif sec_choice == "5.2":
+                    neurops.security.generate_workflow_for_security_event()
+                elif sec_choice == "5.3":
+                    neurops.security.security_scan()
+                elif sec_choice == "5.4":
+                    neurops.security.security_recommendations()
+                elif sec_choice == "5.5":
+                    neurops.security.security_stats()
+                elif sec_choice == "5.6":
+                    break
+                
+                console.print()
+                time.sleep(0.5)
+        elif choice == "6":
+            # Team submenu
+            while True:
+                show_team_menu()
+                console.print()
+                team_choice = prompt_with_animation(
+                    "[rgb(167,199,231)]Enter choice[/rgb(167,199,231)]",
+                    choices=["6.1", "6.2", "6.3", "6.4", "6.5", "6.6", "6.7"],
+                    default="6.7",
+                    console=console
+                )
+                
+                if team_choice == "6.1":
+                    neurops.team.create_team()
+                elif team_choice == "6.2":
+                    neurops.team.join_team()
+                elif team_choice == "6.3":
+                    neurops.team.list_my_teams()
+                elif team_choice == "6.4":
+                    neurops.team.view_team_details()
+                elif team_choice == "6.5":
+                    neurops.team.manage_team_members()
+                elif team_choice == "6.6":
+                    neurops.team.view_team_invitation()
+                elif team_choice == "6.7":
+                    break
+                
+                console.print()
+                time.sleep(0.5)
+        elif choice == "7":
+            neurops.auth.set_token()
+        elif choice == "8":
+            neurops.agent.agent_status()
+        elif choice == "9":
+            neurops.monitor.monitor_terminal_output()
+        elif choice == "10":
+            neurops.agent.full_agent_mode()
+        elif choice == "11":
+            neurops.settings.show_settings_menu()
+        elif choice == "12":
+            console.print()
+            goodbye = Panel(
+                "[rgb(167,199,231)]Thank you for using Neurops CLI![/rgb(167,199,231)]\n"
+                "[dim rgb(167,199,231)]Goodbye! 👋[/dim rgb(167,199,231)]",
+                border_style="white",
+                box=box.SIMPLE
+            )
+            console.print(Align.center(goodbye), width=80)
+            console.print()
+            break
+        
+        console.print()  # Boş satır
+        time.sleep(0.5)  # Kısa bir bekleme
+
+
+if __name__ == "__main__":
+    main()
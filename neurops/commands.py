@@ -0,0 +1,550 @@
+"""
+Scriptlenebilir komut modu (cron / CI için).
+
+    neurops logs analyze app.log --json
+    neurops incident list --status open --json
+    neurops workflow run system_check
+
+Menü, animasyon ve onay sorusu yoktur. Sonuç stdout'a yazılır (--json ile JSON),
+ilerleme ve uyarı mesajları stderr'e gider.
+Çıkış kodları: 0 başarılı, 1 API/komut hatası, 2 kullanım hatası, 3 API'ye ulaşılamadı.
+"""
+
+import sys
+import os
+import json
+import argparse
+from typing import Any, List, Optional, Tuple
+
+from rich.console import Console
+from rich.table import Table
+from rich.text import Text
+from rich import box
+
+import neurops
+from neurops.config import (
+    DEFAULT_API_URL,
+    get_api_headers,
+    load_api_url,
+    load_hf_token,
+    load_settings,
+    normalize_api_url,
+    save_api_url,
+    save_hf_token
+)
+from neurops.ui import console, custom_theme
+
+
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_USAGE = 2
+EXIT_UNAVAILABLE = 3
+
+
+class CommandError(Exception):
+    """Komut başarısız oldu; data verilirse --json çıktısında hata yerine o basılır"""
+
+    def __init__(self, message: str, exit_code: int = EXIT_ERROR, data: Any = None):
+        super().__init__(message)
+        self.exit_code = exit_code
+        self.data = data
+
+
+def _response_json(res, expected=(200, 201)):
+    """Başarılı yanıtın JSON gövdesini döndürür, değilse CommandError fırlatır"""
+    if res.status_code not in expected:
+        try:
+            detail = res.json().get("detail")
+        except (ValueError, AttributeError):
+            detail = None
+        raise CommandError(f"API error {res.status_code}: {detail or res.text[:200] or 'no detail'}")
+    try:
+        return res.json()
+    except ValueError:
+        raise CommandError(f"API returned a non-JSON response (status {res.status_code})")
+
+
+def _is_connection_error(error: Exception) -> bool:
+    requests = sys.modules.get("requests")
+    if requests is None:
+        return False
+    return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+
+# Genel
+def cmd_status(args):
+    is_connected, message = neurops.api.check_api_connection()
+    result = {"api_url": neurops.api.API_URL, "connected": is_connected, "message": message}
+    if not is_connected:
+        raise CommandError(message, EXIT_UNAVAILABLE, data=result)
+    # incident/security/workflow/team özetleri aynı anda çekilir
+    result.update(neurops.aio.fetch_dashboard())
+    return result
+
+
+# Config
+def cmd_config_show(args):
+    token = load_hf_token()
+    return {
+        "api_url": os.getenv("NEUROPS_API_URL") or load_api_url() or DEFAULT_API_URL,
+        "token_set": bool(token),
+        "settings": load_settings()
+    }
+
+
+def cmd_config_set_token(args):
+    token = (sys.stdin.readline() if args.token == "-" else args.token).strip()
+    if not token:
+        raise CommandError("Token cannot be empty", EXIT_USAGE)
+    if not save_hf_token(token):
+        raise CommandError("Could not write config file")
+    return {"token_set": True}
+
+
+def cmd_config_clear_cache(args):
+    neurops.api.response_cache.clear()
+    return {
+        "analysis_results_removed": neurops.api.analysis_cache.clear(),
+        # Default workflow'lar bir sonraki açılışta yeniden kaydedilir
+        "workflow_manifests_removed": neurops.bootstrap.clear_workflow_manifest()
+    }
+
+
+def cmd_config_set_api_url(args):
+    url = args.url if args.url.startswith(("http://", "https://")) else f"http://{args.url}"
+    if not save_api_url(url):
+        raise CommandError("Could not write config file")
+    return {"api_url": normalize_api_url(url)}
+
+
+# Logs
+def _time_range_args(args) -> Tuple[Optional[float], Optional[float]]:
+    """--since/--until değerlerini epoch saniyeye çevirir"""
+    try:
+        since = neurops.logtime.parse_time_spec(args.since) if args.since else None
+        until = neurops.logtime.parse_time_spec(args.until) if args.until else None
+    except ValueError as e:
+        raise CommandError(str(e), EXIT_USAGE)
+    if since is not None and until is not None and until < since:
+        raise CommandError("--until is before --since", EXIT_USAGE)
+    return since, until
+
+
+def cmd_logs_analyze(args):
+    paths = neurops.logfiles.expand_log_paths(args.paths)
+    if not paths:
+        raise CommandError(f"No log files match {' '.join(args.paths)}", EXIT_USAGE)
+    since, until = _time_range_args(args)
+    neurops.logindex.register_log_files(paths)
+    # Dosya/stdin parça parça gönderilir, tamamı belleğe alınmaz
+    try:
+        if len(paths) > 1:
+            result, logs = neurops.logfiles.analyze_log_paths(
+                paths, prescan=args.prescan, context_lines=args.context, incremental=args.incremental,
+                local_analysis=args.local_analysis, since=since, until=until
+            )
+        else:
+            result, logs = neurops.logfiles.analyze_log_file(
+                paths[0], prescan=args.prescan, context_lines=args.context, incremental=args.incremental,
+                local_analysis=args.local_analysis, since=since, until=until
+            )
+    except OSError as e:
+        raise CommandError(f"Cannot read {e.filename or paths[0]}: {e.strerror or e}")
+    except ValueError as e:
+        raise CommandError(str(e), EXIT_USAGE)
+    except neurops.logfiles.LogAnalysisError as e:
+        raise CommandError(f"API error {e.status_code}: {e.detail or 'no detail'}")
+    
+    errors = result.get("errors_detected", 0)
+    warnings = result.get("warnings_detected", 0)
+    critical = result.get("critical_issues", [])
+    if result.get("offline"):
+        # API'ye ulaşılamadı; sonuç yerel kural motorundan, incident da açılamaz
+        console.print("[dim]API unavailable: logs were analyzed locally with built-in rules[/dim]")
+    elif args.create_incident and (errors > 0 or warnings > 0 or critical):
+        result["incident"] = _response_json(neurops.api.api_post(
+            "/incident/",
+            json={
+                "title": f"Log Analysis: {errors} errors, {warnings} warnings detected",
+                "description": f"Automatically created from log analysis.\n\nErrors: {errors}\nWarnings: {warnings}\n\nSummary:\n{result.get('summary', '')}\n\nLog snippet:\n{logs[-1000:]}",
+                "severity": "high" if critical else "medium",
+                "source": "log_analysis"
+            }
+        ))
+    return result
+
+
+def cmd_logs_reset(args):
+    if args.paths:
+        paths = neurops.logfiles.expand_log_paths(args.paths)
+        removed = sum(neurops.logcheckpoints.clear_checkpoints(path) for path in paths)
+        offsets_removed = sum(neurops.tailer.clear_tail_offsets(path) for path in paths)
+    else:
+        removed = neurops.logcheckpoints.clear_checkpoints()
+        offsets_removed = neurops.tailer.clear_tail_offsets()
+    return {"checkpoints_removed": removed, "monitor_offsets_removed": offsets_removed}
+
+
+def cmd_logs_search(args):
+    since, until = _time_range_args(args)
+    try:
+        if not args.no_refresh:
+            # Aramadan önce yalnızca son indekslemeden beri eklenen satırlar işlenir
+            stats = neurops.logindex.refresh_index()
+            if stats["bytes_indexed"]:
+                console.print(f"[dim]Indexed {stats['bytes_indexed']:,} new bytes from {stats['indexed_files']} file(s)[/dim]")
+        return neurops.logindex.search_logs(
+            " ".join(args.query), since, until, args.path,
+            neurops.logindex.SEARCH_LIMIT if args.limit is None else args.limit
+        )
+    except ValueError as e:
+        raise CommandError(str(e), EXIT_USAGE)
+    except neurops.logindex.LogIndexError as e:
+        raise CommandError(str(e), EXIT_UNAVAILABLE)
+
+
+def cmd_logs_index(args):
+    paths = neurops.logfiles.expand_log_paths(args.paths) if args.paths else None
+    try:
+        stats = neurops.logindex.refresh_index(paths, rebuild=args.rebuild)
+        stats.update(neurops.logindex.index_status())
+    except neurops.logindex.LogIndexError as e:
+        raise CommandError(str(e), EXIT_UNAVAILABLE)
+    return stats
+
+
+# Incident
+def cmd_incident_list(args):
+    params = {}
+    if args.team_id:
+        params["team_id"] = args.team_id
+    if args.status:
+        params["status"] = args.status
+    if args.severity:
+        params["severity"] = args.severity
+    return _response_json(neurops.api.api_get("/incident/", params=params, headers=get_api_headers()))
+
+
+def cmd_incident_show(args):
+    return _response_json(neurops.api.api_get(f"/incident/{args.incident_id}"))
+
+
+def cmd_incident_report(args):
+    params = {"team_id": args.team_id} if args.team_id else {}
+    return _response_json(neurops.api.api_post(
+        "/incident/report",
+        json={
+            "title": args.title,
+            "description": args.description,
+            "severity": args.severity
+        },
+        params=params,
+        headers=get_api_headers()
+    ))
+
+
+def cmd_incident_update(args):
+    update_data = {
+        key: value for key, value in (
+            ("status", args.status),
+            ("description", args.description),
+            ("resolution", args.resolution),
+            ("assigned_to", args.assigned_to)
+        ) if value
+    }
+    if not update_data:
+        raise CommandError("Nothing to update (use --status, --description, --resolution or --assigned-to)", EXIT_USAGE)
+    return _response_json(neurops.api.api_patch(f"/incident/{args.incident_id}", json=update_data))
+
+
+def cmd_incident_resolve(args):
+    return _response_json(neurops.api.api_post(
+        f"/incident/{args.incident_id}/resolve",
+        json={"resolution": args.resolution} if args.resolution else {}
+    ))
+
+
+def cmd_incident_stats(args):
+    return _response_json(neurops.api.api_get_cached("/incident/stats/summary"))
+
+
+# Workflow
+def cmd_workflow_list(args):
+    return _response_json(neurops.api.api_get_cached("/workflow/"))
+
+
+def cmd_workflow_show(args):
+    return _response_json(neurops.api.api_get_cached(f"/workflow/{args.name}"))
+
+
+def cmd_workflow_run(args):
+    """Workflow adımlarını lokal olarak sırayla çalıştırır, ilk hatada durur"""
+    workflow = _response_json(neurops.api.api_get_cached(f"/workflow/{args.name}"))
+    steps = workflow.get("steps") or []
+    if not steps:
+        raise CommandError(f"Workflow {args.name} has no steps")
+    if args.dry_run:
+        return {"workflow": workflow.get("name", args.name), "status": "dry_run", "steps_total": len(steps), "steps": steps}
+    
+    executed_steps = []
+    for idx, step in enumerate(steps, 1):
+        console.print(f"[dim]Step {idx}/{len(steps)}: {step.get('action', 'unknown')}[/dim]")
+        step_result = neurops.workflow.execute_workflow_step_local(step)
+        executed_steps.append({"step": idx, "action": step.get("action"), "result": step_result})
+        if step_result["status"] == "failed":
+            break
+    
+    failed = executed_steps[-1]["result"]["status"] == "failed"
+    result = {
+        "workflow": workflow.get("name", args.name),
+        "status": "failed" if failed else "completed",
+        "steps_total": len(steps),
+        "steps": executed_steps
+    }
+    if failed:
+        last = executed_steps[-1]
+        raise CommandError(f"Step {last['step']} failed: {last['result'].get('error') or 'unknown error'}", data=result)
+    return result
+
+
+def cmd_workflow_runs(args):
+    params = {}
+    if args.workflow:
+        params["workflow_name"] = args.workflow
+    if args.status:
+        params["status"] = args.status
+    return _response_json(neurops.api.api_get("/workflow/runs", params=params))
+
+
+def cmd_workflow_status(args):
+    return _response_json(neurops.api.api_get(f"/workflow/runs/{args.run_id}"))
+
+
+# Security
+def cmd_security_analyze(args):
+    since, until = _time_range_args(args)
+    try:
+        logs = neurops.logfiles.read_log_text(args.path, since, until)
+        neurops.logindex.register_log_files([args.path])
+    except OSError as e:
+        raise CommandError(f"Cannot read {e.filename or args.path}: {e.strerror or e}")
+    except ValueError as e:
+        raise CommandError(str(e), EXIT_USAGE)
+    if not logs.strip():
+        raise CommandError("No log lines to analyze", EXIT_USAGE)
+    try:
+        result = neurops.security.run_security_analysis(logs)
+    except neurops.logfiles.LogAnalysisError as e:
+        raise CommandError(f"API error {e.status_code}: {e.detail or 'no detail'}")
+    if result.get("offline"):
+        console.print("[dim]API unavailable: logs were analyzed locally with built-in rules[/dim]")
+    return result
+
+
+def cmd_security_events(args):
+    params = {}
+    if args.threat_level:
+        params["threat_level"] = args.threat_level
+    if args.status:
+        params["status"] = args.status
+    return _response_json(neurops.api.api_get("/security/events", params=params))
+
+
+def cmd_security_recommendations(args):
+    return _response_json(neurops.api.api_get_cached("/security/recommendations"))
+
+
+def cmd_security_stats(args):
+    return _response_json(neurops.api.api_get("/security/stats/summary"))
+
+
+# Team
+def cmd_team_list(args):
+    return _response_json(neurops.api.api_get_cached("/team/", headers=get_api_headers()))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="neurops",
+        description="NeurOps CLI. Run without arguments for the interactive menu."
+    )
+    parser.add_argument("--api-url", help="API URL for this invocation (overrides config and NEUROPS_API_URL)")
+    
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("--json", action="store_true", help="print the result as JSON")
+    
+    groups = parser.add_subparsers(dest="group", metavar="<command>")
+    groups.required = True
+
+    def command(subparsers, name, func, help_text):
+        command_parser = subparsers.add_parser(name, help=help_text, parents=[output])
+        command_parser.set_defaults(func=func)
+        return command_parser
+    
+    def time_range_arguments(command_parser):
+        command_parser.add_argument("--since", metavar="TIME",
+                                    help="only lines at or after TIME: 15m, 2h, 1d, now, ISO 8601 or epoch seconds")
+        command_parser.add_argument("--until", metavar="TIME", help="only lines at or before TIME (same formats)")
+    
+    command(groups, "status", cmd_status, "API connection and dashboard summary")
+    
+    config = groups.add_parser("config", help="local configuration").add_subparsers(dest="command", metavar="<action>")
+    config.required = True
+    command(config, "show", cmd_config_show, "show API URL, token status and settings")
+    p = command(config, "set-token", cmd_config_set_token, "save the Hugging Face API token")
+    p.add_argument("token", help='token value, or "-" to read it from stdin')
+    p = command(config, "set-api-url", cmd_config_set_api_url, "save the API URL")
+    p.add_argument("url")
+    command(config, "clear-cache", cmd_config_clear_cache, "drop cached API responses, analysis results and the workflow registration manifest")
+    
+    logs = groups.add_parser("logs", help="log analysis").add_subparsers(dest="command", metavar="<action>")
+    logs.required = True
+    p = command(logs, "analyze", cmd_logs_analyze, "analyze log files")
+    p.add_argument("paths", nargs="+", metavar="path", help='log files, directories or globs (quote them), or "-" for stdin')
+    p.add_argument("--create-incident", action="store_true", help="create an incident when errors or warnings are found")
+    p.add_argument("--prescan", action=argparse.BooleanOptionalAction, default=None,
+                   help="send only error/warning/traceback lines with context (default: settings)")
+    p.add_argument("--context", type=int, metavar="N", help="context lines around each pre-scan match")
+    p.add_argument("--incremental", action=argparse.BooleanOptionalAction, default=None,
+                   help="only analyze lines appended since the last run on each file (default: settings)")
+    p.add_argument("--local-analysis", choices=["off", "fallback", "filter"],
+                   help="local rule engine: when the API is down (fallback) or as a filter before calling it (default: settings)")
+    time_range_arguments(p)
+    p = command(logs, "reset", cmd_logs_reset, "forget incremental analysis checkpoints and saved monitor offsets")
+    p.add_argument("paths", nargs="*", metavar="path", help="only forget these files (default: all)")
+    p = command(logs, "search", cmd_logs_search, "search analyzed, monitored and captured session logs")
+    p.add_argument("query", nargs="+",
+                   help='words, "quoted phrases", prefix* and AND/OR/NOT; all words must match by default')
+    p.add_argument("--path", metavar="GLOB", help="only files whose path matches GLOB (or contains the text)")
+    # Varsayılan cmd_logs_search'te çözülür: parser kurulurken logindex (sqlite3, api) import edilmez
+    p.add_argument("--limit", type=int, metavar="N", help="newest N matches (default: 50)")
+    p.add_argument("--no-refresh", action="store_true", help="search the index as is, without indexing new lines first")
+    time_range_arguments(p)
+    p = command(logs, "index", cmd_logs_index, "index new log lines for search")
+    p.add_argument("paths", nargs="*", metavar="path", help="add and index these files (default: every known file)")
+    p.add_argument("--rebuild", action="store_true", help="drop indexed lines and index everything again")
+    
+    incident = groups.add_parser("incident", help="incident management").add_subparsers(dest="command", metavar="<action>")
+    incident.required = True
+    p = command(incident, "list", cmd_incident_list, "list incidents")
+    p.add_argument("--status", choices=["open", "in_progress", "resolved", "closed"])
+    p.add_argument("--severity", choices=["low", "medium", "high", "critical"])
+    p.add_argument("--team-id")
+    p = command(incident, "show", cmd_incident_show, "show incident details")
+    p.add_argument("incident_id")
+    p = command(incident, "report", cmd_incident_report, "report a new incident")
+    p.add_argument("--title", required=True)
+    p.add_argument("--description", required=True)
+    p.add_argument("--severity", choices=["low", "medium", "high", "critical"], default="medium")
+    p.add_argument("--team-id")
+    p = command(incident, "update", cmd_incident_update, "update an incident")
+    p.add_argument("incident_id")
+    p.add_argument("--status", choices=["open", "in_progress", "resolved", "closed"])
+    p.add_argument("--description")
+    p.add_argument("--resolution")
+    p.add_argument("--assigned-to")
+    p = command(incident, "resolve", cmd_incident_resolve, "resolve an incident")
+    p.add_argument("incident_id")
+    p.add_argument("--resolution")
+    command(incident, "stats", cmd_incident_stats, "incident statistics")
+    
+    workflow = groups.add_parser("workflow", help="workflow management").add_subparsers(dest="command", metavar="<action>")
+    workflow.required = True
+    command(workflow, "list", cmd_workflow_list, "list workflows")
+    p = command(workflow, "show", cmd_workflow_show, "show a workflow definition")
+    p.add_argument("name")
+    p = command(workflow, "run", cmd_workflow_run, "run a workflow's steps locally")
+    p.add_argument("name")
+    p.add_argument("--dry-run", action="store_true", help="print the steps without running them")
+    p = command(workflow, "runs", cmd_workflow_runs, "list workflow runs")
+    p.add_argument("--workflow")
+    p.add_argument("--status", choices=["pending", "running", "completed", "failed", "cancelled"])
+    p = command(workflow, "status", cmd_workflow_status, "show a workflow run")
+    p.add_argument("run_id")
+    
+    security = groups.add_parser("security", help="security & protection").add_subparsers(dest="command", metavar="<action>")
+    security.required = True
+    p = command(security, "analyze", cmd_security_analyze, "analyze a log file for security threats")
+    p.add_argument("path", help='log file (compressed archives are read transparently), or "-" for stdin')
+    time_range_arguments(p)
+    p = command(security, "events", cmd_security_events, "list security events")
+    p.add_argument("--threat-level", choices=["low", "medium", "high", "critical"])
+    p.add_argument("--status", choices=["detected", "investigating", "resolved", "false_positive"])
+    command(security, "recommendations", cmd_security_recommendations, "security recommendations")
+    command(security, "stats", cmd_security_stats, "security statistics")
+    
+    team = groups.add_parser("team", help="team management").add_subparsers(dest="command", metavar="<action>")
+    team.required = True
+    command(team, "list", cmd_team_list, "list your teams")
+    
+    return parser
+
+
+def _cell(value: Any) -> str:
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value, default=str, ensure_ascii=False)
+    text = "" if value is None else str(value)
+    return text if len(text) <= 60 else text[:57] + "..."
+
+
+def print_result(data: Any, as_json: bool):
+    """Sonucu stdout'a yazar: JSON veya okunabilir tablo/anahtar-değer"""
+    if as_json:
+        sys.stdout.write(json.dumps(data, indent=2, default=str, ensure_ascii=False) + "\n")
+        return
+    
+    out = Console(highlight=False, theme=custom_theme, soft_wrap=True)
+    if isinstance(data, list) and data and all(isinstance(item, dict) for item in data):
+        columns = list(data[0].keys())[:6]
+        table = Table(box=box.SIMPLE, show_header=True, header_style="rgb(167,199,231)")
+        for column in columns:
+            table.add_column(column)
+        for item in data:
+            table.add_row(*[Text(_cell(item.get(column))) for column in columns])
+        out.print(table)
+    elif isinstance(data, dict):
+        for key, value in data.items():
+            line = Text(f"{key}: ", style="rgb(167,199,231)")
+            line.append(_cell(value))
+            out.print(line)
+    elif isinstance(data, list) and not data:
+        out.print("[dim]No results.[/dim]")
+    else:
+        out.print(Text(_cell(data)))
+
+
+def run(argv: Optional[List[str]] = None) -> int:
+    """Komutu çalıştırır ve çıkış kodunu döndürür"""
+    parser = build_parser()
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else EXIT_USAGE
+    
+    if args.api_url:
+        # api modülü import sırasından bağımsız olarak bu URL'yi kullanır; ortam
+        # değişkeni alt süreçler (multiprocessing worker'ları) içindir
+        os.environ["NEUROPS_API_URL"] = normalize_api_url(args.api_url)
+        neurops.api.set_api_url(args.api_url)
+    
+    # İlerleme mesajları stdout'taki sonucu bozmasın
+    console.file = sys.stderr
+    
+    try:
+        data = args.func(args)
+    except CommandError as e:
+        if args.json:
+            print_result(e.data if e.data is not None else {"error": str(e)}, True)
+        console.print(f"Error: {e}", style="rgb(167,199,231)", markup=False)
+        return e.exit_code
+    except KeyboardInterrupt:
+        return 130
+    except Exception as e:
+        exit_code = EXIT_UNAVAILABLE if _is_connection_error(e) else EXIT_ERROR
+        if args.json:
+            print_result({"error": str(e)}, True)
+        console.print(f"Error: {e}", style="rgb(167,199,231)", markup=False)
+        return exit_code
+    
+    print_result(data, args.json)
+    return EXIT_OK
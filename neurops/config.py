@@ -0,0 +1,325 @@
+"""Yerel config (~/.neurops/config.json), settings ve kullanıcı kimliği"""
+
+import os
+import json
+import threading
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+
+CONFIG_DIR = Path.home() / ".neurops"
+CONFIG_FILE = CONFIG_DIR / "config.json"
+USER_WORKFLOWS_DIR = CONFIG_DIR / "workflows"
+DEFAULT_WORKFLOWS_DIR = Path(__file__).parent.parent / "workflows"
+DEFAULT_API_URL = "http://127.0.0.1:8000"
+
+def ensure_config_dir():
+    """Config dizinini oluştur"""
+    CONFIG_DIR.mkdir(exist_ok=True)
+
+class ConfigStore:
+    """
+    config.json için süreç içi önbellek.
+    Dosya sadece stat bilgisi (mtime/size/inode) değiştiğinde yeniden okunur,
+    yazmalar geçici dosya + rename ile atomik yapılır.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.RLock()
+        self._data: Dict[str, Any] = {}
+        self._stat_key = None
+
+    def _read_stat_key(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def load(self) -> Dict[str, Any]:
+        """Güncel config'i döndürür (dosya değişmediyse önbellekten). Dönen dict değiştirilmemeli."""
+        with self._lock:
+            stat_key = self._read_stat_key()
+            if stat_key != self._stat_key:
+                data = {}
+                if stat_key is not None:
+                    try:
+                        data = json.loads(self.path.read_text(encoding="utf-8"))
+                    except (OSError, ValueError):
+                        data = {}
+                    if not isinstance(data, dict):
+                        data = {}
+                self._data = data
+                self._stat_key = stat_key
+            return self._data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.load().get(key, default)
+
+    def update(self, **values) -> None:
+        """Verilen anahtarları config'e atomik olarak yazar"""
+        with self._lock:
+            data = dict(self.load())
+            data.update(values)
+            self._write(data)
+
+    def rewrite(self, func: Callable[[Dict[str, Any]], Dict[str, Any]]) -> None:
+        """Config'i func(kopya) sonucuyla atomik olarak değiştirir (anahtar silmek için)"""
+        with self._lock:
+            self._write(func(dict(self.load())))
+
+    def _write(self, data: Dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.path.parent), prefix=".config-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._data = data
+        self._stat_key = self._read_stat_key()
+
+config_store = ConfigStore(CONFIG_FILE)
+
+def is_setup_completed() -> bool:
+    """Setup'ın tamamlanıp tamamlanmadığını kontrol et"""
+    return bool(config_store.get("setup_completed", False))
+
+def mark_setup_completed():
+    """Setup'ı tamamlandı olarak işaretle"""
+    try:
+        config_store.update(setup_completed=True)
+        return True
+    except:
+        return False
+
+def normalize_api_url(url: str) -> str:
+    """API URL'ini normalize et - sonundaki /'yi kaldır"""
+    if not url:
+        return url
+    url = url.strip()
+    # Sonundaki /'yi kaldır
+    while url.endswith('/'):
+        url = url[:-1]
+    return url
+
+def save_api_url(api_url: str) -> bool:
+    """
+    API URL'ini config dosyasına kaydeder.
+    """
+    try:
+        # URL'yi normalize et
+        normalized_url = normalize_api_url(api_url)
+        
+        config_store.update(api_url=normalized_url)
+        
+        # Environment variable olarak da ayarla
+        os.environ["NEUROPS_API_URL"] = normalized_url
+        
+        return True
+    except Exception as e:
+        # Fallback: sadece environment variable
+        normalized_url = normalize_api_url(api_url)
+        os.environ["NEUROPS_API_URL"] = normalized_url
+        return False
+
+def load_api_url():
+    """
+    API URL'ini yükler.
+    Önce environment variable'dan, sonra config dosyasından okur.
+    """
+    # 1. Environment variable'dan kontrol et
+    api_url = os.getenv("NEUROPS_API_URL")
+    if api_url and len(api_url.strip()) > 0:
+        return normalize_api_url(api_url.strip())
+    
+    # 2. Config dosyasından oku
+    api_url = config_store.get("api_url")
+    if api_url and len(str(api_url).strip()) > 0:
+        api_url = str(api_url).strip()
+        normalized_url = normalize_api_url(api_url)
+        os.environ["NEUROPS_API_URL"] = normalized_url
+        return normalized_url
+    
+    return None
+
+def save_hf_token(token: str) -> bool:
+    """
+    Hugging Face API token'ını config dosyasına kaydeder.
+    """
+    try:
+        config_store.update(hf_token=token)
+        
+        # Environment variable olarak da ayarla
+        os.environ["HF_API_KEY"] = token
+        
+        return True
+    except Exception as e:
+        # Fallback: sadece environment variable
+        os.environ["HF_API_KEY"] = token
+        return False
+
+def load_hf_token() -> str:
+    """
+    Hugging Face API token'ını yükler.
+    Önce environment variable'dan, sonra config dosyasından okur.
+    """
+    # 1. Environment variable'dan kontrol et
+    token = os.getenv("HF_API_KEY")
+    if token and len(token.strip()) > 0:
+        return token.strip()
+    
+    # 2. Config dosyasından oku
+    token = config_store.get("hf_token")
+    if token and len(str(token).strip()) > 0:
+        token = str(token).strip()
+        os.environ["HF_API_KEY"] = token
+        return token
+    
+    return None
+
+# Settings varsayılanları (config.json -> "settings")
+SETTINGS_DEFAULTS = {
+    "auto_workflow_generation": False,
+    "auto_incident_creation": False,
+    "request_compression": "off",  # off | auto | gzip | zstd
+    "response_cache": "memory",  # off | memory | disk
+    "log_prescan": True,  # Log analizinde yalnızca error/warning pencerelerini gönder
+    "prescan_context_lines": 3,
+    "incremental_log_analysis": False,  # Aynı dosyada yalnızca son analizden sonra eklenenleri işle
+    "local_analysis": "fallback",  # off | fallback | filter - API'ye ulaşılamazsa yerel kural motoru
+    "analysis_cache": "disk",  # off | memory | disk - aynı içeriğin analiz sonucu tekrar istenmez
+    "analysis_cache_ttl": 3600,  # saniye
+    "analysis_on_error": True,  # Monitor: hata satırında beklemeden analiz
+    "analysis_debounce": 1,  # saniye - çıktı bu kadar durunca analiz
+    "analysis_max_delay": 10,  # saniye - kesintisiz akan çıktı en fazla bu kadar bekler
+    "analysis_budget_per_minute": 12  # Dakikada en fazla analiz isteği (0 = sınırsız)
+}
+
+def save_settings(auto_workflow: bool = False, auto_incident: bool = False, **extra) -> bool:
+    """Settings'i config dosyasına kaydeder (verilmeyen ayarlar korunur)"""
+    try:
+        settings = load_settings()
+        settings.update(extra)
+        settings["auto_workflow_generation"] = auto_workflow
+        settings["auto_incident_creation"] = auto_incident
+        config_store.update(settings=settings)
+        return True
+    except Exception as e:
+        return False
+
+def load_settings() -> dict:
+    """Settings'i config dosyasından yükler"""
+    settings = config_store.get("settings") or {}
+    if not isinstance(settings, dict):
+        settings = {}
+    return {key: settings.get(key, default) for key, default in SETTINGS_DEFAULTS.items()}
+
+# Kimlik bilgisi süreç başına bir kez çözümlenir (her istekte DNS sorgusu yapılmaz)
+IDENTITY_RESOLVE_TIMEOUT = 2.0
+
+_identity = None
+_identity_lock = threading.Lock()
+
+def _resolve_host_ip(hostname: str, timeout: float) -> Optional[str]:
+    """gethostbyname'i süre sınırı ile çalıştır (yavaş/bozuk resolver'da takılmasın)"""
+    import socket
+    result = [None]
+    
+    def lookup():
+        try:
+            result[0] = socket.gethostbyname(hostname)
+        except OSError:
+            pass
+    
+    lookup_thread = threading.Thread(target=lookup, daemon=True)
+    lookup_thread.start()
+    lookup_thread.join(timeout)
+    return result[0]
+
+def get_identity() -> Dict[str, str]:
+    """
+    user_id, username ve hostname'i döndürür.
+    İlk çağrıda çözümlenir, eksik alanlar config'e kaydedilir; sonraki çağrılar önbellekten döner.
+    """
+    global _identity
+    if _identity is not None:
+        return _identity
+    
+    with _identity_lock:
+        if _identity is not None:
+            return _identity
+        
+        import socket
+        import getpass
+        
+        try:
+            hostname = socket.gethostname()
+        except OSError:
+            hostname = "unknown"
+        
+        missing = {}
+        
+        user_id = config_store.get("user_id")
+        if not user_id:
+            # Fallback: hostname + IP adresini kullan
+            ip_address = _resolve_host_ip(hostname, IDENTITY_RESOLVE_TIMEOUT)
+            if ip_address:
+                user_id = f"{hostname}_{ip_address}"
+                missing["user_id"] = user_id
+            else:
+                # Çözümlenemedi - kaydetme, bir sonraki çalıştırmada tekrar denensin
+                user_id = "unknown"
+        
+        username = config_store.get("username")
+        if not username:
+            try:
+                username = getpass.getuser()
+                missing["username"] = username
+            except Exception:
+                username = "unknown"
+        
+        if config_store.get("hostname") != hostname:
+            missing["hostname"] = hostname
+        
+        if missing:
+            try:
+                config_store.update(**missing)
+            except Exception:
+                pass
+        
+        _identity = {"user_id": user_id, "username": username, "hostname": hostname}
+        return _identity
+
+def get_user_id() -> str:
+    """Kullanıcı ID'sini al (IP veya config'den)"""
+    return get_identity()["user_id"]
+
+
+def get_username() -> str:
+    """Kullanıcı adını al"""
+    return get_identity()["username"]
+
+
+def get_api_headers() -> dict:
+    """
+    API çağrıları için header'ları döndürür.
+    Token varsa header'a ekler.
+    """
+    headers = {"Content-Type": "application/json"}
+    token = load_hf_token()
+    if token:
+        headers["X-HF-Token"] = token
+    identity = get_identity()
+    headers["X-User-ID"] = identity["user_id"]
+    headers["X-Username"] = identity["username"]
+    return headers
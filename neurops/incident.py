@@ -0,0 +1,444 @@
+"""Incident yönetimi komutları"""
+
+
+from rich.table import Table
+from rich.prompt import Confirm, Prompt
+from rich.panel import Panel
+from rich.status import Status
+from rich import box
+
+from neurops.config import get_api_headers
+from neurops.api import api_get, api_get_cached, api_patch, api_post
+from neurops.ui import console, get_multiline_input_simple
+
+
+def report_incident():
+    """Incident raporlama"""
+    console.print()
+    title = Prompt.ask("[rgb(167,199,231)]Enter incident title[/rgb(167,199,231)]")
+    description = Prompt.ask("[rgb(167,199,231)]Enter incident description[/rgb(167,199,231)]")
+    severity = Prompt.ask(
+        "[rgb(167,199,231)]Severity[/rgb(167,199,231)]",
+        choices=["low", "medium", "high", "critical"],
+        default="medium"
+    )
+    
+    # Takım seçeneği
+    team_id = None
+    if Confirm.ask("[rgb(167,199,231)]Associate with a team?[/rgb(167,199,231)]", default=False):
+        team_id = Prompt.ask("[rgb(167,199,231)]Enter team ID[/rgb(167,199,231)]")
+    
+    try:
+        params = {}
+        if team_id:
+            params["team_id"] = team_id
+        
+        with Status("[rgb(167,199,231)]Reporting incident...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+            res = api_post(
+                "/incident/report",
+                json={
+                    "title": title,
+                    "description": description,
+                    "severity": severity
+                },
+                params=params,
+                headers=get_api_headers()
+            )
+        
+        if res.status_code == 200:
+            incident = res.json()
+            console.print()
+            success_panel = Panel(
+                f"[rgb(167,199,231)]Incident created successfully![/rgb(167,199,231)]\n\n"
+                f"ID: [white]{incident.get('id')}[/white]\n"
+                f"Status: [white]{incident.get('status')}[/white]",
+                border_style="white",
+                box=box.SIMPLE
+            )
+            console.print(success_panel)
+        else:
+            console.print(f"[rgb(167,199,231)]Error: {res.status_code}[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)]Error: {e}[/rgb(167,199,231)]")
+
+
+def list_incidents():
+    """Incident'leri listele"""
+    console.print()
+    
+    # Takım filtresi
+    use_team = Confirm.ask("[rgb(167,199,231)]Filter by team?[/rgb(167,199,231)]", default=False)
+    team_id = None
+    if use_team:
+        team_id = Prompt.ask("[rgb(167,199,231)]Enter team ID[/rgb(167,199,231)]")
+    
+    # Filtre seçenekleri
+    status_filter = Prompt.ask(
+        "[rgb(167,199,231)]Filter by status (optional)[/rgb(167,199,231)]",
+        choices=["", "open", "in_progress", "resolved", "closed"],
+        default=""
+    )
+    severity_filter = Prompt.ask(
+        "[rgb(167,199,231)]Filter by severity (optional)[/rgb(167,199,231)]",
+        choices=["", "low", "medium", "high", "critical"],
+        default=""
+    )
+    
+    try:
+        params = {}
+        if team_id:
+            params["team_id"] = team_id
+        if status_filter:
+            params["status"] = status_filter
+        if severity_filter:
+            params["severity"] = severity_filter
+        
+        with Status("[rgb(167,199,231)]Fetching incidents...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+            res = api_get_cached("/incident/", params=params, headers=get_api_headers())
+        
+        if res.status_code == 200:
+            incidents = res.json()
+            console.print()
+            
+            if not incidents:
+                console.print("[rgb(167,199,231)]No incidents found.[/rgb(167,199,231)]")
+                return
+            
+            table = Table(
+                title="[rgb(167,199,231)]Incidents[/rgb(167,199,231)]",
+                box=box.SIMPLE,
+                border_style="white",
+                show_header=True,
+                header_style="rgb(167,199,231)"
+            )
+            table.add_column("ID", style="white", width=36)
+            table.add_column("Title", style="white", width=30)
+            table.add_column("Severity", style="rgb(167,199,231)", width=12)
+            table.add_column("Status", style="white", width=15)
+            table.add_column("Created", style="dim", width=20)
+            
+            status_colors = {
+                "open": "red",
+                "in_progress": "yellow",
+                "resolved": "green",
+                "closed": "dim"
+            }
+            
+            severity_icons = {
+                "low": "[white]LOW[/white]",
+                "medium": "[rgb(167,199,231)]MEDIUM[/rgb(167,199,231)]",
+                "high": "[rgb(167,199,231)]HIGH[/rgb(167,199,231)]",
+                "critical": "[rgb(167,199,231)]CRITICAL[/rgb(167,199,231)]"
+            }
+            
+            for incident in incidents:
+                inc_id = incident.get('id', 'N/A')[:8] + '...'
+                title = incident.get('title', 'N/A')[:28] + '...' if len(incident.get('title', '')) > 28 else incident.get('title', 'N/A')
+                severity = incident.get('severity', 'N/A')
+                status = incident.get('status', 'N/A')
+                created = incident.get('created_at', 'N/A')[:19] if incident.get('created_at') else 'N/A'
+                
+                severity_display = f"{severity_icons.get(severity, severity)}"
+                status_display = f"[{status_colors.get(status, 'white')}]{status}[/{status_colors.get(status, 'white')}]"
+                
+                table.add_row(inc_id, title, severity_display, status_display, created)
+            
+            console.print(table)
+        else:
+            console.print(f"[rgb(167,199,231)]Error: {res.status_code}[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)]Error: {e}[/rgb(167,199,231)]")
+
+
+def view_incident():
+    """Incident detaylarını görüntüle"""
+    console.print()
+    incident_id = Prompt.ask("[rgb(167,199,231)]Enter incident ID[/rgb(167,199,231)]")
+    
+    try:
+        with Status("[rgb(167,199,231)]Fetching incident details...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+            res = api_get(f"/incident/{incident_id}")
+        
+        if res.status_code == 200:
+            incident = res.json()
+            console.print()
+            
+            # Status icon
+            status = incident.get('status', 'unknown')
+            status_icons = {
+                'open': '[rgb(167,199,231)]OPEN[/rgb(167,199,231)]',
+                'in_progress': '[rgb(167,199,231)]IN PROGRESS[/rgb(167,199,231)]',
+                'resolved': '[rgb(167,199,231)]RESOLVED[/rgb(167,199,231)]',
+                'closed': '[dim white]CLOSED[/dim white]'
+            }
+            
+            # Severity icon
+            severity = incident.get('severity', 'unknown')
+            
+            info_text = f"[rgb(167,199,231)]ID:[/rgb(167,199,231)] {incident.get('id')}\n"
+            info_text += f"[rgb(167,199,231)]Title:[/rgb(167,199,231)] {incident.get('title')}\n"
+            info_text += f"[rgb(167,199,231)]Description:[/rgb(167,199,231)] {incident.get('description')}\n"
+            info_text += f"[rgb(167,199,231)]Severity:[/rgb(167,199,231)] {severity.upper()}\n"
+            info_text += f"[rgb(167,199,231)]Status:[/rgb(167,199,231)] {status.upper()}\n"
+            info_text += f"[rgb(167,199,231)]Created:[/rgb(167,199,231)] {incident.get('created_at')}\n"
+            info_text += f"[rgb(167,199,231)]Updated:[/rgb(167,199,231)] {incident.get('updated_at')}\n"
+            
+            if incident.get('resolved_at'):
+                info_text += f"[rgb(167,199,231)]Resolved:[/rgb(167,199,231)] {incident.get('resolved_at')}\n"
+            if incident.get('assigned_to'):
+                info_text += f"[rgb(167,199,231)]Assigned To:[/rgb(167,199,231)] {incident.get('assigned_to')}\n"
+            if incident.get('resolution'):
+                info_text += f"[rgb(167,199,231)]Resolution:[/rgb(167,199,231)] {incident.get('resolution')}\n"
+            
+            # Generated workflow bilgisi
+            if incident.get('metadata') and incident.get('metadata').get('generated_workflow'):
+                workflow_name = incident.get('metadata').get('generated_workflow')
+                info_text += f"\n[rgb(167,199,231)]Generated Workflow:[/rgb(167,199,231)] [white]{workflow_name}[/white]"
+            
+            info_panel = Panel(
+                info_text,
+                border_style="white",
+                box=box.SIMPLE
+            )
+            console.print(info_panel)
+        elif res.status_code == 404:
+            console.print(f"[rgb(167,199,231)]Incident '{incident_id}' not found[/rgb(167,199,231)]")
+        else:
+            console.print(f"[rgb(167,199,231)]Error: {res.status_code}[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)]Error: {e}[/rgb(167,199,231)]")
+
+
+def update_incident():
+    """Incident'i güncelle"""
+    console.print()
+    incident_id = Prompt.ask("[rgb(167,199,231)]Enter incident ID[/rgb(167,199,231)]")
+    
+    # Önce incident'i getir
+    try:
+        res = api_get(f"/incident/{incident_id}")
+        if res.status_code != 200:
+            console.print(f"[rgb(167,199,231)]Incident not found[/rgb(167,199,231)]")
+            return
+        incident = res.json()
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)]Error: {e}[/rgb(167,199,231)]")
+        return
+    
+    console.print()
+    console.print(f"[dim]Current incident: {incident.get('title')}[/dim]")
+    console.print()
+    
+    # Güncelleme seçenekleri
+    update_data = {}
+    
+    if Confirm.ask("[rgb(167,199,231)]Update status?[/rgb(167,199,231)]", default=False):
+        new_status = Prompt.ask(
+            "[white]New status[/white]",
+            choices=["open", "in_progress", "resolved", "closed"],
+            default=incident.get('status', 'open')
+        )
+        update_data["status"] = new_status
+    
+    if Confirm.ask("[rgb(167,199,231)]Update description?[/rgb(167,199,231)]", default=False):
+        new_description = get_multiline_input_simple("[white]New description[/white]")
+        if new_description:
+            update_data["description"] = new_description
+    
+    if Confirm.ask("[rgb(167,199,231)]Add/Update resolution?[/rgb(167,199,231)]", default=False):
+        resolution = get_multiline_input_simple("[white]Resolution[/white]")
+        if resolution:
+            update_data["resolution"] = resolution
+    
+    if Confirm.ask("[rgb(167,199,231)]Assign to someone?[/rgb(167,199,231)]", default=False):
+        assigned_to = Prompt.ask("[white]Assign to (username/email)[/white]")
+        if assigned_to:
+            update_data["assigned_to"] = assigned_to
+    
+    if not update_data:
+        console.print("[rgb(167,199,231)]No updates provided.[/rgb(167,199,231)]")
+        return
+    
+    try:
+        with Status("[rgb(167,199,231)]Updating incident...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+            res = api_patch(
+                f"/incident/{incident_id}",
+                json=update_data
+            )
+        
+        if res.status_code == 200:
+            updated_incident = res.json()
+            console.print()
+            success_panel = Panel(
+                f"[white]Incident updated successfully![/white]\n\n"
+                f"Status: [white]{updated_incident.get('status')}[/white]",
+                border_style="white",
+                box=box.SIMPLE
+            )
+            console.print(success_panel)
+        else:
+            error_detail = res.json().get('detail', 'Unknown error')
+            console.print(f"[rgb(167,199,231)]Error: {error_detail}[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)]Error: {e}[/rgb(167,199,231)]")
+
+
+def resolve_incident():
+    """Incident'i çöz"""
+    console.print()
+    incident_id = Prompt.ask("[white]Enter incident ID[/white]")
+    
+    # Resolution açıklaması (opsiyonel)
+    resolution = None
+    if Confirm.ask("[rgb(167,199,231)]Add resolution description?[/rgb(167,199,231)]", default=False):
+        resolution = get_multiline_input_simple("[white]Resolution[/white]")
+    
+    try:
+        with Status("[rgb(167,199,231)]Resolving incident...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+            res = api_post(
+                f"/incident/{incident_id}/resolve",
+                json={"resolution": resolution} if resolution else {}
+            )
+        
+        if res.status_code == 200:
+            resolved_incident = res.json()
+            console.print()
+            success_panel = Panel(
+                f"[white]Incident resolved successfully![/white]\n\n"
+                f"Status: [white]{resolved_incident.get('status')}[/white]\n"
+                f"Resolved at: [white]{resolved_incident.get('resolved_at')}[/white]",
+                title="Success",
+                border_style="white",
+                box=box.SIMPLE
+            )
+            console.print(success_panel)
+        else:
+            error_detail = res.json().get('detail', 'Unknown error')
+            console.print(f"[rgb(167,199,231)] Error: {error_detail}[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)] Error: {e}[/rgb(167,199,231)]")
+
+
+def generate_workflow_for_incident():
+    """Incident için AI ile workflow oluştur"""
+    console.print()
+    panel = Panel(
+        "[rgb(167,199,231)]Generate Workflow for Incident[/rgb(167,199,231)]\n\n"
+        "[rgb(167,199,231)]AI will analyze the incident and create a custom remediation workflow.[/rgb(167,199,231)]",
+        border_style="white",
+        box=box.SIMPLE
+    )
+    console.print(panel)
+    console.print()
+    
+    incident_id = Prompt.ask("[rgb(167,199,231)]Enter incident ID[/rgb(167,199,231)]")
+    
+    auto_run = Confirm.ask(
+        "[rgb(167,199,231)]Automatically run the generated workflow?[/rgb(167,199,231)]",
+        default=False
+    )
+    
+    try:
+        with Status("[rgb(167,199,231)]AI is analyzing incident and generating workflow...[/rgb(167,199,231)]", spinner="dots12", spinner_style="rgb(167,199,231)"):
+            res = api_post(
+                f"/incident/{incident_id}/generate-workflow",
+                params={"auto_run": str(auto_run).lower()},
+                timeout=120  # AI generation için daha uzun timeout
+            )
+        
+        if res.status_code == 200:
+            result = res.json()
+            console.print()
+            
+            auto_run_msg = f"[rgb(167,199,231)]Workflow will be executed automatically[/rgb(167,199,231)]" if result.get('auto_run') else "[dim]You can run the workflow manually from the Workflow Management menu[/dim]"
+            
+            success_panel = Panel(
+                f"[white]Workflow generated successfully![/white]\n\n"
+                f"Workflow Name: [white]{result.get('workflow_name')}[/white]\n"
+                f"Incident ID: [white]{result.get('incident_id')}[/white]\n"
+                f"Auto Run: [white]{'Yes' if result.get('auto_run') else 'No'}[/white]\n\n"
+                f"{auto_run_msg}",
+                title="Success",
+                border_style="white",
+                box=box.SIMPLE
+            )
+            console.print(success_panel)
+            
+            if result.get('workflow_name'):
+                console.print()
+                if Confirm.ask("[white]View the generated workflow?[/white]", default=True):
+                    # Workflow'u göster
+                    try:
+                        wf_res = api_get_cached(f"/workflow/{result.get('workflow_name')}")
+                        if wf_res.status_code == 200:
+                            workflow = wf_res.json()
+                            console.print()
+                            workflow_panel = Panel(
+                                f"[white]Name:[/white] {workflow.get('name')}\n"
+                                f"[white]Description:[/white] {workflow.get('description', 'N/A')}\n"
+                                f"[white]Steps:[/white] {len(workflow.get('steps', []))}",
+                                title="[bold white]Generated Workflow[/bold white]",
+                                border_style="white",
+                                box=box.SIMPLE
+                            )
+                            console.print(workflow_panel)
+                    except:
+                        pass
+        elif res.status_code == 404:
+            console.print(f"[rgb(167,199,231)] Incident '{incident_id}' not found[/rgb(167,199,231)]")
+        else:
+            error_detail = res.json().get('detail', 'Unknown error')
+            console.print(f"[rgb(167,199,231)] Error: {error_detail}[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)] Error: {e}[/rgb(167,199,231)]")
+
+
+def incident_stats():
+    """Incident istatistiklerini göster"""
+    try:
+        with Status("[rgb(167,199,231)]Fetching incident statistics...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+            res = api_get_cached("/incident/stats/summary")
+        
+        if res.status_code == 200:
+            stats = res.json()
+            console.print()
+            
+            table = Table(
+                title="[bold white]Incident Statistics[/bold white]",
+                box=box.SIMPLE,
+                border_style="white",
+                show_header=True,
+                header_style="bold red"
+            )
+            table.add_column("Metric", style="white", width=25)
+            table.add_column("Value", style="white", width=20)
+            
+            table.add_row("Total Incidents", str(stats.get('total', 0)))
+            table.add_row("Active", f"[rgb(167,199,231)]{stats.get('active', 0)}[/rgb(167,199,231)]")
+            table.add_row("Open", f"[rgb(167,199,231)]{stats.get('open', 0)}[/rgb(167,199,231)]")
+            table.add_row("In Progress", f"[rgb(167,199,231)]{stats.get('in_progress', 0)}[/rgb(167,199,231)]")
+            table.add_row("Resolved", f"[white]{stats.get('resolved', 0)}[/white]")
+            
+            console.print(table)
+            
+            # By severity
+            if stats.get('by_severity'):
+                console.print()
+                severity_table = Table(
+                    title="[bold white]By Severity[/bold white]",
+                    box=box.SIMPLE,
+                    border_style="white",
+                    show_header=True,
+                    header_style="bold red"
+                )
+                severity_table.add_column("Severity", style="white", width=20)
+                severity_table.add_column("Count", style="white", width=15)
+                
+                for severity, count in stats.get('by_severity', {}).items():
+                    severity_table.add_row(severity.upper(), str(count))
+                
+                console.print(severity_table)
+        else:
+            console.print(f"[rgb(167,199,231)] Error: {res.status_code}[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)] Error: {e}[/rgb(167,199,231)]")
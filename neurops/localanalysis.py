@@ -0,0 +1,262 @@
+"""
+Yerel (çevrimdışı) analiz motoru: derlenmiş kural setleriyle backend'in
+/logs/analyze ve /security/analyze yanıtlarıyla aynı şemada sonuç üretir.
+API'ye ulaşılamadığında otomatik devreye girer; "filter" modunda önce yerel
+motor çalışır ve backend yalnızca yerel motor bir bulgu çıkarırsa çağrılır.
+"""
+
+import re
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from neurops import logscan
+from neurops.config import load_settings
+
+
+# off: yalnızca backend | fallback: API'ye ulaşılamazsa yerel | filter: bulgu yoksa backend çağrılmaz
+LOCAL_ANALYSIS_MODES = ["off", "fallback", "filter"]
+ENGINE_LOCAL = "local"
+ENGINE_MIXED = "mixed"  # Parçaların bir kısmı backend'de, bir kısmı yerelde analiz edildi
+
+UNAVAILABLE_STATUS_CODES = (502, 503, 504)
+OFFLINE_RETRY_INTERVAL = 30.0  # saniye - bağlantı hatasından sonra backend bu süre denenmez
+MAX_ISSUE_CHARS = 200  # critical_issues / threats satırlarının kırpıldığı uzunluk
+MAX_THREATS_PER_TYPE = 5  # Tür başına threats listesine eklenen örnek satır
+BRUTE_FORCE_THRESHOLD = 10  # Bu kadar başarısız girişten sonra brute force seviyesi yükselir
+
+# Seviye sırası ve güvenlik skorundan düşülen puan (tür başına en fazla 3 kez)
+THREAT_LEVELS = ["low", "medium", "high", "critical"]
+THREAT_PENALTY = {"low": 2, "medium": 7, "high": 15, "critical": 30}
+VULNERABILITY_PENALTY = 5
+
+_offline_until = 0.0
+
+
+def _compile(pattern: bytes):
+    return re.compile(pattern)
+
+
+# Kurallar küçük harfe çevrilmiş byte'lar üzerinde çalışır (bytes.lower yalnızca ASCII'yi
+# değiştirir, offset'ler korunur). Sabit önekle başlayan küçük harf regex'ler (?i) ve
+# baştaki \b'li hallerinden ~10 kat hızlı; bu yüzden desenler küçük harf yazılır.
+
+# (başlık, regex, critical mi, öneri) - critical olanlar critical_issues'a girer
+LOG_RULES = [(title, _compile(pattern), critical, recommendation) for title, pattern, critical, recommendation in (
+    ("Out of memory", rb"out of memory|oomkilled|oom-kill|cannot allocate memory|memoryerror|outofmemoryerror", True,
+     "Check memory limits and usage of the affected process; look for leaks or raise the limit."),
+    ("Disk full", rb"no space left on device|enospc|disk full|disk is full|quota exceeded", True,
+     "Free disk space or extend the volume; check log rotation and temporary files."),
+    ("Process crash", rb"segmentation fault|sigsegv|core dumped|kernel panic|panic: |fatal error: ", True,
+     "Inspect the crash dump/stack trace and the last deployed change of the crashing process."),
+    ("Service crash loop", rb"crashloopbackoff|back-off restarting failed container|exited with code [1-9]|main process exited, code=", True,
+     "Check the service's startup logs and configuration; it keeps exiting after start."),
+    ("Database failure", rb"deadlock|too many connections|could not connect to (?:server|database)|database is locked|connection pool (?:exhausted|timeout)", True,
+     "Check database health, connection pool sizing and long-running transactions."),
+    ("Connection failure", rb"connection refused|econnrefused|econnreset|connection reset by peer|broken pipe|ehostunreach|no route to host", False,
+     "Verify that the downstream service is running and reachable (ports, firewall, service discovery)."),
+    # Çıplak "timeout" timeout=30 / read_timeout: 5 gibi ayar satırlarına da uyar; yalnızca hata ifadeleri
+    ("Timeout", rb"timed out|timeouterror|timeout error|timeout exceeded|etimedout|deadline exceeded|gateway timeout|readtimeout|connecttimeout", False,
+     "Check latency of the dependency that timed out and review timeout/retry settings."),
+    ("DNS resolution failure", rb"name or service not known|could not resolve host|nxdomain|getaddrinfo|temporary failure in name resolution", False,
+     "Check DNS configuration and that the hostname is correct."),
+    ("TLS/certificate error", rb"certificate (?:verify failed|has expired|is not yet valid)|x509:|sslerror|ssl_error|handshake failure", False,
+     "Check certificate validity, chain and trust store on both sides."),
+    ("Permission denied", rb"permission denied|eacces|operation not permitted|access denied", False,
+     "Check file/directory ownership and the service account's permissions."),
+    ("HTTP 5xx responses", rb"http/\d(?:\.\d)?\"? 5\d\d\b|status(?:[ _]code)?[=: ]+5\d\d\b|internal server error|bad gateway|service unavailable", False,
+     "Look at the upstream service's error logs for the failing requests."),
+    ("Unhandled exception", rb"traceback \(most recent call last\)|exception in thread|unhandled exception|uncaught exception", False,
+     "Inspect the stack trace and add handling for the failing code path."),
+)]
+
+# (tür, regex, seviye, öneri) - türler report_security_event'teki olay türleriyle uyumlu
+SECURITY_RULES = [(kind, _compile(pattern), level, recommendation) for kind, pattern, level, recommendation in (
+    ("brute_force", rb"failed password for|authentication failure|invalid user \S+ from|login failed|too many authentication failures", "medium",
+     "Enable rate limiting or fail2ban for authentication endpoints and enforce key-based login."),
+    ("sql_injection", rb"union(?:\s|%20|\+)+(?:all(?:\s|%20|\+)+)?select|' or '1'='1|' or 1=1|sleep\(\d|benchmark\(\d|pg_sleep\(|information_schema|drop table", "high",
+     "Use parameterized queries and validate input on the affected endpoints."),
+    ("xss", rb"<script|%3cscript|javascript:|onerror=|onload=", "medium",
+     "Encode output and validate input; consider a Content-Security-Policy."),
+    ("path_traversal", rb"\.\./\.\./|%2e%2e%2f|%2e%2e/|\.\.%2f|\.\.%5c|/etc/passwd|/etc/shadow|win\.ini", "high",
+     "Normalize and restrict file paths built from user input."),
+    ("command_injection", rb"(?:;|\|\||&&|\$\(|`) ?(?:wget|curl|nc|ncat|bash|sh|python\d?|perl) |/bin/(?:ba)?sh -[ci]", "critical",
+     "Never pass user input to a shell; audit the affected endpoint and host for compromise."),
+    ("privilege_escalation", rb"sudo:.*(?:incorrect password attempts|not in sudoers|authentication failure)|su: failed|su: authentication failure|command=/bin/(?:ba)?sh\b", "high",
+     "Review sudo/su activity and the sudoers configuration for the listed users."),
+    ("suspicious_activity", rb"nmap|nikto|sqlmap|masscan|zgrab|dirbuster|gobuster|wpscan", "medium",
+     "Block the scanning sources and review which endpoints they probed."),
+    ("intrusion_attempt", rb"\[ufw block\]|iptables.*drop|possible break-in|possible syn flooding", "low",
+     "Review the blocked sources; repeated hits may warrant a permanent block."),
+    ("malware_detected", rb"xmrig|cryptonight|stratum\+tcp://|minerd|kinsing|kdevtmpfsi", "critical",
+     "Isolate the host and investigate the suspicious binary/process."),
+)]
+
+# (açıklama, regex)
+VULNERABILITY_RULES = [(description, _compile(pattern)) for description, pattern in (
+    ("Deprecated SSL/TLS protocol in use", rb"sslv[23]|tlsv1(?:\.[01])?(?!\.?\d)"),
+    ("Expired certificate", rb"certificate (?:has )?expired"),
+    ("Root login over SSH", rb"accepted \w+ for root from"),
+    ("Credentials written to logs", rb"(?:password|passwd|pwd|secret|api[_-]?key|token) ?[=:] ?[\"']?[^\s\"'*]{4,}"),
+)]
+
+
+def get_local_analysis_mode() -> str:
+    """Settings'teki local_analysis değeri (geçersizse fallback)"""
+    mode = load_settings().get("local_analysis")
+    return mode if mode in LOCAL_ANALYSIS_MODES else "fallback"
+
+
+def _match_lines(pattern, data: bytes, lowered: bytes, limit: Optional[int] = None) -> Tuple[int, List[str]]:
+    """
+    Kuralın (lowered üzerinde) eşleştiği satır sayısı ve data'dan ilk limit satır.
+    Bir satır bir kez sayılır.
+    """
+    count = 0
+    lines = []
+    pos = 0
+    size = len(lowered)
+    while True:
+        match = pattern.search(lowered, pos)
+        if not match:
+            break
+        start = logscan._line_start(lowered, match.start(), 0)
+        pos = logscan._line_end(lowered, match.start(), size)
+        count += 1
+        if limit is None or len(lines) < limit:
+            lines.append(data[start:pos].decode("utf-8", errors="replace").strip()[:MAX_ISSUE_CHARS])
+    return count, lines
+
+
+def analyze_logs_locally(text: str) -> Dict[str, Any]:
+    """/logs/analyze şemasında yerel analiz: sayaçlar logscan'den, bulgular LOG_RULES'tan"""
+    data = text.encode("utf-8", errors="replace")
+    lowered = data.lower()
+    _, counts = logscan.prescan_buffer(data, context_lines=0)
+    
+    critical_issues = []
+    recommendations = []
+    findings = []
+    for title, pattern, critical, recommendation in LOG_RULES:
+        count, lines = _match_lines(pattern, data, lowered, limit=1)
+        if not count:
+            continue
+        findings.append(f"{title} (x{count})" if count > 1 else title)
+        recommendations.append(recommendation)
+        if critical:
+            critical_issues.append(f"{title}: {lines[0]}" + (f" (x{count})" if count > 1 else ""))
+    
+    summary = f"Local rule-based analysis: {counts['errors']} errors, {counts['warnings']} warnings, {counts['tracebacks']} tracebacks."
+    summary += f" Matched: {', '.join(findings)}." if findings else " No known failure patterns matched."
+    return {
+        "summary": summary,
+        "errors_detected": counts["errors"],
+        "warnings_detected": counts["warnings"],
+        "critical_issues": critical_issues,
+        "recommendations": recommendations,
+        "engine": ENGINE_LOCAL
+    }
+
+
+def analyze_security_locally(text: str) -> Dict[str, Any]:
+    """/security/analyze şemasında yerel analiz (SECURITY_RULES, VULNERABILITY_RULES)"""
+    data = text.encode("utf-8", errors="replace")
+    lowered = data.lower()
+    threats = []
+    recommendations = []
+    found = []
+    threats_detected = 0
+    score = 100.0
+    top_level = 0
+    for kind, pattern, level, recommendation in SECURITY_RULES:
+        count, lines = _match_lines(pattern, data, lowered, limit=MAX_THREATS_PER_TYPE)
+        if not count:
+            continue
+        if kind == "brute_force" and count >= BRUTE_FORCE_THRESHOLD:
+            level = "high"
+        threats_detected += count
+        threats.extend({"type": kind, "level": level, "line": line} for line in lines)
+        recommendations.append(recommendation)
+        found.append(f"{kind} (x{count})" if count > 1 else kind)
+        score -= THREAT_PENALTY[level] * min(count, 3)
+        top_level = max(top_level, THREAT_LEVELS.index(level))
+    
+    vulnerabilities = [description for description, pattern in VULNERABILITY_RULES if pattern.search(lowered)]
+    score -= VULNERABILITY_PENALTY * len(vulnerabilities)
+    # En yüksek seviyeli tehditler önce listelenir
+    threats.sort(key=lambda threat: THREAT_LEVELS.index(threat["level"]), reverse=True)
+    
+    summary = f"Local rule-based analysis: {threats_detected} suspicious lines"
+    summary += f" ({', '.join(found)})." if found else ", no known attack patterns matched."
+    if vulnerabilities:
+        summary += f" {len(vulnerabilities)} potential vulnerabilities."
+    return {
+        "security_score": max(0.0, score),
+        "threats_detected": threats_detected,
+        "threat_level": THREAT_LEVELS[top_level],
+        "threats": threats,
+        "vulnerabilities": vulnerabilities,
+        "recommendations": recommendations,
+        "summary": summary,
+        "engine": ENGINE_LOCAL
+    }
+
+
+def has_findings(result: Dict[str, Any]) -> bool:
+    """Yerel sonuç backend'e gönderilmeye değer bir şey içeriyor mu (log ve güvenlik şeması)"""
+    return bool(
+        result.get("errors_detected") or result.get("warnings_detected") or result.get("critical_issues")
+        or result.get("threats_detected") or result.get("vulnerabilities")
+    )
+
+
+def is_unavailable_error(error: Exception) -> bool:
+    """Bağlantı hatası, timeout, açık circuit breaker veya 502/503/504 yanıtı"""
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        return True
+    return getattr(error, "status_code", None) in UNAVAILABLE_STATUS_CODES
+
+
+def mark_api_unavailable():
+    """Sonraki analizler OFFLINE_RETRY_INTERVAL boyunca backend'i denemeden yerelde yapılır"""
+    global _offline_until
+    _offline_until = time.monotonic() + OFFLINE_RETRY_INTERVAL
+
+
+def api_known_down() -> bool:
+    """
+    Yakın zamanda bağlantı hatası alındıysa veya arka plandaki check_api_connection
+    başarısız döndüyse True. Bağlantı henüz kontrol edilmediyse istek denenir.
+    """
+    if time.monotonic() < _offline_until:
+        return True
+    from neurops.bootstrap import get_cached_connection_status
+    status = get_cached_connection_status()
+    return status is not None and not status[0]
+
+
+def analyze_with_fallback(remote: Callable[[], Dict[str, Any]], local: Callable[[], Dict[str, Any]],
+                          mode: Optional[str] = None) -> Dict[str, Any]:
+    """
+    remote() backend sonucunu döndürür (başarısız yanıtta status_code'lu exception
+    fırlatır), local() aynı şemada yerel sonucu üretir. API'ye ulaşılamıyorsa yerel
+    sonuç "offline": True ile döner; filter modunda yerel bulgu yoksa backend
+    hiç çağrılmaz.
+    """
+    mode = mode or get_local_analysis_mode()
+    if mode == "off":
+        return remote()
+    if api_known_down():
+        return {**local(), "offline": True}
+    if mode == "filter":
+        result = local()
+        if not has_findings(result):
+            return result
+    try:
+        return remote()
+    except Exception as error:
+        if not is_unavailable_error(error):
+            raise
+        mark_api_unavailable()
+        return {**local(), "offline": True}
@@ -0,0 +1,97 @@
+"""
+Monitor ve full-agent modlarının canlı çıktı tamponu.
+Satır ve byte bütçeli halka tampon: ekleme ve taşan satırı atma O(1);
+tek başına dev bir satır (minify edilmiş JS, base64 dump) kırpılır, böylece
+bellek satır hızından ve satır uzunluğundan bağımsız olarak sınırlı kalır.
+"""
+
+import collections
+import itertools
+from typing import Iterable, Iterator, List, Optional
+
+
+DEFAULT_MAX_LINES = 100
+DEFAULT_MAX_BYTES = 256 * 1024
+DEFAULT_MAX_LINE_BYTES = 16 * 1024  # Daha uzun satırların yalnızca başı tutulur
+TRUNCATED_MARKER = " …[truncated]"
+
+
+class LogRingBuffer:
+    """
+    En fazla max_lines satır ve max_bytes byte (UTF-8) tutan FIFO tampon.
+    Sınır aşılınca en eski satırlar atılır. Liste gibi üzerinde dönülebilir;
+    tail_lines / tail_bytes son kısmı join yapmadan satır listesi olarak verir.
+    """
+
+    def __init__(self, max_lines: int = DEFAULT_MAX_LINES, max_bytes: int = DEFAULT_MAX_BYTES,
+                 max_line_bytes: Optional[int] = DEFAULT_MAX_LINE_BYTES):
+        self.max_lines = max(1, max_lines)
+        self.max_bytes = max(1, max_bytes)
+        self.max_line_bytes = min(max_line_bytes or self.max_bytes, self.max_bytes)
+        self._lines = collections.deque()
+        self._sizes = collections.deque()
+        self._bytes = 0
+
+    def append(self, line: str):
+        # ASCII satırlarda karakter sayısı UTF-8 boyutudur; encode yalnızca gerekirse
+        size = len(line) if line.isascii() else len(line.encode("utf-8", errors="replace"))
+        if size > self.max_line_bytes:
+            keep = max(0, self.max_line_bytes - len(TRUNCATED_MARKER.encode("utf-8")))
+            if line.isascii():
+                line = line[:keep]
+            else:
+                # Byte sınırında bölünen son karakter atılır
+                line = line.encode("utf-8", errors="replace")[:keep].decode("utf-8", errors="ignore")
+            line += TRUNCATED_MARKER
+            size = len(line.encode("utf-8", errors="replace"))
+        self._lines.append(line)
+        self._sizes.append(size)
+        self._bytes += size
+        while len(self._lines) > self.max_lines or self._bytes > self.max_bytes:
+            self._lines.popleft()
+            self._bytes -= self._sizes.popleft()
+
+    def extend(self, lines: Iterable[str]):
+        for line in lines:
+            self.append(line)
+
+    def clear(self):
+        self._lines.clear()
+        self._sizes.clear()
+        self._bytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Tampondaki satırların toplam UTF-8 boyutu"""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._lines)
+
+    def tail_lines(self, count: int) -> List[str]:
+        """Son count satır (eskiden yeniye)"""
+        if count <= 0:
+            return []
+        if count >= len(self._lines):
+            return list(self._lines)
+        tail = list(itertools.islice(reversed(self._lines), count))
+        tail.reverse()
+        return tail
+
+    def tail_bytes(self, limit: int) -> List[str]:
+        """Toplamı limit byte'ı aşmayan son satırlar (eskiden yeniye)"""
+        count = 0
+        used = 0
+        for size in reversed(self._sizes):
+            if used + size > limit:
+                break
+            used += size
+            count += 1
+        return self.tail_lines(count)
+
+    def text(self, lines: Optional[int] = None) -> str:
+        """Tamponun (veya son lines satırının) metni"""
+        return "\n".join(self._lines if lines is None else self.tail_lines(lines))
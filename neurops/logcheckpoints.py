@@ -0,0 +1,132 @@
+"""
+Artımlı log analizi için dosya checkpoint'leri.
+Dosyalar (device, inode) ile tanınır; son analiz edilen offset ile dosya başının
+fingerprint'i saklanır. Böylece tekrar analizde yalnızca sona eklenen satırlar
+işlenir, truncate ve rotate (aynı inode'a başka içerik) algılanır.
+"""
+
+import os
+import time
+import hashlib
+from typing import Any, BinaryIO, Dict, Optional
+
+from neurops.config import CONFIG_DIR, ConfigStore
+
+
+# Yapı: {"dev:inode": {path, offset, head, head_len, updated_at}}
+LOG_CHECKPOINTS_FILE = CONFIG_DIR / "log_checkpoints.json"
+log_checkpoints = ConfigStore(LOG_CHECKPOINTS_FILE)
+
+HEAD_FINGERPRINT_BYTES = 4096  # Dosya başından hash'lenen byte sayısı
+TAIL_SCAN_BYTES = 64 * 1024  # Yarım kalmış son satırı bulmak için geriye bakılan alan
+CHECKPOINT_MAX_AGE = 30 * 24 * 3600  # Bu süredir güncellenmeyen checkpoint'ler silinir
+
+# Checkpoint durumları
+STATUS_NEW = "new"  # Bu dosya ilk kez analiz ediliyor
+STATUS_RESUMED = "resumed"  # Son offset'ten devam
+STATUS_TRUNCATED = "truncated"  # Dosya son offset'ten kısa - baştan
+STATUS_REPLACED = "replaced"  # Aynı inode, farklı baş içerik - baştan
+STATUS_ROTATED = "rotated"  # Yol daha önce başka bir inode'a aitti (logrotate create) - baştan
+
+
+def fingerprint(stream: BinaryIO, length: int) -> str:
+    stream.seek(0)
+    return hashlib.sha256(stream.read(length)).hexdigest()
+
+
+def complete_lines_end(stream: BinaryIO, start: int, size: int) -> int:
+    """
+    [start, size) aralığında son tam satırın bitişi. Yazılmakta olan yarım satır
+    bir sonraki çalıştırmaya bırakılır; son TAIL_SCAN_BYTES içinde satır sonu
+    yoksa dosyanın tamamı alınır.
+    """
+    if size <= start:
+        return size
+    window = min(size - start, TAIL_SCAN_BYTES)
+    stream.seek(size - window)
+    cut = stream.read(window).rfind(b"\n")
+    return size if cut < 0 else size - window + cut + 1
+
+
+def resolve_checkpoint(path: str, stream: BinaryIO) -> Dict[str, Any]:
+    """
+    Açık (sıkıştırılmamış, normal) dosya için analiz aralığını belirler.
+    Dönen dict save_checkpoint'e verilir: key, path, start, end, status, head, head_len.
+    Akış konumu start'a alınır.
+    """
+    st = os.fstat(stream.fileno())
+    key = f"{st.st_dev}:{st.st_ino}"
+    path = os.path.abspath(path)
+    size = st.st_size
+    
+    checkpoint = log_checkpoints.get(key)
+    start = 0
+    if not isinstance(checkpoint, dict):
+        known_path = any(
+            isinstance(entry, dict) and entry.get("path") == path
+            for entry in log_checkpoints.load().values()
+        )
+        status = STATUS_ROTATED if known_path else STATUS_NEW
+    elif size < checkpoint.get("offset", 0):
+        status = STATUS_TRUNCATED
+    elif fingerprint(stream, checkpoint.get("head_len", 0)) != checkpoint.get("head"):
+        status = STATUS_REPLACED
+    else:
+        status = STATUS_RESUMED
+        start = checkpoint.get("offset", 0)
+    
+    head_len = min(size, HEAD_FINGERPRINT_BYTES)
+    head = fingerprint(stream, head_len)
+    end = complete_lines_end(stream, start, size)
+    stream.seek(start)
+    return {"key": key, "path": path, "start": start, "end": end, "status": status, "head": head, "head_len": head_len}
+
+
+def save_checkpoint(checkpoint: Dict[str, Any]) -> None:
+    """Analiz başarılı olduktan sonra offset'i kaydeder; eski checkpoint'leri temizler"""
+    now = time.time()
+
+    def update(data):
+        data = {
+            key: entry for key, entry in data.items()
+            if isinstance(entry, dict) and now - entry.get("updated_at", 0) < CHECKPOINT_MAX_AGE
+        }
+        data[checkpoint["key"]] = {
+            "path": checkpoint["path"],
+            "offset": checkpoint["end"],
+            "head": checkpoint["head"],
+            "head_len": checkpoint["head_len"],
+            "updated_at": now
+        }
+        return data
+    
+    log_checkpoints.rewrite(update)
+
+
+def describe_checkpoint(checkpoint: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Sonuca eklenen özet"""
+    if checkpoint is None:
+        return None
+    return {
+        "status": checkpoint["status"],
+        "start_offset": checkpoint["start"],
+        "end_offset": checkpoint["end"],
+        "new_bytes": max(0, checkpoint["end"] - checkpoint["start"])
+    }
+
+
+def clear_checkpoints(path: Optional[str] = None) -> int:
+    """Checkpoint'leri siler (path verilirse yalnızca o yolunkiler); silinen sayısı döner"""
+    removed = []
+    path = os.path.abspath(path) if path else None
+
+    def remove(data):
+        keep = {
+            key: entry for key, entry in data.items()
+            if path is not None and not (isinstance(entry, dict) and entry.get("path") == path)
+        }
+        removed.extend(key for key in data if key not in keep)
+        return keep
+    
+    log_checkpoints.rewrite(remove)
+    return len(removed)
@@ -0,0 +1,710 @@
+"""
+Log dosyası girişi: dosyayı belleğe almadan satır sınırında parçalara bölerek okur
+ve /logs/analyze'a parça parça gönderip sonuçları birleştirir.
+Ön tarama açıksa yalnızca error/warning/traceback pencereleri gönderilir (bkz. logscan).
+Sıkıştırılmış (rotate edilmiş) loglar magic byte'larından tanınıp akış halinde açılır.
+API'ye ulaşılamazsa parçalar yerel motorla analiz edilir (bkz. localanalysis).
+since/until verilirse yalnızca o zaman aralığındaki satırlar okunur (bkz. logtime).
+"""
+
+import os
+import io
+import sys
+import bz2
+import glob
+import itertools
+import gzip
+import json
+import lzma
+import mmap
+import stat
+import asyncio
+import multiprocessing
+import concurrent.futures
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
+
+from neurops import api, localanalysis, logcheckpoints, logscan, logtime
+from neurops.logtemplates import collapse_log_text
+from neurops.config import load_settings
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+LOG_CHUNK_BYTES = max(64 * 1024, int(os.getenv("NEUROPS_LOG_CHUNK_BYTES", str(4 * 1024 * 1024)) or 4 * 1024 * 1024))
+LOG_TAIL_CHARS = 2000  # Incident/workflow açıklamalarına eklenen log özeti bütçesi
+LOG_TAIL_WINDOW = 64 * 1024  # Özeti çıkarılan son log kısmı (karakter)
+SUMMARY_MAX_PARTS = 10  # Birleştirilmiş özette gösterilen parça özeti sayısı
+LOG_SCAN_WORKERS = max(1, int(os.getenv("NEUROPS_LOG_SCAN_WORKERS", "0") or "0") or os.cpu_count() or 1)
+NO_FINDINGS_SUMMARY = "No errors, warnings or tracebacks found in the logs."
+NO_NEW_DATA_SUMMARY = "No new log data since the last run."
+NO_TIME_RANGE_DATA_SUMMARY = "No log lines in the given time range."
+
+
+class LogAnalysisError(Exception):
+    """Backend bir parçanın analizini başarısız döndürdü"""
+
+    def __init__(self, status_code: int, detail: str = ""):
+        super().__init__(f"Log analysis failed with status {status_code}" + (f": {detail}" if detail else ""))
+        self.status_code = status_code
+        self.detail = detail
+
+
+# (magic byte'lar, sıkıştırma adı) - logrotate'in compresscmd seçenekleri
+COMPRESSION_MAGIC = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+)
+
+
+def detect_compression(stream: BinaryIO) -> Optional[str]:
+    """Akışın başındaki magic byte'lara bakar (akış ilerletilmez); sıkıştırma yoksa None"""
+    head = stream.peek(6)[:6] if hasattr(stream, "peek") else b""
+    for magic, name in COMPRESSION_MAGIC:
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def _decompressing_reader(stream: BinaryIO, compression: str) -> BinaryIO:
+    """Sıkıştırılmış akışı okurken açan bir binary akış döndürür (diske açılmaz)"""
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=stream, mode="rb")
+    if compression == "bz2":
+        return bz2.BZ2File(stream, mode="rb")
+    if compression == "xz":
+        return lzma.LZMAFile(stream, mode="rb")
+    if zstandard is None:
+        raise ValueError("zstd compressed logs require the 'zstandard' package (pip install zstandard)")
+    return zstandard.ZstdDecompressor().stream_reader(stream, read_across_frames=True, closefd=False)
+
+
+class _DecompressedLog(io.BufferedReader):
+    """Açıcı akışı kapatınca altındaki dosyayı da kapatır"""
+
+    def __init__(self, reader: BinaryIO, source: BinaryIO):
+        super().__init__(reader)
+        self._source = source
+
+    def close(self):
+        try:
+            super().close()
+        finally:
+            if self._source is not sys.stdin.buffer:
+                self._source.close()
+
+
+def open_log(path: str) -> BinaryIO:
+    """
+    Log dosyasını binary olarak açar; "-" stdin demektir.
+    gzip/bz2/xz/zstd dosyaları (uzantıdan bağımsız, magic byte ile) okurken açılır.
+    """
+    stream = sys.stdin.buffer if path == "-" else open(path, "rb")
+    try:
+        compression = detect_compression(stream)
+        if compression is None:
+            return stream
+        return _DecompressedLog(_decompressing_reader(stream, compression), stream)
+    except BaseException:
+        if stream is not sys.stdin.buffer:
+            stream.close()
+        raise
+
+
+def detect_file_compression(path: str) -> Optional[str]:
+    """Dosyanın sıkıştırma türü (bkz. detect_compression)"""
+    with open(path, "rb") as f:
+        return detect_compression(f)
+
+
+def open_log_text(path: str) -> io.TextIOWrapper:
+    """open_log'un UTF-8 metin hali (geçersiz byte'lar değiştirilir)"""
+    return io.TextIOWrapper(open_log(path), encoding="utf-8", errors="replace")
+
+
+def read_log_text(path: str, since: Optional[float] = None, until: Optional[float] = None) -> str:
+    """Log dosyasının tamamını veya [since, until] aralığını (gerekirse açarak) metin olarak okur"""
+    if since is None and until is None:
+        with open_log_text(path) as f:
+            return f.read()
+    stream = open_log(path)
+    try:
+        reader, limit, _ = open_time_range(stream, since, until)
+        if reader is None:
+            return ""
+        data = reader.read() if limit is None else reader.read(limit)
+    finally:
+        if stream is not sys.stdin.buffer:
+            stream.close()
+    return data.decode("utf-8", errors="replace")
+
+
+def _plain_file_size(stream: BinaryIO) -> Optional[int]:
+    """Sıkıştırılmamış normal dosyanın boyutu; pipe, stdin veya açılan arşivlerde None"""
+    if type(stream) is not io.BufferedReader or not isinstance(stream.raw, io.FileIO):
+        return None
+    try:
+        st = os.fstat(stream.fileno())
+    except OSError:
+        return None
+    return st.st_size if stat.S_ISREG(st.st_mode) else None
+
+
+def open_time_range(stream: BinaryIO, since: Optional[float],
+                    until: Optional[float]) -> Tuple[Optional[BinaryIO], Optional[int], Dict[str, Any]]:
+    """
+    Akışı [since, until] zaman aralığına daraltır. Normal dosyalarda aralık ikili
+    aramayla bulunur, akış başlangıca alınır ve byte sınırı döner; arşiv ve
+    stdin'de satırları süzen bir akış döner (sınır None).
+    Dönüş: (okunacak akış - aralık boşsa None, limit, sonuca eklenen özet)
+    """
+    size = _plain_file_size(stream)
+    if size is not None:
+        stream.seek(0)
+        sample = stream.read(logtime.DETECT_SAMPLE_BYTES)
+    else:
+        sample = stream.peek(logtime.DETECT_SAMPLE_BYTES) if hasattr(stream, "peek") else b""
+    fmt = logtime.detect_timestamp_format(sample)
+    if fmt is None:
+        raise ValueError("No supported timestamps found in the log (ISO 8601, syslog, nginx/apache or journal export)")
+    
+    summary = {"since": logtime.format_time(since), "until": logtime.format_time(until), "format": fmt.name}
+    if size is not None:
+        start, end = logtime.find_time_range(stream, size, fmt, since, until)
+        stream.seek(start)
+        summary.update(start_offset=start, end_offset=end)
+        return (stream if end > start else None), end - start, summary
+    
+    lines = logtime.iter_time_range(stream, fmt, since, until)
+    first = next(lines, None)
+    if first is None:
+        return None, None, summary
+    return io.BufferedReader(logtime.TimeRangeReader(itertools.chain([first], lines))), None, summary
+
+
+def expand_log_paths(specs: List[str]) -> List[str]:
+    """
+    Dosya, dizin ve glob argümanlarını dosya listesine çevirir (sıra korunur).
+    Dizinlerde yalnızca doğrudan içindeki gizli olmayan dosyalar alınır;
+    "**" içeren glob'lar özyinelemelidir. Var olmayan düz yollar olduğu gibi
+    bırakılır (açılırken FileNotFoundError verir).
+    """
+    paths = []
+    for spec in specs:
+        spec = os.path.expanduser(spec)
+        if spec == "-":
+            paths.append(spec)
+        elif glob.has_magic(spec):
+            paths.extend(sorted(p for p in glob.glob(spec, recursive=True) if os.path.isfile(p)))
+        elif os.path.isdir(spec):
+            with os.scandir(spec) as entries:
+                paths.extend(sorted(e.path for e in entries if not e.name.startswith(".") and e.is_file()))
+        else:
+            paths.append(spec)
+    return list(dict.fromkeys(paths))
+
+
+def iter_log_chunks(stream: BinaryIO, chunk_bytes: int = LOG_CHUNK_BYTES,
+                    limit: Optional[int] = None) -> Iterator[bytes]:
+    """
+    Akıştan en fazla chunk_bytes büyüklüğünde, satır sonunda biten parçalar üretir.
+    Bellekte aynı anda en fazla bir parça tutulur; chunk_bytes'tan uzun tek bir
+    satır parça sınırında bölünür. limit verilirse en fazla o kadar byte okunur.
+    """
+    pending = b""
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = chunk_bytes - len(pending)
+        block = stream.read(size if remaining is None else min(size, remaining))
+        if not block:
+            break
+        if remaining is not None:
+            remaining -= len(block)
+        pending += block
+        if len(pending) < chunk_bytes and remaining != 0:
+            # Pipe'lar kısa okuma döndürebilir, parça dolana kadar oku
+            continue
+        cut = pending.rfind(b"\n") + 1
+        if cut == 0:
+            cut = len(pending)
+        yield pending[:cut]
+        pending = pending[cut:]
+    if pending:
+        yield pending
+
+
+def get_prescan_options() -> Tuple[bool, int]:
+    """Settings'teki (log_prescan, prescan_context_lines) değerleri"""
+    settings = load_settings()
+    try:
+        context_lines = max(0, int(settings.get("prescan_context_lines")))
+    except (TypeError, ValueError):
+        context_lines = logscan.PRESCAN_CONTEXT_LINES
+    return bool(settings.get("log_prescan")), context_lines
+
+
+def prescan_log(stream: BinaryIO, context_lines: int = logscan.PRESCAN_CONTEXT_LINES,
+                chunk_bytes: int = LOG_CHUNK_BYTES, limit: Optional[int] = None) -> Tuple[bytes, Dict[str, int]]:
+    """
+    Akışı mevcut konumundan (en fazla limit byte) ön tarayıp (alıntı, sayaçlar)
+    döndürür. Normal dosyalar mmap ile okunur (sayfa önbelleği üzerinden,
+    kopyasız); stdin/pipe ve arşivler parça parça taranır, bu durumda parça
+    sınırındaki bağlam satırları kesilebilir.
+    """
+    size = _plain_file_size(stream)
+    if size:
+        start = stream.tell()
+        stop = size if limit is None else min(size, start + limit)
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return logscan.prescan_buffer(mm, context_lines, start, stop)
+    
+    parts = []
+    counts: Dict[str, int] = {}
+    for chunk in iter_log_chunks(stream, chunk_bytes, limit):
+        excerpt, chunk_counts = logscan.prescan_buffer(chunk, context_lines)
+        del chunk
+        if excerpt:
+            if parts:
+                parts.append(logscan.WINDOW_SEPARATOR)
+            parts.append(excerpt)
+        logscan.merge_prescan_counts(counts, chunk_counts)
+    excerpt = b"".join(parts)
+    counts["excerpt_bytes"] = len(excerpt)
+    return excerpt, counts
+
+
+def prescan_path(path: str, context_lines: int = logscan.PRESCAN_CONTEXT_LINES,
+                 chunk_bytes: int = LOG_CHUNK_BYTES,
+                 incremental: bool = False,
+                 since: Optional[float] = None,
+                 until: Optional[float] = None) -> Tuple[bytes, Dict[str, int], Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    prescan_log'un dosya yolu alan hali (process pool'a gönderilebilir).
+    incremental ise yalnızca son checkpoint'ten sonrası taranır; checkpoint
+    analiz başarılı olunca çağıran tarafından kaydedilir. since/until verilirse
+    yalnızca o zaman aralığı taranır ve checkpoint kullanılmaz.
+    Dönüş: (alıntı, sayaçlar, checkpoint veya None, zaman aralığı özeti veya None)
+    """
+    stream = open_log(path)
+    try:
+        if since is not None or until is not None:
+            reader, limit, time_range = open_time_range(stream, since, until)
+            if reader is None:
+                return b"", {}, None, time_range
+            excerpt, counts = prescan_log(reader, context_lines, chunk_bytes, limit)
+            return excerpt, counts, None, time_range
+        checkpoint = _resolve_checkpoint(path, stream) if incremental else None
+        limit = checkpoint["end"] - checkpoint["start"] if checkpoint else None
+        excerpt, counts = prescan_log(stream, context_lines, chunk_bytes, limit)
+        return excerpt, counts, checkpoint, None
+    finally:
+        if stream is not sys.stdin.buffer:
+            stream.close()
+
+
+def _unique(items) -> List[Any]:
+    """Sırayı koruyarak tekrarları atar (dict gibi hash'lenemeyen öğeler dahil)"""
+    seen = set()
+    unique = []
+    for item in items:
+        key = json.dumps(item, sort_keys=True, default=str) if isinstance(item, (dict, list)) else item
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(item)
+    return unique
+
+
+def merge_analysis_results(results: List[Dict[str, Any]], labels: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Parça analizlerini tek bir /logs/analyze yanıtı şeklinde birleştirir:
+    sayaçlar toplanır, issue/öneri listeleri birleştirilir, özetler parça
+    numarasıyla (veya labels verildiyse etiketiyle) art arda eklenir.
+    Diğer alanlar ilk parçadan alınır.
+    """
+    if len(results) == 1 and labels is None:
+        return dict(results[0])
+    labels = labels or [f"Part {index}/{len(results)}" for index in range(1, len(results) + 1)]
+    
+    merged: Dict[str, Any] = {}
+    for result in results:
+        for key, value in result.items():
+            merged.setdefault(key, value)
+    
+    merged["errors_detected"] = sum(int(r.get("errors_detected") or 0) for r in results)
+    merged["warnings_detected"] = sum(int(r.get("warnings_detected") or 0) for r in results)
+    merged["critical_issues"] = _unique(issue for r in results for issue in (r.get("critical_issues") or []))
+    merged["recommendations"] = _unique(rec for r in results for rec in (r.get("recommendations") or []))
+    engines = {r.get("engine") for r in results}
+    if engines != {None}:
+        merged["engine"] = localanalysis.ENGINE_LOCAL if engines == {localanalysis.ENGINE_LOCAL} else localanalysis.ENGINE_MIXED
+    if any(r.get("offline") for r in results):
+        merged["offline"] = True
+    
+    summaries = [(label, r.get("summary")) for label, r in zip(labels, results) if r.get("summary")]
+    summary_lines = [f"[{label}] {summary}" for label, summary in summaries[:SUMMARY_MAX_PARTS]]
+    if len(summaries) > SUMMARY_MAX_PARTS:
+        summary_lines.append(f"... {len(summaries) - SUMMARY_MAX_PARTS} more parts")
+    merged["summary"] = "\n\n".join(summary_lines)
+    return merged
+
+
+def analyze_log_stream(stream: BinaryIO, chunk_bytes: int = LOG_CHUNK_BYTES,
+                       on_chunk: Optional[Callable[[int], None]] = None,
+                       extra_payload: Optional[Dict[str, Any]] = None,
+                       limit: Optional[int] = None,
+                       local_analysis: Optional[str] = None) -> Tuple[Dict[str, Any], str]:
+    """
+    Akışı parça parça /logs/analyze'a gönderir ve birleştirilmiş sonucu döndürür.
+    Dönüş: (sonuç, logun son LOG_TAIL_WINDOW karakterinin LOG_TAIL_CHARS'a
+    sığan template özeti - bkz. logtemplates).
+    on_chunk(parça_no) her parça gönderilmeden önce çağrılır.
+    extra_payload her isteğin gövdesine eklenir; limit okunacak byte sınırıdır.
+    local_analysis yerel motor modudur (bkz. localanalysis.LOCAL_ANALYSIS_MODES).
+    """
+    if local_analysis is None:
+        local_analysis = localanalysis.get_local_analysis_mode()
+    
+    results = []
+    tail = ""
+    truncated = False
+    for index, chunk in enumerate(iter_log_chunks(stream, chunk_bytes, limit), 1):
+        if on_chunk:
+            on_chunk(index)
+        text = chunk.decode("utf-8", errors="replace")
+        del chunk
+        truncated = truncated or len(tail) + len(text) > LOG_TAIL_WINDOW
+        tail = (tail + text[-LOG_TAIL_WINDOW:])[-LOG_TAIL_WINDOW:]
+        
+        def remote():
+            res = api.api_post_analysis("/logs/analyze", {"logs": text, **(extra_payload or {})}, compress=True)
+            if res.status_code != 200:
+                try:
+                    detail = res.json().get("detail", "")
+                except (ValueError, AttributeError):
+                    detail = ""
+                raise LogAnalysisError(res.status_code, str(detail or ""))
+            return res.json()
+        
+        results.append(localanalysis.analyze_with_fallback(
+            remote, lambda: localanalysis.analyze_logs_locally(text), local_analysis
+        ))
+    
+    if not results:
+        raise ValueError("No logs to analyze")
+    result = merge_analysis_results(results)
+    if len(results) > 1:
+        result["chunks_analyzed"] = len(results)
+    if truncated:
+        # Pencerenin başındaki yarım satır atılır
+        tail = tail.split("\n", 1)[-1]
+    return result, collapse_log_text(tail, LOG_TAIL_CHARS)
+
+
+def _analyze_prescanned(stream: BinaryIO, chunk_bytes: int, context_lines: int,
+                        on_chunk: Optional[Callable[[int, int], None]],
+                        limit: Optional[int] = None,
+                        local_analysis: Optional[str] = None) -> Tuple[Dict[str, Any], str]:
+    """Ön taramadan çıkan alıntıyı analiz eder; sayaçlar tüm dosyanın yerel sayaçlarıdır"""
+    excerpt, counts = prescan_log(stream, context_lines, chunk_bytes, limit)
+    if not counts.get("scanned_bytes"):
+        raise ValueError("No logs to analyze")
+    return analyze_excerpt(excerpt, counts, chunk_bytes, on_chunk, local_analysis)
+
+
+def analyze_excerpt(excerpt: bytes, counts: Dict[str, int], chunk_bytes: int = LOG_CHUNK_BYTES,
+                    on_chunk: Optional[Callable[[int, int], None]] = None,
+                    local_analysis: Optional[str] = None) -> Tuple[Dict[str, Any], str]:
+    """prescan_log çıktısını analiz eder; alıntı boşsa backend çağrılmaz"""
+    if not excerpt:
+        return {
+            "summary": NO_FINDINGS_SUMMARY,
+            "errors_detected": 0,
+            "warnings_detected": 0,
+            "critical_issues": [],
+            "recommendations": [],
+            "prescan": counts
+        }, ""
+    
+    total = -(-len(excerpt) // chunk_bytes)
+    callback = (lambda index: on_chunk(index, total)) if on_chunk else None
+    result, tail = analyze_log_stream(io.BytesIO(excerpt), chunk_bytes, callback, {"prescan": counts},
+                                      local_analysis=local_analysis)
+    # Backend yalnızca alıntıyı gördü; sayaçlar tüm dosya için yerelde hesaplananlardır
+    result["errors_detected"] = counts["errors"]
+    result["warnings_detected"] = counts["warnings"]
+    result["prescan"] = counts
+    return result, tail
+
+
+def _resolve_checkpoint(path: str, stream: BinaryIO) -> Optional[Dict[str, Any]]:
+    """Artımlı analiz yalnızca sıkıştırılmamış normal dosyalarda yapılabilir"""
+    if _plain_file_size(stream) is None:
+        return None
+    return logcheckpoints.resolve_checkpoint(path, stream)
+
+
+def _empty_result(summary: str) -> Dict[str, Any]:
+    """Analiz edilecek satır kalmadığında backend çağrılmadan dönen sonuç"""
+    return {
+        "summary": summary,
+        "errors_detected": 0,
+        "warnings_detected": 0,
+        "critical_issues": [],
+        "recommendations": []
+    }
+
+
+def _no_new_data_result(checkpoint: Dict[str, Any]) -> Dict[str, Any]:
+    return {**_empty_result(NO_NEW_DATA_SUMMARY), "checkpoint": logcheckpoints.describe_checkpoint(checkpoint)}
+
+
+def _no_time_range_data_result(time_range: Dict[str, Any]) -> Dict[str, Any]:
+    return {**_empty_result(NO_TIME_RANGE_DATA_SUMMARY), "time_range": time_range}
+
+
+def _commit_checkpoint(result: Dict[str, Any], checkpoint: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Analiz başarılı: offset'i kaydet ve sonuca checkpoint özetini ekle"""
+    if checkpoint is not None:
+        try:
+            logcheckpoints.save_checkpoint(checkpoint)
+        except OSError:
+            # Kaydedilemezse bir sonraki çalıştırma aynı aralığı tekrar analiz eder
+            pass
+        result["checkpoint"] = logcheckpoints.describe_checkpoint(checkpoint)
+    return result
+
+
+def get_incremental_default() -> bool:
+    """Settings'teki incremental_log_analysis değeri"""
+    return bool(load_settings().get("incremental_log_analysis"))
+
+
+def analyze_log_file(path: str, chunk_bytes: int = LOG_CHUNK_BYTES,
+                     on_chunk: Optional[Callable[[int, int], None]] = None,
+                     prescan: Optional[bool] = None,
+                     context_lines: Optional[int] = None,
+                     incremental: Optional[bool] = None,
+                     local_analysis: Optional[str] = None,
+                     since: Optional[float] = None,
+                     until: Optional[float] = None) -> Tuple[Dict[str, Any], str]:
+    """
+    Log dosyasını sınırlı bellekle analiz eder (bkz. analyze_log_stream).
+    on_chunk(parça_no, tahmini_toplam) ilerleme göstermek için kullanılabilir.
+    prescan/context_lines/incremental/local_analysis verilmezse settings'teki değerler kullanılır.
+    incremental ise yalnızca son başarılı analizden sonra eklenen tam satırlar
+    işlenir (bkz. logcheckpoints); stdin ve arşivlerde her zaman tamamı işlenir.
+    since/until (epoch saniye) verilirse yalnızca o zaman aralığı analiz edilir
+    (bkz. open_time_range); bu durumda checkpoint kullanılmaz.
+    """
+    if incremental is None:
+        incremental = get_incremental_default()
+    
+    stream = open_log(path)
+    try:
+        if since is not None or until is not None:
+            reader, limit, time_range = open_time_range(stream, since, until)
+            if reader is None:
+                return _no_time_range_data_result(time_range), ""
+            result, tail = _analyze_open_stream(reader, chunk_bytes, on_chunk, prescan, context_lines,
+                                                limit, local_analysis)
+            result["time_range"] = time_range
+            return result, tail
+        checkpoint = _resolve_checkpoint(path, stream) if incremental else None
+        if checkpoint is None:
+            return _analyze_open_stream(stream, chunk_bytes, on_chunk, prescan, context_lines,
+                                        local_analysis=local_analysis)
+        if checkpoint["end"] <= checkpoint["start"]:
+            return _no_new_data_result(checkpoint), ""
+        result, tail = _analyze_open_stream(stream, chunk_bytes, on_chunk, prescan, context_lines,
+                                            checkpoint["end"] - checkpoint["start"], local_analysis)
+    finally:
+        if stream is not sys.stdin.buffer:
+            stream.close()
+    return _commit_checkpoint(result, checkpoint), tail
+
+
+def _analyze_open_stream(stream: BinaryIO, chunk_bytes: int,
+                         on_chunk: Optional[Callable[[int, int], None]],
+                         prescan: Optional[bool], context_lines: Optional[int],
+                         limit: Optional[int] = None,
+                         local_analysis: Optional[str] = None) -> Tuple[Dict[str, Any], str]:
+    default_prescan, default_context = get_prescan_options()
+    if prescan is None:
+        prescan = default_prescan
+    if prescan:
+        return _analyze_prescanned(stream, chunk_bytes, default_context if context_lines is None else context_lines,
+                                   on_chunk, limit, local_analysis)
+    
+    size = _plain_file_size(stream)
+    if size is not None:
+        size = size - stream.tell() if limit is None else limit
+    # total 0: stdin/pipe/arşiv, parça sayısı önceden bilinmiyor
+    total = max(1, -(-size // chunk_bytes)) if size is not None else 0
+    callback = (lambda index: on_chunk(index, total)) if on_chunk else None
+    return analyze_log_stream(stream, chunk_bytes, callback, limit=limit, local_analysis=local_analysis)
+
+
+def analyze_log_text(logs: str, prescan: Optional[bool] = None,
+                     local_analysis: Optional[str] = None) -> Tuple[Dict[str, Any], str]:
+    """Bellekteki log metnini aynı yoldan analiz eder (yapıştırma modu)"""
+    return _analyze_open_stream(io.BytesIO(logs.encode("utf-8")), LOG_CHUNK_BYTES, None, prescan, None,
+                                local_analysis=local_analysis)
+
+
+def _scan_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """
+    Ön tarama için process pool. Arka planda thread'ler (bootstrap, health)
+    çalışırken fork güvenli olmadığından forkserver, yoksa spawn kullanılır.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    return concurrent.futures.ProcessPoolExecutor(max_workers=LOG_SCAN_WORKERS, mp_context=context)
+
+
+async def analyze_log_paths_async(client, paths: List[str], chunk_bytes: int = LOG_CHUNK_BYTES,
+                                  prescan: bool = True, context_lines: int = logscan.PRESCAN_CONTEXT_LINES,
+                                  on_file: Optional[Callable[[str, str], None]] = None,
+                                  incremental: bool = False,
+                                  local_analysis: Optional[str] = None,
+                                  since: Optional[float] = None,
+                                  until: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Dosyaları process pool'da paralel ön tarar; bulgusu olan dosyaların analizi
+    client (AsyncApiClient) üzerinden sınırlı eşzamanlılıkla backend'e gönderilir.
+    Her dosyanın backend isteği kendi taraması biter bitmez başlar.
+    on_file(yol, aşama) "scanned"/"analyzed"/"failed" aşamalarında çağrılır.
+    Dönüş: {yol: (sonuç, tail) veya exception}
+    """
+    loop = asyncio.get_running_loop()
+    pool = _scan_pool() if prescan and len(paths) > 1 else None
+
+    def notify(path, stage):
+        if on_file:
+            on_file(path, stage)
+
+    async def analyze(path):
+        try:
+            if not prescan:
+                outcome = await client.run(analyze_log_file, path, chunk_bytes, None, False, None, incremental,
+                                           local_analysis, since, until)
+            else:
+                excerpt, counts, checkpoint, time_range = await loop.run_in_executor(
+                    pool, prescan_path, path, context_lines, chunk_bytes, incremental, since, until
+                )
+                notify(path, "scanned")
+                if checkpoint is not None and checkpoint["end"] <= checkpoint["start"]:
+                    outcome = (_no_new_data_result(checkpoint), "")
+                elif time_range is not None and not counts.get("scanned_bytes"):
+                    outcome = (_no_time_range_data_result(time_range), "")
+                elif not counts.get("scanned_bytes"):
+                    raise ValueError("No logs to analyze")
+                else:
+                    result, tail = (await client.run(analyze_excerpt, excerpt, counts, chunk_bytes, None, local_analysis)
+                                    if excerpt else analyze_excerpt(excerpt, counts))
+                    if time_range is not None:
+                        result["time_range"] = time_range
+                    outcome = (_commit_checkpoint(result, checkpoint), tail)
+        except Exception:
+            notify(path, "failed")
+            raise
+        notify(path, "analyzed")
+        return outcome
+    
+    try:
+        return await client.gather({path: analyze(path) for path in paths})
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def merge_file_results(outcomes: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+    """
+    Dosya bazlı sonuçları tek rapora birleştirir; "files" alanında dosya başına
+    döküm bulunur. Tüm dosyalar başarısızsa ilk hata fırlatılır.
+    """
+    files = []
+    found = []
+    tails = []
+    prescan_totals: Dict[str, int] = {}
+    for path, outcome in outcomes.items():
+        if isinstance(outcome, Exception):
+            error = outcome.strerror if isinstance(outcome, OSError) and outcome.strerror else str(outcome)
+            files.append({"path": path, "errors_detected": None, "warnings_detected": None,
+                          "critical_issues": [], "summary": "", "checkpoint": None, "time_range": None, "error": error})
+            continue
+        result, tail = outcome
+        files.append({
+            "path": path,
+            "errors_detected": result.get("errors_detected", 0),
+            "warnings_detected": result.get("warnings_detected", 0),
+            "critical_issues": result.get("critical_issues") or [],
+            "summary": result.get("summary", ""),
+            "checkpoint": result.get("checkpoint"),
+            "time_range": result.get("time_range"),
+            "error": None
+        })
+        if result.get("prescan"):
+            logscan.merge_prescan_counts(prescan_totals, result["prescan"])
+        if tail:
+            found.append((path, result))
+            tails.append(f"==> {path} <==\n{tail}")
+    
+    failed = [outcome for outcome in outcomes.values() if isinstance(outcome, Exception)]
+    if failed and len(failed) == len(outcomes):
+        raise failed[0]
+    
+    if found:
+        merged = merge_analysis_results([r for _, r in found], labels=[path for path, _ in found])
+        # Dosya başına; "files" içinde
+        merged.pop("checkpoint", None)
+        merged.pop("time_range", None)
+    elif all(f["checkpoint"] and not f["checkpoint"]["new_bytes"] for f in files if not f["error"]):
+        merged = {"summary": NO_NEW_DATA_SUMMARY, "critical_issues": [], "recommendations": []}
+    else:
+        merged = {"summary": NO_FINDINGS_SUMMARY, "critical_issues": [], "recommendations": []}
+    merged["errors_detected"] = sum(f["errors_detected"] or 0 for f in files)
+    merged["warnings_detected"] = sum(f["warnings_detected"] or 0 for f in files)
+    if prescan_totals:
+        merged["prescan"] = prescan_totals
+    merged["files_analyzed"] = len(files) - len(failed)
+    merged["files_failed"] = len(failed)
+    merged["files"] = files
+    return merged, "\n".join(tails)[-LOG_TAIL_CHARS:]
+
+
+def analyze_log_paths(paths: List[str], chunk_bytes: int = LOG_CHUNK_BYTES,
+                      on_file: Optional[Callable[[str, str], None]] = None,
+                      prescan: Optional[bool] = None,
+                      context_lines: Optional[int] = None,
+                      incremental: Optional[bool] = None,
+                      local_analysis: Optional[str] = None,
+                      since: Optional[float] = None,
+                      until: Optional[float] = None) -> Tuple[Dict[str, Any], str]:
+    """
+    Birden çok log dosyasını analiz edip dosya dökümlü tek rapor döndürür
+    (bkz. analyze_log_paths_async, merge_file_results).
+    """
+    from neurops.aio import AsyncApiClient, run_async
+    
+    if "-" in paths and len(paths) > 1:
+        raise ValueError("stdin cannot be combined with other log files")
+    
+    default_prescan, default_context = get_prescan_options()
+    prescan = default_prescan if prescan is None else prescan
+    context_lines = default_context if context_lines is None else context_lines
+    incremental = get_incremental_default() if incremental is None else incremental
+    local_analysis = local_analysis or localanalysis.get_local_analysis_mode()
+
+    async def _run():
+        return await analyze_log_paths_async(AsyncApiClient(), paths, chunk_bytes, prescan, context_lines, on_file,
+                                             incremental, local_analysis, since, until)
+    
+    result, tail = merge_file_results(run_async(_run()))
+    if since is not None or until is not None:
+        result["time_range"] = {"since": logtime.format_time(since), "until": logtime.format_time(until)}
+    return result, tail
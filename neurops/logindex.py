@@ -0,0 +1,328 @@
+"""
+Görülen loglar üzerinde kalıcı tam metin arama indeksi (SQLite FTS5).
+Log analizi, güvenlik analizi ve monitor'ün okuduğu dosyalar ile temp
+dizinindeki neurops_terminal_*.log / neurops_agent_*.log yakalamaları
+~/.neurops/index altında indekslenir. Normal dosyalarda yalnızca son
+indekslemeden sonra eklenen satırlar işlenir (truncate/rotate logcheckpoints
+ile aynı şekilde algılanır); arşivler bir kez indekslenir.
+Satırlar dosyanın zaman damgası biçimiyle (logtime) zamanlanır, zaman damgası
+olmayan satırlar önceki satırın zamanını alır.
+"""
+
+import os
+import glob
+import time
+import shlex
+import sqlite3
+import tempfile
+from contextlib import closing
+from typing import Any, Dict, Iterable, List, Optional
+
+from neurops import logcheckpoints, logfiles, logtime
+from neurops.config import CONFIG_DIR
+
+
+INDEX_DIR = CONFIG_DIR / "index"
+INDEX_DB = INDEX_DIR / "logs.db"
+CAPTURE_PATTERNS = ("neurops_terminal_*.log", "neurops_agent_*.log")  # Temp dizininde aranır
+INDEX_CHUNK_BYTES = 1024 * 1024  # Her parça tek executemany ile yazılır
+MAX_INDEXED_LINE_CHARS = 4096  # Daha uzun satırların yalnızca başı indekslenir
+SEARCH_LIMIT = 50
+
+_FTS_OPERATORS = ("AND", "OR", "NOT")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    identity TEXT,
+    head TEXT,
+    head_len INTEGER NOT NULL DEFAULT 0,
+    offset INTEGER NOT NULL DEFAULT 0,
+    line_count INTEGER NOT NULL DEFAULT 0,
+    last_ts REAL,
+    indexed_at REAL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS lines USING fts5(text, file_id UNINDEXED, line_no UNINDEXED, ts UNINDEXED);
+-- Her indeksleme parçasının rowid aralığı ve zaman aralığı: zaman/yol süzgeçli
+-- aramalar yalnızca kesişen rowid aralıklarında yapılır, tüm eşleşmeler taranmaz
+CREATE TABLE IF NOT EXISTS segments (
+    file_id INTEGER NOT NULL,
+    first_rowid INTEGER NOT NULL,
+    last_rowid INTEGER NOT NULL,
+    min_ts REAL,
+    max_ts REAL
+);
+CREATE INDEX IF NOT EXISTS segments_file ON segments (file_id);
+"""
+
+
+class LogIndexError(Exception):
+    """İndeks açılamadı veya bu Python'un SQLite'ında FTS5 yok"""
+
+
+def _connect() -> sqlite3.Connection:
+    try:
+        INDEX_DIR.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(INDEX_DB), timeout=30)
+    except (OSError, sqlite3.Error) as e:
+        raise LogIndexError(f"Cannot open log index {INDEX_DB}: {e}")
+    try:
+        # WAL: arama, arka planda süren indekslemeyi beklemez
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+    except sqlite3.OperationalError as e:
+        conn.close()
+        if "fts5" in str(e):
+            raise LogIndexError("Log search needs SQLite with FTS5, which this Python build does not have")
+        raise LogIndexError(f"Cannot open log index {INDEX_DB}: {e}")
+    return conn
+
+
+def _register(conn: sqlite3.Connection, paths: Iterable[str]) -> List[str]:
+    paths = [os.path.abspath(path) for path in paths if path != "-"]
+    with conn:
+        conn.executemany("INSERT OR IGNORE INTO files (path) VALUES (?)", [(path,) for path in paths])
+    return paths
+
+
+def register_log_files(paths: Iterable[str]) -> None:
+    """
+    Okunan log dosyalarını indekse kaydeder; indeksleme bir sonraki aramada
+    yapılır. İndeks isteğe bağlıdır, hatalar analiz akışını bozmaz.
+    """
+    try:
+        with closing(_connect()) as conn:
+            _register(conn, paths)
+    except (LogIndexError, sqlite3.Error):
+        pass
+
+
+def capture_files() -> List[str]:
+    """Temp dizinindeki terminal ve agent oturumu yakalamaları"""
+    temp_dir = tempfile.gettempdir()
+    return sorted(path for pattern in CAPTURE_PATTERNS for path in glob.glob(os.path.join(temp_dir, pattern)))
+
+
+def _index_lines(conn: sqlite3.Connection, file_id: int, stream, limit: Optional[int],
+                 fmt: Optional[logtime.TimestampFormat], line_no: int, last_ts: Optional[float]):
+    rowid = conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM lines").fetchone()[0]
+    for chunk in logfiles.iter_log_chunks(stream, INDEX_CHUNK_BYTES, limit):
+        rows = []
+        first_rowid, min_ts = rowid + 1, None
+        for line in chunk.split(b"\n"):
+            line_no += 1
+            if not line.strip():
+                continue
+            value = fmt.parse(line) if fmt is not None else None
+            if value is not None:
+                last_ts = value
+            if last_ts is not None and (min_ts is None or last_ts < min_ts):
+                min_ts = last_ts
+            text = line.decode("utf-8", errors="replace").rstrip("\r")[:MAX_INDEXED_LINE_CHARS]
+            rowid += 1
+            rows.append((rowid, text, file_id, line_no, last_ts))
+        # Parça satır sonuyla bittiğinde split sonda boş bir eleman verir
+        if chunk.endswith(b"\n"):
+            line_no -= 1
+        if not rows:
+            continue
+        conn.executemany("INSERT INTO lines (rowid, text, file_id, line_no, ts) VALUES (?, ?, ?, ?, ?)", rows)
+        max_ts = max((row[4] for row in rows if row[4] is not None), default=None)
+        conn.execute(
+            "INSERT INTO segments (file_id, first_rowid, last_rowid, min_ts, max_ts) VALUES (?, ?, ?, ?, ?)",
+            (file_id, first_rowid, rowid, min_ts, max_ts)
+        )
+    return line_no, last_ts
+
+
+def _index_file(conn: sqlite3.Connection, row: sqlite3.Row) -> int:
+    """Dosyanın indekslenmemiş kısmını ekler; eklenen byte sayısını döndürür"""
+    path = row["path"]
+    st = os.stat(path)
+    identity = f"{st.st_dev}:{st.st_ino}"
+    compressed = logfiles.detect_file_compression(path) is not None
+    
+    if compressed:
+        # Arşivler değişmez: aynı dosya tekrar açılmaz, değiştiyse baştan indekslenir
+        if row["identity"] == identity and row["offset"] == st.st_size:
+            return 0
+        with closing(logfiles.open_log(path)) as stream:
+            fmt = logtime.detect_timestamp_format(stream.peek(logtime.DETECT_SAMPLE_BYTES))
+            conn.execute("DELETE FROM lines WHERE file_id = ?", (row["id"],))
+            conn.execute("DELETE FROM segments WHERE file_id = ?", (row["id"],))
+            line_no, last_ts = _index_lines(conn, row["id"], stream, None, fmt, 0, None)
+        conn.execute(
+            "UPDATE files SET identity = ?, head = NULL, head_len = 0, offset = ?, line_count = ?, "
+            "last_ts = ?, indexed_at = ? WHERE id = ?",
+            (identity, st.st_size, line_no, last_ts, time.time(), row["id"])
+        )
+        return st.st_size
+    
+    with open(path, "rb") as stream:
+        size = os.fstat(stream.fileno()).st_size
+        start, line_no, last_ts = row["offset"], row["line_count"], row["last_ts"]
+        unchanged = (
+            row["identity"] == identity and size >= start
+            and logcheckpoints.fingerprint(stream, row["head_len"]) == row["head"]
+        )
+        if not unchanged:
+            # Rotate/truncate: eski satırlar geçmiş olarak kalır, yeni içerik baştan indekslenir
+            start, line_no, last_ts = 0, 0, None
+        head_len = min(size, logcheckpoints.HEAD_FINGERPRINT_BYTES)
+        head = logcheckpoints.fingerprint(stream, head_len)
+        end = logcheckpoints.complete_lines_end(stream, start, size)
+        if end <= start and unchanged:
+            return 0
+        
+        stream.seek(0)
+        fmt = logtime.detect_timestamp_format(stream.read(logtime.DETECT_SAMPLE_BYTES))
+        stream.seek(start)
+        line_no, last_ts = _index_lines(conn, row["id"], stream, end - start, fmt, line_no, last_ts)
+    conn.execute(
+        "UPDATE files SET identity = ?, head = ?, head_len = ?, offset = ?, line_count = ?, "
+        "last_ts = ?, indexed_at = ? WHERE id = ?",
+        (identity, head, head_len, end, line_no, last_ts, time.time(), row["id"])
+    )
+    return end - start
+
+
+def refresh_index(paths: Optional[Iterable[str]] = None, rebuild: bool = False) -> Dict[str, Any]:
+    """
+    Kayıtlı dosyaları ve oturum yakalamalarını artımlı indeksler. paths verilirse
+    bunlar kaydedilip yalnızca onlar indekslenir; rebuild tüm satırları silip
+    baştan indeksler. Dönüş: {files, indexed_files, bytes_indexed, missing, failed}
+    """
+    stats = {"files": 0, "indexed_files": 0, "bytes_indexed": 0, "missing": 0, "failed": 0}
+    with closing(_connect()) as conn:
+        conn.row_factory = sqlite3.Row
+        if rebuild:
+            with conn:
+                conn.execute("DELETE FROM lines")
+                conn.execute("DELETE FROM segments")
+                conn.execute("UPDATE files SET identity = NULL, head = NULL, head_len = 0, offset = 0, line_count = 0, last_ts = NULL")
+        if paths is not None:
+            selected = _register(conn, paths)
+            rows = [conn.execute("SELECT * FROM files WHERE path = ?", (path,)).fetchone() for path in selected]
+        else:
+            _register(conn, capture_files())
+            rows = conn.execute("SELECT * FROM files ORDER BY id").fetchall()
+        
+        for row in rows:
+            stats["files"] += 1
+            if not os.path.isfile(row["path"]):
+                # Silinmiş/rotate edilip kaldırılmış dosyaların satırları aranabilir kalır
+                stats["missing"] += 1
+                continue
+            try:
+                with conn:
+                    indexed = _index_file(conn, row)
+            except (OSError, EOFError, ValueError):
+                stats["failed"] += 1
+                continue
+            if indexed:
+                stats["indexed_files"] += 1
+                stats["bytes_indexed"] += indexed
+    return stats
+
+
+def build_match_query(query: str) -> str:
+    """
+    Kullanıcı sorgusunu FTS5 MATCH ifadesine çevirir. Her kelime veya tırnaklı
+    ifade ayrı bir phrase olur ("/", ":", "-" sözdizimi hatası vermez) ve
+    terimler AND'lenir; AND/OR/NOT operatörleri ve sondaki * (önek) korunur.
+    """
+    try:
+        tokens = shlex.split(query)
+    except ValueError:
+        tokens = query.split()  # Kapanmamış tırnak
+    parts = []
+    for token in tokens:
+        if token in _FTS_OPERATORS:
+            parts.append(token)
+            continue
+        prefix = len(token) > 1 and token.endswith("*")
+        token = token.rstrip("*") if prefix else token
+        if token:
+            parts.append('"' + token.replace('"', '""') + '"' + ("*" if prefix else ""))
+    if not any(part not in _FTS_OPERATORS for part in parts):
+        raise ValueError("Empty search query")
+    return " ".join(parts)
+
+
+def _segment_ranges(conn: sqlite3.Connection, since: Optional[float], until: Optional[float],
+                    path: Optional[str]) -> List[List[int]]:
+    """Süzgeçle kesişen parçaların rowid aralıkları; bitişik olanlar birleştirilir, en yeni önce"""
+    sql = "SELECT first_rowid, last_rowid FROM segments JOIN files ON files.id = segments.file_id WHERE 1"
+    params: List[Any] = []
+    if since is not None:
+        sql += " AND max_ts >= ?"
+        params.append(since)
+    if until is not None:
+        sql += " AND min_ts <= ?"
+        params.append(until)
+    if path:
+        sql += " AND files.path GLOB ?"
+        params.append(path)
+    ranges: List[List[int]] = []
+    for first, last in conn.execute(sql + " ORDER BY last_rowid DESC", params):
+        if ranges and last + 1 >= ranges[-1][0]:
+            ranges[-1][0] = min(ranges[-1][0], first)
+        else:
+            ranges.append([first, last])
+    return ranges
+
+
+def search_logs(query: str, since: Optional[float] = None, until: Optional[float] = None,
+                path: Optional[str] = None, limit: int = SEARCH_LIMIT) -> List[Dict[str, Any]]:
+    """
+    İndekste kelime/ifade araması; en yeni satırlar önce. since/until satır
+    zamanına, path (glob, ör. "*/nginx/*") dosya yoluna göre süzer.
+    """
+    sql = (
+        "SELECT files.path, lines.line_no, lines.ts, lines.text FROM lines "
+        "JOIN files ON files.id = lines.file_id WHERE lines MATCH ?"
+    )
+    params: List[Any] = [build_match_query(query)]
+    if since is not None:
+        sql += " AND lines.ts >= ?"
+        params.append(since)
+    if until is not None:
+        sql += " AND lines.ts <= ?"
+        params.append(until)
+    if path:
+        path = path if glob.has_magic(path) else f"*{path}*"
+        sql += " AND files.path GLOB ?"
+        params.append(path)
+    limit = max(1, limit)
+    
+    rows = []
+    with closing(_connect()) as conn:
+        try:
+            if since is None and until is None and not path:
+                rows = conn.execute(sql + " ORDER BY lines.rowid DESC LIMIT ?", params + [limit]).fetchall()
+            else:
+                # Sık geçen terimlerde tüm eşleşmeleri taramamak için yalnızca
+                # süzgeçle kesişen parçalara bakılır
+                for first, last in _segment_ranges(conn, since, until, path):
+                    rows += conn.execute(
+                        sql + " AND lines.rowid BETWEEN ? AND ? ORDER BY lines.rowid DESC LIMIT ?",
+                        params + [first, last, limit - len(rows)]
+                    ).fetchall()
+                    if len(rows) >= limit:
+                        break
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"Invalid search query: {e}")
+    return [
+        {"time": logtime.format_time(ts), "path": file_path, "line": line_no, "text": text}
+        for file_path, line_no, ts, text in rows
+    ]
+
+
+def index_status() -> Dict[str, Any]:
+    """İndekslenen dosya ve satır sayısı ile indeks boyutu"""
+    with closing(_connect()) as conn:
+        files, lines = conn.execute("SELECT COUNT(*), COALESCE(SUM(line_count), 0) FROM files").fetchone()
+    size = sum(os.path.getsize(path) for path in glob.glob(f"{INDEX_DB}*"))
+    return {"path": str(INDEX_DB), "files": files, "lines": lines, "size_bytes": size}
@@ -0,0 +1,276 @@
+"""Log analizi"""
+
+from rich.prompt import Confirm, Prompt
+from rich.panel import Panel
+from rich.table import Table
+from rich.text import Text
+from rich.status import Status
+from rich import box
+
+from neurops.config import get_api_headers, load_settings
+from neurops.api import api_post
+from neurops.logfiles import LogAnalysisError, analyze_log_file, analyze_log_paths, analyze_log_text, expand_log_paths
+from neurops.logindex import LogIndexError, SEARCH_LIMIT, refresh_index, register_log_files, search_logs
+from neurops.logtime import parse_time_range
+from neurops.ui import console, get_multiline_input_simple
+from neurops.auth import check_token
+
+
+def analyze_logs():
+    """Log analizi"""
+    console.print()
+    
+    # Dosya yolu veya direkt yapıştırma seçeneği
+    choice = Prompt.ask(
+        "[white]Choose input method[/white]",
+        choices=["file", "paste", "search"],
+        default="file"
+    )
+    
+    if choice == "search":
+        search_log_history()
+        return
+    
+    logs = ""
+    paths = []
+    since = until = None
+    
+    if choice == "file":
+        # Tek dosya, dizin veya glob (ör. /var/log/app/*.log)
+        paths = expand_log_paths([Prompt.ask("[white]Enter log file path, directory or glob[/white]")])
+        if not paths:
+            console.print("[rgb(167,199,231)]No log files found.[/rgb(167,199,231)]")
+            return
+        # Yalnızca son N dakika veya bir incident çevresi (dosya baştan okunmaz)
+        try:
+            since, until = parse_time_range(Prompt.ask(
+                "[white]Time range (e.g. 30m, 2h, START..END; empty = whole file)[/white]",
+                default=""
+            ))
+        except ValueError as e:
+            console.print(f"[rgb(167,199,231)]{e}[/rgb(167,199,231)]")
+            return
+        # Sonraki aramalarda bu dosyalar da indekslenir
+        register_log_files(paths)
+    else:
+        # Direkt yapıştırma
+        console.print()
+        logs = get_multiline_input_simple("[white]Paste your logs[/white]")
+        if not logs:
+            console.print("[rgb(167,199,231)]No logs provided![/rgb(167,199,231)]")
+            return
+    
+    try:
+        with Status("[rgb(167,199,231)]Analyzing logs...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)") as status:
+            if len(paths) > 1:
+                # Dosyalar paralel taranır, bulgusu olanlar sınırlı eşzamanlılıkla analiz edilir
+                finished = []
+
+                def show_file_progress(path, stage):
+                    if stage != "scanned":
+                        finished.append(path)
+                        status.update(f"[rgb(167,199,231)]Analyzing logs... ({len(finished)}/{len(paths)} files)[/rgb(167,199,231)]")
+                
+                result, logs = analyze_log_paths(paths, on_file=show_file_progress, since=since, until=until)
+            elif paths:
+                # Dosya satır sınırında parçalara bölünüp sırayla gönderilir - bellek kullanımı dosya boyutundan bağımsız
+                def show_progress(index, total):
+                    if total > 1:
+                        status.update(f"[rgb(167,199,231)]Analyzing logs... (part {index}/{total})[/rgb(167,199,231)]")
+                
+                result, logs = analyze_log_file(paths[0], on_chunk=show_progress, since=since, until=until)
+            else:
+                result, logs = analyze_log_text(logs)
+        
+        console.print()
+        console.print("[rgb(167,199,231)]Analysis Complete[/rgb(167,199,231)]")
+        console.print()
+        
+        summary_panel = Panel(
+            # Dosya yolları [..] etiketi içerir, markup olarak yorumlanmamalı
+            Text(result.get('summary', 'N/A')),
+            title="[rgb(167,199,231)]Analysis Summary[/rgb(167,199,231)]",
+            border_style="white",
+            title_align="left",
+            box=box.SIMPLE
+        )
+        console.print(summary_panel)
+        
+        if result.get("offline"):
+            console.print("[dim]API unavailable: logs were analyzed locally with built-in rules[/dim]")
+        elif result.get("engine") == "local":
+            console.print("[dim]Local rules found no issues; the API was not called[/dim]")
+        
+        prescan = result.get("prescan")
+        if prescan and prescan.get("scanned_bytes"):
+            console.print(
+                f"[dim]Pre-scan: {prescan['errors']} errors, {prescan['warnings']} warnings, "
+                f"{prescan['tracebacks']} tracebacks; {'kept' if result.get('offline') else 'sent'} {prescan['excerpt_bytes']:,} of {prescan['scanned_bytes']:,} bytes[/dim]"
+            )
+        
+        time_range = result.get("time_range")
+        if time_range:
+            window = f"{time_range['since'] or 'start'} .. {time_range['until'] or 'end'}"
+            if time_range.get("end_offset") is not None:
+                window += f" ({time_range['end_offset'] - time_range['start_offset']:,} bytes, {time_range['format']} timestamps)"
+            console.print(f"[dim]Time range: {window}[/dim]")
+        
+        checkpoint = result.get("checkpoint")
+        if checkpoint and checkpoint["status"] == "resumed" and checkpoint["new_bytes"]:
+            console.print(f"[dim]Incremental: analyzed {checkpoint['new_bytes']:,} new bytes since the last run (from byte {checkpoint['start_offset']:,})[/dim]")
+        elif checkpoint and checkpoint["status"] in ("truncated", "replaced", "rotated"):
+            console.print(f"[dim]Incremental: file was {checkpoint['status']} since the last run, analyzed from the start[/dim]")
+        
+        if result.get("files"):
+            console.print()
+            table = Table(box=box.SIMPLE, border_style="white", show_header=True, header_style="rgb(167,199,231)")
+            table.add_column("File", style="white")
+            table.add_column("Errors", style="rgb(167,199,231)", justify="right")
+            table.add_column("Warnings", style="rgb(167,199,231)", justify="right")
+            table.add_column("Critical", style="rgb(167,199,231)", justify="right")
+            table.add_column("Status", style="dim")
+            for file_result in result["files"]:
+                if file_result.get("error"):
+                    table.add_row(Text(file_result["path"]), "-", "-", "-", Text(file_result["error"]))
+                else:
+                    table.add_row(
+                        Text(file_result["path"]),
+                        str(file_result["errors_detected"]),
+                        str(file_result["warnings_detected"]),
+                        str(len(file_result["critical_issues"])),
+                        "ok"
+                    )
+            console.print(table)
+        
+        if result.get("critical_issues"):
+            console.print()
+            console.print("[rgb(167,199,231)]Critical Issues:[/rgb(167,199,231)]")
+            for issue in result["critical_issues"]:
+                # Yerel motorun issue'ları ham log satırı içerir, markup olarak yorumlanmamalı
+                console.print(Text.assemble(("  • ", "rgb(167,199,231)"), str(issue)))
+        
+        if result.get("recommendations"):
+            console.print()
+            console.print("[rgb(167,199,231)]Recommendations:[/rgb(167,199,231)]")
+            for rec in result["recommendations"]:
+                console.print(f"  [rgb(167,199,231)]•[/rgb(167,199,231)] {rec}")
+        
+        # Settings kontrolü
+        settings = load_settings()
+        errors = result.get("errors_detected", 0)
+        warnings = result.get("warnings_detected", 0)
+        critical = result.get("critical_issues", [])
+        
+        # Auto Incident Creation (çevrimdışı analizde API'ye istek atılmaz)
+        if not result.get("offline") and settings.get("auto_incident_creation") and (errors > 0 or warnings > 0 or critical):
+            console.print()
+            if Confirm.ask("[rgb(167,199,231)]Create incident for detected issues?[/rgb(167,199,231)]", default=True):
+                try:
+                    incident_title = f"Log Analysis: {errors} errors, {warnings} warnings detected"
+                    incident_desc = f"Automatically created from log analysis.\n\nErrors: {errors}\nWarnings: {warnings}\n\nSummary:\n{result.get('summary', '')}\n\nLog snippet:\n{logs[-1000:]}"
+                    
+                    incident_res = api_post(
+                        "/incident/",
+                        json={
+                            "title": incident_title,
+                            "description": incident_desc,
+                            "severity": "high" if critical else "medium",
+                            "source": "log_analysis"
+                        }
+                    )
+                    
+                    if incident_res.status_code == 200:
+                        incident = incident_res.json()
+                        console.print()
+                        console.print(f"[rgb(167,199,231)]✓ Incident created: {incident.get('id')}[/rgb(167,199,231)]")
+                except Exception as e:
+                    console.print(f"[rgb(167,199,231)]Error creating incident: {e}[/rgb(167,199,231)]")
+        
+        # Auto Workflow Generation (token varsa ve sorun varsa)
+        token_status = check_token()
+        if not result.get("offline") and settings.get("auto_workflow_generation") and token_status.get("token_set") and (errors > 0 or warnings > 0):
+            console.print()
+            if Confirm.ask("[rgb(167,199,231)]Generate and run workflow to fix issues?[/rgb(167,199,231)]", default=True):
+                try:
+                    workflow_desc = f"Fix issues detected in log analysis:\n\nErrors: {errors}\nWarnings: {warnings}\n\nSummary: {result.get('summary', '')}\n\nRecommendations: {', '.join(result.get('recommendations', [])[:3])}"
+                    
+                    workflow_res = api_post(
+                        "/workflow/generate",
+                        json={
+                            "description": workflow_desc,
+                            "context": {
+                                "logs": logs[-2000:],
+                                "errors": errors,
+                                "warnings": warnings,
+                                "summary": result.get('summary', '')
+                            }
+                        },
+                        headers=get_api_headers(),
+                        timeout=120
+                    )
+                    
+                    if workflow_res.status_code == 200:
+                        workflow_result = workflow_res.json()
+                        workflow_name = workflow_result.get("workflow_name")
+                        
+                        console.print()
+                        console.print(f"[rgb(167,199,231)]✓ Workflow generated: {workflow_name}[/rgb(167,199,231)]")
+                        
+                        # Workflow'u çalıştır
+                        run_res = api_post(
+                            "/workflow/run",
+                            json={
+                                "workflow_name": workflow_name,
+                                "parameters": {}
+                            },
+                            headers=get_api_headers()
+                        )
+                        
+                        if run_res.status_code == 200:
+                            run_result = run_res.json()
+                            console.print(f"[rgb(167,199,231)]✓ Workflow started: {run_result.get('run_id')}[/rgb(167,199,231)]")
+                except Exception as e:
+                    console.print(f"[rgb(167,199,231)]Error generating workflow: {e}[/rgb(167,199,231)]")
+    except LogAnalysisError as e:
+        console.print(f"[rgb(167,199,231)]Error: {e.status_code}[/rgb(167,199,231)]")
+    except FileNotFoundError:
+        console.print(f"[rgb(167,199,231)]File not found.[/rgb(167,199,231)]")
+    except ValueError as e:
+        # Zaman damgası tanınamadı, boş log vb.
+        console.print(Text(f"Error: {e}", style="rgb(167,199,231)"))
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)]Error.[/rgb(167,199,231)]")
+
+
+def search_log_history():
+    """Analiz edilen, izlenen ve oturumda yakalanan loglarda arama"""
+    console.print()
+    query = Prompt.ask("[white]Search (words, \"phrases\", prefix*, OR/NOT)[/white]")
+    if not query.strip():
+        return
+    try:
+        since, until = parse_time_range(Prompt.ask(
+            "[white]Time range (e.g. 30m, 2h, START..END; empty = all)[/white]",
+            default=""
+        ))
+        with Status("[rgb(167,199,231)]Indexing new log lines...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+            refresh_index()
+        matches = search_logs(query, since, until, limit=SEARCH_LIMIT)
+    except (ValueError, LogIndexError) as e:
+        console.print(Text(f"Error: {e}", style="rgb(167,199,231)"))
+        return
+    
+    console.print()
+    if not matches:
+        console.print("[rgb(167,199,231)]No matching log lines.[/rgb(167,199,231)]")
+        return
+    table = Table(box=box.SIMPLE, border_style="white", show_header=True, header_style="rgb(167,199,231)")
+    table.add_column("Time", style="dim", no_wrap=True)
+    table.add_column("File", style="rgb(167,199,231)")
+    table.add_column("Line", style="white", overflow="fold")
+    for match in matches:
+        # Ham log satırları markup olarak yorumlanmamalı
+        table.add_row(match["time"] or "-", Text(f"{match['path']}:{match['line']}"), Text(match["text"]))
+    console.print(table)
+    if len(matches) == SEARCH_LIMIT:
+        console.print(f"[dim]Showing the newest {SEARCH_LIMIT} matches; narrow the query or time range for older ones[/dim]")
@@ -0,0 +1,125 @@
+"""
+Yerel log ön taraması: error/warning/traceback satırlarını derlenmiş byte
+regex'leriyle bulur ve backend'e yalnızca bu satırları bağlam pencereleriyle
+birlikte gönderilecek bir alıntı olarak çıkarır.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+
+PRESCAN_CONTEXT_LINES = 3  # Eşleşen satırın önünde ve arkasında tutulan satır sayısı
+MAX_CONTINUATION_LINES = 200  # Eşleşmeden sonra alıntıya eklenen girintili (stack frame) satır sınırı
+WINDOW_SEPARATOR = b"--\n"  # Bitişik olmayan pencereler arasına konur (grep -C gibi)
+
+LEVEL_KEYWORDS = ("error", "fatal", "critical", "panic", "severe", "exception", "warn")
+
+# Hızlı aday araması: sabit yazımlı anahtar kelimeler (büyük/küçük/baş harf büyük).
+# (?i) ve \b içeren regex'ler her pozisyonda denendiği için ~5 kat yavaş; adaylar
+# satır bazında aşağıdaki kesin regex'lerle doğrulanır.
+CANDIDATE_PATTERN = re.compile(
+    b"|".join(re.escape(variant) for keyword in LEVEL_KEYWORDS
+              for variant in (keyword.upper().encode(), keyword.capitalize().encode(), keyword.encode()))
+    + b"|Traceback"
+)
+# Satırın alıntıya girip girmeyeceğine ve türüne karar veren kesin regex'ler
+LINE_PATTERN = re.compile(
+    rb"(?i:\b(?:error|fatal|critical|panic|severe|exception|warn(?:ing)?)\b)"
+    rb"|\w(?:Error|Exception):"
+    rb"|Traceback \(most recent call last\)"
+)
+TRACEBACK_PATTERN = re.compile(rb"Traceback \(most recent call last\)")
+ERROR_PATTERN = re.compile(
+    rb"(?i:\b(?:error|fatal|critical|panic|severe|exception)\b)"
+    rb"|\w(?:Error|Exception):"
+)
+
+_CONTINUATION_PREFIXES = (b" ", b"\t")
+
+
+def _line_end(buf, pos: int, size: int) -> int:
+    """pos'un bulunduğu satırın bitişi (satır sonu karakterinden sonraki index)"""
+    end = buf.find(b"\n", pos, size)
+    return size if end < 0 else end + 1
+
+
+def _line_start(buf, pos: int, lower: int) -> int:
+    """pos'un bulunduğu satırın başı (lower'dan geriye gidilmez)"""
+    return buf.rfind(b"\n", lower, pos) + 1 or lower
+
+
+def prescan_buffer(buf, context_lines: int = PRESCAN_CONTEXT_LINES,
+                   start: int = 0, stop: Optional[int] = None) -> Tuple[bytes, Dict[str, int]]:
+    """
+    bytes veya mmap üzerinde ön tarama yapar; buffer kopyalanmaz.
+    start/stop verilirse yalnızca buf[start:stop] taranır (artımlı analiz).
+    Dönüş: (alıntı, sayaçlar). Sayaçlar taranan aralık içindir:
+    errors, warnings, tracebacks, windows, scanned_bytes, excerpt_bytes.
+    """
+    size = len(buf) if stop is None else stop
+    counts = {"errors": 0, "warnings": 0, "tracebacks": 0}
+    windows: List[Tuple[int, int]] = []
+    
+    pos = start
+    while pos < size:
+        match = CANDIDATE_PATTERN.search(buf, pos, size)
+        if not match:
+            break
+        line_start = _line_start(buf, match.start(), start)
+        line_end = _line_end(buf, match.start(), size)
+        if not LINE_PATTERN.search(buf, line_start, line_end):
+            # "errors=0", "warnings.py" gibi kelime sınırına uymayan adaylar
+            pos = line_end
+            continue
+        
+        if TRACEBACK_PATTERN.search(buf, line_start, line_end):
+            counts["tracebacks"] += 1
+        elif ERROR_PATTERN.search(buf, line_start, line_end):
+            counts["errors"] += 1
+        else:
+            counts["warnings"] += 1
+        
+        window_start = line_start
+        for _ in range(context_lines):
+            if window_start == start:
+                break
+            window_start = _line_start(buf, window_start - 1, start)
+        
+        # Stack trace satırları (girintili devam satırları) bağlamdan bağımsız olarak eklenir
+        window_end = line_end
+        for _ in range(MAX_CONTINUATION_LINES):
+            if window_end >= size or buf[window_end:window_end + 1] not in _CONTINUATION_PREFIXES:
+                break
+            window_end = _line_end(buf, window_end, size)
+        for _ in range(context_lines):
+            if window_end >= size:
+                break
+            window_end = _line_end(buf, window_end, size)
+        
+        if windows and window_start <= windows[-1][1]:
+            windows[-1] = (windows[-1][0], max(window_end, windows[-1][1]))
+        else:
+            windows.append((window_start, window_end))
+        # Bağlam satırları da taranır; yalnızca eşleşen satırın kendisi atlanır
+        pos = line_end
+    
+    parts = []
+    for window_start, window_end in windows:
+        if parts:
+            parts.append(WINDOW_SEPARATOR)
+        parts.append(buf[window_start:window_end])
+        if buf[window_end - 1:window_end] != b"\n":
+            parts.append(b"\n")
+    excerpt = b"".join(parts)
+    
+    counts["windows"] = len(windows)
+    counts["scanned_bytes"] = max(0, size - start)
+    counts["excerpt_bytes"] = len(excerpt)
+    return excerpt, counts
+
+
+def merge_prescan_counts(total: Dict[str, int], counts: Dict[str, int]) -> Dict[str, int]:
+    """Parça parça yapılan taramaların sayaçlarını toplar"""
+    for key, value in counts.items():
+        total[key] = total.get(key, 0) + value
+    return total
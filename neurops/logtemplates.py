@@ -0,0 +1,203 @@
+"""
+Drain tarzı çevrimiçi log template çıkarımı.
+Satırlar sabit derinlikli bir parse ağacı ile şablonlara (template) gruplanır;
+değişken kısımlar <*> olur, her şablonun sayısı ve örnek değerleri tutulur.
+Backend'e ham son N karakter yerine şablon özeti gönderilir: aynı satırın
+50 kopyası tek satır olur, karakter bütçesi farklı satırlara kalır.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional
+
+from neurops import logscan
+
+
+TEMPLATE_DEPTH = 4  # Ağaç derinliği: uzunluk düğümü + ilk (DEPTH - 2) token
+TEMPLATE_SIMILARITY = 0.4  # Bir satırın şablona katılması için gereken sabit token oranı
+TEMPLATE_MAX_CHILDREN = 100  # Düğüm başına çocuk sınırı, aşılınca <*> düğümüne düşülür
+TEMPLATE_MAX_CLUSTERS = 1000  # Bellek sınırı - en uzun süredir görülmeyen şablon atılır
+TEMPLATE_SAMPLE_VALUES = 3  # Her <*> için saklanan farklı örnek değer sayısı
+LOG_TEMPLATE_CHARS = 2000  # Monitor ve workflow payload'larındaki log bütçesi
+WILDCARD = "<*>"
+
+# Açıkça değişken olan tokenlar daha ağaca girmeden <*> yapılır
+_MASK_PATTERNS = [re.compile(pattern) for pattern in (
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}",  # UUID
+    r"\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?",  # IPv4[:port]
+    r"0x[0-9a-fA-F]+",
+    r"[0-9a-fA-F]{16,}",  # hash / trace id
+    r"[-+]?\d+(?:[.,:/]\d+)*[a-zA-Z%µ]*",  # sayı, süre (12ms), tarih/saat, yüzde
+)]
+_KEY_VALUE = re.compile(r"^([\w.\-]+[=:])(.+)$")
+_HAS_DIGIT = re.compile(r"\d")
+
+
+def _mask_token(token: str) -> str:
+    for pattern in _MASK_PATTERNS:
+        if pattern.fullmatch(token):
+            return WILDCARD
+    # key=value / key:value - anahtar korunur, değer maskelenir
+    match = _KEY_VALUE.match(token)
+    if match and _mask_token(match.group(2)) == WILDCARD:
+        return match.group(1) + WILDCARD
+    return token
+
+
+class LogTemplate:
+    """Bir şablon: tokenlar, görülme sayısı ve <*> pozisyonlarının örnek değerleri"""
+
+    def __init__(self, tokens: List[str], example: str, seq: int):
+        self.tokens = tokens
+        self.example = example  # İlk görülen ham satır
+        self.count = 0
+        self.first_seen = seq
+        self.last_seen = seq
+        self.samples: Dict[int, List[str]] = {}
+        self._leaf: Optional[List["LogTemplate"]] = None
+
+    @property
+    def template(self) -> str:
+        return " ".join(self.tokens)
+
+    def similarity(self, tokens: List[str]) -> float:
+        # İki tarafta da maskelenmiş pozisyonlar eşleşme sayılır; yoksa değişkeni bol
+        # satırlar (id, süre, trace id) eşiğin altında kalıp hiç birleşmez
+        same = sum(1 for mine, other in zip(self.tokens, tokens) if mine == other)
+        return same / len(tokens)
+
+    def merge(self, tokens: List[str]):
+        """Farklı olan pozisyonları <*> yapar"""
+        self.tokens = [mine if mine == other else WILDCARD for mine, other in zip(self.tokens, tokens)]
+
+    def observe(self, raw_tokens: List[str], seq: int):
+        self.count += 1
+        self.last_seen = seq
+        for position, token in enumerate(self.tokens):
+            if token == WILDCARD or token.endswith(WILDCARD):
+                values = self.samples.setdefault(position, [])
+                value = raw_tokens[position]
+                if len(values) < TEMPLATE_SAMPLE_VALUES and value not in values:
+                    values.append(value)
+
+    def render(self) -> str:
+        if self.count == 1:
+            return self.example
+        line = f"[x{self.count}] {self.template}"
+        samples = [", ".join(values) for _, values in sorted(self.samples.items()) if values]
+        if samples:
+            line += f"  (values: {' | '.join(samples)})"
+        return line
+
+
+class _Node:
+    __slots__ = ("children", "clusters")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.clusters: List[LogTemplate] = []
+
+
+class TemplateMiner:
+    """
+    Drain (He et al., ICWS 2017) algoritmasının sade hali: satır uzunluğu ve ilk
+    tokenlar ile ağaçta yaprağa inilir, yapraktaki en benzer şablona katılır
+    ya da yeni şablon açılır. Satır başına maliyet şablon sayısından bağımsızdır.
+    """
+
+    def __init__(self, depth: int = TEMPLATE_DEPTH, similarity: float = TEMPLATE_SIMILARITY,
+                 max_children: int = TEMPLATE_MAX_CHILDREN, max_clusters: int = TEMPLATE_MAX_CLUSTERS):
+        self.depth = max(3, depth)
+        self.similarity = similarity
+        self.max_children = max_children
+        self.max_clusters = max_clusters
+        self.clusters: List[LogTemplate] = []
+        self._root: Dict[int, _Node] = {}
+        self._seq = 0
+
+    def add(self, line: str) -> Optional[LogTemplate]:
+        """Satırı bir şablona ekler; boş satırlar atlanır"""
+        raw_tokens = line.split()
+        if not raw_tokens:
+            return None
+        tokens = [_mask_token(token) for token in raw_tokens]
+        self._seq += 1
+        
+        leaf = self._leaf(tokens)
+        best = None
+        best_key = None
+        for cluster in leaf.clusters:
+            score = cluster.similarity(tokens)
+            key = (score, cluster.tokens.count(WILDCARD))
+            if score >= self.similarity and (best_key is None or key > best_key):
+                best, best_key = cluster, key
+        
+        if best is None:
+            best = LogTemplate(tokens, line.rstrip(), self._seq)
+            best._leaf = leaf.clusters
+            leaf.clusters.append(best)
+            self.clusters.append(best)
+            if len(self.clusters) > self.max_clusters:
+                self._evict()
+        else:
+            best.merge(tokens)
+        best.observe(raw_tokens, self._seq)
+        return best
+
+    def _leaf(self, tokens: List[str]) -> _Node:
+        node = self._root.setdefault(len(tokens), _Node())
+        for token in tokens[:self.depth - 2]:
+            # Rakam içeren tokenlar büyük olasılıkla değişkendir, ağacı dallandırmaz
+            key = WILDCARD if _HAS_DIGIT.search(token) else token
+            child = node.children.get(key)
+            if child is None:
+                if len(node.children) >= self.max_children:
+                    key = WILDCARD
+                child = node.children.setdefault(key, _Node())
+            node = child
+        return node
+
+    def _evict(self):
+        oldest = min(self.clusters, key=lambda cluster: cluster.last_seen)
+        self.clusters.remove(oldest)
+        oldest._leaf.remove(oldest)
+
+    def render(self, max_chars: Optional[int] = None) -> str:
+        """
+        Şablonları ilk görülme sırasıyla satır satır yazar. max_chars verilirse
+        önce error/warning içeren, sonra en son görülen şablonlar bütçeye sığdırılır.
+        """
+        lines = {id(cluster): cluster.render() for cluster in self.clusters}
+        if max_chars is None:
+            chosen = self.clusters
+        else:
+            def priority(cluster):
+                is_issue = logscan.LINE_PATTERN.search(lines[id(cluster)].encode("utf-8", "replace")) is not None
+                return (is_issue, cluster.last_seen)
+            
+            chosen = []
+            used = 0
+            for cluster in sorted(self.clusters, key=priority, reverse=True):
+                cost = len(lines[id(cluster)]) + 1
+                if used + cost > max_chars:
+                    continue
+                chosen.append(cluster)
+                used += cost
+            if not chosen and self.clusters:
+                # Tek satır bile sığmıyorsa en önceliklisi kırpılarak verilir
+                first = max(self.clusters, key=priority)
+                lines[id(first)] = lines[id(first)][:max_chars]
+                chosen = [first]
+        return "\n".join(lines[id(cluster)] for cluster in sorted(chosen, key=lambda cluster: cluster.first_seen))
+
+
+def collapse_log_lines(lines: Iterable[str], max_chars: Optional[int] = LOG_TEMPLATE_CHARS) -> str:
+    """Satırları şablonlara indirip max_chars bütçesinde metin olarak döndürür"""
+    miner = TemplateMiner()
+    for line in lines:
+        miner.add(line)
+    return miner.render(max_chars)
+
+
+def collapse_log_text(text: str, max_chars: Optional[int] = LOG_TEMPLATE_CHARS) -> str:
+    """collapse_log_lines'ın metin alan hali"""
+    return collapse_log_lines(text.splitlines(), max_chars)
@@ -0,0 +1,278 @@
+"""
+Zaman aralığına göre log okuma (--since/--until).
+Zaman damgası biçimi logun başından otomatik tanınır (ISO 8601, syslog,
+nginx/apache, journald export). Normal dosyalarda aralığın byte offset'leri,
+satır sınırlarındaki zaman damgaları okunarak ikili aramayla bulunur; dosya
+baştan okunmaz. Arşiv ve stdin'de satırlar okunurken süzülür.
+Loglar kabaca zamana göre sıralı varsayılır; zaman damgası olmayan satırlar
+(stack trace vb.) önceki satırın zamanına aittir.
+"""
+
+import io
+import re
+import time
+import calendar
+import functools
+from datetime import datetime
+from typing import BinaryIO, Iterable, Iterator, Optional, Tuple
+
+
+DETECT_SAMPLE_BYTES = 64 * 1024  # Biçim tanıma için okunan log başı
+DETECT_SAMPLE_LINES = 200
+TIMESTAMP_SEARCH_CHARS = 256  # Zaman damgası satırın bu kadar başında aranır
+SEEK_LINEAR_BYTES = 64 * 1024  # İkili arama bu aralığa inince satır satır taranır
+SEEK_SCAN_BYTES = 1024 * 1024  # Bir noktadan sonra zaman damgalı satır aranan en fazla alan
+MAX_LINE_BYTES = 64 * 1024
+
+MONTHS = {name: index for index, name in enumerate(
+    (b"Jan", b"Feb", b"Mar", b"Apr", b"May", b"Jun", b"Jul", b"Aug", b"Sep", b"Oct", b"Nov", b"Dec"), 1
+)}
+_MONTH_PATTERN = b"(" + b"|".join(MONTHS) + b")"
+
+_RELATIVE_TIME = re.compile(r"^(\d+(?:\.\d+)?)\s*([smhdw])$")
+_RELATIVE_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 7 * 86400}
+
+
+@functools.lru_cache(maxsize=4096)
+def _minute_epoch(year: int, month: int, day: int, hour: int, minute: int, offset: Optional[int]) -> float:
+    # Ardışık satırlar çoğunlukla aynı dakikadadır; mktime satır başına çağrılmaz (indeksleme)
+    if offset is None:
+        return time.mktime((year, month, day, hour, minute, 0, 0, 0, -1))
+    return calendar.timegm((year, month, day, hour, minute, 0, 0, 0, 0)) - offset
+
+
+def _epoch(year: int, month: int, day: int, hour: int, minute: int, second: int,
+           fraction: float = 0.0, offset: Optional[int] = None) -> float:
+    """Saat dilimi (saniye) verilmezse yerel saat kabul edilir"""
+    return _minute_epoch(year, month, day, hour, minute, offset) + second + fraction
+
+
+def _tz_offset(value: Optional[bytes]) -> Optional[int]:
+    """b"Z", b"+0200", b"+02:00" -> saniye"""
+    if not value:
+        return None
+    if value in (b"Z", b"z"):
+        return 0
+    digits = value[1:].replace(b":", b"")
+    offset = int(digits[:2]) * 3600 + int(digits[2:4]) * 60
+    return -offset if value[:1] == b"-" else offset
+
+
+def _fraction(value: Optional[bytes]) -> float:
+    return float(b"0." + value) if value else 0.0
+
+
+class TimestampFormat:
+    """Bir zaman damgası biçimi: satırda aranan regex ve eşleşmeyi epoch'a çeviren fonksiyon"""
+
+    def __init__(self, name: str, pattern: bytes, convert):
+        self.name = name
+        self.pattern = re.compile(pattern)
+        self._convert = convert
+
+    def parse(self, line: bytes) -> Optional[float]:
+        """Satırın zaman damgası (epoch saniye); yoksa veya geçersizse None"""
+        match = self.pattern.search(line, 0, TIMESTAMP_SEARCH_CHARS)
+        if not match:
+            return None
+        try:
+            return self._convert(match)
+        except (ValueError, OverflowError):
+            return None
+
+
+def _convert_iso(match) -> float:
+    year, month, day, hour, minute, second = (int(group) for group in match.groups()[:6])
+    return _epoch(year, month, day, hour, minute, second, _fraction(match.group(7)), _tz_offset(match.group(8)))
+
+
+def _convert_syslog(match) -> float:
+    # Syslog'da yıl yok: bu yıl kabul edilir, gelecekte kalıyorsa geçen yıldır
+    month = MONTHS[match.group(1)]
+    day, hour, minute, second = (int(group) for group in match.groups()[1:5])
+    year = time.localtime().tm_year
+    value = _epoch(year, month, day, hour, minute, second, _fraction(match.group(6)))
+    if value > time.time() + 86400:
+        value = _epoch(year - 1, month, day, hour, minute, second, _fraction(match.group(6)))
+    return value
+
+
+def _convert_clf(match) -> float:
+    day, year, hour, minute, second = (int(match.group(index)) for index in (1, 3, 4, 5, 6))
+    return _epoch(year, MONTHS[match.group(2)], day, hour, minute, second, offset=_tz_offset(match.group(7)))
+
+
+def _convert_journal(match) -> float:
+    return int(match.group(1)) / 1_000_000
+
+
+# Tanıma sırası eşitlikte öncelik belirler (journal export satırları ISO tarih de içerebilir)
+TIMESTAMP_FORMATS = [
+    TimestampFormat("journal", rb"__REALTIME_TIMESTAMP\"?[=:] ?\"?(\d{13,19})", _convert_journal),
+    TimestampFormat("clf", rb"\[(\d{2})/" + _MONTH_PATTERN + rb"/(\d{4}):(\d{2}):(\d{2}):(\d{2}) ([+-]\d{4})\]", _convert_clf),
+    TimestampFormat(
+        "iso8601",
+        rb"(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:[.,](\d{1,9}))? ?(Z|[+-]\d{2}:?\d{2}(?!\d))?",
+        _convert_iso
+    ),
+    TimestampFormat("syslog", _MONTH_PATTERN + rb" +(\d{1,2}) (\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,9}))?", _convert_syslog),
+]
+
+
+def detect_timestamp_format(sample: bytes) -> Optional[TimestampFormat]:
+    """Örnek satırlarda en çok zaman damgası çözülebilen biçim; hiçbiri yoksa None"""
+    lines = [line for line in sample.split(b"\n")[:DETECT_SAMPLE_LINES] if line.strip()]
+    best, best_count = None, 0
+    for fmt in TIMESTAMP_FORMATS:
+        count = sum(1 for line in lines if fmt.parse(line) is not None)
+        if count > best_count:
+            best, best_count = fmt, count
+    return best
+
+
+def parse_time_spec(value: str, now: Optional[float] = None) -> float:
+    """
+    "15m", "2h", "1d", "1w" (şimdiden önce), "now", ISO 8601 tarih/saat
+    (saat dilimi yoksa yerel) veya epoch saniye -> epoch saniye.
+    """
+    value = value.strip()
+    now = time.time() if now is None else now
+    if value.lower() == "now":
+        return now
+    match = _RELATIVE_TIME.match(value.lower())
+    if match:
+        return now - float(match.group(1)) * _RELATIVE_UNITS[match.group(2)]
+    if re.fullmatch(r"\d{9,10}(?:\.\d+)?", value):
+        return float(value)
+    try:
+        parsed = datetime.fromisoformat(value[:-1] + "+00:00" if value[-1:] in ("Z", "z") else value)
+    except ValueError:
+        raise ValueError(f"Invalid time {value!r} (use e.g. 15m, 2h, 1d, now or 2024-05-01T12:00)")
+    return parsed.timestamp()
+
+
+def parse_time_range(value: str) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Menüdeki tek satırlık aralık: "30m" (o zamandan beri), "START..END",
+    "START.." veya "..END". Boş değer tüm log demektir.
+    """
+    value = value.strip()
+    if not value:
+        return None, None
+    start, separator, end = value.partition("..")
+    if not separator:
+        return parse_time_spec(start), None
+    now = time.time()
+    since = parse_time_spec(start, now) if start.strip() else None
+    until = parse_time_spec(end, now) if end.strip() else None
+    if since is not None and until is not None and until < since:
+        raise ValueError("Time range end is before its start")
+    return since, until
+
+
+def format_time(value: Optional[float]) -> Optional[str]:
+    """Sonuçlarda gösterilen yerel ISO 8601 zaman"""
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value).astimezone().isoformat(timespec="seconds")
+
+
+def _timestamped_line_at(stream: BinaryIO, offset: int, fmt: TimestampFormat) -> Tuple[Optional[float], int]:
+    """
+    offset'te veya sonrasında başlayan ilk zaman damgalı satır: (zaman, satır başı).
+    SEEK_SCAN_BYTES içinde bulunamazsa zaman None'dır.
+    """
+    if offset > 0:
+        stream.seek(offset - 1)
+        if stream.read(1) != b"\n":
+            stream.readline()
+    else:
+        stream.seek(0)
+    pos = stream.tell()
+    stop = pos + SEEK_SCAN_BYTES
+    while pos < stop:
+        line = stream.readline(MAX_LINE_BYTES)
+        if not line:
+            break
+        value = fmt.parse(line)
+        if value is not None:
+            return value, pos
+        pos += len(line)
+    return None, pos
+
+
+def find_time_offset(stream: BinaryIO, size: int, target: float, fmt: TimestampFormat,
+                     after: bool = False) -> int:
+    """
+    Zamanı target'a eşit veya sonra (after=True ise kesinlikle sonra) olan ilk
+    satırın başı; yoksa dosya sonu. Seekable akışta O(log n) okuma yapar.
+    """
+    def reached(value):
+        return value > target if after else value >= target
+    
+    # lo her zaman satır başıdır ve lo'dan önce başlayan zaman damgalı satırlar target'tan öncedir
+    lo, hi = 0, size
+    while hi - lo > SEEK_LINEAR_BYTES:
+        mid = (lo + hi) // 2
+        value, pos = _timestamped_line_at(stream, mid, fmt)
+        if value is None or reached(value):
+            hi = mid
+        else:
+            lo = pos
+    
+    stream.seek(lo)
+    pos = lo
+    while True:
+        line = stream.readline(MAX_LINE_BYTES)
+        if not line:
+            return pos
+        value = fmt.parse(line)
+        if value is not None and reached(value):
+            return pos
+        pos += len(line)
+
+
+def find_time_range(stream: BinaryIO, size: int, fmt: TimestampFormat,
+                    since: Optional[float], until: Optional[float]) -> Tuple[int, int]:
+    """[since, until] aralığının byte offset'leri (başlangıç dahil, bitiş hariç)"""
+    start = 0 if since is None else find_time_offset(stream, size, since, fmt)
+    end = size if until is None else find_time_offset(stream, size, until, fmt, after=True)
+    return start, max(start, end)
+
+
+def iter_time_range(lines: Iterable[bytes], fmt: TimestampFormat,
+                    since: Optional[float], until: Optional[float]) -> Iterator[bytes]:
+    """Sırayla okunan satırları süzer; until'den sonraki ilk zaman damgasında durur"""
+    inside = since is None
+    for line in lines:
+        value = fmt.parse(line)
+        if value is not None:
+            if until is not None and value > until:
+                return
+            inside = inside or value >= since
+        if inside:
+            yield line
+
+
+class TimeRangeReader(io.RawIOBase):
+    """iter_time_range çıktısını read() ile okunabilir akış olarak sunar"""
+
+    def __init__(self, lines: Iterator[bytes]):
+        super().__init__()
+        self._lines = lines
+        self._line = b""
+        self._offset = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._offset >= len(self._line):
+            self._line = next(self._lines, b"")
+            self._offset = 0
+            if not self._line:
+                return 0
+        size = min(len(buffer), len(self._line) - self._offset)
+        buffer[:size] = self._line[self._offset:self._offset + size]
+        self._offset += size
+        return size
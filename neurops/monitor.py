@@ -0,0 +1,537 @@
+"""Terminal çıktısı izleme"""
+
+import os
+import glob
+import contextlib
+import time
+import subprocess
+import platform
+import shlex
+import re
+import tempfile
+
+from rich.prompt import Confirm, Prompt
+from rich.panel import Panel
+from rich.markdown import Markdown
+from rich.text import Text
+from rich import box
+
+from neurops.config import get_api_headers, load_settings
+from neurops.api import agent_analyze, api_post, api_post_analysis
+from neurops.analysisworker import CoalescingWorker
+from neurops.analysistrigger import AnalysisTrigger
+from neurops.tailer import FileTailer
+from neurops.localanalysis import analyze_logs_locally, analyze_with_fallback
+from neurops.logbuffer import LogRingBuffer
+from neurops.logindex import register_log_files
+from neurops.logfiles import LogAnalysisError, detect_file_compression, open_log_text
+from neurops.logtemplates import collapse_log_lines
+from neurops.ui import console
+from neurops.auth import check_token
+
+
+def follow_glob_lines(tailer: FileTailer, pattern: str):
+    """Glob'a uyan dosyaların satırları, dosya adıyla; yeni dosyalar indekse kaydedilir"""
+    def is_plain(path):
+        return detect_file_compression(path) is None
+    
+    seen = set()
+    for path, line in tailer.follow_glob(pattern, accept=is_plain):
+        if path not in seen:
+            seen.add(path)
+            register_log_files([path])
+        yield f"{os.path.basename(path)}: {line}"
+
+
+def monitor_terminal_output():
+    """Terminal output'unu anlık olarak izle ve log analizi yap"""
+    console.print()
+    panel = Panel(
+        "[rgb(167,199,231)]Terminal Monitor[/rgb(167,199,231)]\n"
+        "[dim rgb(167,199,231)]Monitor a command's output in real-time and analyze logs for issues.[/dim rgb(167,199,231)]\n"
+        "[dim rgb(167,199,231)]The AI will analyze the output and alert you if problems are detected.[/dim rgb(167,199,231)]",
+        border_style="white",
+        padding=(0, 0),
+        box=box.SIMPLE
+    )
+    console.print(panel)
+    console.print()
+    
+    # Token kontrolü
+    token_status = check_token()
+    if not token_status.get("token_set"):
+        console.print()
+        warning = Panel(
+            "[rgb(167,199,231)]Warning:[/rgb(167,199,231)]\n"
+            "[rgb(167,199,231)] Token not set![/rgb(167,199,231)]\n\n"
+            "[rgb(167,199,231)]AI analysis requires a Hugging Face API token.[/rgb(167,199,231)]\n"
+            "[rgb(167,199,231)]Basic log analysis will still work, but AI insights won't be available.[/rgb(167,199,231)]",
+            border_style="white",
+            box=box.SIMPLE
+        )
+        console.print(warning)
+        console.print()
+        if not Confirm.ask("[rgb(167,199,231)]Continue without AI analysis?[/rgb(167,199,231)]", default=True):
+            return
+    
+    # Komut seçimi
+    choice = Prompt.ask(
+        "[rgb(167,199,231)]Choose input method[/rgb(167,199,231)]",
+        choices=["command", "file", "stdin", "terminal"],
+        default="command"
+    )
+    
+    # Son 100 satır / 256 KB tutulur; ekleme ve eskiyi atma O(1)
+    log_buffer = LogRingBuffer(max_lines=100, max_bytes=256 * 1024)
+    
+    def analyze_window(logs_text: str):
+        """Log penceresini analiz et (ilk aşama; worker thread'inde çalışır)"""
+        try:
+            # Önce basit analiz; API'ye ulaşılamazsa yerel kural motoru (bkz. localanalysis)
+            def remote():
+                res = api_post_analysis(
+                    "/logs/analyze",
+                    {"logs": logs_text},
+                    timeout=10
+                )
+                if res.status_code != 200:
+                    raise LogAnalysisError(res.status_code)
+                return res.json()
+            
+            result = analyze_with_fallback(remote, lambda: analyze_logs_locally(logs_text))
+            errors = result.get("errors_detected", 0)
+            warnings = result.get("warnings_detected", 0)
+            critical = result.get("critical_issues", [])
+            
+            if errors > 0 or warnings > 0 or critical:
+                console.print()
+                alert_panel = Panel(
+                    f"[rgb(167,199,231)]Issues Detected![/rgb(167,199,231)]\n\n"
+                    f"Errors: [rgb(167,199,231)]{errors}[/rgb(167,199,231)]\n"
+                    f"Warnings: [rgb(167,199,231)]{warnings}[/rgb(167,199,231)]\n"
+                    + (f"Critical Issues: {len(critical)}\n" if critical else ""),
+                    border_style="white",
+                    box=box.SIMPLE
+                )
+                console.print(alert_panel)
+                if result.get("offline"):
+                    console.print("[dim]API unavailable: analyzed locally with built-in rules[/dim]")
+                
+                if critical:
+                    console.print("[rgb(167,199,231)]Critical Issues:[/rgb(167,199,231)]")
+                    for issue in critical[:3]:
+                        # Ham log satırı içerebilir, markup olarak yorumlanmamalı
+                        console.print(Text.assemble(("  • ", "rgb(167,199,231)"), issue[:100]))
+                
+                if result.get("recommendations"):
+                    console.print()
+                    console.print("[rgb(167,199,231)]Recommendations:[/rgb(167,199,231)]")
+                    for rec in result.get("recommendations", [])[:3]:
+                        console.print(f"  [rgb(167,199,231)]•[/rgb(167,199,231)] {rec}")
+            
+            # Settings kontrolü
+            settings = load_settings()
+            
+            # Auto Incident Creation (loglarda sorun varsa, API'ye ulaşılabiliyorsa)
+            if not result.get("offline") and settings.get("auto_incident_creation") and (errors > 0 or warnings > 0 or critical):
+                try:
+                    incident_title = f"Log Analysis: {errors} errors, {warnings} warnings detected"
+                    incident_desc = f"Automatically created from log analysis.\n\nErrors: {errors}\nWarnings: {warnings}\n\nLog snippet:\n{logs_text[-1000:]}"
+                    
+                    incident_res = api_post(
+                        "/incident/",
+                        json={
+                            "title": incident_title,
+                            "description": incident_desc,
+                            "severity": "high" if critical else "medium",
+                            "source": "log_analysis"
+                        }
+                    )
+                    
+                    if incident_res.status_code == 200:
+                        incident = incident_res.json()
+                        console.print()
+                        console.print(f"[rgb(167,199,231)]✓ Incident created: {incident.get('id')}[/rgb(167,199,231)]")
+                except:
+                    pass
+            
+            # AI analizi ve Auto Workflow (token varsa) ikinci aşamada: uçuşta bir AI isteği
+            # varken gelen pencere bekler, daha yenisi gelirse onun yerini alır
+            if not result.get("offline") and token_status.get("token_set") and (errors > 0 or warnings > 0):
+                ai_worker.submit(logs_text)
+        
+        except Exception as e:
+            # İzleme sürer; hata worker'ın failed sayacına yansısın diye tekrar fırlatılır
+            console.print(Text(f"Log analysis failed: {e}", style="dim"))
+            raise
+    
+    def explain_window(logs_text: str):
+        """AI analizi ve auto workflow (ikinci aşama)"""
+        settings = load_settings()
+        try:
+            # Auto workflow generation ayarı kontrol et
+            auto_workflow = settings.get("auto_workflow_generation", False)
+            
+            ai_res = agent_analyze(
+                {
+                    "problem_description": f"Analyze these logs for issues:\n\n{logs_text[-2000:]}",
+                    "context": {"logs": logs_text[-2000:]},
+                    "auto_apply": False
+                },
+                timeout=90  # Log analizi için daha uzun timeout
+            )
+            
+            if ai_res.status_code == 200:
+                ai_result = ai_res.json()
+                if ai_result.get("analysis") and not ai_result.get("fallback"):
+                    console.print()
+                    ai_panel = Panel(
+                        Markdown(ai_result.get("analysis", "")[:500]),
+                        title="[bold white]AI Analysis[/bold white]",
+                        border_style="white",
+                        box=box.SIMPLE
+                    )
+                    console.print(ai_panel)
+                    
+                    # Auto workflow generation
+                    if auto_workflow:
+                        console.print()
+                        if Confirm.ask("[rgb(167,199,231)]Generate and run workflow automatically?[/rgb(167,199,231)]", default=True):
+                            try:
+                                workflow_desc = f"Fix issues detected in logs:\n\n{ai_result.get('analysis', '')[:500]}\n\nLog context:\n{logs_text[-1000:]}"
+                                
+                                workflow_res = api_post(
+                                    "/workflow/generate",
+                                    json={
+                                        "description": workflow_desc,
+                                        "context": {"logs": logs_text[-1000:], "analysis": ai_result.get("analysis", "")}
+                                    },
+                                    headers=get_api_headers(),
+                                    timeout=120
+                                )
+                                
+                                if workflow_res.status_code == 200:
+                                    workflow_result = workflow_res.json()
+                                    workflow_name = workflow_result.get("workflow_name")
+                                    
+                                    console.print()
+                                    console.print(f"[rgb(167,199,231)]✓ Workflow generated: {workflow_name}[/rgb(167,199,231)]")
+                                    
+                                    # Workflow'u çalıştır
+                                    run_res = api_post(
+                                        "/workflow/run",
+                                        json={
+                                            "workflow_name": workflow_name,
+                                            "parameters": {}
+                                        },
+                                        headers=get_api_headers()
+                                    )
+                                    
+                                    if run_res.status_code == 200:
+                                        run_result = run_res.json()
+                                        console.print(f"[rgb(167,199,231)]✓ Workflow started: {run_result.get('run_id')}[/rgb(167,199,231)]")
+                            except Exception as e:
+                                console.print(f"[rgb(167,199,231)]Error generating workflow: {e}[/rgb(167,199,231)]")
+        except Exception as e:
+            console.print(Text(f"AI analysis failed: {e}", style="dim"))
+            raise
+    
+    # Aşama başına tek worker: en fazla bir istek uçuşta, bekleyen pencere en yenisiyle değişir
+    log_worker = CoalescingWorker(analyze_window, "logs")
+    ai_worker = CoalescingWorker(explain_window, "agent")
+    
+    # Satırlar tampona tetikleyici üzerinden eklenir: hata satırında hemen, çıktı durulunca
+    # veya en geç max_delay sonunda analiz; yeni satır yoksa ve bütçe doluysa istek atılmaz
+    trigger = AnalysisTrigger.from_settings(log_buffer, lambda: log_worker.submit(collapse_log_lines(log_buffer)))
+    
+    def finish_analysis(logs_text: str):
+        """Son pencereyi (son analizden beri yeni satır geldiyse) analiz eder ve iki aşamanın da bitmesini bekler"""
+        trigger.close()
+        if trigger.pending:
+            log_worker.submit(logs_text)
+        log_worker.wait_idle()
+        ai_worker.wait_idle()
+    
+    if choice == "command":
+        # Komut çalıştır ve output'unu izle
+        command = Prompt.ask("[white]Enter command to monitor[/white]")
+        
+        if not command:
+            console.print("[rgb(167,199,231)] Command cannot be empty![/rgb(167,199,231)]")
+            return
+        
+        console.print()
+        console.print("[white]🚀 Starting command execution...[/white]")
+        console.print(f"[dim]Command: {command}[/dim]")
+        console.print()
+        console.print("[rgb(167,199,231)]Monitoring output (Press Ctrl+C to stop)...[/rgb(167,199,231)]")
+        console.print()
+        
+        is_windows = platform.system() == "Windows"
+        
+        try:
+            if is_windows:
+                process = subprocess.Popen(
+                    command,
+                    shell=True,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    bufsize=1,
+                    universal_newlines=True
+                )
+            else:
+                cmd_parts = shlex.split(command)
+                process = subprocess.Popen(
+                    cmd_parts,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    bufsize=1,
+                    universal_newlines=True
+                )
+            
+            # Output'u oku ve göster
+            while True:
+                line = process.stdout.readline()
+                if not line:
+                    if process.poll() is not None:
+                        break
+                    time.sleep(0.1)
+                    continue
+                
+                # Satırı göster; analiz tetikleyicide (worker'a verilir, blocking olmaz)
+                console.print(line.rstrip())
+                trigger.add(line.rstrip())
+            
+            # Process bitti, son analiz
+            if log_buffer:
+                finish_analysis(collapse_log_lines(log_buffer))
+            
+            console.print()
+            console.print(f"[white]Command completed (exit code: {process.returncode})[/white]")
+            
+        except KeyboardInterrupt:
+            console.print()
+            console.print("[rgb(167,199,231)] Monitoring stopped by user[/rgb(167,199,231)]")
+            if 'process' in locals():
+                process.terminate()
+        except Exception as e:
+            console.print(f"[rgb(167,199,231)] Error: {e}[/rgb(167,199,231)]")
+    
+    elif choice == "file":
+        # Dosyadan oku ve izle (tail -f benzeri); glob verilirse eşleşen tüm dosyalar
+        filepath = Prompt.ask("[white]Enter log file path or glob (e.g. /var/log/app/*.log)[/white]")
+        is_glob = glob.has_magic(filepath)
+        
+        if not is_glob and not os.path.exists(filepath):
+            console.print(f"[rgb(167,199,231)] File not found: {filepath}[/rgb(167,199,231)]")
+            return
+        
+        try:
+            # Rotate edilmiş arşivler büyümez: sonuna gidilmez, baştan sona okunur
+            compression = None if is_glob else detect_file_compression(filepath)
+        except OSError as e:
+            console.print(f"[rgb(167,199,231)] Error: {e}[/rgb(167,199,231)]")
+            return
+        if not is_glob:
+            register_log_files([filepath])
+        
+        console.print()
+        if compression:
+            console.print(f"[white]📄 Replaying {compression} archive: {filepath}[/white]")
+        elif is_glob:
+            console.print(f"[white]📄 Monitoring files matching: {filepath}[/white]")
+            console.print("[dim]New and rotated files are picked up; compressed archives are skipped[/dim]")
+        else:
+            console.print(f"[white]📄 Monitoring file: {filepath}[/white]")
+        console.print("[rgb(167,199,231)]Press Ctrl+C to stop...[/rgb(167,199,231)]")
+        console.print()
+        
+        try:
+            with contextlib.ExitStack() as stack:
+                if compression:
+                    lines = iter(stack.enter_context(open_log_text(filepath)).readline, "")
+                else:
+                    # Dosyanın sonundan (veya önceki oturumun kaldığı yerden) izle;
+                    # yeni satırlar yazıldığı anda gelir (inotify / polling)
+                    tailer = stack.enter_context(FileTailer(lines=True, persist=True))
+                    if is_glob:
+                        lines = follow_glob_lines(tailer, filepath)
+                    else:
+                        lines = tailer.follow(filepath)
+                
+                for line in lines:
+                    console.print(line.rstrip())
+                    trigger.add(line.rstrip())
+                
+                # Yalnızca arşivlerin sonuna ulaşılır
+                console.print()
+                console.print("[rgb(167,199,231)] End of archive[/rgb(167,199,231)]")
+                # Son satırlar aralık dolmadan bitmiş olabilir
+                if log_buffer:
+                    finish_analysis(collapse_log_lines(log_buffer))
+        
+        except KeyboardInterrupt:
+            console.print()
+            console.print("[rgb(167,199,231)] Monitoring stopped by user[/rgb(167,199,231)]")
+        except Exception as e:
+            console.print(f"[rgb(167,199,231)] Error: {e}[/rgb(167,199,231)]")
+    
+    elif choice == "stdin":
+        # Standart input'tan oku
+        console.print()
+        console.print("[white]📥 Reading from stdin (paste logs, press Ctrl+D/Ctrl+Z to finish)[/white]")
+        console.print()
+        
+        try:
+            while True:
+                line = input()
+                console.print(line)
+                trigger.add(line)
+                    
+        except (EOFError, KeyboardInterrupt):
+            console.print()
+            console.print("[rgb(167,199,231)] Input finished[/rgb(167,199,231)]")
+            if log_buffer:
+                finish_analysis(collapse_log_lines(log_buffer))
+    
+    elif choice == "terminal":
+        # Açık terminal penceresini izle
+        console.print()
+        console.print("[white]🖥️  Open Terminal Monitor[/white]")
+        console.print()
+        console.print("[rgb(167,199,231)]Monitor output from an already open terminal window.[/rgb(167,199,231)]")
+        console.print()
+        
+        is_windows = platform.system() == "Windows"
+        
+        if is_windows:
+            # Windows için
+            console.print("[rgb(167,199,231)]Windows: Please run this command in your open terminal:[/rgb(167,199,231)]")
+            console.print()
+            temp_file = tempfile.NamedTemporaryFile(mode='w+', delete=False, suffix='.log', prefix='neurops_terminal_')
+            temp_file.close()
+            script_file = temp_file.name
+            console.print(f"[white]Get-Content -Path '{script_file}' -Wait -Tail 0[/white]")
+            console.print()
+            console.print("[rgb(167,199,231)]Then redirect your command output to this file:[/rgb(167,199,231)]")
+            console.print(f"[white]YourCommand 2>&1 | Tee-Object -FilePath '{script_file}' -Append[/white]")
+            console.print()
+            if not Confirm.ask("[rgb(167,199,231)]Ready to monitor? (Make sure you've started the command above)[/rgb(167,199,231)]", default=True):
+                return
+        else:
+            # Unix/Linux/macOS için
+            console.print("[rgb(167,199,231)]To monitor an open terminal window:[/rgb(167,199,231)]")
+            console.print()
+            console.print("[white]1. Go to your open terminal window[/white]")
+            console.print("[white]2. Run this command in that terminal:[/white]")
+            console.print()
+            
+            # Geçici dosya oluştur
+            temp_file = tempfile.NamedTemporaryFile(mode='w+', delete=False, suffix='.log', prefix='neurops_terminal_')
+            temp_file.close()
+            script_file = temp_file.name
+            
+            # macOS'ta -f seçeneği yok
+            if platform.system() == "Darwin":  # macOS
+                console.print(f"[white]script -q {script_file}[/white]")
+                console.print()
+                console.print("[dim]Note: On macOS, use 'script -q' (without -f option)[/dim]")
+            else:
+                console.print(f"[white]script -q -f {script_file}[/white]")
+            
+            console.print()
+            console.print("[rgb(167,199,231)]3. Now run your commands in that terminal - output will appear here[/rgb(167,199,231)]")
+            console.print()
+            console.print(f"[rgb(167,199,231)]Log file location:[/rgb(167,199,231)]")
+            console.print(f"[white]{script_file}[/white]")
+            console.print()
+            
+            if not Confirm.ask("[rgb(167,199,231)]Have you run 'script' command in your terminal?[/rgb(167,199,231)]", default=True):
+                return
+        
+        console.print()
+        console.print("[white]📄 Monitoring terminal output...[/white]")
+        console.print("[rgb(167,199,231)]Press Ctrl+C to stop monitoring[/rgb(167,199,231)]")
+        console.print()
+        
+        try:
+            # Dosyayı izle (hem Windows hem Unix için aynı mantık)
+            # Dosya oluşturulana kadar bekle
+            max_wait = 30  # 30 saniye bekle (kullanıcının script komutunu çalıştırması için zaman)
+            waited = 0
+            console.print("[rgb(167,199,231)]Waiting for log file to be created...[/rgb(167,199,231)]")
+            while not os.path.exists(script_file) and waited < max_wait:
+                time.sleep(1)
+                waited += 1
+                if waited % 5 == 0:
+                    console.print(f"[dim]Still waiting... ({waited}/{max_wait} seconds)[/dim]")
+            
+            if not os.path.exists(script_file):
+                console.print()
+                console.print(f"[rgb(167,199,231)]⚠️  Log file not created yet.[/rgb(167,199,231)]")
+                console.print(f"[rgb(167,199,231)]Make sure you ran the command in your open terminal:[/rgb(167,199,231)]")
+                if is_windows:
+                    console.print(f"[white]YourCommand 2>&1 | Tee-Object -FilePath '{script_file}' -Append[/white]")
+                else:
+                    if platform.system() == "Darwin":  # macOS
+                        console.print(f"[white]script -q {script_file}[/white]")
+                    else:
+                        console.print(f"[white]script -q -f {script_file}[/white]")
+                console.print()
+                if not Confirm.ask("[rgb(167,199,231)]Continue waiting?[/rgb(167,199,231)]", default=True):
+                    return
+            
+            # Dosyayı izle
+            console.print()
+            console.print("[white]✅ Log file found! Monitoring terminal output...[/white]")
+            console.print()
+            
+            # Mevcut içerik atlanır, yalnızca yeni içerik izlenir; yazıldığı anda gelir (inotify / polling).
+            # lines=True: iki okuma arasında bölünen satır tamamlanınca tek satır olarak gelir
+            with FileTailer(lines=True) as tailer:
+                tailer.add(script_file)
+                while True:
+                    for _, new_content in tailer.poll():
+                        lines = new_content.splitlines()
+                        for line in lines:
+                            if line.strip():
+                                # script komutu bazı kontrol karakterleri ekler, temizle
+                                line_clean = line.rstrip()
+                                # ANSI escape kodlarını temizle
+                                ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+                                line_clean = ansi_escape.sub('', line_clean)
+                                
+                                if line_clean.strip():
+                                    console.print(line_clean)
+                                    trigger.add(line_clean)
+        
+        except KeyboardInterrupt:
+            console.print()
+            console.print("[rgb(167,199,231)] Monitoring stopped by user[/rgb(167,199,231)]")
+            console.print(f"[dim]Log file saved at: {script_file}[/dim]")
+            console.print("[rgb(167,199,231)]Your terminal window will continue running normally.[/rgb(167,199,231)]")
+            if is_windows:
+                console.print("[rgb(167,199,231)]To stop redirecting, just stop running commands with Tee-Object.[/rgb(167,199,231)]")
+            else:
+                console.print("[rgb(167,199,231)]To stop script, type 'exit' in your terminal.[/rgb(167,199,231)]")
+        except Exception as e:
+            console.print(f"[rgb(167,199,231)] Error: {e}[/rgb(167,199,231)]")
+            console.print(f"[dim]Log file: {script_file}[/dim]")
+    
+    # Ctrl+C ile çıkılınca bekleyen pencereler düşürülür, uçuştaki istek arka planda tamamlanır
+    trigger.close()
+    log_worker.close()
+    ai_worker.close()
+    stats = log_worker.stats()
+    if stats["submitted"]:
+        console.print(
+            f"[dim]Analysis windows: {stats['completed']} analyzed, "
+            f"{stats['dropped']} superseded by newer output, {stats['failed']} failed[/dim]"
+        )
+        trigger_stats = trigger.stats()
+        console.print(
+            f"[dim]Triggers: {trigger_stats['on_error']} on errors, {trigger_stats['on_quiet']} when output settled, "
+            f"{trigger_stats['on_max_delay']} at max delay, {trigger_stats['budget_deferred']} delayed by the per-minute budget[/dim]"
+        )
@@ -0,0 +1,650 @@
+"""Security & Protection komutları"""
+
+import time
+import subprocess
+import platform
+import shlex
+from typing import Any, Dict, Optional
+
+from rich.table import Table
+from rich.prompt import Confirm, Prompt
+from rich.panel import Panel
+from rich.status import Status
+from rich.text import Text
+from rich import box
+
+from neurops.config import get_api_headers
+from neurops.api import api_get, api_get_cached, api_post, api_post_analysis
+from neurops.localanalysis import analyze_security_locally, analyze_with_fallback
+from neurops.logfiles import LogAnalysisError, read_log_text
+from neurops.logindex import register_log_files
+from neurops.logtime import parse_time_range
+from neurops.ui import console, get_multiline_input_simple
+
+
+def run_security_analysis(logs_content: str, network_traffic: Optional[str] = None) -> Dict[str, Any]:
+    """
+    /security/analyze çağrısı; API'ye ulaşılamazsa yerel kural motoru (bkz. localanalysis).
+    Backend hata dönerse LogAnalysisError fırlatılır.
+    """
+    def remote():
+        res = api_post_analysis(
+            "/security/analyze",
+            {
+                "logs": logs_content,
+                "network_traffic": network_traffic
+            },
+            compress=True,
+            headers=get_api_headers(),
+            timeout=30
+        )
+        if res.status_code != 200:
+            raise LogAnalysisError(res.status_code, res.json().get('detail', 'Unknown error'))
+        return res.json()
+    
+    return analyze_with_fallback(remote, lambda: analyze_security_locally(logs_content))
+
+
+def security_analysis():
+    """Güvenlik analizi"""
+    console.print()
+    panel = Panel(
+        "[rgb(167,199,231)]Security Analysis[/rgb(167,199,231)]\n\n"
+        "[rgb(167,199,231)]Analyze logs, network traffic, and system metrics for security threats.[/rgb(167,199,231)]",
+        border_style="white",
+        box=box.SIMPLE
+    )
+    console.print(panel)
+    console.print()
+    
+    # Input seçenekleri
+    choice = Prompt.ask(
+        "[rgb(167,199,231)]Choose input method[/rgb(167,199,231)]",
+        choices=["logs", "file", "paste"],
+        default="logs"
+    )
+    
+    logs_content = ""
+    network_traffic = None
+    
+    if choice == "file":
+        path = Prompt.ask("[rgb(167,199,231)]Enter log file path[/rgb(167,199,231)]")
+        try:
+            since, until = parse_time_range(Prompt.ask(
+                "[rgb(167,199,231)]Time range (e.g. 30m, 2h, START..END; empty = whole file)[/rgb(167,199,231)]",
+                default=""
+            ))
+        except ValueError as e:
+            console.print(f"[rgb(167,199,231)] {e}[/rgb(167,199,231)]")
+            return
+        try:
+            with Status("[rgb(167,199,231)]Reading file...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+                # .gz/.bz2/.xz/.zst arşivleri okurken açılır; zaman aralığı ikili aramayla bulunur
+                logs_content = read_log_text(path, since, until)
+            register_log_files([path])
+        except FileNotFoundError:
+            console.print(f"[rgb(167,199,231)] File not found: {path}[/rgb(167,199,231)]")
+            return
+        except Exception as e:
+            console.print(f"[rgb(167,199,231)] Error reading file: {e}[/rgb(167,199,231)]")
+            return
+    elif choice == "paste":
+        logs_content = get_multiline_input_simple("[rgb(167,199,231)]Paste logs/network traffic[/rgb(167,199,231)]")
+    else:
+        # Komut çalıştır
+        command = Prompt.ask("[rgb(167,199,231)]Enter command to get logs[/rgb(167,199,231)]", default="")
+        if command:
+            try:
+                is_windows = platform.system() == "Windows"
+                if is_windows:
+                    process = subprocess.run(
+                        command,
+                        shell=True,
+                        capture_output=True,
+                        text=True,
+                        timeout=30
+                    )
+                else:
+                    cmd_parts = shlex.split(command)
+                    process = subprocess.run(
+                        cmd_parts,
+                        capture_output=True,
+                        text=True,
+                        timeout=30
+                    )
+                logs_content = process.stdout + process.stderr
+            except Exception as e:
+                console.print(f"[rgb(167,199,231)] Error: {e}[/rgb(167,199,231)]")
+                return
+    
+    if not logs_content:
+        console.print("[rgb(167,199,231)] No content provided![/rgb(167,199,231)]")
+        return
+    
+    try:
+        with Status("[rgb(167,199,231)]Analyzing security threats...[/rgb(167,199,231)]", spinner="dots12", spinner_style="rgb(167,199,231)"):
+            result = run_security_analysis(logs_content, network_traffic)
+        
+        console.print()
+        
+        # Security Score
+        score = result.get('security_score', 100)
+        score_color = "green" if score >= 80 else "yellow" if score >= 50 else "red"
+        
+        score_panel = Panel(
+            f"[bold {score_color}]Security Score: {score:.1f}/100[/bold {score_color}]\n"
+            f"[white]Threats Detected:[/white] {result.get('threats_detected', 0)}\n"
+            f"[white]Threat Level:[/white] {result.get('threat_level', 'low').upper()}\n"
+            f"[white]Vulnerabilities:[/white] {len(result.get('vulnerabilities', []))}",
+            title="[bold white]Security Analysis Results[/bold white]",
+            border_style="white",
+            box=box.SIMPLE
+        )
+        console.print(score_panel)
+        
+        # Threats
+        threats = result.get('threats', [])
+        if threats:
+            console.print()
+            console.print("[rgb(167,199,231)]Threats Detected:[/rgb(167,199,231)]")
+            for threat in threats[:10]:  # İlk 10 threat
+                threat_type = threat.get('type', 'unknown')
+                level = threat.get('level', 'low')
+                level_colors = {
+                    'critical': 'red',
+                    'high': 'yellow',
+                    'medium': 'yellow',
+                    'low': 'dim'
+                }
+                color = level_colors.get(level, 'white')
+                # Log satırı markup olarak yorumlanmamalı
+                console.print(Text.assemble((f"  • {level.upper()}", color), f" {threat_type}: {threat.get('line', '')[:80]}"))
+        
+        # Vulnerabilities
+        vulnerabilities = result.get('vulnerabilities', [])
+        if vulnerabilities:
+            console.print()
+            console.print("[rgb(167,199,231)]Vulnerabilities:[/rgb(167,199,231)]")
+            for vuln in vulnerabilities:
+                console.print(f"  [rgb(167,199,231)]•[/rgb(167,199,231)] {vuln}")
+        
+        # Recommendations
+        recommendations = result.get('recommendations', [])
+        if recommendations:
+            console.print()
+            console.print("[rgb(167,199,231)]Recommendations:[/rgb(167,199,231)]")
+            for rec in recommendations:
+                console.print(f"  [white]•[/white] {rec}")
+        
+        # Summary
+        console.print()
+        summary_panel = Panel(
+            result.get('summary', 'Analysis completed'),
+            title="[bold white]Summary[/bold white]",
+            border_style="white",
+            box=box.SIMPLE
+        )
+        console.print(summary_panel)
+        if result.get("offline"):
+            console.print("[dim]API unavailable: analyzed locally with built-in rules[/dim]")
+        elif result.get("engine") == "local":
+            console.print("[dim]Local rules found no threats; the API was not called[/dim]")
+    except LogAnalysisError as e:
+        console.print(f"[rgb(167,199,231)] Error: {e.detail}[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)] Error: {e}[/rgb(167,199,231)]")
+
+
+def report_security_event():
+    """Güvenlik olayı raporla"""
+    console.print()
+    panel = Panel(
+        "[rgb(167,199,231)]Report Security Event[/rgb(167,199,231)]\n\n"
+        "[rgb(167,199,231)]Report a security incident or threat detection.[/rgb(167,199,231)]",
+        title="Security Event",
+        border_style="white",
+        box=box.SIMPLE
+    )
+    console.print(panel)
+    console.print()
+    
+    event_type = Prompt.ask(
+        "[rgb(167,199,231)]Event Type[/rgb(167,199,231)]",
+        choices=["intrusion_attempt", "malware_detected", "suspicious_activity", 
+                 "unauthorized_access", "data_breach", "ddos_attack", "phishing", 
+                 "vulnerability", "other"],
+        default="suspicious_activity"
+    )
+    
+    threat_level = Prompt.ask(
+        "[rgb(167,199,231)]Threat Level[/rgb(167,199,231)]",
+        choices=["low", "medium", "high", "critical"],
+        default="medium"
+    )
+    
+    title = Prompt.ask("[rgb(167,199,231)]Event Title[/rgb(167,199,231)]")
+    description = get_multiline_input_simple("[rgb(167,199,231)]Description[/rgb(167,199,231)]")
+    
+    source_ip = Prompt.ask("[rgb(167,199,231)]Source IP (optional)[/rgb(167,199,231)]", default="")
+    target_resource = Prompt.ask("[rgb(167,199,231)]Target Resource (optional)[/rgb(167,199,231)]", default="")
+    
+    # Critical/High threat level için otomatik workflow oluşturma seçeneği
+    auto_create_workflow = False
+    if threat_level in ["critical", "high"]:
+        auto_create_workflow = Confirm.ask(
+            "[rgb(167,199,231)]Auto-generate remediation workflow?[/rgb(167,199,231)]",
+            default=False
+        )
+    
+    try:
+        with Status("[rgb(167,199,231)]Reporting security event...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+            res = api_post(
+                "/security/events",
+                params={"auto_create_workflow": str(auto_create_workflow).lower()},
+                json={
+                    "event_type": event_type,
+                    "threat_level": threat_level,
+                    "title": title,
+                    "description": description,
+                    "source_ip": source_ip if source_ip else None,
+                    "target_resource": target_resource if target_resource else None
+                }
+            )
+        
+        if res.status_code == 200:
+            event = res.json()
+            console.print()
+            
+            # Workflow oluşturuldu mu kontrol et
+            workflow_name = None
+            if event.get('metadata') and event.get('metadata').get('generated_workflow'):
+                workflow_name = event.get('metadata').get('generated_workflow')
+            
+            success_msg = f"[white]Security event reported successfully![/white]\n\n"
+            success_msg += f"Event ID: [white]{event.get('id')}[/white]\n"
+            success_msg += f"Threat Level: [white]{event.get('threat_level', '').upper()}[/white]"
+            
+            if workflow_name:
+                success_msg += f"\n\n[rgb(167,199,231)]AI Generated Workflow:[/rgb(167,199,231)] [white]{workflow_name}[/white]"
+            
+            success_panel = Panel(
+                success_msg,
+                title="Success",
+                border_style="white",
+                box=box.SIMPLE
+            )
+            console.print(success_panel)
+        else:
+            error_detail = res.json().get('detail', 'Unknown error')
+            console.print(f"[rgb(167,199,231)] Error: {error_detail}[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)] Error: {e}[/rgb(167,199,231)]")
+
+
+def list_security_events():
+    """Güvenlik olaylarını listele"""
+    console.print()
+    
+    threat_level_filter = Prompt.ask(
+        "[white]Filter by threat level (optional)[/white]",
+        choices=["", "low", "medium", "high", "critical"],
+        default=""
+    )
+    
+    status_filter = Prompt.ask(
+        "[white]Filter by status (optional)[/white]",
+        choices=["", "detected", "investigating", "resolved", "false_positive"],
+        default=""
+    )
+    
+    try:
+        params = {}
+        if threat_level_filter:
+            params["threat_level"] = threat_level_filter
+        if status_filter:
+            params["status"] = status_filter
+        
+        with Status("[rgb(167,199,231)]Fetching security events...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+            res = api_get("/security/events", params=params)
+        
+        if res.status_code == 200:
+            events = res.json()
+            console.print()
+            
+            if not events:
+                console.print("[rgb(167,199,231)]No security events found.[/rgb(167,199,231)]")
+                return
+            
+            table = Table(
+                title="[rgb(167,199,231)]Security Events[/rgb(167,199,231)]",
+                box=box.SIMPLE,
+                border_style="rgb(167,199,231)",
+                show_header=True,
+                header_style="rgb(167,199,231)"
+            )
+            table.add_column("ID", style="white", width=36)
+            table.add_column("Type", style="white", width=20)
+            table.add_column("Threat Level", style="rgb(167,199,231)", width=15)
+            table.add_column("Title", style="white", width=25)
+            table.add_column("Status", style="white", width=15)
+            table.add_column("Detected", style="dim", width=20)
+            
+            threat_colors = {
+                "critical": "red",
+                "high": "yellow",
+                "medium": "yellow",
+                "low": "dim"
+            }
+            
+            for event in events:
+                event_id = event.get('id', 'N/A')[:8] + '...'
+                event_type = event.get('event_type', 'N/A').replace('_', ' ').title()
+                threat_level = event.get('threat_level', 'N/A')
+                title = event.get('title', 'N/A')[:23] + '...' if len(event.get('title', '')) > 23 else event.get('title', 'N/A')
+                status = event.get('status', 'N/A')
+                detected = event.get('detected_at', 'N/A')[:19] if event.get('detected_at') else 'N/A'
+                
+                threat_color = threat_colors.get(threat_level, 'white')
+                threat_display = f"[{threat_color}]{threat_level.upper()}[/{threat_color}]"
+                
+                table.add_row(event_id, event_type, threat_display, title, status, detected)
+            
+            console.print(table)
+        else:
+            console.print(f"[rgb(167,199,231)] Error: {res.status_code}[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)] Error: {e}[/rgb(167,199,231)]")
+
+
+def view_security_event():
+    """Güvenlik olayı detaylarını görüntüle"""
+    console.print()
+    event_id = Prompt.ask("[white]Enter security event ID[/white]")
+    
+    try:
+        with Status("[rgb(167,199,231)]Fetching event details...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+            res = api_get(f"/security/events/{event_id}")
+        
+        if res.status_code == 200:
+            event = res.json()
+            console.print()
+            
+            threat_level = event.get('threat_level', 'unknown')
+            threat_colors = {
+                "critical": "red",
+                "high": "yellow",
+                "medium": "yellow",
+                "low": "dim"
+            }
+            threat_color = threat_colors.get(threat_level, 'white')
+            
+            info_text = f"[white]ID:[/white] {event.get('id')}\n"
+            info_text += f"[white]Type:[/white] {event.get('event_type', 'N/A').replace('_', ' ').title()}\n"
+            info_text += f"[white]Threat Level:[/white] [{threat_color}]{threat_level.upper()}[/{threat_color}]\n"
+            info_text += f"[white]Title:[/white] {event.get('title')}\n"
+            info_text += f"[white]Description:[/white] {event.get('description')}\n"
+            info_text += f"[white]Status:[/white] {event.get('status', 'N/A')}\n"
+            info_text += f"[white]Detected:[/white] {event.get('detected_at')}\n"
+            
+            if event.get('resolved_at'):
+                info_text += f"[white]Resolved:[/white] {event.get('resolved_at')}\n"
+            if event.get('source_ip'):
+                info_text += f"[white]Source IP:[/white] {event.get('source_ip')}\n"
+            if event.get('target_resource'):
+                info_text += f"[white]Target:[/white] {event.get('target_resource')}\n"
+            
+            # Generated workflow bilgisi
+            if event.get('metadata') and event.get('metadata').get('generated_workflow'):
+                workflow_name = event.get('metadata').get('generated_workflow')
+                info_text += f"\n[rgb(167,199,231)]Generated Workflow:[/rgb(167,199,231)] [white]{workflow_name}[/white]"
+            
+            info_panel = Panel(
+                info_text,
+                title="[bold white]Security Event Details[/bold white]",
+                border_style="white",
+                box=box.SIMPLE
+            )
+            console.print(info_panel)
+        elif res.status_code == 404:
+            console.print(f"[rgb(167,199,231)] Security event '{event_id}' not found[/rgb(167,199,231)]")
+        else:
+            console.print(f"[rgb(167,199,231)] Error: {res.status_code}[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)] Error: {e}[/rgb(167,199,231)]")
+
+
+def generate_workflow_for_security_event():
+    """Security event için AI ile workflow oluştur"""
+    console.print()
+    panel = Panel(
+        "[rgb(167,199,231)]Generate Workflow for Security Event[/rgb(167,199,231)]\n\n"
+        "[rgb(167,199,231)]AI will analyze the security event and create a custom remediation workflow.[/rgb(167,199,231)]",
+        border_style="rgb(167,199,231)",
+        box=box.SIMPLE
+    )
+    console.print(panel)
+    console.print()
+    
+    event_id = Prompt.ask("[rgb(167,199,231)]Enter security event ID[/rgb(167,199,231)]")
+    
+    auto_run = Confirm.ask(
+        "[rgb(167,199,231)]Automatically run the generated workflow?[/rgb(167,199,231)]",
+        default=False
+    )
+    
+    try:
+        with Status("[rgb(167,199,231)]AI is analyzing event and generating workflow...[/rgb(167,199,231)]", spinner="dots12", spinner_style="rgb(167,199,231)"):
+            res = api_post(
+                f"/security/events/{event_id}/generate-workflow",
+                params={"auto_run": str(auto_run).lower()},
+                timeout=120  # AI generation için daha uzun timeout
+            )
+        
+        if res.status_code == 200:
+            result = res.json()
+            console.print()
+            
+            auto_run_msg = f"[rgb(167,199,231)]Workflow will be executed automatically[/rgb(167,199,231)]" if result.get('auto_run') else "[dim]You can run the workflow manually from the Workflow Management menu[/dim]"
+            
+            success_panel = Panel(
+                f"[rgb(167,199,231)]Workflow generated successfully![/rgb(167,199,231)]\n\n"
+                f"Workflow Name: [rgb(167,199,231)]{result.get('workflow_name')}[/rgb(167,199,231)]\n"
+                f"Event ID: [rgb(167,199,231)]{result.get('event_id')}[/rgb(167,199,231)]\n"
+                f"Auto Run: [rgb(167,199,231)]{'Yes' if result.get('auto_run') else 'No'}[/rgb(167,199,231)]\n\n"
+                f"{auto_run_msg}",
+                border_style="rgb(167,199,231)",
+                box=box.SIMPLE
+            )
+            console.print(success_panel)
+            
+            if result.get('workflow_name'):
+                console.print()
+                if Confirm.ask("[rgb(167,199,231)]View the generated workflow?[/rgb(167,199,231)]", default=True):
+                    # Workflow'u göster
+                    try:
+                        wf_res = api_get_cached(f"/workflow/{result.get('workflow_name')}")
+                        if wf_res.status_code == 200:
+                            workflow = wf_res.json()
+                            console.print()
+                            workflow_panel = Panel(
+                                f"[rgb(167,199,231)]Name:[/rgb(167,199,231)] {workflow.get('name')}\n"
+                                f"[rgb(167,199,231)]Description:[/rgb(167,199,231)] {workflow.get('description', 'N/A')}\n"
+                                f"[rgb(167,199,231)]Steps:[/rgb(167,199,231)] {len(workflow.get('steps', []))}",
+                                title="[bold rgb(167,199,231)]Generated Workflow[/bold rgb(167,199,231)]",
+                                border_style="rgb(167,199,231)",
+                                box=box.SIMPLE
+                            )
+                            console.print(workflow_panel)
+                    except:
+                        pass
+        elif res.status_code == 404:
+            console.print(f"[rgb(167,199,231)] Security event '{event_id}' not found[/rgb(167,199,231)]")
+        else:
+            error_detail = res.json().get('detail', 'Unknown error')
+            console.print(f"[rgb(167,199,231)] Error: {error_detail}[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)] Error: {e}[/rgb(167,199,231)]")
+
+
+def security_scan():
+    """Güvenlik taraması başlat"""
+    console.print()
+    panel = Panel(
+        "[rgb(167,199,231)]Security Scan[/rgb(167,199,231)]\n\n"
+        "[rgb(167,199,231)]Perform a security scan to detect vulnerabilities and threats.[/rgb(167,199,231)]",
+        border_style="white",
+        box=box.SIMPLE
+    )
+    console.print(panel)
+    console.print()
+    
+    scan_type = Prompt.ask(
+        "[rgb(167,199,231)]Scan Type[/rgb(167,199,231)]",
+        choices=["quick", "full", "custom"],
+        default="quick"
+    )
+    
+    target = Prompt.ask("[rgb(167,199,231)]Target (optional)[/rgb(167,199,231)]", default="")
+    
+    try:
+        with Status("[rgb(167,199,231)]Starting security scan...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+            res = api_post(
+                "/security/scan",
+                json={
+                    "scan_type": scan_type,
+                    "target": target if target else None
+                }
+            )
+        
+        if res.status_code == 200:
+            scan = res.json()
+            console.print()
+            success_panel = Panel(
+                f"[rgb(167,199,231)]Security scan started![/rgb(167,199,231)]\n\n"
+                f"Scan ID: [rgb(167,199,231)]{scan.get('scan_id')}[/rgb(167,199,231)]\n"
+                f"Type: [rgb(167,199,231)]{scan.get('scan_type')}[/rgb(167,199,231)]\n"
+                f"Status: [rgb(167,199,231)]{scan.get('status')}[/rgb(167,199,231)]\n\n"
+                f"[dim rgb(167,199,231)]Use option 5.5 to check scan results.[/dim rgb(167,199,231)]",
+                title="Success",
+                border_style="white",
+                box=box.SIMPLE
+            )
+            console.print(success_panel)
+            
+            # Scan sonuçlarını bekle (opsiyonel)
+            if Confirm.ask("[rgb(167,199,231)]Wait for scan to complete?[/rgb(167,199,231)]", default=False):
+                console.print()
+                console.print("[dim rgb(167,199,231)]Waiting for scan to complete...[/dim rgb(167,199,231)]")
+                time.sleep(3)  # Simüle edilmiş tarama için bekle
+                
+                # Sonuçları getir
+                scan_res = api_get(f"/security/scan/{scan.get('scan_id')}")
+                if scan_res.status_code == 200:
+                    scan_result = scan_res.json()
+                    console.print()
+                    result_panel = Panel(
+                        f"[rgb(167,199,231)]Scan Results:[/rgb(167,199,231)]\n"
+                        f"[rgb(167,199,231)]Vulnerabilities Found:[/rgb(167,199,231)] {scan_result.get('vulnerabilities_found', 0)}\n"
+                        f"[rgb(167,199,231)]Threats Found:[/rgb(167,199,231)] {scan_result.get('threats_found', 0)}\n"
+                        f"[rgb(167,199,231)]Status:[/rgb(167,199,231)] {scan_result.get('status', 'N/A')}",
+                        border_style="white",
+                        box=box.SIMPLE
+                    )
+                    console.print(result_panel)
+        else:
+            error_detail = res.json().get('detail', 'Unknown error')
+            console.print(f"[rgb(167,199,231)] Error: {error_detail}[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)] Error: {e}[/rgb(167,199,231)]")
+
+
+def security_recommendations():
+    """Güvenlik önerilerini göster"""
+    try:
+        with Status("[rgb(167,199,231)]Fetching security recommendations...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+            res = api_get_cached("/security/recommendations")
+        
+        if res.status_code == 200:
+            recommendations = res.json()
+            console.print()
+            
+            if not recommendations:
+                console.print("[rgb(167,199,231)]No recommendations available.[/rgb(167,199,231)]")
+                return
+            
+            for rec in recommendations:
+                priority = rec.get('priority', 'low')
+                priority_colors = {
+                    'critical': 'red',
+                    'high': 'yellow',
+                    'medium': 'yellow',
+                    'low': 'dim'
+                }
+                color = priority_colors.get(priority, 'white')
+                
+                rec_panel = Panel(
+                    f"[rgb(167,199,231)]Title:[/rgb(167,199,231)] {rec.get('title', 'Recommendation')}\n"
+                    f"[rgb(167,199,231)]Category:[/rgb(167,199,231)] {rec.get('category', 'N/A').title()}\n"
+                    f"[rgb(167,199,231)]Priority:[/rgb(167,199,231)] [{color}]{priority.upper()}[/{color}]\n"
+                    f"[rgb(167,199,231)]Description:[/rgb(167,199,231)] {rec.get('description', 'N/A')}\n\n"
+                    + "\n".join([f"  [rgb(167,199,231)]•[/rgb(167,199,231)] {item}" for item in rec.get('action_items', [])]),
+                    border_style="white",
+                    box=box.SIMPLE
+                )
+                console.print(rec_panel)
+                console.print()
+        else:
+            console.print(f"[rgb(167,199,231)] Error: {res.status_code}[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)] Error: {e}[/rgb(167,199,231)]")
+
+
+def security_stats():
+    """Güvenlik istatistiklerini göster"""
+    try:
+        with Status("[rgb(167,199,231)]Fetching security statistics...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+            res = api_get_cached("/security/stats/summary")
+        
+        if res.status_code == 200:
+            stats = res.json()
+            console.print()
+            
+            table = Table(
+                title="[rgb(167,199,231)]Security Statistics[/rgb(167,199,231)]",
+                box=box.SIMPLE,
+                border_style="rgb(167,199,231)",
+                show_header=True,
+                header_style="rgb(167,199,231)"
+            )
+            table.add_column("Metric", style="rgb(167,199,231)", width=25)
+            table.add_column("Value", style="rgb(167,199,231)", width=20)
+            
+            table.add_row("Total Events", str(stats.get('total_events', 0)))
+            table.add_row("Total Scans", str(stats.get('total_scans', 0)))
+            table.add_row("Critical Events", f"[rgb(167,199,231)]{stats.get('critical_events', 0)}[/rgb(167,199,231)]")
+            table.add_row("High Events", f"[rgb(167,199,231)]{stats.get('high_events', 0)}[/rgb(167,199,231)]")
+            table.add_row("Active Threats", f"[rgb(167,199,231)]{stats.get('active_threats', 0)}[/rgb(167,199,231)]")
+            
+            console.print(table)
+            
+            # By threat level
+            if stats.get('by_threat_level'):
+                console.print()
+                threat_table = Table(
+                    title="[rgb(167,199,231)]By Threat Level[/rgb(167,199,231)]",
+                    box=box.SIMPLE,
+                    border_style="rgb(167,199,231)",
+                    show_header=True,
+                    header_style="rgb(167,199,231)"
+                )
+                threat_table.add_column("Threat Level", style="rgb(167,199,231)", width=20)
+                threat_table.add_column("Count", style="rgb(167,199,231)", width=15)
+                
+                for level, count in stats.get('by_threat_level', {}).items():
+                    threat_table.add_row(level.upper(), str(count))
+                
+                console.print(threat_table)
+        else:
+            console.print(f"[rgb(167,199,231)] Error: {res.status_code}[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)] Error: {e}[/rgb(167,199,231)]")
@@ -0,0 +1,211 @@
+"""Settings menüsü"""
+
+import os
+import tempfile
+from datetime import datetime
+
+from rich.table import Table
+from rich.prompt import Confirm, IntPrompt, Prompt
+from rich.panel import Panel
+from rich import box
+
+from neurops.config import load_settings, save_settings
+from neurops.api import ANALYSIS_CACHE_MODES, REQUEST_COMPRESSION_MODES, RESPONSE_CACHE_MODES
+from neurops.localanalysis import LOCAL_ANALYSIS_MODES
+from neurops.ui import console
+
+
+def show_settings_menu():
+    """Settings menüsü"""
+    console.print()
+    panel = Panel(
+        "[rgb(167,199,231)]Settings[/rgb(167,199,231)]\n\n"
+        "[rgb(167,199,231)]Configure automatic actions for terminal monitoring and log analysis.[/rgb(167,199,231)]",
+        border_style="white",
+        box=box.SIMPLE
+    )
+    console.print(panel)
+    console.print()
+    
+    settings = load_settings()
+    
+    # Mevcut ayarları göster
+    console.print("[rgb(167,199,231)]Current Settings:[/rgb(167,199,231)]")
+    console.print(f"  Auto Workflow Generation: [rgb(167,199,231)]{'Enabled' if settings['auto_workflow_generation'] else 'Disabled'}[/rgb(167,199,231)]")
+    console.print(f"  Auto Incident Creation: [rgb(167,199,231)]{'Enabled' if settings['auto_incident_creation'] else 'Disabled'}[/rgb(167,199,231)]")
+    console.print(f"  Request Compression: [rgb(167,199,231)]{settings['request_compression']}[/rgb(167,199,231)]")
+    console.print(f"  Response Cache: [rgb(167,199,231)]{settings['response_cache']}[/rgb(167,199,231)]")
+    console.print(f"  Analysis Cache: [rgb(167,199,231)]{settings['analysis_cache']} (TTL {settings['analysis_cache_ttl']}s)[/rgb(167,199,231)]")
+    console.print(f"  Log Pre-scan: [rgb(167,199,231)]{'Enabled' if settings['log_prescan'] else 'Disabled'} ({settings['prescan_context_lines']} context lines)[/rgb(167,199,231)]")
+    console.print(f"  Incremental Log Analysis: [rgb(167,199,231)]{'Enabled' if settings['incremental_log_analysis'] else 'Disabled'}[/rgb(167,199,231)]")
+    console.print(f"  Local Analysis: [rgb(167,199,231)]{settings['local_analysis']}[/rgb(167,199,231)]")
+    budget = settings['analysis_budget_per_minute'] or "unlimited"
+    console.print(
+        f"  Monitor Analysis Trigger: [rgb(167,199,231)]{'on errors, ' if settings['analysis_on_error'] else ''}"
+        f"after {settings['analysis_debounce']}s quiet or {settings['analysis_max_delay']}s max, {budget}/min[/rgb(167,199,231)]"
+    )
+    console.print()
+    
+    # Log dosyalarını göster
+    if Confirm.ask("[rgb(167,199,231)]View log file locations?[/rgb(167,199,231)]", default=False):
+        show_log_file_locations()
+        console.print()
+    
+    # Auto Workflow Generation
+    auto_workflow = Confirm.ask(
+        "[rgb(167,199,231)]Auto-generate and run workflows when issues detected in terminal?[/rgb(167,199,231)]",
+        default=settings['auto_workflow_generation']
+    )
+    
+    # Auto Incident Creation
+    auto_incident = Confirm.ask(
+        "[rgb(167,199,231)]Auto-create incidents when issues detected in logs?[/rgb(167,199,231)]",
+        default=settings['auto_incident_creation']
+    )
+    
+    # Büyük log yüklemeleri için istek sıkıştırma
+    request_compression = Prompt.ask(
+        "[rgb(167,199,231)]Compress large log uploads (auto = negotiate with API)[/rgb(167,199,231)]",
+        choices=REQUEST_COMPRESSION_MODES,
+        default=settings['request_compression'] if settings['request_compression'] in REQUEST_COMPRESSION_MODES else "off"
+    )
+    
+    # Okuma endpoint'leri için yanıt önbelleği
+    response_cache_mode = Prompt.ask(
+        "[rgb(167,199,231)]Cache API responses (disk = keep across sessions)[/rgb(167,199,231)]",
+        choices=RESPONSE_CACHE_MODES,
+        default=settings['response_cache'] if settings['response_cache'] in RESPONSE_CACHE_MODES else "memory"
+    )
+    
+    # Aynı log/problem metninin analiz sonucu tekrar istenmez
+    analysis_cache_mode = Prompt.ask(
+        "[rgb(167,199,231)]Reuse results when identical logs or problems are analyzed again (disk = keep across sessions)[/rgb(167,199,231)]",
+        choices=ANALYSIS_CACHE_MODES,
+        default=settings['analysis_cache'] if settings['analysis_cache'] in ANALYSIS_CACHE_MODES else "disk"
+    )
+    analysis_cache_ttl = settings['analysis_cache_ttl']
+    if analysis_cache_mode != "off":
+        analysis_cache_ttl = IntPrompt.ask(
+            "[rgb(167,199,231)]Analysis cache lifetime (seconds)[/rgb(167,199,231)]",
+            default=analysis_cache_ttl
+        )
+    
+    # Log analizinde yerel ön tarama
+    log_prescan = Confirm.ask(
+        "[rgb(167,199,231)]Pre-scan logs locally and send only error/warning context?[/rgb(167,199,231)]",
+        default=bool(settings['log_prescan'])
+    )
+    prescan_context_lines = settings['prescan_context_lines']
+    if log_prescan:
+        prescan_context_lines = IntPrompt.ask(
+            "[rgb(167,199,231)]Context lines around each match[/rgb(167,199,231)]",
+            default=prescan_context_lines
+        )
+    
+    # Aynı log dosyasında yalnızca yeni eklenen satırları analiz et
+    incremental_log_analysis = Confirm.ask(
+        "[rgb(167,199,231)]Only analyze lines appended since the last analysis of a file?[/rgb(167,199,231)]",
+        default=bool(settings['incremental_log_analysis'])
+    )
+    
+    # API'ye ulaşılamadığında (veya ön filtre olarak) yerel kural motoru
+    local_analysis = Prompt.ask(
+        "[rgb(167,199,231)]Local analysis engine (fallback = when API is down, filter = call API only if local rules find something)[/rgb(167,199,231)]",
+        choices=LOCAL_ANALYSIS_MODES,
+        default=settings['local_analysis'] if settings['local_analysis'] in LOCAL_ANALYSIS_MODES else "fallback"
+    )
+    
+    # Monitor'de analiz zamanlaması: sabit aralık yerine çıktıya göre
+    analysis_on_error = Confirm.ask(
+        "[rgb(167,199,231)]Monitor: analyze immediately when an error line appears?[/rgb(167,199,231)]",
+        default=bool(settings['analysis_on_error'])
+    )
+    analysis_debounce = IntPrompt.ask(
+        "[rgb(167,199,231)]Monitor: analyze once output has been quiet for (seconds)[/rgb(167,199,231)]",
+        default=settings['analysis_debounce']
+    )
+    analysis_max_delay = IntPrompt.ask(
+        "[rgb(167,199,231)]Monitor: longest wait before analyzing continuous output (seconds)[/rgb(167,199,231)]",
+        default=settings['analysis_max_delay']
+    )
+    analysis_budget_per_minute = IntPrompt.ask(
+        "[rgb(167,199,231)]Monitor: maximum analyses per minute (0 = unlimited)[/rgb(167,199,231)]",
+        default=settings['analysis_budget_per_minute']
+    )
+    
+    # Kaydet
+    if save_settings(auto_workflow, auto_incident, request_compression=request_compression, response_cache=response_cache_mode,
+                     analysis_cache=analysis_cache_mode, analysis_cache_ttl=max(0, analysis_cache_ttl),
+                     log_prescan=log_prescan, prescan_context_lines=max(0, prescan_context_lines),
+                     incremental_log_analysis=incremental_log_analysis, local_analysis=local_analysis,
+                     analysis_on_error=analysis_on_error, analysis_debounce=max(0, analysis_debounce),
+                     analysis_max_delay=max(1, analysis_max_delay), analysis_budget_per_minute=max(0, analysis_budget_per_minute)):
+        console.print()
+        console.print("[rgb(167,199,231)]Settings saved successfully![/rgb(167,199,231)]")
+    else:
+        console.print()
+        console.print("[rgb(167,199,231)]Error saving settings[/rgb(167,199,231)]")
+    
+    console.print()
+
+
+def show_log_file_locations():
+    """Log dosyalarının konumlarını göster"""
+    console.print()
+    console.print("[rgb(167,199,231)]📁 Log File Locations[/rgb(167,199,231)]")
+    console.print()
+    
+    # Temp dizinini bul
+    temp_dir = tempfile.gettempdir()
+    console.print(f"[rgb(167,199,231)]Temporary directory:[/rgb(167,199,231)] [white]{temp_dir}[/white]")
+    console.print()
+    
+    # Neurops log dosyalarını bul
+    import glob
+    log_patterns = [
+        os.path.join(temp_dir, "neurops_terminal_*.log"),
+        os.path.join(temp_dir, "neurops_agent_*.log"),
+        os.path.join(temp_dir, "neurops_fix_*.sh"),
+    ]
+    
+    all_logs = []
+    for pattern in log_patterns:
+        all_logs.extend(glob.glob(pattern))
+    
+    if all_logs:
+        console.print("[rgb(167,199,231)]Found log files:[/rgb(167,199,231)]")
+        console.print()
+        
+        table = Table(
+            box=box.SIMPLE,
+            border_style="white",
+            show_header=True,
+            header_style="rgb(167,199,231)"
+        )
+        table.add_column("File", style="white", width=60)
+        table.add_column("Size", style="rgb(167,199,231)", width=15)
+        table.add_column("Modified", style="dim", width=20)
+        
+        # Dosyaları tarihe göre sırala (en yeni önce)
+        all_logs.sort(key=lambda x: os.path.getmtime(x) if os.path.exists(x) else 0, reverse=True)
+        
+        for log_file in all_logs[:20]:  # En fazla 20 dosya göster
+            if os.path.exists(log_file):
+                size = os.path.getsize(log_file)
+                size_str = f"{size / 1024:.1f} KB" if size < 1024 * 1024 else f"{size / (1024*1024):.1f} MB"
+                mtime = os.path.getmtime(log_file)
+                mtime_str = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S")
+                table.add_row(log_file, size_str, mtime_str)
+        
+        console.print(table)
+        console.print()
+        console.print(f"[dim]Showing {min(len(all_logs), 20)} of {len(all_logs)} files[/dim]")
+    else:
+        console.print("[rgb(167,199,231)]No log files found in temporary directory.[/rgb(167,199,231)]")
+        console.print("[rgb(167,199,231)]Log files are created when you use terminal monitoring features.[/rgb(167,199,231)]")
+    
+    console.print()
+    console.print("[rgb(167,199,231)]💡 Tip: Log files are stored in your system's temporary directory.[/rgb(167,199,231)]")
+    console.print(f"[dim]On macOS: Usually /var/folders/... or /tmp[/dim]")
+    console.print(f"[dim]On Linux: Usually /tmp[/dim]")
+    console.print(f"[dim]On Windows: Usually C:\\Users\\...\\AppData\\Local\\Temp[/dim]")
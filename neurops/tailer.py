@@ -0,0 +1,539 @@
+"""
+Dosya izleme (tail -f).
+Linux'ta inotify (ctypes ile libc) kullanılır: izlenen dosyaların dizinleri
+izlenir, yeni byte'lar yazıldığı anda teslim edilir ve boştayken süreç hiç
+uyanmaz. inotify yoksa (macOS, Windows) veya açılamazsa stat ile polling
+yapılır. Tek bir FileTailer tek thread'den birçok dosyayı ve glob'u izler.
+Dosyalar (device, inode) ile tanınır: sonradan oluşturulan dosyalar glob'a
+katılır, rename ile rotate edilen dosyanın kalanı yeni adıyla okunmaya devam
+eder, truncate (copytruncate) baştan okunur. Rotate edilen dosya, yazıcı ona
+yazmayı bırakana kadar (TAIL_ROTATE_GRACE) okunmaya devam eder. persist=True ise offset'ler
+saklanır ve yeniden başlatılan izleme kaldığı yerden devam eder.
+"""
+
+import os
+import sys
+import time
+import glob
+import codecs
+import select
+import struct
+import ctypes
+import ctypes.util
+import fnmatch
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from neurops.config import CONFIG_DIR, ConfigStore
+from neurops.logcheckpoints import CHECKPOINT_MAX_AGE, HEAD_FINGERPRINT_BYTES, fingerprint
+
+
+TAIL_POLL_INTERVAL = 0.5  # Polling modunda stat aralığı (saniye)
+TAIL_READ_BYTES = 4 * 1024 * 1024  # Dosya başına tek seferde teslim edilen en fazla veri
+TAIL_SAVE_INTERVAL = 2.0  # persist=True iken offset'lerin en sık kaydedilme aralığı (saniye)
+TAIL_ROTATE_GRACE = 1.0  # Rotate edilen dosya bu kadar süre büyümezse bırakılır (saniye)
+
+# Yapı: {"dev:inode": {path, offset, head, head_len, updated_at}} (bkz. logcheckpoints)
+TAIL_OFFSETS_FILE = CONFIG_DIR / "tail_offsets.json"
+tail_offsets = ConfigStore(TAIL_OFFSETS_FILE)
+
+# inotify(7)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+_WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+def _load_inotify():
+    """libc'nin inotify fonksiyonları; desteklenmiyorsa None"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+def _identity_key(dev: int, inode: int) -> str:
+    return f"{dev}:{inode}"
+
+
+class _TailState:
+    __slots__ = ("path", "handle", "identity", "offset", "decoder", "pending", "polled", "from_glob",
+                 "head", "head_len", "drain_quiet")
+
+    def __init__(self, path: str, offset: Optional[int], from_glob: bool = False):
+        self.path = path
+        self.handle = None
+        self.identity = None  # Açık dosyanın (dev, inode) çifti
+        self.offset = offset  # None: dosya henüz yok, göründüğünde baştan okunur
+        self.decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        self.pending = b""  # lines=True iken yarım kalan son satır
+        self.polled = False  # Dizini inotify ile izlenemedi
+        self.from_glob = from_glob  # Glob eşleşmesi; dosya silinince izlemeden çıkar
+        self.head = ""  # Okunan ilk head_len byte'ın parmak izi (copytruncate tespiti)
+        self.head_len = 0
+        self.drain_quiet = None  # Rotate edilmiş dosyanın son büyüdüğü an (monotonic)
+
+    def committed_offset(self) -> int:
+        """Teslim edilmiş son byte'ın sonu (yarım satır / yarım karakter hariç)"""
+        return (self.offset or 0) - len(self.pending) - len(self.decoder.getstate()[0])
+
+
+class FileTailer:
+    """
+    Dosyaları sonundan (from_start=True ise baştan) izler.
+    poll(timeout) yeni veri gelene kadar bekler ve [(path, metin)] döndürür;
+    lines=True ise yalnızca tamamlanmış satırlar teslim edilir.
+    add_glob ile eklenen desenlere sonradan uyan dosyalar baştan okunur.
+    """
+
+    def __init__(self, lines: bool = False, poll_interval: float = TAIL_POLL_INTERVAL, persist: bool = False):
+        self.lines = lines
+        self.poll_interval = poll_interval
+        self.persist = persist
+        self._states: Dict[str, _TailState] = {}
+        self._dirty: Set[str] = set()
+        self._dir_watches: Dict[str, int] = {}  # dizin -> watch descriptor
+        self._watch_dirs: Dict[int, str] = {}
+        self._globs: Dict[str, Optional[Callable[[str], bool]]] = {}  # desen -> accept
+        self._glob_dirs: Dict[str, List[str]] = {}  # inotify ile izlenen dizin -> dosya adı desenleri
+        self._rejected: Set[Tuple[str, Tuple[int, int]]] = set()  # accept'in reddettiği (yol, kimlik)
+        self._drained: Dict[Tuple[int, int], int] = {}  # Rotate ile bırakılan dosyalar -> okunan son offset
+        self._rescan = False
+        self._next_rescan = 0.0
+        self._saved: Dict[str, int] = {}  # Son kaydedilen offset'ler
+        self._next_save = 0.0
+        self._libc = _load_inotify()
+        self._fd = None
+        if self._libc is not None:
+            fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            self._fd = fd if fd >= 0 else None
+
+    @property
+    def backend(self) -> str:
+        return "inotify" if self._fd is not None else "polling"
+
+    @property
+    def paths(self) -> List[str]:
+        """İzlenen dosyalar"""
+        return sorted(self._states)
+
+    def add(self, path: str, from_start: bool = False):
+        path = os.path.abspath(path)
+        if path not in self._states:
+            self._add_state(path, from_start)
+
+    def add_glob(self, pattern: str, from_start: bool = False, accept: Optional[Callable[[str], bool]] = None):
+        """
+        Desene uyan dosyaları izler. Şu an uyanlar add gibi (sonundan) eklenir,
+        sonradan oluşan veya desene uyan ada taşınanlar baştan okunur.
+        accept verilirse yeni bulunan her dosya için bir kez çağrılır
+        (örn. sıkıştırılmış arşivleri dışarıda bırakmak için).
+        """
+        pattern = os.path.abspath(os.path.expanduser(pattern))
+        if pattern in self._globs:
+            return
+        self._globs[pattern] = accept
+        directory, name = os.path.split(pattern)
+        if not glob.has_magic(directory) and self._watch_directory(directory):
+            self._glob_dirs.setdefault(directory, []).append(name)
+        self._scan_globs(from_start)
+
+    def _add_state(self, path: str, from_start: bool, from_glob: bool = False, st: Optional[os.stat_result] = None):
+        try:
+            st = st or os.stat(path)
+        except OSError:
+            st = None
+        if st is None:
+            offset = None
+        else:
+            offset = self._resume_offset(path, st)
+            if offset is None:
+                offset = 0 if from_start else st.st_size
+        state = _TailState(path, offset, from_glob)
+        self._states[path] = state
+        if st is not None:
+            # Dosya hemen açılır: ilk poll'dan önce rotate edilse de kalanı okunur
+            self._open(state)
+        state.polled = not self._watch_directory(os.path.dirname(path))
+        self._dirty.add(path)
+
+    def _resume_offset(self, path: str, st: os.stat_result) -> Optional[int]:
+        """persist=True iken aynı dosya için saklanan offset; dosya değiştiyse 0, kayıt yoksa None"""
+        if not self.persist:
+            return None
+        entry = tail_offsets.get(_identity_key(st.st_dev, st.st_ino))
+        if not isinstance(entry, dict):
+            return None
+        offset = entry.get("offset", 0)
+        if st.st_size < offset:
+            return 0  # Kapalıyken truncate edildi
+        try:
+            with open(path, "rb") as f:
+                if fingerprint(f, entry.get("head_len", 0)) != entry.get("head"):
+                    return 0  # Aynı inode'a başka içerik
+        except OSError:
+            return None
+        return offset
+
+    def _watch_directory(self, directory: str) -> bool:
+        # Dosyanın kendisi değil dizini izlenir: sonradan oluşturulan ve rotate
+        # ile yerine yenisi konan dosyalar da aynı watch ile görülür
+        if self._fd is None:
+            return False
+        if directory in self._dir_watches:
+            return True
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            return False
+        self._dir_watches[directory] = wd
+        self._watch_dirs[wd] = directory
+        return True
+
+    def _scan_globs(self, from_start: bool = True):
+        """Desenlere yeni uyan dosyaları ekler, silinmiş glob dosyalarını çıkarır"""
+        matches = {}
+        for pattern, accept in self._globs.items():
+            for path in glob.glob(pattern):
+                matches.setdefault(path, accept)
+        
+        for path, accept in sorted(matches.items()):
+            if path in self._states:
+                continue
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if not os.path.isfile(path):
+                continue
+            identity = (st.st_dev, st.st_ino)
+            if (path, identity) in self._rejected:
+                continue
+            if accept is not None:
+                try:
+                    accepted = accept(path)
+                except OSError:
+                    accepted = False
+                if not accepted:
+                    self._rejected.add((path, identity))
+                    continue
+            owner = self._owner_of(identity)
+            if owner is not None and owner.from_glob:
+                # Glob içinde rename (app.log -> app.log.1): dosya yeni adıyla kaldığı
+                # yerden okunur, eski ada açılan yeni dosya ayrıca baştan okunur
+                old_path = owner.path
+                del self._states[old_path]
+                owner.path = path
+                owner.drain_quiet = None
+                self._states[path] = owner
+                self._dirty.add(path)
+                if old_path in matches and os.path.isfile(old_path):
+                    self._add_state(old_path, True, from_glob=True)
+            elif owner is not None:
+                # add ile izlenen dosya: kalanını eski durum okur, tekrar teslim edilmez
+                self._add_state(path, False, from_glob=True, st=st)
+            elif identity in self._drained:
+                # Rotate önceden işlendi: okunan son offset'ten devam
+                self._add_state(path, False, from_glob=True, st=st)
+                self._states[path].offset = self._drained.pop(identity)
+            else:
+                self._add_state(path, from_start, from_glob=True, st=st)
+        
+        for path, state in list(self._states.items()):
+            if state.from_glob and path not in matches and state.handle is None:
+                del self._states[path]
+        if len(self._drained) > 1024:
+            self._drained.clear()
+
+    def _owner_of(self, identity: Tuple[int, int]) -> Optional[_TailState]:
+        """Bu dosyayı açık tutan ama yolunda artık başka dosya (veya hiçbir şey) olan durum"""
+        for state in self._states.values():
+            if state.handle is None or state.identity != identity:
+                continue
+            try:
+                st = os.stat(state.path)
+            except OSError:
+                return state
+            if (st.st_dev, st.st_ino) != identity:
+                return state
+        return None
+
+    def remove(self, path: str):
+        state = self._states.pop(os.path.abspath(path), None)
+        if state is not None and state.handle is not None:
+            state.handle.close()
+
+    def close(self):
+        if self.persist:
+            self.save_offsets(force=True)
+        for state in self._states.values():
+            if state.handle is not None:
+                state.handle.close()
+        self._states.clear()
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "FileTailer":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def save_offsets(self, force: bool = False):
+        """Açık dosyaların teslim edilmiş offset'lerini kaydeder (en fazla TAIL_SAVE_INTERVAL'de bir)"""
+        now = time.time()
+        if not force and now < self._next_save:
+            return
+        self._next_save = now + TAIL_SAVE_INTERVAL
+        entries = {}
+        for state in self._states.values():
+            if state.handle is None:
+                continue
+            key = _identity_key(*state.identity)
+            offset = state.committed_offset()
+            if self._saved.get(key) == offset:
+                continue
+            head_len = min(offset, HEAD_FINGERPRINT_BYTES)
+            try:
+                head = fingerprint(state.handle, head_len)
+            except (OSError, ValueError):
+                continue
+            entries[key] = {"path": state.path, "offset": offset, "head": head, "head_len": head_len, "updated_at": now}
+        if not entries:
+            return
+
+        def update(data):
+            data = {
+                key: entry for key, entry in data.items()
+                if isinstance(entry, dict) and now - entry.get("updated_at", 0) < CHECKPOINT_MAX_AGE
+            }
+            data.update(entries)
+            return data
+        
+        try:
+            tail_offsets.rewrite(update)
+        except OSError:
+            return
+        self._saved.update((key, entry["offset"]) for key, entry in entries.items())
+
+    def _read_events(self):
+        """Bekleyen inotify olaylarını okuyup ilgili dosyaları işaretler"""
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        position = 0
+        while position + _EVENT_HEADER.size <= len(data):
+            wd, mask, _, name_len = _EVENT_HEADER.unpack_from(data, position)
+            name = data[position + _EVENT_HEADER.size:position + _EVENT_HEADER.size + name_len].rstrip(b"\0")
+            position += _EVENT_HEADER.size + name_len
+            if mask & IN_Q_OVERFLOW:
+                # Olay kuyruğu taştı: hangi dosyanın değiştiği bilinmiyor, hepsine bakılır
+                self._dirty.update(self._states)
+                self._rescan = True
+                continue
+            directory = self._watch_dirs.get(wd)
+            if directory is None or not name:
+                continue
+            name = os.fsdecode(name)
+            path = os.path.join(directory, name)
+            if path in self._states:
+                self._dirty.add(path)
+            if any(fnmatch.fnmatch(name, pattern) for pattern in self._glob_dirs.get(directory, ())):
+                self._rescan = True
+
+    def _open(self, state: _TailState) -> bool:
+        try:
+            state.handle = open(state.path, "rb")
+        except OSError:
+            return False
+        st = os.fstat(state.handle.fileno())
+        state.identity = (st.st_dev, st.st_ino)
+        if state.offset is None:
+            state.offset = 0
+        state.head_len = 0
+        self._update_head(state)
+        return True
+
+    def _update_head(self, state: _TailState):
+        """Parmak izini HEAD_FINGERPRINT_BYTES dolana kadar okunan kısımla genişletir"""
+        head_len = min(state.offset, HEAD_FINGERPRINT_BYTES)
+        if head_len > state.head_len:
+            state.head = fingerprint(state.handle, head_len)
+            state.head_len = head_len
+
+    def _truncated(self, state: _TailState, st: os.stat_result) -> bool:
+        """
+        Dosya okunan yerin gerisine kısaldı veya baştaki içerik değişti
+        (copytruncate sonrası iki poll arasında offset'i geçecek kadar yeniden doldu)
+        """
+        if st.st_size < state.offset:
+            return True
+        return bool(state.head_len) and fingerprint(state.handle, state.head_len) != state.head
+
+    def _drain_rotated(self, state: _TailState, st: Optional[os.stat_result]) -> Tuple[str, bool]:
+        """
+        Rotate/silme sonrası eski dosyadan yeni veriyi okur; (metin, bırakıldı mı).
+        Yazıcı rename'den sonra eski dosyaya bir süre daha yazabilir: dosya
+        TAIL_ROTATE_GRACE boyunca büyümeyene ve yolda yeni dosya oluşana
+        (veya dosya silinene) kadar handle açık kalır ve her poll'da okunur.
+        """
+        now = time.monotonic()
+        state.handle.seek(state.offset)
+        data = state.handle.read(TAIL_READ_BYTES)
+        state.offset += len(data)
+        if data or state.drain_quiet is None:
+            state.drain_quiet = now
+        if len(data) == TAIL_READ_BYTES:
+            self._dirty.add(state.path)  # Kalanı bir sonraki poll'da
+            return self._decode(state, data), False
+        if now - state.drain_quiet < TAIL_ROTATE_GRACE or (st is None and os.fstat(state.handle.fileno()).st_nlink):
+            return self._decode(state, data), False
+        text = self._decode(state, data, final=True)
+        self._drained[state.identity] = state.offset
+        state.handle.close()
+        state.handle = None
+        state.offset = 0
+        state.head_len = 0
+        state.drain_quiet = None
+        return text, True
+
+    def _read_new(self, state: _TailState) -> str:
+        text = ""
+        try:
+            st = os.stat(state.path)
+        except OSError:
+            st = None
+        if state.handle is not None and (st is None or (st.st_dev, st.st_ino) != state.identity):
+            # Rotate/silme: eski dosya bırakılmadan yeni dosyaya geçilmez
+            text, released = self._drain_rotated(state, st)
+            if not released:
+                return text
+            if st is None and state.from_glob:
+                self._rescan = True  # Silinen glob dosyası bir sonraki taramada çıkarılır
+        if st is not None:
+            if state.handle is None and not self._open(state):
+                return text
+            if self._truncated(state, st):
+                # truncate (copytruncate): yarım satır da geçersizdir
+                state.offset = 0
+                state.head_len = 0
+                state.pending = b""
+                state.decoder.reset()
+            if st.st_size > state.offset:
+                state.handle.seek(state.offset)
+                chunk = state.handle.read(min(st.st_size - state.offset, TAIL_READ_BYTES))
+                state.offset += len(chunk)
+                self._update_head(state)
+                text += self._decode(state, chunk)
+                if state.offset < st.st_size:
+                    self._dirty.add(state.path)  # Kalanı bir sonraki poll'da
+        return text
+
+    def _decode(self, state: _TailState, data: bytes, final: bool = False) -> str:
+        if not self.lines:
+            return state.decoder.decode(data, final)
+        # Satırlar byte düzeyinde bölünür: yarım satırın byte boyu offset kaydı için bilinir
+        data = state.pending + data
+        cut = data.rfind(b"\n") + 1
+        if final or (not cut and len(data) > TAIL_READ_BYTES):
+            cut = len(data)  # Rotate edilen dosyanın son satırı veya satır sonu olmayan dev satır
+        state.pending = data[cut:]
+        text = data[:cut].decode("utf-8", errors="ignore")
+        if cut and not text.endswith("\n"):
+            text += "\n"
+        return text
+
+    def poll(self, timeout: Optional[float] = None) -> List[Tuple[str, str]]:
+        """Yeni veri gelene veya timeout dolana kadar bekler; [(path, metin)]"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            # Glob taraması okumadan önce: rename edilen dosya yeni adında eski handle'la devam eder
+            rescan_polled = self._globs and (self._fd is None or len(self._glob_dirs) < len(self._globs))
+            if self._rescan or (rescan_polled and time.monotonic() >= self._next_rescan):
+                self._rescan = False
+                self._next_rescan = time.monotonic() + self.poll_interval
+                self._scan_globs()
+            
+            dirty, self._dirty = self._dirty, set()
+            results = []
+            for path in dirty:
+                state = self._states.get(path)
+                text = self._read_new(state) if state is not None else ""
+                if text:
+                    results.append((path, text))
+            if self.persist:
+                self.save_offsets()
+            if results:
+                return results
+            
+            wait = None if deadline is None else deadline - time.monotonic()
+            if wait is not None and wait <= 0:
+                return []
+            # Rotate edilmiş dosya eski adıyla izlenmediğinden inotify olayı gelmez, periyodik okunur
+            polled = [path for path, state in self._states.items()
+                      if state.polled or self._fd is None or state.drain_quiet is not None]
+            if polled or rescan_polled:
+                wait = self.poll_interval if wait is None else min(wait, self.poll_interval)
+            if self.persist and any(self._saved.get(_identity_key(*state.identity)) != state.committed_offset()
+                                    for state in self._states.values() if state.handle is not None):
+                # Kaydedilmemiş offset varsa boşta da kaydedilmesi için uyanılır
+                wait = TAIL_SAVE_INTERVAL if wait is None else min(wait, TAIL_SAVE_INTERVAL)
+            if self._fd is not None:
+                ready, _, _ = select.select([self._fd], [], [], wait)
+                if ready:
+                    self._read_events()
+            else:
+                time.sleep(wait)
+            self._dirty.update(polled)
+
+    def _follow(self) -> Iterator[Tuple[str, str]]:
+        while True:
+            for path, text in self.poll():
+                if self.lines:
+                    for line in text.splitlines():
+                        yield path, line
+                else:
+                    yield path, text
+
+    def follow(self, path: str, from_start: bool = False) -> Iterator[str]:
+        """Tek dosyayı izleyip metin parçalarını (lines=True ise satırları) üretir"""
+        self.add(path, from_start)
+        for _, text in self._follow():
+            yield text
+
+    def follow_glob(self, pattern: str, from_start: bool = False,
+                    accept: Optional[Callable[[str], bool]] = None) -> Iterator[Tuple[str, str]]:
+        """Desene uyan dosyaları izleyip (path, metin parçası / satır) üretir"""
+        self.add_glob(pattern, from_start, accept)
+        yield from self._follow()
+
+
+def clear_tail_offsets(path: Optional[str] = None) -> int:
+    """Saklanan izleme offset'lerini siler (path verilirse yalnızca o yolunkileri); silinen sayısı döner"""
+    removed = []
+    path = os.path.abspath(path) if path else None
+
+    def remove(data):
+        keep = {
+            key: entry for key, entry in data.items()
+            if path is not None and not (isinstance(entry, dict) and entry.get("path") == path)
+        }
+        removed.extend(key for key in data if key not in keep)
+        return keep
+    
+    tail_offsets.rewrite(remove)
+    return len(removed)
@@ -0,0 +1,287 @@
+"""Team yönetimi komutları"""
+
+
+from rich.table import Table
+from rich.prompt import Prompt
+from rich.panel import Panel
+from rich.status import Status
+from rich import box
+
+from neurops.config import get_api_headers, get_username
+from neurops.api import api_delete, api_get, api_get_cached, api_post, api_put
+from neurops.ui import console
+
+
+# Team Management Functions
+def create_team():
+    """Takım oluştur"""
+    console.print()
+    name = Prompt.ask("[rgb(167,199,231)]Enter team name[/rgb(167,199,231)]")
+    description = Prompt.ask("[rgb(167,199,231)]Enter team description (optional)[/rgb(167,199,231)]", default="")
+    
+    try:
+        with Status("[rgb(167,199,231)]Creating team...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+            res = api_post(
+                "/team/create",
+                json={"name": name, "description": description if description else None},
+                headers=get_api_headers()
+            )
+        
+        if res.status_code == 200:
+            result = res.json()
+            console.print()
+            success_panel = Panel(
+                f"[rgb(167,199,231)]Team created successfully![/rgb(167,199,231)]\n\n"
+                f"Team ID: [white]{result.get('team_id')}[/white]\n"
+                f"Invitation ID: [white]{result.get('invitation_id')}[/white]\n"
+                f"Invitation Password: [white]{result.get('invitation_password')}[/white]\n\n"
+                f"[bold rgb(167,199,231)]⚠️ IMPORTANT: Save the invitation ID and password![/bold rgb(167,199,231)]\n"
+                f"[dim]Share these with team members to join.[/dim]",
+                border_style="white",
+                box=box.SIMPLE
+            )
+            console.print(success_panel)
+        else:
+            error_detail = res.json().get('detail', 'Unknown error')
+            console.print(f"[rgb(167,199,231)]Error: {error_detail}[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)]Error: {e}[/rgb(167,199,231)]")
+
+
+def join_team():
+    """Takıma katıl"""
+    console.print()
+    invitation_id = Prompt.ask("[rgb(167,199,231)]Enter invitation ID[/rgb(167,199,231)]")
+    password = Prompt.ask("[rgb(167,199,231)]Enter invitation password[/rgb(167,199,231)]", password=True)
+    username = Prompt.ask("[rgb(167,199,231)]Enter your username[/rgb(167,199,231)]", default=get_username())
+    
+    try:
+        with Status("[rgb(167,199,231)]Joining team...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+            res = api_post(
+                "/team/join",
+                json={
+                    "team_id": invitation_id,
+                    "password": password,
+                    "username": username
+                },
+                headers=get_api_headers()
+            )
+        
+        if res.status_code == 200:
+            result = res.json()
+            console.print()
+            success_panel = Panel(
+                f"[rgb(167,199,231)]Successfully joined team![/rgb(167,199,231)]\n\n"
+                f"Team: [white]{result.get('team_name')}[/white]\n"
+                f"Team ID: [white]{result.get('team_id')}[/white]",
+                border_style="white",
+                box=box.SIMPLE
+            )
+            console.print(success_panel)
+        else:
+            error_detail = res.json().get('detail', 'Unknown error')
+            console.print(f"[rgb(167,199,231)]Error: {error_detail}[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)]Error: {e}[/rgb(167,199,231)]")
+
+
+def list_my_teams():
+    """Kullanıcının takımlarını listele"""
+    console.print()
+    try:
+        with Status("[rgb(167,199,231)]Fetching teams...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+            res = api_get_cached("/team/", headers=get_api_headers())
+        
+        if res.status_code == 200:
+            teams = res.json()
+            console.print()
+            
+            if not teams:
+                console.print("[rgb(167,199,231)]No teams found. Create a team or join one![/rgb(167,199,231)]")
+                return
+            
+            table = Table(
+                title="[rgb(167,199,231)]My Teams[/rgb(167,199,231)]",
+                box=box.SIMPLE,
+                border_style="white",
+                show_header=True,
+                header_style="rgb(167,199,231)"
+            )
+            table.add_column("Team Name", style="white", width=30)
+            table.add_column("Role", style="rgb(167,199,231)", width=15)
+            table.add_column("Members", style="white", width=10)
+            table.add_column("Created", style="dim", width=20)
+            
+            for team in teams:
+                role_colors = {
+                    "owner": "bold white",
+                    "admin": "white",
+                    "member": "dim white",
+                    "viewer": "dim"
+                }
+                role_style = role_colors.get(team.get('role', '').lower(), "white")
+                table.add_row(
+                    team.get('name', 'N/A'),
+                    f"[{role_style}]{team.get('role', 'N/A').upper()}[/{role_style}]",
+                    str(team.get('member_count', 0)),
+                    team.get('created_at', 'N/A')[:10] if team.get('created_at') else 'N/A'
+                )
+            
+            console.print(table)
+        else:
+            error_detail = res.json().get('detail', 'Unknown error')
+            console.print(f"[rgb(167,199,231)]Error: {error_detail}[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)]Error: {e}[/rgb(167,199,231)]")
+
+
+def view_team_details():
+    """Takım detaylarını göster"""
+    console.print()
+    team_id = Prompt.ask("[rgb(167,199,231)]Enter team ID[/rgb(167,199,231)]")
+    
+    try:
+        with Status("[rgb(167,199,231)]Fetching team details...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+            res = api_get(f"/team/{team_id}", headers=get_api_headers())
+        
+        if res.status_code == 200:
+            team = res.json()
+            console.print()
+            
+            info_text = f"[rgb(167,199,231)]Name:[/rgb(167,199,231)] {team.get('name')}\n"
+            info_text += f"[rgb(167,199,231)]Description:[/rgb(167,199,231)] {team.get('description', 'N/A')}\n"
+            info_text += f"[rgb(167,199,231)]Created:[/rgb(167,199,231)] {team.get('created_at')}\n"
+            info_text += f"[rgb(167,199,231)]Members:[/rgb(167,199,231)] {len(team.get('members', []))}\n\n"
+            
+            # Members list
+            if team.get('members'):
+                info_text += "[rgb(167,199,231)]Members:[/rgb(167,199,231)]\n"
+                for member in team.get('members', []):
+                    info_text += f"  - [white]{member.get('username')}[/white] ([rgb(167,199,231)]{member.get('role')}[/rgb(167,199,231)])\n"
+            
+            info_panel = Panel(
+                info_text,
+                border_style="white",
+                box=box.SIMPLE
+            )
+            console.print(info_panel)
+        else:
+            error_detail = res.json().get('detail', 'Unknown error')
+            console.print(f"[rgb(167,199,231)]Error: {error_detail}[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)]Error: {e}[/rgb(167,199,231)]")
+
+
+def manage_team_members():
+    """Takım üyelerini yönet"""
+    console.print()
+    team_id = Prompt.ask("[rgb(167,199,231)]Enter team ID[/rgb(167,199,231)]")
+    
+    # Önce takım üyelerini listele
+    try:
+        res = api_get(f"/team/{team_id}/members", headers=get_api_headers())
+        if res.status_code != 200:
+            error_detail = res.json().get('detail', 'Unknown error')
+            console.print(f"[rgb(167,199,231)]Error: {error_detail}[/rgb(167,199,231)]")
+            return
+        
+        members = res.json()
+        console.print()
+        console.print("[rgb(167,199,231)]Current Team Members:[/rgb(167,199,231)]")
+        table = Table(box=box.SIMPLE, border_style="white", show_header=True, header_style="rgb(167,199,231)")
+        table.add_column("Username", style="white")
+        table.add_column("Role", style="rgb(167,199,231)")
+        table.add_column("Joined", style="dim")
+        
+        for member in members:
+            table.add_row(
+                member.get('username', 'N/A'),
+                member.get('role', 'N/A'),
+                member.get('joined_at', 'N/A')[:10] if member.get('joined_at') else 'N/A'
+            )
+        console.print(table)
+        console.print()
+        
+        action = Prompt.ask(
+            "[rgb(167,199,231)]Choose action[/rgb(167,199,231)]",
+            choices=["add", "remove", "update", "back"],
+            default="back"
+        )
+        
+        if action == "add":
+            user_id = Prompt.ask("[rgb(167,199,231)]Enter user ID to add[/rgb(167,199,231)]")
+            username = Prompt.ask("[rgb(167,199,231)]Enter username[/rgb(167,199,231)]")
+            role = Prompt.ask(
+                "[rgb(167,199,231)]Role[/rgb(167,199,231)]",
+                choices=["member", "admin", "viewer"],
+                default="member"
+            )
+            
+            res = api_post(
+                f"/team/{team_id}/members",
+                params={"username": username, "user_id": user_id, "role": role},
+                headers=get_api_headers()
+            )
+            if res.status_code == 200:
+                console.print("[rgb(167,199,231)]Member added successfully![/rgb(167,199,231)]")
+            else:
+                error_detail = res.json().get('detail', 'Unknown error')
+                console.print(f"[rgb(167,199,231)]Error: {error_detail}[/rgb(167,199,231)]")
+        
+        elif action == "remove":
+            user_id = Prompt.ask("[rgb(167,199,231)]Enter user ID to remove[/rgb(167,199,231)]")
+            res = api_delete(f"/team/{team_id}/members/{user_id}", headers=get_api_headers())
+            if res.status_code == 200:
+                console.print("[rgb(167,199,231)]Member removed successfully![/rgb(167,199,231)]")
+            else:
+                error_detail = res.json().get('detail', 'Unknown error')
+                console.print(f"[rgb(167,199,231)]Error: {error_detail}[/rgb(167,199,231)]")
+        
+        elif action == "update":
+            user_id = Prompt.ask("[rgb(167,199,231)]Enter user ID to update[/rgb(167,199,231)]")
+            role = Prompt.ask(
+                "[rgb(167,199,231)]New role[/rgb(167,199,231)]",
+                choices=["member", "admin", "viewer"],
+                default="member"
+            )
+            res = api_put(
+                f"/team/{team_id}/members/{user_id}",
+                json={"role": role},
+                headers=get_api_headers()
+            )
+            if res.status_code == 200:
+                console.print("[rgb(167,199,231)]Member updated successfully![/rgb(167,199,231)]")
+            else:
+                error_detail = res.json().get('detail', 'Unknown error')
+                console.print(f"[rgb(167,199,231)]Error: {error_detail}[/rgb(167,199,231)]")
+    
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)]Error: {e}[/rgb(167,199,231)]")
+
+
+def view_team_invitation():
+    """Takım davet bilgilerini göster"""
+    console.print()
+    team_id = Prompt.ask("[rgb(167,199,231)]Enter team ID[/rgb(167,199,231)]")
+    
+    try:
+        with Status("[rgb(167,199,231)]Fetching invitation details...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+            res = api_get(f"/team/{team_id}/invitation", headers=get_api_headers())
+        
+        if res.status_code == 200:
+            result = res.json()
+            console.print()
+            info_panel = Panel(
+                f"[rgb(167,199,231)]Team Invitation Details[/rgb(167,199,231)]\n\n"
+                f"Team: [white]{result.get('team_name')}[/white]\n"
+                f"Invitation ID: [white]{result.get('invitation_id')}[/white]\n\n"
+                f"[dim]Share the invitation ID and password with team members.[/dim]",
+                border_style="white",
+                box=box.SIMPLE
+            )
+            console.print(info_panel)
+        else:
+            error_detail = res.json().get('detail', 'Unknown error')
+            console.print(f"[rgb(167,199,231)]Error: {error_detail}[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)]Error: {e}[/rgb(167,199,231)]")
@@ -0,0 +1,245 @@
+"""Rich console, tema ve ortak input yardımcıları"""
+
+# Windows encoding fix - UTF-8'i zorla
+import sys
+import os
+import io
+import time
+from typing import Optional, List
+
+# Windows'ta UTF-8 encoding'i zorla
+if sys.platform == 'win32':
+    # Windows terminal encoding sorunlarını çöz
+    try:
+        # Python 3.7+ için reconfigure kullan
+        if hasattr(sys.stdout, 'reconfigure'):
+            sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+        else:
+            if sys.stdout.encoding != 'utf-8':
+                sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace', line_buffering=True)
+    except (AttributeError, ValueError):
+        # Fallback: eski yöntem
+        if sys.stdout.encoding != 'utf-8':
+            sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace', line_buffering=True)
+    
+    try:
+        if hasattr(sys.stderr, 'reconfigure'):
+            sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+        else:
+            if sys.stderr.encoding != 'utf-8':
+                sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace', line_buffering=True)
+    except (AttributeError, ValueError):
+        if sys.stderr.encoding != 'utf-8':
+            sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace', line_buffering=True)
+    
+    try:
+        # stdin'i de UTF-8'e ayarla (Python 3.7+)
+        if hasattr(sys.stdin, 'reconfigure'):
+            sys.stdin.reconfigure(encoding='utf-8', errors='replace')
+    except (AttributeError, ValueError):
+        # stdin için reconfigure yoksa, encoding'i environment variable ile ayarla
+        pass
+    
+    # Environment variable ile de UTF-8'i zorla
+    os.environ['PYTHONIOENCODING'] = 'utf-8'
+
+from rich.console import Console
+from rich.prompt import Prompt
+from rich.style import Style
+from rich.theme import Theme
+
+# Basit renk şeması: Beyaz ve Kırmızımsı Turuncu (Claude style)
+PRIMARY_COLOR = "white"
+ACCENT_COLOR = "rgb(167,199,231)"  # Kırmızımsı turuncu (Claude style)
+DIM_COLOR = "dim white"
+
+# Rich Theme - Prompt renklerini özelleştir (tüm mor/cyan renkleri kırmızımsı turuncu yap)
+# Rich'in tüm default renklerini override et
+custom_theme = Theme({
+    "prompt": Style(color="rgb(167,199,231)"),
+    "prompt.choices": Style(color="rgb(167,199,231)"),
+    "prompt.default": Style(color="rgb(167,199,231)"),
+    "prompt.invalid": Style(color="rgb(167,199,231)"),
+    "prompt.invalid.choice": Style(color="rgb(167,199,231)"),
+    # Rich'in tüm default renklerini override et
+    "repr.number": Style(color="rgb(167,199,231)"),
+    "repr.str": Style(color="rgb(167,199,231)"),
+    "markup.code": Style(color="rgb(167,199,231)"),
+    "markup.code.attr": Style(color="rgb(167,199,231)"),
+    "markup.code.keyword": Style(color="rgb(167,199,231)"),
+    # Magenta ve cyan renklerini override et
+    "magenta": Style(color="rgb(167,199,231)"),
+    "cyan": Style(color="rgb(167,199,231)"),
+    "bright_magenta": Style(color="rgb(167,199,231)"),
+    "bright_cyan": Style(color="rgb(167,199,231)"),
+    "blue": Style(color="rgb(167,199,231)"),
+    "bright_blue": Style(color="rgb(167,199,231)")
+})
+
+# Console'u UTF-8 encoding ile başlat (Windows uyumluluğu için)
+if sys.platform == 'win32':
+    # Windows'ta renk desteğini zorla
+    # Windows Terminal ve PowerShell'de renkler çalışır
+    try:
+        # Windows Terminal renk desteğini aktif et
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        # Enable virtual terminal processing (Windows 10+)
+        kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7)
+    except:
+        pass  # Eski Windows versiyonlarında çalışmayabilir
+    
+    # Rich Console'u renk desteği ile başlat
+    console = Console(
+        force_terminal=True,
+        width=None,
+        color_system="auto",  # Otomatik renk algılama
+        legacy_windows=False,  # Modern Windows Terminal kullan
+        no_color=False,  # Renkleri devre dışı bırakma
+        highlight=False,  # Syntax highlighting'i kapat (mor/mavi renkleri kaldırır)
+        theme=custom_theme  # Özel tema - Prompt renklerini değiştir
+    )
+else:
+    console = Console(
+        color_system="auto", 
+        highlight=False, 
+        theme=custom_theme
+    )
+
+# Rich'in Prompt.ask fonksiyonunu monkey-patch et - choices renklerini override et
+_original_prompt_ask = Prompt.ask
+
+def _patched_prompt_ask(
+    prompt: str,
+    *,
+    console: Optional[Console] = None,
+    password: bool = False,
+    choices: Optional[List[str]] = None,
+    default: Optional[str] = None,
+    show_default: bool = True,
+    show_choices: bool = True,
+    **kwargs
+) -> str:
+    """Patched Prompt.ask - choices renklerini rgb(167,199,231) yap"""
+    # Console'u kullan veya global console'u kullan
+    if console is None:
+        console = globals().get('console')
+    
+    # Orijinal fonksiyonu çağır ama console'u geç
+    return _original_prompt_ask(
+        prompt,
+        console=console,
+        password=password,
+        choices=choices,
+        default=default,
+        show_default=show_default,
+        show_choices=show_choices,
+        **kwargs
+    )
+
+# Monkey-patch'i uygula
+Prompt.ask = staticmethod(_patched_prompt_ask)
+
+
+def get_multiline_input(prompt_text: str, end_marker: str = "END") -> str:
+    """
+    Multi-line input almak için özel fonksiyon.
+    Kullanıcı yapıştırdığında tüm içeriği alır.
+    END yazıp Enter'a basarak bitirir.
+    """
+    console.print(f"[bold rgb(167,199,231)]{prompt_text}[/bold rgb(167,199,231)]")
+    console.print(f"[dim rgb(167,199,231)]Paste your content. Type '{end_marker}' on a new line and press Enter to finish:[/dim rgb(167,199,231)]")
+    console.print()
+    
+    lines = []
+    try:
+        while True:
+            try:
+                line = input()
+                if line.strip() == end_marker:
+                    break
+                lines.append(line)
+            except EOFError:
+                # Ctrl+D veya Ctrl+Z ile bitir
+                break
+            except KeyboardInterrupt:
+                # Ctrl+C ile iptal
+                console.print("\n[rgb(167,199,231)]Input cancelled.[/rgb(167,199,231)]")
+                return ""
+    except Exception:
+        # Fallback: tek satır input
+        return Prompt.ask(prompt_text)
+    
+    result = "\n".join(lines)
+    return result.strip()
+
+
+def get_multiline_input_simple(prompt_text: str) -> str:
+    """
+    Daha basit multi-line input - sadece Enter'a basınca bitirir (boş satır)
+    veya Ctrl+D/Ctrl+Z ile bitirir.
+    """
+    console.print(f"[bold rgb(167,199,231)]{prompt_text}[/bold rgb(167,199,231)]")
+    console.print("[dim rgb(167,199,231)]Paste your content. Press Enter twice or Ctrl+D/Ctrl+Z to finish:[/dim rgb(167,199,231)]")
+    
+    lines = []
+    empty_line_count = 0
+    
+    try:
+        while True:
+            try:
+                line = input()
+                if not line.strip():
+                    empty_line_count += 1
+                    if empty_line_count >= 2:
+                        break
+                else:
+                    empty_line_count = 0
+                    lines.append(line)
+            except EOFError:
+                # Ctrl+D veya Ctrl+Z ile bitir
+                break
+            except KeyboardInterrupt:
+                # Ctrl+C ile iptal
+                console.print("\n[rgb(167,199,231)]Input cancelled.[/rgb(167,199,231)]")
+                return ""
+    except Exception:
+        # Fallback: tek satır input
+        return Prompt.ask(prompt_text)
+    
+    result = "\n".join(lines)
+    return result.strip()
+
+
+def welcome_screen():
+    """Basit ve temiz welcome ekranı"""
+    console.clear()
+    console.print("[rgb(167,199,231)]NeurOps[/rgb(167,199,231)] [dim rgb(167,199,231)]v2.0.0[/dim rgb(167,199,231)]")
+    console.print("[rgb(167,199,231)]Welcome to NeurOps CLI[/rgb(167,199,231)]")
+    console.print()
+    console.print("[dim rgb(167,199,231)]Let's get started.[/dim rgb(167,199,231)]")
+    console.print()
+
+
+def prompt_with_animation(prompt_text: str, **kwargs) -> str:
+    """Prompt'un yanında animasyon gösterir"""
+    from rich.text import Text
+    
+    # Animasyonlu karakterler (rgb(167,199,231) renginde)
+    spinner_chars = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+    
+    # Prompt'tan önce kısa bir animasyon göster
+    for i in range(4):
+        char = spinner_chars[i % len(spinner_chars)]
+        animation = Text(char, style="rgb(167,199,231)")
+        console.print(animation, end="\r")
+        time.sleep(0.08)
+    
+    # Animasyonu temizle
+    console.print(" " * 2, end="\r")
+    
+    # Prompt metninin yanına animasyonlu karakter ekle (ilk karakter)
+    animated_prompt = f"[rgb(167,199,231)]{spinner_chars[0]}[/rgb(167,199,231)] {prompt_text}"
+    
+    # Normal prompt'u göster
+    return Prompt.ask(animated_prompt, **kwargs)
\ No newline at end of file
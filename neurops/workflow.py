@@ -0,0 +1,802 @@
+"""Workflow yönetimi ve lokal workflow çalıştırma"""
+
+import time
+import subprocess
+import platform
+import shlex
+
+import requests
+from rich.table import Table
+from rich.prompt import Confirm, Prompt
+from rich.panel import Panel
+from rich.status import Status
+from rich.align import Align
+from rich import box
+
+from neurops.config import USER_WORKFLOWS_DIR, get_api_headers
+from neurops.api import api_get, api_get_cached, api_post
+from neurops.ui import console, get_multiline_input_simple
+from neurops.auth import check_token, set_token
+from neurops.bootstrap import ensure_user_workflows_dir
+
+
+def list_workflows():
+    """Workflow'ları listele"""
+    try:
+        with Status("[rgb(167,199,231)]Fetching workflows...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+            res = api_get_cached("/workflow/")
+        
+        if res.status_code == 200:
+            workflows = res.json()
+            console.print()
+            
+            if not workflows:
+                console.print("[rgb(167,199,231)]No workflows found.[/rgb(167,199,231)]")
+                return
+            
+            table = Table(
+                title="[bold white]Available Workflows[/bold white]",
+                box=box.SIMPLE,
+                border_style="white",
+                show_header=True,
+                header_style="rgb(167,199,231)"
+            )
+            table.add_column("Name", style="rgb(167,199,231)", width=25)
+            table.add_column("Description", style="rgb(167,199,231)", width=30)
+            table.add_column("Steps", style="rgb(167,199,231)", width=10)
+            table.add_column("Source", style="dim rgb(167,199,231)", width=15)
+            
+            for wf in workflows:
+                name = wf.get("name", "N/A")
+                desc = wf.get("description", "No description") or "No description"
+                steps = wf.get("steps_count", 0)
+                source = "File" if wf.get("file") else "Registered"
+                table.add_row(name, desc[:40] + "..." if len(desc) > 40 else desc, str(steps), source)
+            
+            console.print(table)
+        else:
+            console.print(f"[rgb(167,199,231)] Error: {res.status_code}[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)] Error: {e}[/rgb(167,199,231)]")
+
+
+def view_workflow():
+    """Workflow detaylarını görüntüle"""
+    console.print()
+    wf_name = Prompt.ask("[rgb(167,199,231)]Enter workflow name[/rgb(167,199,231)]")
+    
+    try:
+        with Status("[rgb(167,199,231)]Fetching workflow details...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+            res = api_get_cached(f"/workflow/{wf_name}")
+        
+        if res.status_code == 200:
+            workflow = res.json()
+            console.print()
+            
+            # Workflow bilgileri
+            triggers = workflow.get('triggers') or []
+            triggers_str = ', '.join(triggers) if triggers else 'None'
+            info_panel = Panel(
+                f"[bold rgb(167,199,231)]Workflow: {workflow.get('name')}[/bold rgb(167,199,231)]\n"
+                f"[rgb(167,199,231)]Name:[/rgb(167,199,231)] {workflow.get('name')}\n"
+                f"[rgb(167,199,231)]Description:[/rgb(167,199,231)] {workflow.get('description', 'No description') or 'No description'}\n"
+                f"[rgb(167,199,231)]Steps:[/rgb(167,199,231)] {len(workflow.get('steps', []))}\n"
+                f"[rgb(167,199,231)]Triggers:[/rgb(167,199,231)] {triggers_str}\n"
+                f"[rgb(167,199,231)]Timeout:[/rgb(167,199,231)] {workflow.get('timeout', 'Not set')}",
+                border_style="white",
+                padding=(0, 0),
+                box=box.SIMPLE
+            )
+            console.print(info_panel)
+            
+            # Steps tablosu
+            if workflow.get('steps'):
+                console.print()
+                steps_table = Table(
+                    title="[bold rgb(167,199,231)]Workflow Steps[/bold rgb(167,199,231)]",
+                    box=box.SIMPLE,
+                    border_style="white",
+                    show_header=True,
+                    header_style="rgb(167,199,231)"
+                )
+                steps_table.add_column("#", style="rgb(167,199,231)", width=5)
+                steps_table.add_column("Action", style="rgb(167,199,231)", width=20)
+                steps_table.add_column("Service/Command", style="rgb(167,199,231)", width=25)
+                steps_table.add_column("Timeout", style="dim rgb(167,199,231)", width=10)
+                steps_table.add_column("Retry", style="dim rgb(167,199,231)", width=10)
+                
+                for idx, step in enumerate(workflow.get('steps', []), 1):
+                    action = step.get('action', 'N/A')
+                    service = step.get('service') or step.get('command') or 'N/A'
+                    timeout = str(step.get('timeout', 'N/A'))
+                    retry = str(step.get('retry', 'N/A'))
+                    steps_table.add_row(str(idx), action, service, timeout, retry)
+                
+                console.print(steps_table)
+        elif res.status_code == 404:
+            console.print(f"[rgb(167,199,231)] Workflow '{wf_name}' not found[/rgb(167,199,231)]")
+        else:
+            console.print(f"[rgb(167,199,231)] Error: {res.status_code}[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)] Error: {e}[/rgb(167,199,231)]")
+
+
+def check_workflow_status():
+    """Workflow run durumunu kontrol et"""
+    console.print()
+    run_id = Prompt.ask("[rgb(167,199,231)]Enter workflow run ID[/rgb(167,199,231)]")
+    
+    try:
+        with Status("[rgb(167,199,231)]Fetching run status...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+            res = api_get(f"/workflow/runs/{run_id}")
+        
+        if res.status_code == 200:
+            run = res.json()
+            console.print()
+            
+            # Status icon
+            status = run.get('status', 'unknown')
+            status_icons = {
+                'pending': '⏳',
+                'running': '🔄',
+                'completed': '[rgb(167,199,231)]COMPLETED[/rgb(167,199,231)]',
+                'failed': '',
+                'cancelled': '🚫'
+            }
+            icon = status_icons.get(status, '❓')
+            
+            status_panel = Panel(
+                f"[rgb(167,199,231)]Run ID:[/rgb(167,199,231)] {run.get('id')}\n"
+                f"[rgb(167,199,231)]Workflow:[/rgb(167,199,231)] {run.get('workflow_name')}\n"
+                f"[rgb(167,199,231)]Status:[/rgb(167,199,231)] {icon} {status.upper()}\n"
+                f"[rgb(167,199,231)]Started:[/rgb(167,199,231)] {run.get('started_at')}\n"
+                f"[rgb(167,199,231)]Completed:[/rgb(167,199,231)] {run.get('completed_at', 'N/A')}\n"
+                f"[rgb(167,199,231)]Steps Executed:[/rgb(167,199,231)] {len(run.get('steps_executed', []))}\n"
+                + (f"[rgb(167,199,231)]Error:[/rgb(167,199,231)] {run.get('error')}\n" if run.get('error') else ""),
+                title=f"[bold rgb(167,199,231)]Workflow Run Status[/bold rgb(167,199,231)]",
+                border_style="white",
+                box=box.SIMPLE
+            )
+            console.print(status_panel)
+            
+            # Steps executed
+            if run.get('steps_executed'):
+                console.print()
+                console.print("[rgb(167,199,231)]Executed Steps:[/rgb(167,199,231)]")
+                for step in run.get('steps_executed', []):
+                    console.print(f"  [rgb(167,199,231)]•[/rgb(167,199,231)] {step}")
+            
+            # Output
+            if run.get('output'):
+                console.print()
+                console.print("[rgb(167,199,231)]📤 Output:[/rgb(167,199,231)]")
+                import json
+                console.print(json.dumps(run.get('output'), indent=2))
+        elif res.status_code == 404:
+            console.print(f"[rgb(167,199,231)] Run ID '{run_id}' not found[/rgb(167,199,231)]")
+        else:
+            console.print(f"[rgb(167,199,231)] Error: {res.status_code}[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)] Error: {e}[/rgb(167,199,231)]")
+
+
+def list_workflow_runs():
+    """Workflow run'larını listele"""
+    console.print()
+    workflow_name = Prompt.ask("[rgb(167,199,231)]Filter by workflow name (optional)[/rgb(167,199,231)]", default="")
+    status_filter = Prompt.ask(
+        "[rgb(167,199,231)]Filter by status (optional)[/rgb(167,199,231)]",
+        choices=["", "pending", "running", "completed", "failed", "cancelled"],
+        default=""
+    )
+    
+    try:
+        params = {}
+        if workflow_name:
+            params["workflow_name"] = workflow_name
+        if status_filter:
+            params["status"] = status_filter
+        
+        with Status("[rgb(167,199,231)]Fetching workflow runs...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+            res = api_get("/workflow/runs", params=params)
+        
+        if res.status_code == 200:
+            runs = res.json()
+            console.print()
+            
+            if not runs:
+                console.print("[rgb(167,199,231)]No workflow runs found.[/rgb(167,199,231)]")
+                return
+            
+            table = Table(
+                title="[bold rgb(167,199,231)]Workflow Runs[/bold rgb(167,199,231)]",
+                box=box.SIMPLE,
+                border_style="white",
+                show_header=True,
+                header_style="rgb(167,199,231)"
+            )
+            table.add_column("Run ID", style="rgb(167,199,231)", width=36)
+            table.add_column("Workflow", style="rgb(167,199,231)", width=20)
+            table.add_column("Status", style="rgb(167,199,231)", width=12)
+            table.add_column("Started", style="dim rgb(167,199,231)", width=20)
+            table.add_column("Completed", style="dim rgb(167,199,231)", width=20)
+            
+            status_icons = {
+                'pending': '⏳',
+                'running': '🔄',
+                'completed': '[rgb(167,199,231)]COMPLETED[/rgb(167,199,231)]',
+                'failed': '',
+                'cancelled': '🚫'
+            }
+            
+            for run in runs:
+                run_id = run.get('id', 'N/A')[:8] + '...'
+                workflow = run.get('workflow_name', 'N/A')
+                status = run.get('status', 'unknown')
+                icon = status_icons.get(status, '❓')
+                started = run.get('started_at', 'N/A')[:19] if run.get('started_at') else 'N/A'
+                completed = run.get('completed_at', 'N/A')[:19] if run.get('completed_at') else 'N/A'
+                table.add_row(run_id, workflow, f"{icon} {status}", started, completed)
+            
+            console.print(table)
+        else:
+            console.print(f"[rgb(167,199,231)] Error: {res.status_code}[/rgb(167,199,231)]")
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)] Error: {e}[/rgb(167,199,231)]")
+
+
+def generate_workflow_ai():
+    """AI ile workflow oluşturma"""
+    # Token kontrolü
+    token_status = check_token()
+    if not token_status.get("token_set"):
+        console.print()
+        warning = Panel(
+            "[rgb(167,199,231)]Warning:[/rgb(167,199,231)]\n"
+            "[rgb(167,199,231)] Token not set![/rgb(167,199,231)]"
+            "[rgb(167,199,231)]AI workflow generation requires a Hugging Face API token.[/rgb(167,199,231)]",
+            border_style="white",
+            box=box.SIMPLE
+        )
+        console.print(warning)
+        console.print()
+        
+        if Confirm.ask("[rgb(167,199,231)]Would you like to set token now?[/rgb(167,199,231)]"):
+            set_token()
+            token_status = check_token()
+            if not token_status.get("token_set"):
+                console.print("[rgb(167,199,231)] Token setup failed. Cannot proceed.[/rgb(167,199,231)]")
+                return
+        else:
+            return
+    
+    console.print()
+    panel = Panel(
+        "[rgb(167,199,231)]AI Workflow Generator[/rgb(167,199,231)]\n\n"
+        "[rgb(167,199,231)]Describe what you want your workflow to do in natural language.[/rgb(167,199,231)]\n"
+        "[dim rgb(167,199,231)]Example: 'Restart nginx service, then check if it's running'[/dim rgb(167,199,231)]\n"
+        "[dim rgb(167,199,231)]         'Deploy my app: build, test, and deploy to production'[/dim rgb(167,199,231)]",
+        border_style="white",
+        box=box.SIMPLE
+    )
+    console.print(panel)
+    console.print()
+    
+    # Workflow açıklaması al
+    description = get_multiline_input_simple("[rgb(167,199,231)]Describe your workflow[/rgb(167,199,231)]")
+    
+    if not description:
+        console.print("[rgb(167,199,231)] Workflow description cannot be empty![/rgb(167,199,231)]")
+        return
+    
+    # Context (opsiyonel)
+    context = {}
+    if Confirm.ask("[rgb(167,199,231)]Do you have additional context (platform, services, etc.)?[/rgb(167,199,231)]", default=False):
+        console.print()
+        context_input = get_multiline_input_simple("[rgb(167,199,231)]Additional context[/rgb(167,199,231)]")
+        if context_input:
+            context["notes"] = context_input
+    
+    try:
+        console.print()
+        
+        # Loading animasyonu ile workflow oluştur
+        with Status(
+            "[rgb(167,199,231)]Generating workflow with AI...[/rgb(167,199,231)]",
+            spinner="dots12",
+            spinner_style="rgb(167,199,231)"
+        ):
+            res = api_post(
+                "/workflow/generate",
+                json={
+                    "description": description,
+                    "context": context if context else None
+                },
+                headers=get_api_headers(),
+                timeout=120  # AI generation için daha uzun timeout
+            )
+        
+        if res.status_code == 200:
+            result = res.json()
+            console.print()
+            console.print("[rgb(167,199,231)]Workflow Generated Successfully![/rgb(167,199,231)]")
+            console.print()
+            
+            # Workflow bilgileri
+            info_panel = Panel(
+                f"[rgb(167,199,231)]Name:[/rgb(167,199,231)] {result.get('workflow_name')}\n"
+                f"[rgb(167,199,231)]Message:[/rgb(167,199,231)] {result.get('message')}",
+                border_style="rgb(167,199,231)",
+                box=box.SIMPLE
+            )
+            console.print(info_panel)
+            
+            # YAML içeriğini göster
+            yaml_content = result.get('yaml_content', '')
+            if yaml_content:
+                console.print()
+                yaml_panel = Panel(
+                    yaml_content,
+                    title="[bold rgb(167,199,231)]Generated YAML[/bold rgb(167,199,231)]",
+                    border_style="white",
+                    box=box.SIMPLE,
+                    padding=(0, 0)
+                )
+                console.print(yaml_panel)
+            
+            # Workflow detayları
+            workflow_def = result.get('workflow_definition', {})
+            if workflow_def.get('steps'):
+                console.print()
+                console.print("[rgb(167,199,231)]Workflow Steps:[/rgb(167,199,231)]")
+                for idx, step in enumerate(workflow_def.get('steps', []), 1):
+                    action = step.get('action', 'N/A')
+                    service = step.get('service') or step.get('command') or 'N/A'
+                    console.print(f"  [white]{idx}.[/white] {action}: {service}")
+            
+            # Dosyaya kaydetme seçeneği
+            console.print()
+            if Confirm.ask("[rgb(167,199,231)]Save workflow to file?[/rgb(167,199,231)]", default=True):
+                workflow_name = result.get('workflow_name', 'generated_workflow')
+                filename = f"{workflow_name}.yml"
+                
+                # Kullanıcı workflow dizinine kaydet (~/.neurops/workflows/)
+                ensure_user_workflows_dir()
+                filepath = USER_WORKFLOWS_DIR / filename
+                
+                try:
+                    with open(filepath, 'w', encoding='utf-8') as f:
+                        f.write(yaml_content)
+                    console.print(f"[rgb(167,199,231)]Workflow saved to: {filepath}[/rgb(167,199,231)]")
+                    console.print(f"[dim rgb(167,199,231)]This workflow is now available in your local workflows directory.[/dim rgb(167,199,231)]")
+                except Exception as e:
+                    console.print(f"[rgb(167,199,231)] Error saving file: {e}[/rgb(167,199,231)]")
+        
+        else:
+            error_detail = res.json().get('detail', 'Unknown error')
+            error_panel = Panel(
+                f"[rgb(167,199,231)] Workflow generation failed:[/rgb(167,199,231)]\n\n{error_detail}",
+                border_style="white",
+                box=box.SIMPLE
+            )
+            console.print(error_panel)
+    
+    except requests.Timeout:
+        error_panel = Panel(
+            "[rgb(167,199,231)] Request Timeout[/rgb(167,199,231)]\n\n"
+            "The AI workflow generation took longer than 2 minutes.\n"
+            "This can happen if:\n"
+            "  • The AI service is slow or overloaded\n"
+            "  • Your description is very complex\n"
+            "  • Network connection is slow\n\n"
+            "[rgb(167,199,231)]Try again with a simpler description or check your connection.[/rgb(167,199,231)]",
+            title="Timeout",
+            border_style="white",
+            box=box.SIMPLE
+        )
+        console.print(Align.center(error_panel), width=80)
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)] Error: {e}[/rgb(167,199,231)]")
+
+
+def execute_workflow_step_local(step: dict) -> dict:
+    """
+    Workflow step'ini kullanıcının lokal terminalinde çalıştırır.
+    """
+    result = {
+        "action": step.get("action"),
+        "status": "completed",
+        "output": None,
+        "error": None
+    }
+    
+    try:
+        is_windows = platform.system() == "Windows"
+        action = step.get("action")
+        
+        if action == "run_command":
+            # Command field'ını kontrol et - farklı isimlerle de gelebilir
+            command = step.get("command") or step.get("cmd") or step.get("execute")
+            if not command:
+                # Step'in tüm içeriğini göster (debug için)
+                console.print(f"[rgb(167,199,231)] Step data: {step}[/rgb(167,199,231)]")
+                result["status"] = "failed"
+                result["error"] = f"Command not specified in step. Step has fields: {list(step.keys())}. This workflow may have been generated incorrectly. Please regenerate it using 'AI - Generate Workflow'."
+                return result
+            
+            try:
+                console.print(f"[dim]Executing: {command}[/dim]")
+                
+                if is_windows:
+                    process = subprocess.run(
+                        command,
+                        shell=True,
+                        capture_output=True,
+                        text=True,
+                        timeout=step.get("timeout") or 300,
+                        check=False
+                    )
+                else:
+                    cmd_parts = shlex.split(command)
+                    process = subprocess.run(
+                        cmd_parts,
+                        capture_output=True,
+                        text=True,
+                        timeout=step.get("timeout") or 300,
+                        check=False
+                    )
+                
+                if process.stdout:
+                    console.print(f"[white]Output:[/white]\n{process.stdout}")
+                if process.stderr:
+                    console.print(f"[rgb(167,199,231)]Stderr:[/rgb(167,199,231)]\n{process.stderr}")
+                
+                result["output"] = {
+                    "stdout": process.stdout,
+                    "stderr": process.stderr,
+                    "returncode": process.returncode
+                }
+                
+                if process.returncode != 0:
+                    result["status"] = "failed"
+                    result["error"] = f"Command failed with return code {process.returncode}"
+                    console.print(f"[rgb(167,199,231)] Command failed (exit code: {process.returncode})[/rgb(167,199,231)]")
+                else:
+                    console.print(f"[white]Command completed successfully[/white]")
+                
+            except subprocess.TimeoutExpired:
+                result["status"] = "failed"
+                result["error"] = f"Command timed out after {step.get('timeout') or 300} seconds"
+                console.print(f"[rgb(167,199,231)] Command timed out[/rgb(167,199,231)]")
+            except Exception as e:
+                result["status"] = "failed"
+                result["error"] = f"Error executing command: {str(e)}"
+                console.print(f"[rgb(167,199,231)] Error: {str(e)}[/rgb(167,199,231)]")
+        
+        elif action == "stop_service":
+            service = step.get("service")
+            if not service:
+                result["status"] = "failed"
+                result["error"] = "Service name not specified"
+                return result
+            
+            try:
+                console.print(f"[dim]Stopping service: {service}[/dim]")
+                
+                if is_windows:
+                    cmd = f"net stop {service}"
+                    process = subprocess.run(
+                        cmd,
+                        shell=True,
+                        capture_output=True,
+                        text=True,
+                        timeout=step.get("timeout") or 60,
+                        check=False
+                    )
+                else:
+                    cmd_parts = ["systemctl", "stop", service]
+                    process = subprocess.run(
+                        cmd_parts,
+                        capture_output=True,
+                        text=True,
+                        timeout=step.get("timeout") or 60,
+                        check=False
+                    )
+                
+                if process.stdout:
+                    console.print(process.stdout)
+                if process.stderr:
+                    console.print(f"[rgb(167,199,231)]{process.stderr}[/rgb(167,199,231)]")
+                
+                result["output"] = {
+                    "stdout": process.stdout,
+                    "stderr": process.stderr,
+                    "returncode": process.returncode
+                }
+                
+                if process.returncode != 0:
+                    result["status"] = "failed"
+                    result["error"] = f"Failed to stop service: {process.stderr}"
+                    console.print(f"[rgb(167,199,231)] Failed to stop service[/rgb(167,199,231)]")
+                else:
+                    console.print(f"[white]Service {service} stopped successfully[/white]")
+                    
+            except subprocess.TimeoutExpired:
+                result["status"] = "failed"
+                result["error"] = "Service stop timed out"
+                console.print(f"[rgb(167,199,231)] Service stop timed out[/rgb(167,199,231)]")
+            except Exception as e:
+                result["status"] = "failed"
+                result["error"] = f"Error stopping service: {str(e)}"
+                console.print(f"[rgb(167,199,231)] Error: {str(e)}[/rgb(167,199,231)]")
+        
+        elif action == "start_service":
+            service = step.get("service")
+            if not service:
+                result["status"] = "failed"
+                result["error"] = "Service name not specified"
+                return result
+            
+            try:
+                console.print(f"[dim]Starting service: {service}[/dim]")
+                
+                if is_windows:
+                    cmd = f"net start {service}"
+                    process = subprocess.run(
+                        cmd,
+                        shell=True,
+                        capture_output=True,
+                        text=True,
+                        timeout=step.get("timeout") or 60,
+                        check=False
+                    )
+                else:
+                    cmd_parts = ["systemctl", "start", service]
+                    process = subprocess.run(
+                        cmd_parts,
+                        capture_output=True,
+                        text=True,
+                        timeout=step.get("timeout") or 60,
+                        check=False
+                    )
+                
+                if process.stdout:
+                    console.print(process.stdout)
+                if process.stderr:
+                    console.print(f"[rgb(167,199,231)]{process.stderr}[/rgb(167,199,231)]")
+                
+                result["output"] = {
+                    "stdout": process.stdout,
+                    "stderr": process.stderr,
+                    "returncode": process.returncode
+                }
+                
+                if process.returncode != 0:
+                    result["status"] = "failed"
+                    result["error"] = f"Failed to start service: {process.stderr}"
+                    console.print(f"[rgb(167,199,231)] Failed to start service[/rgb(167,199,231)]")
+                else:
+                    console.print(f"[white]Service {service} started successfully[/white]")
+                    
+            except subprocess.TimeoutExpired:
+                result["status"] = "failed"
+                result["error"] = "Service start timed out"
+                console.print(f"[rgb(167,199,231)] Service start timed out[/rgb(167,199,231)]")
+            except Exception as e:
+                result["status"] = "failed"
+                result["error"] = f"Error starting service: {str(e)}"
+                console.print(f"[rgb(167,199,231)] Error: {str(e)}[/rgb(167,199,231)]")
+        
+        elif action == "restart_service":
+            service = step.get("service")
+            if not service:
+                result["status"] = "failed"
+                result["error"] = "Service name not specified"
+                return result
+            
+            try:
+                console.print(f"[dim]Restarting service: {service}[/dim]")
+                
+                if is_windows:
+                    stop_cmd = f"net stop {service}"
+                    start_cmd = f"net start {service}"
+                    
+                    stop_process = subprocess.run(
+                        stop_cmd,
+                        shell=True,
+                        capture_output=True,
+                        text=True,
+                        timeout=step.get("timeout") or 60,
+                        check=False
+                    )
+                    
+                    if stop_process.returncode == 0:
+                        start_process = subprocess.run(
+                            start_cmd,
+                            shell=True,
+                            capture_output=True,
+                            text=True,
+                            timeout=step.get("timeout") or 60,
+                            check=False
+                        )
+                        process = start_process
+                    else:
+                        process = stop_process
+                else:
+                    cmd_parts = ["systemctl", "restart", service]
+                    process = subprocess.run(
+                        cmd_parts,
+                        capture_output=True,
+                        text=True,
+                        timeout=step.get("timeout") or 60,
+                        check=False
+                    )
+                
+                if process.stdout:
+                    console.print(process.stdout)
+                if process.stderr:
+                    console.print(f"[rgb(167,199,231)]{process.stderr}[/rgb(167,199,231)]")
+                
+                result["output"] = {
+                    "stdout": process.stdout,
+                    "stderr": process.stderr,
+                    "returncode": process.returncode
+                }
+                
+                if process.returncode != 0:
+                    result["status"] = "failed"
+                    result["error"] = f"Failed to restart service: {process.stderr}"
+                    console.print(f"[rgb(167,199,231)] Failed to restart service[/rgb(167,199,231)]")
+                else:
+                    console.print(f"[white]Service {service} restarted successfully[/white]")
+                    
+            except subprocess.TimeoutExpired:
+                result["status"] = "failed"
+                result["error"] = "Service restart timed out"
+                console.print(f"[rgb(167,199,231)] Service restart timed out[/rgb(167,199,231)]")
+            except Exception as e:
+                result["status"] = "failed"
+                result["error"] = f"Error restarting service: {str(e)}"
+                console.print(f"[rgb(167,199,231)] Error: {str(e)}[/rgb(167,199,231)]")
+        
+        else:
+            result["status"] = "failed"
+            result["error"] = f"Unknown action type: {action}"
+            console.print(f"[rgb(167,199,231)] Unknown action: {action}[/rgb(167,199,231)]")
+    
+    except Exception as e:
+        result["status"] = "failed"
+        result["error"] = str(e)
+        console.print(f"[rgb(167,199,231)] Error: {str(e)}[/rgb(167,199,231)]")
+    
+    return result
+
+
+def run_workflow():
+    """Workflow çalıştırma - lokal terminalde"""
+    console.print()
+    
+    # Önce workflow'ları listele
+    try:
+        res = api_get_cached("/workflow/")
+        if res.status_code == 200:
+            workflows = res.json()
+            if workflows:
+                console.print("[rgb(167,199,231)]Available workflows:[/rgb(167,199,231)]")
+                for wf in workflows[:10]:  # İlk 10'unu göster
+                    console.print(f"  [rgb(167,199,231)]•[/rgb(167,199,231)] {wf.get('name')}")
+                console.print()
+    except:
+        pass
+    
+    wf_name = Prompt.ask("[rgb(167,199,231)]Enter workflow name[/rgb(167,199,231)]")
+    
+    # Workflow tanımını backend'den al
+    try:
+        with Status("[rgb(167,199,231)]Loading workflow...[/rgb(167,199,231)]", spinner="dots", spinner_style="rgb(167,199,231)"):
+            res = api_get_cached(f"/workflow/{wf_name}")
+        
+        if res.status_code != 200:
+            error_detail = res.json().get('detail', 'Unknown error') if res.status_code != 404 else "Workflow not found"
+            console.print(f"[rgb(167,199,231)] Error: {error_detail}[/rgb(167,199,231)]")
+            return
+        
+        workflow = res.json()
+        
+    except Exception as e:
+        console.print(f"[rgb(167,199,231)] Error loading workflow: {e}[/rgb(167,199,231)]")
+        return
+    
+    # Workflow bilgilerini göster
+    console.print()
+    info_panel = Panel(
+        f"[bold rgb(167,199,231)]Workflow:[/bold rgb(167,199,231)]\n"
+        f"[rgb(167,199,231)]Name:[/rgb(167,199,231)] {workflow.get('name')}\n"
+        f"[rgb(167,199,231)]Description:[/rgb(167,199,231)] {workflow.get('description', 'No description') or 'No description'}\n"
+        f"[rgb(167,199,231)]Steps:[/rgb(167,199,231)] {len(workflow.get('steps', []))}",
+        border_style="white",
+        box=box.SIMPLE
+    )
+    console.print(Align.center(info_panel), width=80)
+    console.print()
+    
+    # Onay iste
+    if not Confirm.ask("[rgb(167,199,231)]Run this workflow in your local terminal?[/rgb(167,199,231)]", default=True):
+        console.print("[rgb(167,199,231)]Workflow execution cancelled.[/rgb(167,199,231)]")
+        return
+    
+    console.print()
+    console.print("[rgb(167,199,231)]🚀 Executing workflow steps...[/rgb(167,199,231)]")
+    console.print()
+    
+    # Her step'i lokal olarak çalıştır
+    steps = workflow.get('steps', [])
+    executed_steps = []
+    failed = False
+    
+    # Debug: Step'leri kontrol et
+    if not steps:
+        console.print("[rgb(167,199,231)] No steps found in workflow![/rgb(167,199,231)]")
+        return
+    
+    for idx, step in enumerate(steps, 1):
+        # Step'in tüm içeriğini debug için göster (sadece ilk seferde)
+        if idx == 1:
+            console.print(f"[dim rgb(167,199,231)]Debug: First step content: {step}[/dim rgb(167,199,231)]")
+        
+        step_name = step.get('action', 'unknown')
+        service_or_cmd = step.get('service') or step.get('command') or 'N/A'
+        
+        console.print()
+        step_header = Panel(
+            f"[rgb(167,199,231)]Step {idx}/{len(steps)}: {step_name}[/rgb(167,199,231)]\n"
+            f"[dim rgb(167,199,231)]{service_or_cmd}[/dim rgb(167,199,231)]",
+            border_style="white",
+            box=box.SIMPLE
+        )
+        console.print(step_header)
+        console.print()
+        
+        # Step'i çalıştır
+        step_result = execute_workflow_step_local(step)
+        executed_steps.append({
+            "step": idx,
+            "action": step_name,
+            "result": step_result
+        })
+        
+        # Hata varsa durdur
+        if step_result["status"] == "failed":
+            failed = True
+            console.print()
+            error_panel = Panel(
+                f"[rgb(167,199,231)] Step {idx} failed![/rgb(167,199,231)]\n\n"
+                f"[bold rgb(167,199,231)]Error:[/bold rgb(167,199,231)] {step_result.get('error', 'Unknown error')}\n\n"
+                f"[rgb(167,199,231)]Workflow execution stopped.[/rgb(167,199,231)]",
+                border_style="white",
+                box=box.SIMPLE
+            )
+            console.print(error_panel)
+            break
+        
+        # Kısa bir bekleme (opsiyonel)
+        if idx < len(steps):
+            time.sleep(0.5)
+    
+    # Sonuç özeti
+    console.print()
+    if failed:
+        result_panel = Panel(
+            f"[rgb(167,199,231)] Workflow execution failed[/rgb(167,199,231)]\n\n"
+            f"Completed steps: {len([s for s in executed_steps if s['result']['status'] == 'completed'])}/{len(steps)}",
+            border_style="white",
+            box=box.SIMPLE
+        )
+    else:
+        result_panel = Panel(
+            f"[rgb(167,199,231)]Workflow completed successfully![/rgb(167,199,231)]\n\n"
+            f"Executed {len(executed_steps)}/{len(steps)} steps",
+            border_style="white",
+            box=box.SIMPLE
+        )
+    console.print(Align.center(result_panel), width=80)
@@ -0,0 +1,109 @@
+"""
+AsyncApiClient fan-out: kaynaklar stand-in backend'den (http.server, rastgele
+port) aynı anda çekilir; alt menü prefetch'i yanıt önbelleğini doldurur ve
+ekranın kendi isteği ağa gitmez.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+from neurops import aio, api
+
+
+HEADERS = {"Content-Type": "application/json", "X-User-ID": "tester", "X-Username": "tester"}
+
+
+class SlowBackend(ThreadingHTTPServer):
+    """Her GET'e gecikmeyle yanıt veren, eşzamanlı istek sayısını ölçen backend"""
+
+    def __init__(self, delay: float = 0.2):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def close(self):
+        self.shutdown()
+        self.server_close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path.split("?")[0])
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        time.sleep(server.delay)
+        with server.lock:
+            server.in_flight -= 1
+        data = json.dumps({"total": 1}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class FanOutTest(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = SlowBackend()
+        self.addCleanup(self.backend.close)
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        api_url = api.API_URL
+        self.addCleanup(api.set_api_url, api_url)
+        api.set_api_url(self.backend.url)
+        patches = [
+            mock.patch.object(api, "response_cache", api.ResponseCache(Path(self._tmp.name))),
+            mock.patch.object(aio, "get_api_headers", return_value=HEADERS),
+            mock.patch.dict(os.environ, {"NEUROPS_RESPONSE_CACHE": "memory"}),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_resources_are_fetched_concurrently(self):
+        async def fetch():
+            return await aio.fetch_resources_async(aio.AsyncApiClient(), aio.DASHBOARD_RESOURCES)
+        dashboard = aio.run_async(fetch())
+        self.assertEqual(set(dashboard), set(aio.DASHBOARD_RESOURCES))
+        self.assertEqual(dashboard["incident_stats"], {"total": 1})
+        self.assertGreater(self.backend.max_in_flight, 1)
+
+    def test_menu_prefetch_warms_screen_loads(self):
+        """Prefetch sonrası incident ekranlarının GET'leri önbellekten döner"""
+        aio.prefetch_menu("incident").join(5)
+        self.assertEqual(sorted(self.backend.requests), ["/incident/", "/incident/stats/summary"])
+        self.assertGreater(self.backend.max_in_flight, 1)
+        api.api_get_cached("/incident/stats/summary")
+        api.api_get_cached("/incident/", params={}, headers=HEADERS)
+        self.assertEqual(len(self.backend.requests), 2)
+
+    def test_prefetch_skipped_when_cache_off(self):
+        with mock.patch.dict(os.environ, {"NEUROPS_RESPONSE_CACHE": "off"}):
+            self.assertIsNone(aio.prefetch_menu("security"))
+        self.assertEqual(self.backend.requests, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Analiz önbelleği: aynı payload ikinci kez backend'e gitmez, ama backend'in
+fallback/offline (model yok, çevrimdışı) yanıtları saklanmaz; backend
+düzelince gerçek analiz alınır.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import requests
+
+from neurops import api
+
+
+PAYLOAD = {"logs": "ERROR db connection refused", "source": "test"}
+
+
+def _response(body: dict) -> requests.Response:
+    res = requests.Response()
+    res.status_code = 200
+    res._content = json.dumps(body).encode("utf-8")
+    res.headers["Content-Type"] = "application/json"
+    res.url = f"{api.API_URL}/logs/analyze"
+    return res
+
+
+class CachedAnalysisTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        cache = api.AnalysisCache(Path(self._tmp.name), 1024 * 1024, 1024 * 1024)
+        patches = [
+            mock.patch.object(api, "analysis_cache", cache),
+            mock.patch.dict(os.environ, {"NEUROPS_ANALYSIS_CACHE": "memory", "NEUROPS_ANALYSIS_CACHE_TTL": "3600"}),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.sent = 0
+
+    def _analyze(self, body: dict):
+        def send():
+            self.sent += 1
+            return _response(body)
+        return api.cached_analysis("/logs/analyze", PAYLOAD, send)
+
+    def test_repeated_payload_is_served_from_cache(self):
+        first = self._analyze({"summary": "db down", "fallback": False})
+        second = self._analyze({"summary": "db down", "fallback": False})
+        self.assertEqual(self.sent, 1)
+        self.assertEqual(second.json(), first.json())
+
+    def test_degraded_answers_are_not_cached(self):
+        """fallback/offline yanıt saklanmaz; backend düzelince gerçek analiz döner"""
+        for flag in api.ANALYSIS_DEGRADED_FLAGS:
+            with self.subTest(flag=flag):
+                self.sent = 0
+                api.analysis_cache.clear()
+                self._analyze({"summary": "AI model not available", flag: True})
+                recovered = self._analyze({"summary": "db down"})
+                self.assertEqual(self.sent, 2)
+                self.assertEqual(recovered.json()["summary"], "db down")
+                self._analyze({"summary": "db down"})
+                self.assertEqual(self.sent, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+AnalysisTrigger karar mantığı sahte saatle: hata satırı beklemeden,
+çıktı debounce süresince durunca veya en geç max_delay sonunda analiz
+istenir; yeni satır yoksa istenmez, dakikalık bütçe aşılmaz.
+"""
+
+import unittest
+
+from neurops.analysistrigger import AnalysisTrigger, REASON_ERROR, REASON_MAX_DELAY, REASON_QUIET
+from neurops.logbuffer import LogRingBuffer
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class AnalysisTriggerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.calls = 0
+
+    def _trigger(self, **kwargs) -> AnalysisTrigger:
+        def fire():
+            self.calls += 1
+        options = {"debounce": 1.0, "max_delay": 10.0, "budget_per_minute": 0}
+        options.update(kwargs)
+        trigger = AnalysisTrigger(LogRingBuffer(), fire, clock=self.clock, **options)
+        self.addCleanup(trigger.close)
+        return trigger
+
+    def _at(self, offset: float):
+        self.clock.now = 1000.0 + offset
+
+    def test_error_line_fires_immediately(self):
+        trigger = self._trigger()
+        trigger.add("INFO starting")
+        self.assertEqual(self.calls, 0)
+        trigger.add("ERROR connection refused")
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(trigger.fired[REASON_ERROR], 1)
+        self.assertEqual(trigger.pending, 0)
+
+    def test_error_line_waits_when_disabled(self):
+        trigger = self._trigger(on_error=False)
+        trigger.add("ERROR connection refused")
+        self.assertEqual(self.calls, 0)
+
+    def test_fires_after_quiet_period(self):
+        """Çıktı debounce süresi kadar durunca bir kez istenir"""
+        trigger = self._trigger()
+        trigger.add("INFO one")
+        self._at(0.5)
+        trigger.add("INFO two")
+        self._at(1.2)
+        self.assertFalse(trigger.check())
+        self._at(1.5)
+        self.assertTrue(trigger.check())
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(trigger.fired[REASON_QUIET], 1)
+
+    def test_max_delay_caps_continuous_output(self):
+        """Çıktı hiç durmazsa ilk bekleyen satırdan max_delay sonra istenir"""
+        trigger = self._trigger(max_delay=3.0)
+        for step in range(13):
+            self._at(step * 0.5)
+            trigger.add(f"INFO tick {step}")
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(trigger.fired[REASON_MAX_DELAY], 1)
+        self.assertEqual(trigger.pending, 6)
+
+    def test_no_new_output_no_fire(self):
+        trigger = self._trigger()
+        trigger.add("INFO one")
+        self._at(2)
+        self.assertTrue(trigger.check())
+        self._at(100)
+        self.assertFalse(trigger.check())
+        self.assertEqual(self.calls, 1)
+
+    def test_per_minute_budget(self):
+        """Bütçe dolunca tetikleme pencerenin en eski kaydı düşene kadar ertelenir"""
+        trigger = self._trigger(budget_per_minute=2)
+        for offset in (0, 5, 10):
+            self._at(offset)
+            trigger.add("ERROR boom")
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(trigger.budget_deferred, 1)
+        self._at(59)
+        self.assertFalse(trigger.check())
+        self._at(60)
+        self.assertTrue(trigger.check())
+        self.assertEqual(trigger.stats()["fired"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+CoalescingWorker: uçuşta bir iş varken gelen pencereler en yenisiyle
+değişir (latest-wins), hata veren işler failed sayacına yazılır ve
+close() bekleyenleri düşürüp thread'i durdurur.
+"""
+
+import threading
+import unittest
+
+from neurops.analysisworker import CoalescingWorker
+
+
+class CoalescingWorkerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.processed = []
+
+    def _blocking(self, value):
+        self.started.set()
+        self.release.wait(5)
+        if value == "bad":
+            raise RuntimeError("backend down")
+        self.processed.append(value)
+
+    def _worker(self, **kwargs) -> CoalescingWorker:
+        worker = CoalescingWorker(self._blocking, "test", **kwargs)
+        self.addCleanup(worker.close)
+        self.addCleanup(self.release.set)
+        return worker
+
+    def test_latest_window_replaces_pending(self):
+        """Uçuştaki iş bitene kadar gelen pencerelerden yalnızca en yenisi işlenir"""
+        worker = self._worker()
+        worker.submit(1)
+        self.assertTrue(self.started.wait(5))
+        for value in (2, 3, 4):
+            worker.submit(value)
+        self.assertEqual(worker.stats()["in_flight"], 1)
+        self.assertEqual(worker.queue_depth, 1)
+        self.release.set()
+        self.assertTrue(worker.wait_idle(5))
+        self.assertEqual(self.processed, [1, 4])
+        stats = worker.stats()
+        self.assertEqual((stats["submitted"], stats["completed"], stats["dropped"], stats["failed"]), (4, 2, 2, 0))
+
+    def test_max_pending_keeps_newest(self):
+        worker = self._worker(max_pending=2)
+        worker.submit(1)
+        self.assertTrue(self.started.wait(5))
+        for value in (2, 3, 4):
+            worker.submit(value)
+        self.release.set()
+        self.assertTrue(worker.wait_idle(5))
+        self.assertEqual(self.processed, [1, 3, 4])
+        self.assertEqual(worker.dropped, 1)
+
+    def test_failures_are_counted(self):
+        """func'tan çıkan hata worker'ı durdurmaz, failed sayacına yazılır"""
+        self.release.set()
+        worker = self._worker()
+        worker.submit("bad")
+        self.assertTrue(worker.wait_idle(5))
+        worker.submit("ok")
+        self.assertTrue(worker.wait_idle(5))
+        self.assertEqual(self.processed, ["ok"])
+        self.assertEqual((worker.failed, worker.completed), (1, 1))
+
+    def test_close_drops_pending_and_stops(self):
+        """close() bekleyeni düşürür, çalışan işi tamamlatır ve thread'i sonlandırır"""
+        worker = self._worker()
+        worker.submit(1)
+        self.assertTrue(self.started.wait(5))
+        worker.submit(2)
+        worker.close()
+        self.assertFalse(worker.submit(3))
+        self.release.set()
+        worker._thread.join(5)
+        self.assertFalse(worker._thread.is_alive())
+        self.assertEqual(self.processed, [1])
+        stats = worker.stats()
+        self.assertEqual((stats["queue_depth"], stats["in_flight"], stats["completed"], stats["dropped"]), (0, 0, 1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
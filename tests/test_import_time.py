@@ -0,0 +1,69 @@
+"""
+Başlangıç süresi bütçesi: `python -X importtime` ile neurops.cli'nin soğuk
+import maliyeti ölçülür. Ağır bağımlılıklar (requests, sqlite3, yaml,
+rich.markdown, ...) ilk kullanımda yüklenmelidir; biri yeniden en üste
+taşınırsa bu test başarısız olur.
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Tek tip komut çalıştırmak için ödenen import maliyeti (eskiden ~200ms, şu an ~50ms)
+IMPORT_BUDGET_MS = float(os.getenv("NEUROPS_IMPORT_BUDGET_MS", "150"))
+IMPORT_RUNS = 3  # Gürültüye karşı en iyi ölçüm alınır
+
+# Menü ve komut parser'ı kurulurken yüklenmemesi gereken modüller
+LAZY_MODULES = (
+    "requests", "sqlite3", "multiprocessing", "asyncio", "yaml", "rich.markdown",
+    "neurops.api", "neurops.logfiles", "neurops.logindex", "neurops.monitor", "neurops.agent",
+)
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    return subprocess.run([sys.executable, *args], cwd=REPO_ROOT, env=env,
+                          capture_output=True, text=True, check=True)
+
+
+def _import_time_ms(module: str) -> float:
+    """`python -X importtime` çıktısından modülün kümülatif import süresi (ms)"""
+    output = _run_python("-X", "importtime", "-c", f"import {module}").stderr
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name.strip() == module:
+            return int(cumulative) / 1000
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+def _loaded_modules(code: str) -> set:
+    """code çalıştıktan sonra LAZY_MODULES'tan yüklenmiş olanlar"""
+    check = f"import sys\n{code}\nprint(' '.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    return set(_run_python("-c", check).stdout.split())
+
+
+class ImportTimeTest(unittest.TestCase):
+
+    def test_cli_import_within_budget(self):
+        best = min(_import_time_ms("neurops.cli") for _ in range(IMPORT_RUNS))
+        self.assertLessEqual(best, IMPORT_BUDGET_MS,
+                             f"import neurops.cli took {best:.1f}ms (budget {IMPORT_BUDGET_MS:.0f}ms)")
+
+    def test_cli_import_is_lazy(self):
+        self.assertEqual(_loaded_modules("import neurops.cli"), set())
+
+    def test_command_parser_is_lazy(self):
+        # Parser kurulumu feature modüllerini (ve api'yi) import etmemeli: --api-url
+        # ancak api import edilmeden önce ayarlanabiliyordu
+        self.assertEqual(_loaded_modules("import neurops.commands\nneurops.commands.build_parser()"), set())
+
+
+if __name__ == "__main__":
+    unittest.main()
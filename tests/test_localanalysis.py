@@ -0,0 +1,44 @@
+"""
+Yerel kural motoru: hata ifadeleri eşleşir, aynı kelimeyi içeren ayar
+satırları (timeout=30, read_timeout: 5) bulgu sayılmaz.
+"""
+
+import unittest
+
+from neurops.localanalysis import LOG_RULES, analyze_logs_locally, analyze_with_fallback
+
+
+def _matched_titles(text: str) -> set:
+    lowered = text.lower().encode("utf-8")
+    return {title for title, pattern, _, _ in LOG_RULES if pattern.search(lowered)}
+
+
+class TimeoutRuleTest(unittest.TestCase):
+
+    def test_failure_phrases_match(self):
+        for line in (
+            "requests.exceptions.ReadTimeout: HTTPConnectionPool(host='api', port=80): Read timed out.",
+            "connect ETIMEDOUT 10.0.0.5:5432",
+            "asyncio.exceptions.TimeoutError",
+            "upstream returned 504 Gateway Timeout",
+            "rpc error: code = DeadlineExceeded desc = context deadline exceeded",
+        ):
+            with self.subTest(line=line):
+                self.assertIn("Timeout", _matched_titles(line))
+
+    def test_config_lines_do_not_match(self):
+        for line in ("timeout=30", "read_timeout: 5", "INFO starting worker with connect_timeout=10s idle_timeout=60"):
+            with self.subTest(line=line):
+                self.assertNotIn("Timeout", _matched_titles(line))
+
+    def test_filter_mode_skips_backend_for_config_lines(self):
+        """filter modunda ayar satırları bulgu üretmez, backend çağrılmaz"""
+        logs = "INFO loaded config timeout=30 read_timeout: 5\nINFO listening on :8080"
+        calls = []
+        result = analyze_with_fallback(lambda: calls.append(1) or {}, lambda: analyze_logs_locally(logs), mode="filter")
+        self.assertEqual(calls, [])
+        self.assertNotIn("Timeout", result["summary"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+"""
+Log şablon çıkarımı: değişken alanları (id, süre, durum kodu, trace id)
+farklı olan satırlar tek şablona iner; sabit kelimeleri farklı olanlar ayrı kalır.
+"""
+
+import unittest
+
+from neurops.logtemplates import TemplateMiner, collapse_log_lines
+
+
+class TemplateMinerTest(unittest.TestCase):
+
+    def test_parameterised_lines_collapse(self):
+        """Yoğun parametreli 50 satır tek şablon olur"""
+        miner = TemplateMiner()
+        for i in range(50):
+            miner.add(f"GET /api/users/{i} 200 in {i}ms req=abc{i * 7919:08x}")
+        self.assertEqual(len(miner.clusters), 1)
+        self.assertEqual(miner.clusters[0].count, 50)
+        self.assertTrue(miner.render().startswith("[x50] GET <*> <*> in <*> <*>"))
+
+    def test_masked_key_values_collapse(self):
+        """key=value değerleri maskelenince anahtarlar korunarak birleşir"""
+        lines = [f"worker {i} done status={i % 3} took={i}.5s trace={i:032x}" for i in range(20)]
+        rendered = collapse_log_lines(lines, max_chars=None)
+        self.assertEqual(len(rendered.splitlines()), 1)
+        self.assertIn("status=<*> took=<*> trace=<*>", rendered)
+
+    def test_different_messages_stay_apart(self):
+        """Aynı uzunlukta ama sabit kelimeleri farklı satırlar birleşmez"""
+        miner = TemplateMiner()
+        for i in range(10):
+            miner.add(f"job {i} finished ok after retry")
+            miner.add(f"job {i} crashed with signal kill")
+        self.assertEqual(sorted(cluster.count for cluster in miner.clusters), [10, 10])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+İstek gövdesi sıkıştırma: yerel bir stand-in backend (http.server, rastgele
+port) gelen gövdeyi Content-Encoding'e göre açar; açılan payload gönderilenle
+aynı olmalıdır. 415 dönen backend'de istek sıkıştırmasız tekrarlanır ve
+/health probe sonucu (başarısız olsa da) kısa süre önbellekte tutulur.
+"""
+
+import gzip
+import json
+import os
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from neurops import api
+
+
+PAYLOAD = {"logs": "\n".join(f"2024-05-01T12:00:{i % 60:02d} ERROR worker {i} failed" for i in range(4000))}
+
+
+class StandInBackend(ThreadingHTTPServer):
+    """/health ile encoding ilan eden, POST gövdelerini açıp kaydeden backend"""
+
+    def __init__(self, accept_encoding: str = "gzip", health_status: int = 200, reject_encoded: bool = False):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.accept_encoding = accept_encoding
+        self.health_status = health_status
+        self.reject_encoded = reject_encoded
+        self.health_requests = 0
+        self.received = []  # (Content-Encoding, açılmış payload)
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def close(self):
+        self.shutdown()
+        self.server_close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status: int, body: dict, headers: dict = None):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self.server.health_requests += 1
+        if self.server.health_status != 200:
+            self._reply(self.server.health_status, {"status": "unavailable"})
+        else:
+            self._reply(200, {"status": "ok"}, {"Accept-Encoding": self.server.accept_encoding})
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        encoding = self.headers.get("Content-Encoding")
+        if encoding and self.server.reject_encoded:
+            self._reply(415, {"detail": "Unsupported Media Type"})
+            return
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        elif encoding == "zstd":
+            import zstandard
+            body = zstandard.ZstdDecompressor().decompressobj().decompress(body)
+        self.server.received.append((encoding, json.loads(body)))
+        self._reply(200, {"summary": "ok"})
+
+
+class RequestCompressionTest(unittest.TestCase):
+
+    def setUp(self):
+        self._api_url = api.API_URL
+        self._env = mock.patch.dict(os.environ, {"NEUROPS_REQUEST_COMPRESSION": "auto"})
+        self._env.start()
+
+    def tearDown(self):
+        self._env.stop()
+        api.set_api_url(self._api_url)
+
+    def _backend(self, **kwargs) -> StandInBackend:
+        backend = StandInBackend(**kwargs)
+        self.addCleanup(backend.close)
+        api.set_api_url(backend.url)
+        return backend
+
+    def test_decoded_payload_matches(self):
+        backend = self._backend(accept_encoding="gzip")
+        res = api.api_post_json("/logs/analyze", PAYLOAD, compress=True, timeout=10)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(backend.received, [("gzip", PAYLOAD)])
+
+    def test_small_bodies_are_not_compressed(self):
+        backend = self._backend(accept_encoding="gzip")
+        api.api_post_json("/logs/analyze", {"logs": "short"}, compress=True, timeout=10)
+        self.assertEqual(backend.received, [(None, {"logs": "short"})])
+
+    def test_415_falls_back_to_identity(self):
+        backend = self._backend(accept_encoding="gzip", reject_encoded=True)
+        res = api.api_post_json("/logs/analyze", PAYLOAD, compress=True, timeout=10)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(backend.received, [(None, PAYLOAD)])
+        # Reddedilen encoding bu backend için bir daha denenmez
+        api.api_post_json("/logs/analyze", PAYLOAD, compress=True, timeout=10)
+        self.assertEqual(backend.received, [(None, PAYLOAD), (None, PAYLOAD)])
+
+    def test_failed_probe_is_cached_briefly(self):
+        backend = self._backend(accept_encoding="gzip", health_status=503)
+        self.assertEqual(api.get_supported_request_encodings(), [])
+        self.assertEqual(api.get_supported_request_encodings(), [])
+        self.assertEqual(backend.health_requests, 1)
+        # Geçici 503 kalıcı değildir: retry süresi dolunca tekrar sorulur
+        backend.health_status = 200
+        with mock.patch.object(api.time, "monotonic", return_value=api.time.monotonic() + api.REQUEST_ENCODINGS_RETRY + 1):
+            self.assertEqual(api.get_supported_request_encodings(), ["gzip"])
+        self.assertEqual(backend.health_requests, 2)
+
+    def test_unreachable_backend_is_not_probed_per_upload(self):
+        backend = self._backend()
+        url = backend.url
+        backend.close()
+        with mock.patch.object(api, "api_get", wraps=api.api_get) as probe:
+            self.assertEqual(api.get_supported_request_encodings(), [])
+            self.assertEqual(api.get_supported_request_encodings(), [])
+        self.assertEqual(probe.call_count, 1)
+        self.assertEqual(api.API_URL, url)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+GET yanıt önbelleği: yalnızca gerçek mutasyonlar (register, güncelleme,
+resolve, silme, oluşturma) ilgili kaynağı geçersiz kılar; analiz POST'ları
+önbelleğe dokunmaz. Bellek katmanı RESPONSE_CACHE_MAX_ENTRIES ile sınırlı LRU'dur.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from neurops import api
+
+
+def _entry(path: str) -> dict:
+    return {"path": path, "body": "[]", "status_code": 200, "expires_at": 0}
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = api.ResponseCache(Path(self._tmp.name), max_entries=3)
+        mode = mock.patch.object(api, "get_response_cache_mode", return_value="memory")
+        mode.start()
+        self.addCleanup(mode.stop)
+        self.addCleanup(self._tmp.cleanup)
+
+    def _store(self, path: str) -> str:
+        key = self.cache.key(path)
+        self.cache.store(key, _entry(path), self.cache.generation(path))
+        return key
+
+    def test_analysis_posts_keep_cache(self):
+        """Analiz endpoint'leri önbelleği düşürmez"""
+        keys = [self._store("/workflow/"), self._store("/security/recommendations"), self._store("/team/")]
+        for path in ("/security/analyze", "/security/scan", "/workflow/generate", "/workflow/run", "/logs/analyze"):
+            self.cache.invalidate_for_mutation(path, "POST")
+        for key in keys:
+            self.assertIsNotNone(self.cache.lookup(key))
+
+    def test_mutations_invalidate_resource(self):
+        """Mutasyon yalnızca etkilediği kaynağın kayıtlarını siler"""
+        cases = [
+            ("POST /workflow/register", "/workflow/"),
+            ("PUT /workflow/deploy", "/workflow/"),
+            ("PATCH /workflow/deploy", "/workflow/deploy"),
+            ("DELETE /workflow/deploy", "/workflow/deploy"),
+            ("POST /incident/abc/generate-workflow", "/workflow/"),
+            ("POST /incident/abc/resolve", "/incident/stats/summary"),
+            ("PATCH /incident/abc", "/incident/stats/summary"),
+            ("POST /incident/report", "/incident/stats/summary"),
+            ("POST /security/events", "/security/recommendations"),
+            ("POST /team/create", "/team/"),
+            ("DELETE /team/t1/members/u1", "/team/"),
+        ]
+        for mutation, cached_path in cases:
+            with self.subTest(mutation=mutation):
+                key = self._store(cached_path)
+                other = self._store("/team/" if not cached_path.startswith("/team/") else "/workflow/")
+                method, path = mutation.split()
+                self.cache.invalidate_for_mutation(f"{api.API_URL}{path}", method)
+                self.assertIsNone(self.cache.lookup(key))
+                self.assertIsNotNone(self.cache.lookup(other))
+
+    def test_memory_entries_are_bounded(self):
+        """Sınır aşılınca en uzun süredir kullanılmayan kayıt düşer"""
+        first = self._store("/workflow/a")
+        second = self._store("/workflow/b")
+        self._store("/workflow/c")
+        self.cache.lookup(first)
+        self._store("/workflow/d")
+        self.assertEqual(len(self.cache._entries), 3)
+        self.assertIsNotNone(self.cache.lookup(first))
+        self.assertIsNone(self.cache.lookup(second))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+FileTailer rotate/truncate davranışı: rename sonrası eski dosyaya yazılan
+satırlar kaybolmaz, copytruncate sonrası offset'i geçecek kadar yeniden
+dolan dosya baştan okunur, persist=True ile saklanan offset'ten devam edilir.
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from neurops import tailer
+from neurops.config import ConfigStore
+
+
+def _collect(tail: tailer.FileTailer, count: int, timeout: float = 5.0) -> list:
+    """En az count satır gelene veya timeout dolana kadar poll eder"""
+    lines = []
+    deadline = time.monotonic() + timeout
+    while len(lines) < count and time.monotonic() < deadline:
+        for _, text in tail.poll(timeout=0.1):
+            lines.extend(text.splitlines())
+    return lines
+
+
+class TailerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.dir = Path(self._tmp.name)
+        self.path = self.dir / "app.log"
+        grace = mock.patch.object(tailer, "TAIL_ROTATE_GRACE", 0.3)
+        grace.start()
+        self.addCleanup(grace.stop)
+
+    def _tailer(self, **kwargs) -> tailer.FileTailer:
+        tail = tailer.FileTailer(lines=True, poll_interval=0.05, **kwargs)
+        self.addCleanup(tail.close)
+        return tail
+
+    def _append(self, text: str, path: Path = None):
+        with open(path or self.path, "a", encoding="utf-8") as f:
+            f.write(text)
+
+
+class RotationTest(TailerTestCase):
+
+    def _rotate_while_writing(self, tail: tailer.FileTailer):
+        writer = open(self.path, "a", encoding="utf-8")
+        self.addCleanup(writer.close)
+        writer.write("before\n")
+        writer.flush()
+        self.assertEqual(_collect(tail, 1), ["before"])
+        
+        # Yazıcı rename'den sonra eski handle'ına yazmaya devam eder
+        os.rename(self.path, self.dir / "app.log.1")
+        writer.write("late1\n")
+        writer.flush()
+        self._append("new1\n")
+        self.assertEqual(_collect(tail, 1), ["late1"])
+        writer.write("late2\n")
+        writer.flush()
+        writer.close()
+        self.assertEqual(_collect(tail, 2), ["late2", "new1"])
+
+    def test_rename_keeps_draining_old_file(self):
+        """add ile izlenen dosya: eski dosya sessizleşene kadar okunur, sonra yenisine geçilir"""
+        self._append("")
+        tail = self._tailer()
+        tail.add(str(self.path))
+        self._rotate_while_writing(tail)
+
+    def test_rename_out_of_glob_keeps_draining_old_file(self):
+        """Desene uymayan ada rotate edilen dosyanın geç yazılan satırları da teslim edilir"""
+        self._append("")
+        tail = self._tailer()
+        tail.add_glob(str(self.dir / "*.log"))
+        self._rotate_while_writing(tail)
+
+    def test_copytruncate_refilled_past_offset(self):
+        """Truncate sonrası iki poll arasında offset'i geçen yeni içerik baştan okunur"""
+        self._append("")
+        tail = self._tailer()
+        tail.add(str(self.path))
+        self._append("before-trunc\n")
+        self.assertEqual(_collect(tail, 1), ["before-trunc"])
+        
+        with open(self.path, "r+", encoding="utf-8") as f:
+            f.truncate(0)
+        self._append("after-trunc\nand-more\n")
+        self.assertEqual(_collect(tail, 2), ["after-trunc", "and-more"])
+
+
+class LinesModeTest(TailerTestCase):
+
+    def test_line_split_across_reads_is_delivered_whole(self):
+        """lines=True: yazılmakta olan satır tamamlanana kadar bekletilir"""
+        self._append("")
+        tail = self._tailer()
+        tail.add(str(self.path))
+        self._append("Traceback (most recent")
+        self.assertEqual(_collect(tail, 1, timeout=0.3), [])
+        self._append(" call last):\nnext\n")
+        self.assertEqual(_collect(tail, 2), ["Traceback (most recent call last):", "next"])
+
+
+class PersistedOffsetTest(TailerTestCase):
+
+    def setUp(self):
+        super().setUp()
+        store = mock.patch.object(tailer, "tail_offsets", ConfigStore(self.dir / "tail_offsets.json"))
+        store.start()
+        self.addCleanup(store.stop)
+
+    def _first_run(self):
+        self._append("one\ntwo\n")
+        tail = tailer.FileTailer(lines=True, poll_interval=0.05, persist=True)
+        tail.add(str(self.path), from_start=True)
+        self.assertEqual(_collect(tail, 2), ["one", "two"])
+        tail.close()
+
+    def test_resume_from_saved_offset(self):
+        """Kapalıyken eklenen satırlar teslim edilir, önceki satırlar tekrarlanmaz"""
+        self._first_run()
+        self._append("three\n")
+        tail = self._tailer(persist=True)
+        tail.add(str(self.path))
+        self.assertEqual(_collect(tail, 1), ["three"])
+        self.assertEqual(_collect(tail, 1, timeout=0.3), [])
+
+    def test_resume_after_rewrite_starts_over(self):
+        """Aynı inode'a başka içerik yazıldıysa saklanan offset kullanılmaz"""
+        self._first_run()
+        with open(self.path, "r+", encoding="utf-8") as f:
+            f.truncate(0)
+            f.write("uno\ndos\ntres\n")
+        tail = self._tailer(persist=True)
+        tail.add(str(self.path))
+        self.assertEqual(_collect(tail, 3), ["uno", "dos", "tres"])
+
+
+if __name__ == "__main__":
+    unittest.main()